@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 import yaml
 from fastapi import FastAPI
@@ -39,12 +40,14 @@ def _load_tenants(data_dir: str | Path) -> list[dict]:
     return _DEFAULT_TENANTS
 
 
-def create_app(data_dir: str | Path | None = None) -> FastAPI:
+def create_app(data_dir: str | Path | None = None, runtime: Any = None) -> FastAPI:
     """Create and return a configured FastAPI application.
 
     Args:
         data_dir: Path to store JSON files. Use ":memory:" to skip all I/O (tests).
                   Defaults to VIBE_DATA_DIR env var, or ~/.openvibe.
+        runtime: RoleRuntime backing the streaming endpoints (respond and
+                 workflow SSE). Without it those endpoints return 503.
     """
     if data_dir is None:
         data_dir = os.environ.get("VIBE_DATA_DIR", str(Path.home() / ".openvibe"))
@@ -64,6 +67,7 @@ def create_app(data_dir: str | Path | None = None) -> FastAPI:
     app.state.workspace_svc = workspace_svc
     app.state.human_loop_svc = human_loop_svc
     app.state.registry = registry
+    app.state.runtime = runtime
 
     # Load tenants from YAML (production) or defaults (:memory: / tests)
     tenants = _load_tenants(data_dir)
@@ -88,6 +92,7 @@ def create_app(data_dir: str | Path | None = None) -> FastAPI:
     from openvibe_platform.routers import approvals as approvals_router
     from openvibe_platform.routers import deliverables as deliverables_router
     from openvibe_platform.routers import roles as roles_router
+    from openvibe_platform.routers import stream as stream_router
     from openvibe_platform.routers import tenants as tenants_router
     from openvibe_platform.routers import workspaces as ws_router
 
@@ -95,6 +100,7 @@ def create_app(data_dir: str | Path | None = None) -> FastAPI:
     app.include_router(roles_router.make_router(registry, store), prefix="/api/v1")
     app.include_router(approvals_router.make_router(human_loop_svc, store), prefix="/api/v1")
     app.include_router(deliverables_router.make_router(human_loop_svc, store), prefix="/api/v1")
+    app.include_router(stream_router.make_router(), prefix="/api/v1")
     app.include_router(tenants_router.router)
     app.include_router(ws_router.make_tenant_router())
     app.include_router(roles_router.make_tenant_router())
@@ -0,0 +1,102 @@
+"""HTTP router for streaming — Server-Sent Events from the role runtime.
+
+Each StreamEvent becomes one SSE message: ``event:`` is the event type
+(text, tool_use, done, node) and ``data:`` a JSON payload. A failure mid
+stream is sent as an ``error`` event, since headers are already out.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterator
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from openvibe_sdk.llm import StreamEvent
+
+
+class _RespondBody(BaseModel):
+    message: str
+    context: str = ""
+
+
+class _WorkflowBody(BaseModel):
+    role_id: str
+    input_data: dict = Field(default_factory=dict)
+
+
+def _payload(event: StreamEvent) -> dict[str, Any]:
+    data: dict[str, Any] = {"node": event.node} if event.node else {}
+    if event.type == "text":
+        data["text"] = event.text
+    elif event.type == "tool_use" and event.tool_call:
+        data.update(
+            id=event.tool_call.id,
+            name=event.tool_call.name,
+            input=event.tool_call.input,
+        )
+    elif event.type == "done" and event.response:
+        data.update(
+            content=event.response.content,
+            tokens_in=event.response.tokens_in,
+            tokens_out=event.response.tokens_out,
+            stop_reason=event.response.stop_reason,
+        )
+    elif event.type == "node":
+        data["output"] = event.output
+    return data
+
+
+def _sse(events: Iterator[StreamEvent]) -> Iterator[str]:
+    try:
+        for event in events:
+            data = json.dumps(_payload(event), default=str)
+            yield f"event: {event.type}\ndata: {data}\n\n"
+    except Exception as exc:
+        data = json.dumps({"error": str(exc)})
+        yield f"event: error\ndata: {data}\n\n"
+
+
+def _stream_response(events: Iterator[StreamEvent]) -> StreamingResponse:
+    return StreamingResponse(
+        _sse(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def make_router() -> APIRouter:
+    """Streaming endpoints; 503 until the app is given a runtime."""
+    router = APIRouter(tags=["stream"])
+
+    def _get_runtime(request: Request) -> Any:
+        runtime = getattr(request.app.state, "runtime", None)
+        if runtime is None:
+            raise HTTPException(status_code=503, detail="No role runtime configured")
+        return runtime
+
+    @router.post("/roles/{role_id}/respond/stream")
+    def stream_respond(role_id: str, body: _RespondBody, request: Request) -> StreamingResponse:
+        runtime = _get_runtime(request)
+        try:
+            role = runtime.get_role(role_id)
+        except ValueError as exc:
+            raise HTTPException(status_code=404, detail=str(exc))
+        return _stream_response(role.respond_stream(body.message, body.context))
+
+    @router.post("/workflows/{operator_id}/{workflow_id}/stream")
+    def stream_workflow(
+        operator_id: str, workflow_id: str, body: _WorkflowBody, request: Request
+    ) -> StreamingResponse:
+        runtime = _get_runtime(request)
+        try:
+            events = runtime.stream(
+                body.role_id, operator_id, workflow_id, body.input_data
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=404, detail=str(exc))
+        return _stream_response(events)
+
+    return router
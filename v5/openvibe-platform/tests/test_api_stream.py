@@ -0,0 +1,102 @@
+"""Tests for the Server-Sent Events streaming endpoints."""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from langgraph.graph import END, START, StateGraph
+
+from openvibe_platform.app import create_app
+from openvibe_runtime.role_runtime import RoleRuntime
+from openvibe_sdk.llm import LLMResponse, StreamEvent
+from openvibe_sdk.operator import Operator, llm_node
+from openvibe_sdk.role import Role
+
+
+class ChunkedLLM:
+    """Streams its answer in two chunks."""
+
+    def call(self, *, system, messages, **kwargs):
+        return LLMResponse(content="hello world", tokens_in=3, tokens_out=2)
+
+    def stream(self, *, system, messages, **kwargs):
+        yield StreamEvent(type="text", text="hello ")
+        yield StreamEvent(type="text", text="world")
+        yield StreamEvent(type="done", response=self.call(system=system, messages=messages))
+
+
+class ReportOps(Operator):
+    operator_id = "report_ops"
+
+    @llm_node(output_key="summary")
+    def summarize(self, state):
+        """Summarize the day."""
+        return "numbers"
+
+
+class Analyst(Role):
+    role_id = "analyst"
+    operators = [ReportOps]
+
+
+def _report_graph(operator):
+    graph = StateGraph(dict)
+    graph.add_node("summarize", operator.summarize)
+    graph.add_edge(START, "summarize")
+    graph.add_edge("summarize", END)
+    return graph.compile()
+
+
+def _events(response):
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        kind, data = block.split("\n")
+        events.append((kind.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+@pytest.fixture
+def stream_client():
+    runtime = RoleRuntime(roles=[Analyst], llm=ChunkedLLM())
+    runtime.register_workflow("report_ops", "daily", _report_graph)
+    return TestClient(create_app(data_dir=":memory:", runtime=runtime))
+
+
+def test_stream_requires_runtime(client):
+    r = client.post("/api/v1/roles/analyst/respond/stream", json={"message": "hi"})
+    assert r.status_code == 503
+
+
+def test_stream_respond_sends_deltas_then_done(stream_client):
+    r = stream_client.post("/api/v1/roles/analyst/respond/stream", json={"message": "hi"})
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/event-stream")
+    events = _events(r)
+    assert [kind for kind, _ in events] == ["text", "text", "done"]
+    assert "".join(data["text"] for kind, data in events if kind == "text") == "hello world"
+    assert events[-1][1]["tokens_out"] == 2
+
+
+def test_stream_respond_unknown_role(stream_client):
+    r = stream_client.post("/api/v1/roles/nobody/respond/stream", json={"message": "hi"})
+    assert r.status_code == 404
+
+
+def test_stream_workflow_sends_node_deltas_and_output(stream_client):
+    r = stream_client.post(
+        "/api/v1/workflows/report_ops/daily/stream",
+        json={"role_id": "analyst", "input_data": {}},
+    )
+    assert r.status_code == 200
+    events = _events(r)
+    assert [kind for kind, _ in events] == ["text", "text", "done", "node"]
+    assert all(data["node"] == "summarize" for _, data in events)
+    assert events[-1][1]["output"]["summary"] == "hello world"
+
+
+def test_stream_workflow_unknown_workflow(stream_client):
+    r = stream_client.post(
+        "/api/v1/workflows/report_ops/weekly/stream",
+        json={"role_id": "analyst"},
+    )
+    assert r.status_code == 404
@@ -53,6 +53,19 @@ class AuditLog:
             result[e.role_id] = result.get(e.role_id, 0.0) + e.cost_usd
         return result
 
+    def response_cache_stats(self) -> dict[str, int]:
+        """Total response-cache hits/misses across entries.
+
+        Calls a CachingLLMProvider doesn't cache (by default, any with
+        temperature > 0) count as neither.
+        """
+        result = {"hits": 0, "misses": 0}
+        for e in self.entries:
+            stats = e.metadata.get("response_cache", {})
+            result["hits"] += stats.get("hits", 0)
+            result["misses"] += stats.get("misses", 0)
+        return result
+
     def cost_by_operator(self) -> dict[str, float]:
         result: dict[str, float] = {}
         for e in self.entries:
@@ -12,12 +12,18 @@ class OperatorRuntime:
     """Central runtime for operators.
 
     Loads operators.yaml, indexes by ID, dispatches activations.
+    Compiled graphs are cached per (operator, workflow) unless
+    cache_graphs=False; re-registering a workflow drops its graph.
     """
 
-    def __init__(self, config_path: str | None = None) -> None:
+    def __init__(
+        self, config_path: str | None = None, cache_graphs: bool = True
+    ) -> None:
         self._config_path = config_path
         self.operators: dict[str, OperatorConfig] = {}
         self._workflow_factories: dict[str, dict[str, Callable]] = {}
+        self.cache_graphs = cache_graphs
+        self._graphs: dict[tuple[str, str], Any] = {}
 
     @classmethod
     def from_yaml(
@@ -37,6 +43,7 @@ class OperatorRuntime:
         if operator_id not in self._workflow_factories:
             self._workflow_factories[operator_id] = {}
         self._workflow_factories[operator_id][workflow_id] = factory
+        self._graphs.pop((operator_id, workflow_id), None)
 
     def get_workflow_factory(
         self, operator_id: str, workflow_id: str
@@ -58,13 +65,18 @@ class OperatorRuntime:
             raise ValueError(
                 f"Unknown trigger '{trigger_id}' for operator '{operator_id}'"
             )
-        factory = self.get_workflow_factory(operator_id, trigger.workflow)
-        if not factory:
-            raise ValueError(
-                f"No graph factory registered for "
-                f"{operator_id}/{trigger.workflow}"
-            )
-        graph = factory()
+        key = (operator_id, trigger.workflow)
+        graph = self._graphs.get(key)
+        if graph is None:
+            factory = self.get_workflow_factory(operator_id, trigger.workflow)
+            if not factory:
+                raise ValueError(
+                    f"No graph factory registered for "
+                    f"{operator_id}/{trigger.workflow}"
+                )
+            graph = factory()
+            if self.cache_graphs:
+                graph = self._graphs.setdefault(key, graph)
         return graph.invoke(input_data)
 
     def list_operators(self) -> list[OperatorConfig]:
@@ -58,3 +58,13 @@ def test_audit_log_cost_by_role():
 def test_compute_cost():
     cost = compute_cost(tokens_in=1_000_000, tokens_out=1_000_000)
     assert abs(cost - 18.0) < 0.001  # $3 in + $15 out
+
+
+def test_response_cache_stats_sums_metadata():
+    log = AuditLog()
+    for meta in ({"response_cache": {"hits": 2, "misses": 1}}, {},
+                 {"response_cache": {"hits": 0, "misses": 3}}):
+        log.record(AuditEntry(role_id="r", operator_id="o", node_name="n",
+                              action="llm_call", tokens_in=0, tokens_out=0,
+                              latency_ms=0, cost_usd=0.0, metadata=meta))
+    assert log.response_cache_stats() == {"hits": 2, "misses": 4}
@@ -101,6 +101,32 @@ def test_activate():
         mock_graph.invoke.assert_called_once_with({"input": "test"})
 
 
+def test_activate_reuses_compiled_graph_until_reregistered():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        runtime = OperatorRuntime.from_yaml(_write_yaml(tmpdir))
+        factory = MagicMock(return_value=MagicMock())
+        runtime.register_workflow("op1", "wf1", factory)
+        runtime.activate("op1", "t1", {})
+        runtime.activate("op1", "t1", {})
+        factory.assert_called_once()
+
+        replacement = MagicMock(return_value=MagicMock())
+        runtime.register_workflow("op1", "wf1", replacement)
+        runtime.activate("op1", "t1", {})
+        replacement.assert_called_once()
+
+
+def test_activate_without_graph_cache():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        runtime = OperatorRuntime.from_yaml(_write_yaml(tmpdir))
+        runtime.cache_graphs = False
+        factory = MagicMock(return_value=MagicMock())
+        runtime.register_workflow("op1", "wf1", factory)
+        runtime.activate("op1", "t1", {})
+        runtime.activate("op1", "t1", {})
+        assert factory.call_count == 2
+
+
 def test_activate_unknown_operator():
     runtime = OperatorRuntime()
     with pytest.raises(ValueError, match="Unknown operator"):
@@ -1,9 +1,11 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
+from langgraph.graph import StateGraph
 
 from openvibe_sdk.llm import LLMResponse
-from openvibe_sdk.operator import Operator, llm_node
+from openvibe_sdk.operator import Operator, async_llm_node, llm_node
 from openvibe_sdk.role import Role
 from openvibe_runtime.role_runtime import RoleRuntime
 
@@ -126,3 +128,198 @@ def test_testing_mode_no_llm_required():
     runtime = RoleRuntime(roles=[CRO], mode="test")
     role = runtime.get_role("cro")
     assert role is not None
+
+
+class AsyncRevenueOps(Operator):
+    operator_id = "async_revenue_ops"
+
+    @async_llm_node(model="sonnet", output_key="score")
+    def qualify(self, state):
+        """You qualify leads."""
+        return f"Score: {state.get('lead', '')}"
+
+
+class AsyncCRO(Role):
+    role_id = "async_cro"
+    soul = "You are the CRO."
+    operators = [AsyncRevenueOps]
+
+
+def _async_qualify_factory(operator):
+    graph = StateGraph(dict)
+    graph.add_node("qualify", operator.qualify)
+    graph.set_entry_point("qualify")
+    graph.set_finish_point("qualify")
+    return graph.compile()
+
+
+def test_aactivate_runs_ainvoke():
+    runtime = RoleRuntime(roles=[AsyncCRO], llm=FakeLLM(content="90"))
+    runtime.register_workflow(
+        "async_revenue_ops", "qualify", _async_qualify_factory
+    )
+    result = asyncio.run(
+        runtime.aactivate("async_cro", "async_revenue_ops", "qualify", {"lead": "Acme"})
+    )
+    assert result["score"] == 90
+
+
+def test_aactivate_concurrent_activations():
+    runtime = RoleRuntime(roles=[AsyncCRO], mode="test")
+    runtime.register_workflow(
+        "async_revenue_ops", "qualify", _async_qualify_factory
+    )
+
+    async def run_many():
+        return await asyncio.gather(*(
+            runtime.aactivate("async_cro", "async_revenue_ops", "qualify", {"lead": str(i)})
+            for i in range(50)
+        ))
+
+    results = asyncio.run(run_many())
+    assert len(results) == 50
+    assert all(r["score"] == "mock response" for r in results)
+
+
+def test_aactivate_unknown_workflow():
+    runtime = RoleRuntime(roles=[CRO], llm=FakeLLM())
+    with pytest.raises(ValueError, match="No workflow"):
+        asyncio.run(runtime.aactivate("cro", "revenue_ops", "missing_wf", {}))
+
+
+def test_audit_log_records_node_episodes_with_cache_stats():
+    from openvibe_sdk.llm.cache import CachingLLMProvider
+    from openvibe_runtime.audit import AuditLog
+
+    log = AuditLog()
+    # The nodes run at the default temperature=0.7: opt in to caching them
+    llm = CachingLLMProvider(FakeLLM(content="70"), max_temperature=None)
+    runtime = RoleRuntime(roles=[AsyncCRO], llm=llm, audit_log=log)
+    runtime.register_workflow(
+        "async_revenue_ops", "qualify", _async_qualify_factory
+    )
+    for _ in range(2):
+        asyncio.run(runtime.aactivate(
+            "async_cro", "async_revenue_ops", "qualify", {"lead": "Acme"}
+        ))
+
+    assert len(log.entries) == 2
+    entry = log.entries[0]
+    assert (entry.role_id, entry.operator_id, entry.node_name) == (
+        "async_cro", "async_revenue_ops", "qualify",
+    )
+    assert entry.action == "llm_call"
+    assert log.response_cache_stats() == {"hits": 1, "misses": 1}
+    # Episodes still reach agent memory
+    role = runtime.get_role("async_cro")
+    assert len(role.agent_memory.recall_episodes()) == 2
+
+
+
+def test_memory_config_persists_episodes_in_sqlite(tmp_path):
+    path = str(tmp_path / "memory.db")
+    runtime = RoleRuntime(
+        roles=[CRO], llm=FakeLLM(content="85"),
+        memory={"backend": "sqlite", "path": path},
+    )
+    assert runtime.workspace is not None
+
+    def qualify_factory(operator):
+        mock_graph = MagicMock()
+        mock_graph.invoke.return_value = operator.qualify({"lead": "Acme"})
+        return mock_graph
+
+    runtime.register_workflow("revenue_ops", "qualify", qualify_factory)
+    runtime.activate("cro", "revenue_ops", "qualify", {"lead": "Acme"})
+
+    reopened = RoleRuntime(
+        roles=[CRO], llm=FakeLLM(),
+        memory={"backend": "sqlite", "path": path},
+    )
+    episodes = reopened.get_role("cro").agent_memory.recall_episodes()
+    assert [e.node_name for e in episodes] == ["qualify"]
+
+
+def test_reflect_all_sweeps_role_memories():
+    llm = FakeLLM(content='[{"content": "Acme leads score high"}]')
+    runtime = RoleRuntime(roles=[CRO, CMO], llm=llm)
+
+    def qualify_factory(operator):
+        mock_graph = MagicMock()
+        mock_graph.invoke.return_value = operator.qualify({"lead": "Acme"})
+        return mock_graph
+
+    runtime.register_workflow("revenue_ops", "qualify", qualify_factory)
+    runtime.activate("cro", "revenue_ops", "qualify", {"lead": "Acme"})
+
+    report = runtime.reflect_all(batch_size=10)
+    assert report.errors == {}
+    assert [b.agent_id for b in report.batches] == ["cro"]
+    assert set(report.watermarks) == {"cro"}
+    assert runtime.reflect_all(watermarks=report.watermarks).batches == []
+
+
+def test_activate_compiles_each_workflow_once_per_role():
+    runtime = RoleRuntime(roles=[CRO, CMO], llm=FakeLLM())
+    factory = MagicMock(return_value=MagicMock())
+    runtime.register_workflow("content_engine", "write", factory)
+    for _ in range(3):
+        runtime.activate("cro", "content_engine", "write", {})
+        runtime.activate("cmo", "content_engine", "write", {})
+    assert factory.call_count == 2  # one graph per (role, operator, workflow)
+    operators = {call.args[0] for call in factory.call_args_list}
+    assert operators == {
+        runtime.get_role("cro").get_operator("content_engine"),
+        runtime.get_role("cmo").get_operator("content_engine"),
+    }
+
+
+def test_reregister_workflow_invalidates_compiled_graph():
+    runtime = RoleRuntime(roles=[CRO], llm=FakeLLM())
+    old = MagicMock(return_value=MagicMock())
+    new = MagicMock(return_value=MagicMock())
+    runtime.register_workflow("revenue_ops", "qualify", old)
+    runtime.activate("cro", "revenue_ops", "qualify", {})
+    runtime.register_workflow("revenue_ops", "qualify", new)
+    runtime.activate("cro", "revenue_ops", "qualify", {})
+    runtime.activate("cro", "revenue_ops", "qualify", {})
+    assert (old.call_count, new.call_count) == (1, 1)
+
+    runtime.clear_graph_cache()
+    runtime.activate("cro", "revenue_ops", "qualify", {})
+    assert new.call_count == 2
+
+
+def test_activate_many_streams_results_and_errors():
+    runtime = RoleRuntime(roles=[CRO], llm=FakeLLM(content="85"))
+
+    def qualify_factory(operator):
+        graph = StateGraph(dict)
+        graph.add_node("qualify", operator.qualify)
+        graph.set_entry_point("qualify")
+        graph.set_finish_point("qualify")
+        return graph.compile()
+
+    runtime.register_workflow("revenue_ops", "qualify", qualify_factory)
+    requests = [
+        {"role_id": "cro", "operator_id": "revenue_ops",
+         "workflow_id": "qualify", "input_data": {"lead": f"L{i}"}}
+        for i in range(3)
+    ]
+    requests.append({"role_id": "cro", "operator_id": "revenue_ops",
+                     "workflow_id": "missing"})
+    results = list(runtime.activate_many(requests, max_concurrency=2))
+    assert len(results) == 4
+    assert sorted(r.output["score"] for r in results if r.ok) == [85, 85, 85]
+    errors = [r for r in results if not r.ok]
+    assert len(errors) == 1
+    assert isinstance(errors[0].error, ValueError)
+
+
+def test_close_runs_shutdown_hooks_once_in_reverse():
+    calls = []
+    with RoleRuntime(roles=[CRO], mode="test") as runtime:
+        runtime.add_shutdown_hook(lambda: calls.append("clients"))
+        runtime.add_shutdown_hook(lambda: calls.append("stores"))
+    runtime.close()
+    assert calls == ["stores", "clients"]
@@ -0,0 +1,110 @@
+"""Micro-benchmark: InMemoryEpisodicStore query time vs. store size.
+
+Grows one agent's episode log to --max episodes and times the queries
+MemoryAssembler / AgentMemory.reflect issue. Indexed query time should
+stay flat while the linear-scan baseline grows with N.
+
+    python benchmarks/bench_memory_stores.py [--max 1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from openvibe_sdk.memory.in_memory import InMemoryEpisodicStore  # noqa: E402
+from openvibe_sdk.memory.types import Episode  # noqa: E402
+
+ENTITIES = [f"account_{i}" for i in range(500)]
+DOMAINS = ["revenue", "marketing", "ads", "crm", "cro"]
+TAGS = [["daily"], ["weekly"], ["daily", "alert"], []]
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _episode(i: int) -> Episode:
+    return Episode(
+        id=f"ep{i}",
+        agent_id="d2c_growth",
+        operator_id="meta_ad_ops",
+        node_name="optimize",
+        timestamp=START + timedelta(seconds=30 * i),
+        action="optimize",
+        input_summary="",
+        output_summary="paused 2 ad sets",
+        outcome={},
+        duration_ms=1200,
+        tokens_in=900,
+        tokens_out=300,
+        entity=ENTITIES[i % len(ENTITIES)],
+        domain=DOMAINS[i % len(DOMAINS)],
+        tags=TAGS[i % len(TAGS)],
+    )
+
+
+def _linear_query(episodes, agent_id, entity=None, domain=None, tags=None,
+                  since=None, limit=50):
+    """The pre-index implementation, for comparison."""
+    results = [e for e in episodes if e.agent_id == agent_id]
+    if entity:
+        results = [e for e in results if e.entity == entity]
+    if domain:
+        results = [e for e in results if e.domain == domain]
+    if tags:
+        results = [e for e in results if any(t in e.tags for t in tags)]
+    if since:
+        results = [e for e in results if e.timestamp >= since]
+    return results[:limit]
+
+
+def _time(fn, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat * 1e6  # µs per call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max", type=int, default=1_000_000)
+    parser.add_argument("--baseline-max", type=int, default=100_000,
+                        help="largest N to run the linear-scan baseline at")
+    args = parser.parse_args()
+
+    sizes = [n for n in (1_000, 10_000, 100_000, 1_000_000) if n <= args.max]
+    store = InMemoryEpisodicStore()
+    flat: list[Episode] = []
+    stored = 0
+
+    header = f"{'N':>10} {'query':<28} {'indexed µs':>12} {'linear µs':>12}"
+    print(header)
+    print("-" * len(header))
+    for n in sizes:
+        while stored < n:
+            ep = _episode(stored)
+            store.store(ep)
+            flat.append(ep)
+            stored += 1
+        recent = START + timedelta(seconds=30 * (n - 200))
+        queries = {
+            "latest limit=50": dict(limit=50),
+            "entity+domain limit=3": dict(
+                entity=ENTITIES[7], domain=DOMAINS[2], limit=3),
+            "tags limit=10": dict(tags=["alert"], limit=10),
+            "since last 200 limit=50": dict(since=recent, limit=50),
+        }
+        for name, kwargs in queries.items():
+            indexed = _time(lambda: store.query("d2c_growth", **kwargs), 200)
+            linear = f"{'-':>12}"
+            if n <= args.baseline_max:
+                us = _time(lambda: _linear_query(flat, "d2c_growth", **kwargs), 3)
+                linear = f"{us:12.1f}"
+            print(f"{n:>10} {name:<28} {indexed:12.1f} {linear}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,12 @@
 
 __version__ = "1.0.0"
 
-from openvibe_sdk.operator import Operator, llm_node, agent_node
+from openvibe_sdk.operator import (
+    Operator, llm_node, agent_node, async_llm_node, async_agent_node,
+)
 from openvibe_sdk.role import Role
 from openvibe_sdk.runtime import OperatorRuntime, RoleRuntime
+from openvibe_sdk.batch import ActivationRequest, ActivationResult
 
 # V2 exports
 from openvibe_sdk.memory.types import Fact, Episode, Insight, Classification
@@ -43,9 +46,13 @@ __all__ = [
     "Operator",
     "llm_node",
     "agent_node",
+    "async_llm_node",
+    "async_agent_node",
     "Role",
     "OperatorRuntime",
     "RoleRuntime",
+    "ActivationRequest",
+    "ActivationResult",
     # V2
     "Fact",
     "Episode",
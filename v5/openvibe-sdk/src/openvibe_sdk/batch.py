@@ -0,0 +1,113 @@
+"""Batch activation — run many workflow activations with bounded concurrency.
+
+RoleRuntime.activate_many builds on run_activations: a worker pool of
+max_concurrency threads, optional per-provider caps (e.g. at most 2 Meta
+activations at once), results streamed back in completion order. One
+failing activation never cancels the rest.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator
+
+
+@dataclass
+class ActivationRequest:
+    """One workflow activation in a batch.
+
+    provider: rate-limit key for per_provider_limits; defaults to
+    operator_id (e.g. "meta_ad_ops").
+    """
+
+    role_id: str
+    operator_id: str
+    workflow_id: str
+    input_data: dict[str, Any] = field(default_factory=dict)
+    provider: str = ""
+
+    @property
+    def limit_key(self) -> str:
+        return self.provider or self.operator_id
+
+
+@dataclass
+class ActivationResult:
+    """Outcome of one activation: output or error, plus timing."""
+
+    request: ActivationRequest
+    output: dict[str, Any] | None = None
+    error: Exception | None = None
+    queued_ms: int = 0
+    duration_ms: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _as_request(item: ActivationRequest | dict[str, Any]) -> ActivationRequest:
+    return item if isinstance(item, ActivationRequest) else ActivationRequest(**item)
+
+
+def run_activations(
+    activate: Callable[[str, str, str, dict], dict],
+    requests: Iterable[ActivationRequest | dict[str, Any]],
+    max_concurrency: int = 8,
+    per_provider_limits: dict[str, int] | None = None,
+) -> Iterator[ActivationResult]:
+    """Run activate(role_id, operator_id, workflow_id, input_data) per request.
+
+    Yields ActivationResult as each activation finishes. A request whose
+    provider is at its limit waits in queue without holding a worker, so
+    other providers keep flowing.
+    """
+    limits = per_provider_limits or {}
+    pending = deque(_as_request(r) for r in requests)
+    running: dict[str, int] = {}
+    start = time.monotonic()
+
+    def execute(request: ActivationRequest) -> ActivationResult:
+        began = time.monotonic()
+        result = ActivationResult(
+            request=request, queued_ms=int((began - start) * 1000)
+        )
+        try:
+            result.output = activate(
+                request.role_id,
+                request.operator_id,
+                request.workflow_id,
+                request.input_data,
+            )
+        except Exception as exc:
+            result.error = exc
+        result.duration_ms = int((time.monotonic() - began) * 1000)
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+        in_flight: dict[Future, ActivationRequest] = {}
+        while pending or in_flight:
+            # Submit every queued request whose provider has a free slot
+            deferred: deque[ActivationRequest] = deque()
+            while pending and len(in_flight) < max(1, max_concurrency):
+                request = pending.popleft()
+                key = request.limit_key
+                limit = limits.get(key)
+                if limit is not None and running.get(key, 0) >= max(1, limit):
+                    deferred.append(request)
+                    continue
+                running[key] = running.get(key, 0) + 1
+                # Workers inherit the caller's llm_context (tenant, priority)
+                context = contextvars.copy_context()
+                in_flight[pool.submit(context.run, execute, request)] = request
+            pending.extendleft(reversed(deferred))
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                request = in_flight.pop(future)
+                running[request.limit_key] -= 1
+                yield future.result()
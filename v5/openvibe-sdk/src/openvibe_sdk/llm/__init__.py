@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Any, Protocol, runtime_checkable
+from typing import (
+    Any, AsyncIterator, Callable, Iterator, Protocol, runtime_checkable,
+)
 
 MODEL_ALIASES: dict[str, str] = {
     "sonnet": "claude-sonnet-4-5-20250929",
@@ -37,6 +44,29 @@ class LLMResponse:
     model: str = ""
     stop_reason: str = "end_turn"
     raw_content: Any = None
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_status: str = ""  # response cache: "" (not cached) | "hit" | "miss"
+
+
+@dataclass
+class StreamEvent:
+    """One event from a streaming LLM call or workflow run.
+
+    type:
+    - "text": a text delta (``text``)
+    - "tool_use": a complete tool call (``tool_call``)
+    - "done": the final LLMResponse (``response``); always last per call
+    - "node": a workflow node finished (``output``); emitted by runtimes
+    node: the llm_node / workflow node the event came from, if any.
+    """
+
+    type: str
+    text: str = ""
+    tool_call: ToolCall | None = None
+    response: LLMResponse | None = None
+    output: Any = None
+    node: str = ""
 
 
 class LLMError(Exception):
@@ -50,7 +80,17 @@ class LLMError(Exception):
 
 @runtime_checkable
 class LLMProvider(Protocol):
-    """Protocol for LLM providers. Implement this to add new LLM backends."""
+    """Protocol for LLM providers. Implement this to add new LLM backends.
+
+    cache_prefix: leading part of ``system`` that is stable across calls
+    (soul + node docstring). Providers with prompt caching cache the tool
+    schemas and this prefix; the rest of ``system`` and the messages are
+    sent uncached. It is optional: call_llm / acall_llm / stream_llm /
+    astream_llm only pass it when it is non-empty and the method declares
+    it (or takes ``**kwargs``), so providers written without it keep
+    working. Set ``supports_cache_prefix`` on a provider to override the
+    signature check.
+    """
 
     def call(
         self,
@@ -61,4 +101,161 @@ class LLMProvider(Protocol):
         max_tokens: int = 4096,
         temperature: float = 0.7,
         tools: list[dict] | None = None,
+        cache_prefix: str = "",
+    ) -> LLMResponse: ...
+
+
+@runtime_checkable
+class AsyncLLMProvider(Protocol):
+    """Protocol for async LLM providers. Same contract as LLMProvider, awaitable."""
+
+    async def acall(
+        self,
+        *,
+        system: str,
+        messages: list[dict],
+        model: str = "haiku",
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        tools: list[dict] | None = None,
+        cache_prefix: str = "",
     ) -> LLMResponse: ...
+
+
+@functools.lru_cache(maxsize=256)
+def _accepts_cache_prefix(func: Callable) -> bool:
+    try:
+        params = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        p.name == "cache_prefix" or p.kind is inspect.Parameter.VAR_KEYWORD
+        for p in params
+    )
+
+
+def _provider_kwargs(llm: Any, method: Callable, kwargs: dict) -> dict:
+    """kwargs without cache_prefix when it is empty or method can't take it."""
+    if "cache_prefix" not in kwargs:
+        return kwargs
+    supported = getattr(llm, "supports_cache_prefix", None)
+    if supported is None:
+        func = getattr(method, "__func__", method)
+        try:
+            supported = _accepts_cache_prefix(func)
+        except TypeError:  # unhashable callable
+            supported = _accepts_cache_prefix.__wrapped__(func)
+    if kwargs["cache_prefix"] and supported:
+        return kwargs
+    return {k: v for k, v in kwargs.items() if k != "cache_prefix"}
+
+
+def call_llm(llm: Any, **kwargs: Any) -> LLMResponse:
+    """Call any provider, passing cache_prefix only where it is accepted."""
+    return llm.call(**_provider_kwargs(llm, llm.call, kwargs))
+
+
+async def acall_llm(llm: Any, **kwargs: Any) -> LLMResponse:
+    """Await an LLM call on any provider.
+
+    Uses ``acall`` when the provider is async-capable; otherwise runs the
+    blocking ``call`` in a worker thread so the event loop stays free.
+    """
+    acall = getattr(llm, "acall", None)
+    if acall is not None:
+        return await acall(**_provider_kwargs(llm, acall, kwargs))
+    return await asyncio.to_thread(call_llm, llm, **kwargs)
+
+
+@runtime_checkable
+class StreamingLLMProvider(Protocol):
+    """LLMProvider that can stream: same arguments as ``call``.
+
+    Yields "text" deltas and "tool_use" events as they arrive, then one
+    "done" event carrying the full LLMResponse.
+    """
+
+    def stream(
+        self,
+        *,
+        system: str,
+        messages: list[dict],
+        model: str = "haiku",
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        tools: list[dict] | None = None,
+        cache_prefix: str = "",
+    ) -> Iterator[StreamEvent]: ...
+
+
+@runtime_checkable
+class AsyncStreamingLLMProvider(Protocol):
+    """Async counterpart of StreamingLLMProvider."""
+
+    def astream(
+        self,
+        *,
+        system: str,
+        messages: list[dict],
+        model: str = "haiku",
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        tools: list[dict] | None = None,
+        cache_prefix: str = "",
+    ) -> AsyncIterator[StreamEvent]: ...
+
+
+def response_events(response: LLMResponse) -> Iterator[StreamEvent]:
+    """A complete response replayed as stream events (one text chunk)."""
+    if response.content:
+        yield StreamEvent(type="text", text=response.content)
+    for tool_call in response.tool_calls:
+        yield StreamEvent(type="tool_use", tool_call=tool_call)
+    yield StreamEvent(type="done", response=response)
+
+
+def stream_llm(llm: Any, **kwargs: Any) -> Iterator[StreamEvent]:
+    """Stream from any provider.
+
+    Uses ``stream`` when the provider has it; otherwise makes a blocking
+    ``call`` and replays the response as events.
+    """
+    stream = getattr(llm, "stream", None)
+    if stream is not None:
+        yield from stream(**_provider_kwargs(llm, stream, kwargs))
+        return
+    yield from response_events(call_llm(llm, **kwargs))
+
+
+async def astream_llm(llm: Any, **kwargs: Any) -> AsyncIterator[StreamEvent]:
+    """Async stream from any provider (``astream``, else ``acall_llm``)."""
+    astream = getattr(llm, "astream", None)
+    if astream is not None:
+        async for event in astream(**_provider_kwargs(llm, astream, kwargs)):
+            yield event
+        return
+    for event in response_events(await acall_llm(llm, **kwargs)):
+        yield event
+
+
+_stream_sink: ContextVar[Callable[[StreamEvent], None] | None] = ContextVar(
+    "openvibe_stream_sink", default=None
+)
+
+
+@contextmanager
+def stream_to(sink: Callable[[StreamEvent], None]) -> Iterator[None]:
+    """Forward llm_node output to ``sink`` while the block runs.
+
+    Inside the block, llm_node / async_llm_node stream their LLM calls and
+    pass every event (tagged with the node name) to sink.
+    """
+    token = _stream_sink.set(sink)
+    try:
+        yield
+    finally:
+        _stream_sink.reset(token)
+
+
+def current_stream_sink() -> Callable[[StreamEvent], None] | None:
+    return _stream_sink.get()
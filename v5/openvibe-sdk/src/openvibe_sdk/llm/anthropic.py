@@ -2,16 +2,133 @@
 
 from __future__ import annotations
 
-from anthropic import Anthropic
+from typing import Any, AsyncIterator, Iterator
 
-from openvibe_sdk.llm import LLMError, LLMResponse, ToolCall, resolve_model
+from anthropic import Anthropic, AsyncAnthropic
+
+from openvibe_sdk.llm import (
+    LLMError, LLMResponse, StreamEvent, ToolCall, resolve_model,
+)
+
+
+_EPHEMERAL = {"type": "ephemeral"}
+
+
+def _build_kwargs(
+    *,
+    system: str,
+    messages: list[dict],
+    model: str,
+    max_tokens: int,
+    temperature: float,
+    tools: list[dict] | None,
+    cache_prefix: str = "",
+    prompt_caching: bool = False,
+) -> dict:
+    """Build messages.create kwargs shared by sync and async providers.
+
+    With prompt_caching, the stable cache_prefix of ``system`` becomes its
+    own text block carrying a cache_control breakpoint. Anthropic caches in
+    tools -> system -> messages order, so that one breakpoint covers the
+    tool schemas too. Without a usable prefix the last tool is marked.
+    """
+    kwargs: dict = dict(
+        model=resolve_model(model),
+        max_tokens=max_tokens,
+        temperature=temperature,
+        system=system,
+        messages=messages,
+    )
+    if tools:
+        kwargs["tools"] = tools
+
+    if not prompt_caching:
+        return kwargs
+    if cache_prefix and system.startswith(cache_prefix):
+        blocks = [
+            {"type": "text", "text": cache_prefix, "cache_control": _EPHEMERAL}
+        ]
+        suffix = system[len(cache_prefix):].strip()
+        if suffix:
+            blocks.append({"type": "text", "text": suffix})
+        kwargs["system"] = blocks
+    elif tools:
+        kwargs["tools"] = [
+            *tools[:-1], {**tools[-1], "cache_control": _EPHEMERAL}
+        ]
+    return kwargs
+
+
+def _usage_tokens(usage: Any, name: str) -> int:
+    """Read an optional usage counter (absent or None on older responses)."""
+    value = getattr(usage, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def _parse_response(response: Any, resolved: str) -> LLMResponse:
+    """Convert an Anthropic Message into an LLMResponse."""
+    text_parts: list[str] = []
+    tool_calls: list[ToolCall] = []
+    for block in response.content:
+        if block.type == "text":
+            text_parts.append(block.text)
+        elif block.type == "tool_use":
+            tool_calls.append(
+                ToolCall(id=block.id, name=block.name, input=block.input)
+            )
+
+    content = "\n".join(text_parts) if text_parts else ""
+
+    return LLMResponse(
+        content=content,
+        tool_calls=tool_calls,
+        tokens_in=response.usage.input_tokens,
+        tokens_out=response.usage.output_tokens,
+        model=resolved,
+        stop_reason=response.stop_reason,
+        raw_content=response.content,
+        cache_read_input_tokens=_usage_tokens(
+            response.usage, "cache_read_input_tokens"
+        ),
+        cache_creation_input_tokens=_usage_tokens(
+            response.usage, "cache_creation_input_tokens"
+        ),
+    )
+
+
+def _stream_event(event: Any) -> StreamEvent | None:
+    """Map a MessageStream event to a StreamEvent (None = not surfaced)."""
+    if event.type == "text":
+        return StreamEvent(type="text", text=event.text)
+    if event.type == "content_block_stop":
+        block = event.content_block
+        if block.type == "tool_use":
+            return StreamEvent(
+                type="tool_use",
+                tool_call=ToolCall(
+                    id=block.id, name=block.name, input=block.input
+                ),
+            )
+    return None
+
+
+def _stream_error(exc: Exception) -> LLMError:
+    return LLMError(
+        f"Anthropic API stream failed: {exc}", provider="anthropic", cause=exc
+    )
 
 
 class AnthropicProvider:
-    """LLMProvider implementation using Anthropic's Claude API."""
+    """LLMProvider implementation using Anthropic's Claude API.
 
-    def __init__(self, api_key: str | None = None):
+    prompt_caching=True (default) sends cache_control breakpoints so the
+    stable soul + docstring + tool prefix is billed as a cache read on
+    repeat calls (agent loop steps, repeated node runs).
+    """
+
+    def __init__(self, api_key: str | None = None, prompt_caching: bool = True):
         self._client = Anthropic(api_key=api_key)
+        self._prompt_caching = prompt_caching
 
     def call(
         self,
@@ -22,20 +139,103 @@ class AnthropicProvider:
         max_tokens: int = 4096,
         temperature: float = 0.7,
         tools: list[dict] | None = None,
+        cache_prefix: str = "",
     ) -> LLMResponse:
-        resolved = resolve_model(model)
-        kwargs: dict = dict(
-            model=resolved,
+        kwargs = _build_kwargs(
+            system=system,
+            messages=messages,
+            model=model,
             max_tokens=max_tokens,
             temperature=temperature,
+            tools=tools,
+            cache_prefix=cache_prefix,
+            prompt_caching=self._prompt_caching,
+        )
+
+        try:
+            response = self._client.messages.create(**kwargs)
+        except Exception as exc:
+            raise LLMError(
+                f"Anthropic API call failed: {exc}",
+                provider="anthropic",
+                cause=exc,
+            ) from exc
+
+        return _parse_response(response, kwargs["model"])
+
+    def stream(
+        self,
+        *,
+        system: str,
+        messages: list[dict],
+        model: str = "haiku",
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        tools: list[dict] | None = None,
+        cache_prefix: str = "",
+    ) -> Iterator[StreamEvent]:
+        """Stream text deltas and tool calls, then a "done" LLMResponse."""
+        kwargs = _build_kwargs(
             system=system,
             messages=messages,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            tools=tools,
+            cache_prefix=cache_prefix,
+            prompt_caching=self._prompt_caching,
         )
-        if tools:
-            kwargs["tools"] = tools
 
         try:
-            response = self._client.messages.create(**kwargs)
+            with self._client.messages.stream(**kwargs) as stream:
+                for event in stream:
+                    mapped = _stream_event(event)
+                    if mapped is not None:
+                        yield mapped
+                final = stream.get_final_message()
+        except Exception as exc:
+            raise _stream_error(exc) from exc
+
+        yield StreamEvent(
+            type="done", response=_parse_response(final, kwargs["model"])
+        )
+
+
+class AsyncAnthropicProvider:
+    """AsyncLLMProvider implementation using Anthropic's async client.
+
+    One instance can serve many concurrent activations on a single event
+    loop — the underlying httpx.AsyncClient pools connections.
+    """
+
+    def __init__(self, api_key: str | None = None, prompt_caching: bool = True):
+        self._client = AsyncAnthropic(api_key=api_key)
+        self._prompt_caching = prompt_caching
+
+    async def acall(
+        self,
+        *,
+        system: str,
+        messages: list[dict],
+        model: str = "haiku",
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        tools: list[dict] | None = None,
+        cache_prefix: str = "",
+    ) -> LLMResponse:
+        kwargs = _build_kwargs(
+            system=system,
+            messages=messages,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            tools=tools,
+            cache_prefix=cache_prefix,
+            prompt_caching=self._prompt_caching,
+        )
+
+        try:
+            response = await self._client.messages.create(**kwargs)
         except Exception as exc:
             raise LLMError(
                 f"Anthropic API call failed: {exc}",
@@ -43,24 +243,41 @@ class AnthropicProvider:
                 cause=exc,
             ) from exc
 
-        text_parts: list[str] = []
-        tool_calls: list[ToolCall] = []
-        for block in response.content:
-            if block.type == "text":
-                text_parts.append(block.text)
-            elif block.type == "tool_use":
-                tool_calls.append(
-                    ToolCall(id=block.id, name=block.name, input=block.input)
-                )
-
-        content = "\n".join(text_parts) if text_parts else ""
-
-        return LLMResponse(
-            content=content,
-            tool_calls=tool_calls,
-            tokens_in=response.usage.input_tokens,
-            tokens_out=response.usage.output_tokens,
-            model=resolved,
-            stop_reason=response.stop_reason,
-            raw_content=response.content,
+        return _parse_response(response, kwargs["model"])
+
+    async def astream(
+        self,
+        *,
+        system: str,
+        messages: list[dict],
+        model: str = "haiku",
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        tools: list[dict] | None = None,
+        cache_prefix: str = "",
+    ) -> AsyncIterator[StreamEvent]:
+        """Async stream: text deltas and tool calls, then "done"."""
+        kwargs = _build_kwargs(
+            system=system,
+            messages=messages,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            tools=tools,
+            cache_prefix=cache_prefix,
+            prompt_caching=self._prompt_caching,
+        )
+
+        try:
+            async with self._client.messages.stream(**kwargs) as stream:
+                async for event in stream:
+                    mapped = _stream_event(event)
+                    if mapped is not None:
+                        yield mapped
+                final = await stream.get_final_message()
+        except Exception as exc:
+            raise _stream_error(exc) from exc
+
+        yield StreamEvent(
+            type="done", response=_parse_response(final, kwargs["model"])
         )
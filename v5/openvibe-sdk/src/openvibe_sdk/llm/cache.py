@@ -0,0 +1,337 @@
+"""Response cache — memoizes LLM calls on identical inputs.
+
+CachingLLMProvider wraps any LLMProvider. Cache key:
+(resolved model, system hash, messages hash, tools hash, temperature, max_tokens).
+
+Backends:
+- InMemoryResponseCache: LRU, per-process.
+- SQLiteResponseCache: on-disk, shared across restarts/processes, TTL +
+  size-based eviction.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, replace
+from typing import Any, AsyncIterator, Iterator, Protocol, runtime_checkable
+
+from openvibe_sdk.llm import (
+    LLMResponse,
+    StreamEvent,
+    ToolCall,
+    acall_llm,
+    astream_llm,
+    call_llm,
+    resolve_model,
+    response_events,
+    stream_llm,
+)
+
+
+def _digest(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def cache_key(
+    *,
+    system: str,
+    messages: list[dict],
+    model: str = "haiku",
+    max_tokens: int = 4096,
+    temperature: float = 0.7,
+    tools: list[dict] | None = None,
+) -> str:
+    """Stable key for one LLM request."""
+    return _digest([
+        resolve_model(model),
+        _digest(system),
+        _digest(messages),
+        _digest(tools or []),
+        temperature,
+        max_tokens,
+    ])
+
+
+def _dump_response(response: LLMResponse) -> str:
+    data = asdict(response)
+    data.pop("raw_content", None)
+    return json.dumps(data, default=str)
+
+
+def _load_response(text: str) -> LLMResponse:
+    data = json.loads(text)
+    data["tool_calls"] = [ToolCall(**tc) for tc in data.get("tool_calls", [])]
+    return LLMResponse(**data)
+
+
+@runtime_checkable
+class ResponseCache(Protocol):
+    """Protocol for response cache backends."""
+
+    def get(self, key: str) -> LLMResponse | None: ...
+
+    def set(self, key: str, response: LLMResponse) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class InMemoryResponseCache:
+    """LRU response cache with optional TTL."""
+
+    def __init__(
+        self, max_entries: int = 1024, ttl_seconds: float | None = None
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, LLMResponse]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> LLMResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, response = entry
+            if self.ttl_seconds is not None and (
+                time.time() - stored_at > self.ttl_seconds
+            ):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: LLMResponse) -> None:
+        with self._lock:
+            stored = replace(response, raw_content=None)
+            self._entries[key] = (time.time(), stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache:
+    """On-disk response cache. TTL on read, LRU trim to max_entries on write."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float | None = 7 * 24 * 3600,
+        max_entries: int = 10_000,
+    ) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_response_cache ("
+            " key TEXT PRIMARY KEY,"
+            " response TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_response_cache_access"
+            " ON llm_response_cache (last_access)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> LLMResponse | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_response_cache"
+                " WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if self.ttl_seconds is not None and now - row[1] > self.ttl_seconds:
+                self._conn.execute(
+                    "DELETE FROM llm_response_cache WHERE key = ?", (key,)
+                )
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE llm_response_cache SET last_access = ? WHERE key = ?",
+                (now, key),
+            )
+            self._conn.commit()
+        return _load_response(row[0])
+
+    def set(self, key: str, response: LLMResponse) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_response_cache"
+                " (key, response, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, _dump_response(response), now, now),
+            )
+            if self.ttl_seconds is not None:
+                self._conn.execute(
+                    "DELETE FROM llm_response_cache WHERE created_at < ?",
+                    (now - self.ttl_seconds,),
+                )
+            self._conn.execute(
+                "DELETE FROM llm_response_cache WHERE key IN ("
+                " SELECT key FROM llm_response_cache"
+                " ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_response_cache")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM llm_response_cache"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class CachingLLMProvider:
+    """LLMProvider wrapper that serves repeated requests from a ResponseCache.
+
+    Only requests with temperature <= max_temperature are cached. The
+    default, 0.0, caches deterministic calls only: replaying a sampled
+    response would silently turn off sampling. Raise it (None = cache all)
+    to opt in for non-zero temperatures. llm_node / agent_node (and their
+    async variants) default to temperature=0.7, so their calls are only
+    cached when the node sets temperature=0.0 or the wrapper opts in.
+    Responses are tagged
+    cache_status="hit" | "miss"; hits carry zero token usage since nothing
+    was billed.
+    """
+
+    def __init__(
+        self,
+        inner: Any,
+        cache: ResponseCache | None = None,
+        max_temperature: float | None = 0.0,
+    ) -> None:
+        self._inner = inner
+        self.cache: ResponseCache = (
+            cache if cache is not None else InMemoryResponseCache()
+        )
+        self.max_temperature = max_temperature
+        self.hits = 0
+        self.misses = 0
+
+    def _key(
+        self, system: str, messages: list[dict], kwargs: dict
+    ) -> str | None:
+        temperature = kwargs.get("temperature", 0.7)
+        if (
+            self.max_temperature is not None
+            and temperature > self.max_temperature
+        ):
+            return None
+        return cache_key(
+            system=system,
+            messages=messages,
+            model=kwargs.get("model", "haiku"),
+            max_tokens=kwargs.get("max_tokens", 4096),
+            temperature=temperature,
+            tools=kwargs.get("tools"),
+        )
+
+    def _hit(self, key: str | None) -> LLMResponse | None:
+        if key is None:
+            return None
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        self.hits += 1
+        return replace(
+            cached,
+            tokens_in=0,
+            tokens_out=0,
+            cache_read_input_tokens=0,
+            cache_creation_input_tokens=0,
+            cache_status="hit",
+        )
+
+    def _store(self, key: str | None, response: LLMResponse) -> LLMResponse:
+        if key is None:
+            return response
+        self.misses += 1
+        self.cache.set(key, response)
+        return replace(response, cache_status="miss")
+
+    def call(
+        self, *, system: str, messages: list[dict], **kwargs: Any
+    ) -> LLMResponse:
+        key = self._key(system, messages, kwargs)
+        cached = self._hit(key)
+        if cached is not None:
+            return cached
+        response = call_llm(
+            self._inner, system=system, messages=messages, **kwargs
+        )
+        return self._store(key, response)
+
+    async def acall(
+        self, *, system: str, messages: list[dict], **kwargs: Any
+    ) -> LLMResponse:
+        key = self._key(system, messages, kwargs)
+        cached = self._hit(key)
+        if cached is not None:
+            return cached
+        response = await acall_llm(
+            self._inner, system=system, messages=messages, **kwargs
+        )
+        return self._store(key, response)
+
+    def stream(
+        self, *, system: str, messages: list[dict], **kwargs: Any
+    ) -> Iterator[StreamEvent]:
+        """Hits replay instantly; misses stream through and are stored."""
+        key = self._key(system, messages, kwargs)
+        cached = self._hit(key)
+        if cached is not None:
+            yield from response_events(cached)
+            return
+        for event in stream_llm(
+            self._inner, system=system, messages=messages, **kwargs
+        ):
+            if event.type == "done":
+                event = replace(event, response=self._store(key, event.response))
+            yield event
+
+    async def astream(
+        self, *, system: str, messages: list[dict], **kwargs: Any
+    ) -> AsyncIterator[StreamEvent]:
+        key = self._key(system, messages, kwargs)
+        cached = self._hit(key)
+        if cached is not None:
+            for event in response_events(cached):
+                yield event
+            return
+        async for event in astream_llm(
+            self._inner, system=system, messages=messages, **kwargs
+        ):
+            if event.type == "done":
+                event = replace(event, response=self._store(key, event.response))
+            yield event
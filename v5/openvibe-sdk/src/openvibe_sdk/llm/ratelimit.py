@@ -0,0 +1,597 @@
+"""Rate limiting — shapes LLM traffic per model and tenant.
+
+RateLimitedLLMProvider wraps any LLMProvider and admits each call through a
+shared RateLimiter:
+
+- Token buckets per resolved model (requests/min and tokens/min), plus an
+  optional cap on in-flight calls.
+- Waiting calls queue by priority class (Priority.INTERACTIVE first, then
+  DEFAULT, then BATCH); within a class, tenants take turns (round-robin),
+  so one tenant's burst cannot starve the others.
+- 429 / 529 / "overloaded" errors pause the model for every caller
+  (honoring Retry-After) and the call is retried with jittered backoff.
+
+Tenant and priority come from the calling context — see llm_context().
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, AsyncIterator, Callable, Iterator
+
+from openvibe_sdk.llm import (
+    LLMError,
+    LLMResponse,
+    StreamEvent,
+    acall_llm,
+    astream_llm,
+    call_llm,
+    resolve_model,
+    stream_llm,
+)
+
+_ASYNC_POLL_SECONDS = 0.05
+
+
+class Priority(IntEnum):
+    """Admission order when a model is saturated (lower goes first)."""
+
+    INTERACTIVE = 0  # Role.respond, chat
+    DEFAULT = 1      # workflow activations
+    BATCH = 2        # cron reports, backfills, reflection sweeps
+
+
+_tenant: ContextVar[str] = ContextVar("openvibe_llm_tenant", default="default")
+_priority: ContextVar[Priority] = ContextVar(
+    "openvibe_llm_priority", default=Priority.DEFAULT
+)
+
+
+@contextmanager
+def llm_context(
+    *, tenant: str | None = None, priority: Priority | None = None
+) -> Iterator[None]:
+    """Tag LLM calls made inside the block with a tenant and/or priority.
+
+    Context variables follow asyncio tasks and asyncio.to_thread; batch
+    activations (run_activations) copy them into their workers.
+    """
+    tokens = []
+    if tenant is not None:
+        tokens.append((_tenant, _tenant.set(tenant)))
+    if priority is not None:
+        tokens.append((_priority, _priority.set(Priority(priority))))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+def current_tenant() -> str:
+    return _tenant.get()
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+@dataclass
+class RateLimit:
+    """Limits for one model. None disables that dimension."""
+
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+    max_concurrency: int | None = None
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at rate_per_minute.
+
+    A request larger than the bucket waits for a full bucket instead of
+    blocking forever. The level may go negative when actual usage exceeds
+    the reservation; later requests then wait off the debt.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: float | None = None,
+        now: float = 0.0,
+    ) -> None:
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.level = self.capacity
+        self._updated = now
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self.level = min(self.capacity, self.level + elapsed * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` can be taken (0 = now)."""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate if self.rate else math.inf
+
+    def take(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.level -= min(amount, self.capacity)
+
+    def adjust(self, amount: float) -> None:
+        """Return (positive) or charge (negative) tokens after the fact."""
+        self.level = min(self.capacity, self.level + amount)
+
+
+@dataclass(eq=False)
+class Lease:
+    """An admitted call. Pass back to RateLimiter.release()."""
+
+    model: str
+    tenant: str
+    priority: Priority
+    tokens: int
+    enqueued_at: float
+    waited_s: float = 0.0
+    granted: bool = False
+
+
+@dataclass
+class RateLimitStats:
+    """Per-model counters exported by RateLimiter.stats()."""
+
+    model: str
+    queue_depth: int = 0
+    in_flight: int = 0
+    granted: int = 0
+    throttled: int = 0
+    wait_s_total: float = 0.0
+    wait_s_max: float = 0.0
+
+    @property
+    def avg_wait_ms(self) -> float:
+        return 1000 * self.wait_s_total / self.granted if self.granted else 0.0
+
+
+@dataclass
+class _ModelState:
+    limit: RateLimit
+    requests: TokenBucket | None
+    tokens: TokenBucket | None
+    stats: RateLimitStats
+    # priority -> tenant -> FIFO of waiting leases; tenant order = turn order
+    queues: dict[Priority, OrderedDict[str, deque[Lease]]] = field(
+        default_factory=dict
+    )
+    blocked_until: float = 0.0
+
+    def head(self) -> Lease | None:
+        for priority in sorted(self.queues):
+            tenants = self.queues[priority]
+            if tenants:
+                return next(iter(tenants.values()))[0]
+        return None
+
+    def delay(self, lease: Lease, now: float) -> float:
+        limit = self.limit
+        if (
+            limit.max_concurrency is not None
+            and self.stats.in_flight >= limit.max_concurrency
+        ):
+            return math.inf
+        delay = max(0.0, self.blocked_until - now)
+        if self.requests is not None:
+            delay = max(delay, self.requests.wait_time(1, now))
+        if self.tokens is not None:
+            delay = max(delay, self.tokens.wait_time(lease.tokens, now))
+        return delay
+
+    def dequeue(self, lease: Lease) -> None:
+        tenants = self.queues.get(lease.priority, OrderedDict())
+        waiting = tenants.get(lease.tenant)
+        if not waiting or lease not in waiting:
+            return
+        was_head = waiting[0] is lease
+        waiting.remove(lease)
+        if not waiting:
+            del tenants[lease.tenant]
+        elif was_head:
+            tenants.move_to_end(lease.tenant)  # tenant had its turn
+        self.stats.queue_depth -= 1
+
+
+class RateLimiter:
+    """Shared admission control for LLM calls, keyed by resolved model.
+
+    limits: per-model RateLimit, keyed by alias or full model id
+    (e.g. {"sonnet": RateLimit(requests_per_minute=50,
+    tokens_per_minute=80_000)}). Models without an entry use ``default``;
+    with no default they are admitted immediately but still counted.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, RateLimit] | None = None,
+        default: RateLimit | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._limits = {
+            resolve_model(name): limit for name, limit in (limits or {}).items()
+        }
+        self._default = default or RateLimit()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._models: dict[str, _ModelState] = {}
+
+    def _state(self, model: str) -> _ModelState:
+        state = self._models.get(model)
+        if state is None:
+            limit = self._limits.get(model, self._default)
+            now = self._clock()
+            state = _ModelState(
+                limit=limit,
+                requests=(
+                    TokenBucket(limit.requests_per_minute, now=now)
+                    if limit.requests_per_minute else None
+                ),
+                tokens=(
+                    TokenBucket(limit.tokens_per_minute, now=now)
+                    if limit.tokens_per_minute else None
+                ),
+                stats=RateLimitStats(model=model),
+            )
+            self._models[model] = state
+        return state
+
+    def _enqueue(
+        self,
+        model: str,
+        tokens: int,
+        tenant: str | None,
+        priority: Priority | None,
+    ) -> Lease:
+        lease = Lease(
+            model=resolve_model(model),
+            tenant=tenant if tenant is not None else current_tenant(),
+            priority=Priority(
+                priority if priority is not None else current_priority()
+            ),
+            tokens=max(0, tokens),
+            enqueued_at=self._clock(),
+        )
+        with self._lock:
+            state = self._state(lease.model)
+            tenants = state.queues.setdefault(lease.priority, OrderedDict())
+            tenants.setdefault(lease.tenant, deque()).append(lease)
+            state.stats.queue_depth += 1
+        return lease
+
+    def _dispatch(self, state: _ModelState) -> float:
+        """Grant queued leases in order while limits allow (lock held).
+
+        Returns seconds until the next head could be admitted.
+        """
+        while True:
+            head = state.head()
+            if head is None:
+                return math.inf
+            now = self._clock()
+            delay = state.delay(head, now)
+            if delay > 0:
+                return delay
+            state.dequeue(head)
+            if state.requests is not None:
+                state.requests.take(1, now)
+            if state.tokens is not None:
+                state.tokens.take(head.tokens, now)
+            head.granted = True
+            head.waited_s = now - head.enqueued_at
+            stats = state.stats
+            stats.in_flight += 1
+            stats.granted += 1
+            stats.wait_s_total += head.waited_s
+            stats.wait_s_max = max(stats.wait_s_max, head.waited_s)
+            self._changed.notify_all()
+
+    def _finish(
+        self, state: _ModelState, lease: Lease, used_tokens: int | None
+    ) -> None:
+        """Retire a lease (lock held): free its slot or leave the queue."""
+        if lease.granted:
+            lease.granted = False
+            state.stats.in_flight -= 1
+            if state.tokens is not None and used_tokens is not None:
+                state.tokens.adjust(lease.tokens - used_tokens)
+        else:
+            state.dequeue(lease)
+        self._dispatch(state)
+        self._changed.notify_all()
+
+    def acquire(
+        self,
+        model: str,
+        tokens: int = 0,
+        *,
+        tenant: str | None = None,
+        priority: Priority | None = None,
+    ) -> Lease:
+        """Block until a call of ~``tokens`` may be sent to ``model``.
+
+        tenant/priority default to the current llm_context().
+        """
+        lease = self._enqueue(model, tokens, tenant, priority)
+        try:
+            with self._lock:
+                state = self._models[lease.model]
+                while True:
+                    delay = self._dispatch(state)
+                    if lease.granted:
+                        return lease
+                    self._changed.wait(None if delay == math.inf else delay)
+        except BaseException:
+            with self._lock:
+                self._finish(self._models[lease.model], lease, used_tokens=0)
+            raise
+
+    async def aacquire(
+        self,
+        model: str,
+        tokens: int = 0,
+        *,
+        tenant: str | None = None,
+        priority: Priority | None = None,
+    ) -> Lease:
+        """Async acquire: waits with asyncio.sleep, never blocks the loop."""
+        lease = self._enqueue(model, tokens, tenant, priority)
+        try:
+            while True:
+                with self._lock:
+                    delay = self._dispatch(self._models[lease.model])
+                if lease.granted:
+                    return lease
+                await asyncio.sleep(min(delay, _ASYNC_POLL_SECONDS))
+        except BaseException:
+            with self._lock:
+                self._finish(self._models[lease.model], lease, used_tokens=0)
+            raise
+
+    def release(self, lease: Lease, used_tokens: int | None = None) -> None:
+        """Mark a call finished; reconcile reserved vs. used tokens."""
+        with self._lock:
+            if lease.granted:
+                self._finish(self._models[lease.model], lease, used_tokens)
+
+    def throttle(self, model: str, seconds: float) -> None:
+        """Pause admissions to ``model`` (server said 429/529)."""
+        with self._lock:
+            state = self._state(resolve_model(model))
+            state.blocked_until = max(
+                state.blocked_until, self._clock() + seconds
+            )
+            state.stats.throttled += 1
+
+    def queue_depth(self, model: str | None = None) -> int:
+        """Waiting calls for one model, or across all models."""
+        with self._lock:
+            if model is not None:
+                state = self._models.get(resolve_model(model))
+                return state.stats.queue_depth if state else 0
+            return sum(s.stats.queue_depth for s in self._models.values())
+
+    def stats(self) -> dict[str, RateLimitStats]:
+        """Snapshot of per-model counters (queue depth, waits, throttles)."""
+        with self._lock:
+            return {
+                model: RateLimitStats(**vars(state.stats))
+                for model, state in self._models.items()
+            }
+
+
+def estimate_tokens(
+    system: str,
+    messages: list[dict],
+    tools: list[dict] | None = None,
+    max_tokens: int = 4096,
+) -> int:
+    """Conservative reservation: ~4 chars/token input plus max_tokens output."""
+    size = len(system) + len(json.dumps(messages, default=str))
+    if tools:
+        size += len(json.dumps(tools, default=str))
+    return size // 4 + max_tokens
+
+
+def _used_tokens(response: LLMResponse) -> int:
+    return (
+        response.tokens_in
+        + response.cache_creation_input_tokens
+        + response.tokens_out
+    )
+
+
+def is_rate_limited(exc: Exception) -> bool:
+    """True for 429 / 529 / overloaded errors (worth retrying later)."""
+    cause = getattr(exc, "cause", None) or exc
+    if getattr(cause, "status_code", None) in (429, 529):
+        return True
+    text = f"{type(cause).__name__} {cause}".lower()
+    return any(
+        marker in text
+        for marker in ("overloaded", "rate_limit", "rate limit", "ratelimit")
+    )
+
+
+def retry_after(exc: Exception) -> float | None:
+    """Retry-After header (seconds) from the underlying HTTP error, if any."""
+    cause = getattr(exc, "cause", None) or exc
+    headers = getattr(getattr(cause, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitedLLMProvider:
+    """LLMProvider wrapper that admits calls through a shared RateLimiter.
+
+    Share one limiter across every provider that hits the same account.
+    Rate-limited calls (429/529/overloaded) pause the model for all callers
+    and retry up to max_retries times with full-jitter exponential backoff;
+    other errors propagate unchanged. Streams hold their slot until the
+    last event and are only retried before the first event arrives.
+    """
+
+    def __init__(
+        self,
+        inner: Any,
+        limiter: RateLimiter | None = None,
+        max_retries: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._inner = inner
+        self.limiter = limiter if limiter is not None else RateLimiter()
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+
+    def _backoff(self, model: str, attempt: int, exc: Exception) -> float:
+        """Throttle the model and return this caller's jittered delay."""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** attempt)
+        server = retry_after(exc)
+        self.limiter.throttle(model, server if server is not None else ceiling)
+        return max(server or 0.0, random.uniform(0, ceiling))
+
+    def _reservation(
+        self, system: str, messages: list[dict], kwargs: dict
+    ) -> tuple[str, int]:
+        return kwargs.get("model", "haiku"), estimate_tokens(
+            system, messages, kwargs.get("tools"), kwargs.get("max_tokens", 4096)
+        )
+
+    def call(
+        self, *, system: str, messages: list[dict], **kwargs: Any
+    ) -> LLMResponse:
+        model, tokens = self._reservation(system, messages, kwargs)
+        attempt = 0
+        while True:
+            lease = self.limiter.acquire(model, tokens)
+            try:
+                response = call_llm(
+                    self._inner, system=system, messages=messages, **kwargs
+                )
+            except LLMError as exc:
+                self.limiter.release(lease, used_tokens=0)
+                if attempt >= self.max_retries or not is_rate_limited(exc):
+                    raise
+                self._sleep(self._backoff(model, attempt, exc))
+                attempt += 1
+                continue
+            except BaseException:
+                self.limiter.release(lease, used_tokens=0)
+                raise
+            self.limiter.release(lease, used_tokens=_used_tokens(response))
+            return response
+
+    async def acall(
+        self, *, system: str, messages: list[dict], **kwargs: Any
+    ) -> LLMResponse:
+        model, tokens = self._reservation(system, messages, kwargs)
+        attempt = 0
+        while True:
+            lease = await self.limiter.aacquire(model, tokens)
+            try:
+                response = await acall_llm(
+                    self._inner, system=system, messages=messages, **kwargs
+                )
+            except LLMError as exc:
+                self.limiter.release(lease, used_tokens=0)
+                if attempt >= self.max_retries or not is_rate_limited(exc):
+                    raise
+                await asyncio.sleep(self._backoff(model, attempt, exc))
+                attempt += 1
+                continue
+            except BaseException:
+                self.limiter.release(lease, used_tokens=0)
+                raise
+            self.limiter.release(lease, used_tokens=_used_tokens(response))
+            return response
+
+    def stream(
+        self, *, system: str, messages: list[dict], **kwargs: Any
+    ) -> Iterator[StreamEvent]:
+        model, tokens = self._reservation(system, messages, kwargs)
+        attempt = 0
+        while True:
+            lease = self.limiter.acquire(model, tokens)
+            used: int | None = 0
+            started = False
+            try:
+                for event in stream_llm(
+                    self._inner, system=system, messages=messages, **kwargs
+                ):
+                    started = True
+                    if event.type == "done":
+                        used = _used_tokens(event.response)
+                    yield event
+                return
+            except LLMError as exc:
+                if (
+                    started
+                    or attempt >= self.max_retries
+                    or not is_rate_limited(exc)
+                ):
+                    raise
+                delay = self._backoff(model, attempt, exc)
+            finally:
+                self.limiter.release(lease, used_tokens=used)
+            self._sleep(delay)
+            attempt += 1
+
+    async def astream(
+        self, *, system: str, messages: list[dict], **kwargs: Any
+    ) -> AsyncIterator[StreamEvent]:
+        model, tokens = self._reservation(system, messages, kwargs)
+        attempt = 0
+        while True:
+            lease = await self.limiter.aacquire(model, tokens)
+            used: int | None = 0
+            started = False
+            try:
+                async for event in astream_llm(
+                    self._inner, system=system, messages=messages, **kwargs
+                ):
+                    started = True
+                    if event.type == "done":
+                        used = _used_tokens(event.response)
+                    yield event
+                return
+            except LLMError as exc:
+                if (
+                    started
+                    or attempt >= self.max_retries
+                    or not is_rate_limited(exc)
+                ):
+                    raise
+                delay = self._backoff(model, attempt, exc)
+            finally:
+                self.limiter.release(lease, used_tokens=used)
+            await asyncio.sleep(delay)
+            attempt += 1
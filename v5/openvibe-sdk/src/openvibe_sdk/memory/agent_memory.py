@@ -5,11 +5,12 @@ from __future__ import annotations
 import json
 import uuid
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterator
 
 from openvibe_sdk.memory import MemoryEntry
 from openvibe_sdk.memory.in_memory import InMemoryEpisodicStore, InMemoryInsightStore
-from openvibe_sdk.memory.stores import EpisodicStore, InsightStore
+from openvibe_sdk.memory.reflection import ReflectionBatch, Watermark
+from openvibe_sdk.memory.stores import EpisodicStore, InsightStore, store_change_count
 from openvibe_sdk.memory.types import Classification, Episode, Fact, Insight
 from openvibe_sdk.memory.workspace import WorkspaceMemory
 
@@ -74,6 +75,22 @@ class AgentMemory:
         self.workspace = workspace
         self._episodic: EpisodicStore = episodic or InMemoryEpisodicStore()
         self._insights: InsightStore = insights or InMemoryInsightStore()
+        # Newest episode already reflected on (reflect_incremental)
+        self.reflection_watermark: Watermark | None = None
+        self._writes = 0
+
+    @property
+    def version(self) -> tuple:
+        """Changes on every insight or workspace fact write (not episodes).
+
+        Includes the stores' own change counters when they are shared with
+        other processes, so their writes change it too.
+        """
+        return (
+            self._writes,
+            store_change_count(self._insights),
+            self.workspace.version if self.workspace else None,
+        )
 
     # --- L2: Episodes ---
 
@@ -120,6 +137,7 @@ class AgentMemory:
     def store_insight(self, insight: Insight) -> None:
         insight.agent_id = self.agent_id
         self._insights.store(insight)
+        self._writes += 1
 
     # --- Reflection: L2 -> L3 ---
 
@@ -128,9 +146,66 @@ class AgentMemory:
         recent = self._episodic.query(self.agent_id, limit=50)
         if not recent:
             return []
+        new_insights, _ = self._reflect_on(llm, recent, role_context)
+        return new_insights
+
+    def reflect_incremental(
+        self,
+        llm: Any,
+        role_context: str = "",
+        batch_size: int = 20,
+        max_episodes: int = 10_000,
+    ) -> list[ReflectionBatch]:
+        """Reflect only on episodes newer than reflection_watermark."""
+        return list(self.iter_reflection(
+            llm, role_context, batch_size=batch_size, max_episodes=max_episodes
+        ))
+
+    def iter_reflection(
+        self,
+        llm: Any,
+        role_context: str = "",
+        batch_size: int = 20,
+        max_episodes: int = 10_000,
+    ) -> Iterator[ReflectionBatch]:
+        """Yield one ReflectionBatch per LLM call over unreflected episodes.
+
+        Unreflected episodes are processed oldest-first in batches of
+        batch_size (one LLM call each); the watermark advances after every
+        batch, so a failed call resumes from the last completed batch. A
+        backlog larger than max_episodes is trimmed to its newest episodes.
+        """
+        mark = self.reflection_watermark
+        pending = self._episodic.query(
+            self.agent_id,
+            since=mark.timestamp if mark else None,
+            limit=max_episodes + (len(mark.episode_ids) if mark else 0),
+        )
+        if mark:
+            pending = [e for e in pending if not mark.covers(e)]
+        pending = pending[:max_episodes]
+        pending.reverse()  # oldest first
 
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            new_insights, response = self._reflect_on(llm, chunk, role_context)
+            self.reflection_watermark = Watermark.advance(
+                self.reflection_watermark, chunk
+            )
+            yield ReflectionBatch(
+                agent_id=self.agent_id,
+                episode_ids=[e.id for e in chunk],
+                insights=new_insights,
+                tokens_in=response.tokens_in,
+                tokens_out=response.tokens_out,
+            )
+
+    def _reflect_on(
+        self, llm: Any, episodes: list[Episode], role_context: str
+    ) -> tuple[list[Insight], Any]:
+        """One LLM call over episodes; merge results into the insight store."""
         episodes_text = "\n".join(
-            f"- [{e.domain}] {e.action}: {e.output_summary}" for e in recent
+            f"- [{e.domain}] {e.action}: {e.output_summary}" for e in episodes
         )
         response = llm.call(
             system=(
@@ -150,6 +225,8 @@ class AgentMemory:
 
         new_insights = _parse_insights(response.content, self.agent_id)
         for insight in new_insights:
+            # find_similar is index-backed, so dedupe cost tracks matches,
+            # not the size of the insight store.
             existing = self._insights.find_similar(self.agent_id, insight.content)
             if existing:
                 existing.confidence = min(1.0, existing.confidence + 0.1)
@@ -158,8 +235,9 @@ class AgentMemory:
                 self._insights.update(existing)
             else:
                 self._insights.store(insight)
+            self._writes += 1
 
-        return new_insights
+        return new_insights, response
 
     # --- Sync: Agent -> Workspace ---
 
@@ -201,6 +279,7 @@ class AgentMemory:
             created_at=datetime.now(timezone.utc),
         )
         self._insights.store(insight)
+        self._writes += 1
 
     def recall(
         self, namespace: str, query: str, limit: int = 10
@@ -0,0 +1,52 @@
+"""Memory backends — build the fact/episode/insight stores from MemoryConfig."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from openvibe_sdk.memory.in_memory import (
+    InMemoryEpisodicStore,
+    InMemoryFactStore,
+    InMemoryInsightStore,
+)
+from openvibe_sdk.memory.stores import EpisodicStore, FactStore, InsightStore
+from openvibe_sdk.models import MemoryConfig
+
+
+@dataclass
+class MemoryStores:
+    """One set of stores shared by every role in a runtime."""
+
+    facts: FactStore
+    episodic: EpisodicStore
+    insights: InsightStore
+
+
+def create_memory_stores(config: MemoryConfig | dict[str, Any]) -> MemoryStores:
+    """Build stores for config.backend ("in_memory" or "sqlite")."""
+    if isinstance(config, dict):
+        config = MemoryConfig(**config)
+    if config.backend == "in_memory":
+        return MemoryStores(
+            facts=InMemoryFactStore(),
+            episodic=InMemoryEpisodicStore(),
+            insights=InMemoryInsightStore(),
+        )
+    if config.backend == "sqlite":
+        from openvibe_sdk.memory.sqlite import (
+            SQLiteEpisodicStore,
+            SQLiteFactStore,
+            SQLiteInsightStore,
+            SQLiteMemoryDB,
+        )
+
+        db = SQLiteMemoryDB(config.path)
+        return MemoryStores(
+            facts=SQLiteFactStore(db),
+            episodic=SQLiteEpisodicStore(
+                db, batch_size=config.episode_batch_size
+            ),
+            insights=SQLiteInsightStore(db),
+        )
+    raise ValueError(f"Unknown memory backend: {config.backend}")
@@ -1,11 +1,20 @@
-"""In-memory store -- dict-based, for dev/test."""
+"""In-memory store -- dict-based, for dev/test.
+
+The V2 fact/episode/insight stores lock each call, so async nodes can read
+and write them from worker threads.
+"""
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any
+import bisect
+import heapq
+import itertools
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator
 
 from openvibe_sdk.memory import MemoryEntry
+from openvibe_sdk.memory.retrieval import Embedder, RetrievalIndex
 from openvibe_sdk.memory.types import Episode, Fact, Insight
 
 
@@ -43,16 +52,30 @@ class InMemoryStore:
 
 
 class InMemoryFactStore:
-    """In-memory FactStore for development and testing."""
+    """In-memory FactStore for development and testing.
 
-    def __init__(self) -> None:
+    query= matches like SQLiteFactStore: a case-insensitive substring of
+    the content. Matches are ranked by BM25 over an inverted index; with an
+    embedder, facts close in meaning also match and the two rankings are
+    fused. Without query=, insertion order.
+    """
+
+    def __init__(self, embedder: Embedder | None = None) -> None:
         self._facts: dict[str, Fact] = {}
+        self._position: dict[str, int] = {}  # insertion order, for ties
+        self._seq = itertools.count()
+        self._index = RetrievalIndex(embedder)
+        self._lock = threading.RLock()
 
     def store(self, fact: Fact) -> None:
-        self._facts[fact.id] = fact
+        with self._lock:
+            self._facts[fact.id] = fact
+            self._position.setdefault(fact.id, next(self._seq))
+            self._index.add(fact.id, fact.content)
 
     def get(self, fact_id: str) -> Fact | None:
-        return self._facts.get(fact_id)
+        with self._lock:
+            return self._facts.get(fact_id)
 
     def query(
         self,
@@ -63,35 +86,238 @@ class InMemoryFactStore:
         min_confidence: float = 0.0,
         limit: int = 10,
     ) -> list[Fact]:
-        results = list(self._facts.values())
-        if entity:
-            results = [f for f in results if f.entity == entity]
-        if domain:
-            results = [f for f in results if f.domain == domain]
-        if tags:
-            results = [f for f in results if any(t in f.tags for t in tags)]
-        if query:
-            q = query.lower()
-            results = [f for f in results if q in f.content.lower()]
-        if min_confidence > 0:
-            results = [f for f in results if f.confidence >= min_confidence]
-        return results[:limit]
+        with self._lock:
+            if query:
+                results = self._ranked(query)
+            else:
+                results = list(self._facts.values())
+            if entity:
+                results = [f for f in results if f.entity == entity]
+            if domain:
+                results = [f for f in results if f.domain == domain]
+            if tags:
+                results = [
+                    f for f in results if any(t in f.tags for t in tags)
+                ]
+            if min_confidence > 0:
+                results = [
+                    f for f in results if f.confidence >= min_confidence
+                ]
+            return results[:limit]
+
+    def _ranked(self, query: str) -> list[Fact]:
+        """Facts containing query, most relevant first.
+
+        Substring matches without a BM25 score (partial words) come last,
+        in insertion order.
+        """
+        q = query.lower()
+        matches = {
+            fid for fid, f in self._facts.items() if q in f.content.lower()
+        }
+        scores = _match_scores(self._index, query, matches)
+        matches.update(scores)
+        position = self._position
+        ranked = sorted(
+            matches, key=lambda fid: (-scores.get(fid, 0.0), position[fid])
+        )
+        return [self._facts[fid] for fid in ranked]
 
     def update(self, fact: Fact) -> None:
-        self._facts[fact.id] = fact
+        self.store(fact)
 
     def delete(self, fact_id: str) -> None:
-        self._facts.pop(fact_id, None)
+        with self._lock:
+            self._facts.pop(fact_id, None)
+            self._position.pop(fact_id, None)
+            self._index.remove(fact_id)
 
 
-class InMemoryEpisodicStore:
-    """In-memory EpisodicStore for development and testing."""
+def _match_scores(
+    index: RetrievalIndex,
+    query: str,
+    matches: set[str],
+    candidates: set[str] | None = None,
+) -> dict[str, float]:
+    """Relevance scores for the substring matches of query.
+
+    With an embedder, every candidate the fused ranking finds is scored,
+    so semantic matches come back too.
+    """
+    if index.vectors is None:
+        return index.scores(query, matches)
+    return index.scores(query, candidates)
+
+
+class _AgentEpisodes:
+    """One agent's episodes + time-sorted posting lists.
+
+    Keys are (timestamp, seq) tuples, so every list sorts by time. Evicted
+    keys stay in posting lists until compaction; readers skip them.
+    """
+
+    __slots__ = (
+        "episodes", "timeline", "start", "by_entity", "by_domain", "by_tag",
+    )
 
     def __init__(self) -> None:
-        self._episodes: list[Episode] = []
+        self.episodes: dict[int, Episode] = {}
+        self.timeline: list[tuple[datetime, int]] = []
+        self.start = 0  # timeline[:start] has been evicted
+        self.by_entity: dict[str, list[tuple[datetime, int]]] = {}
+        self.by_domain: dict[str, list[tuple[datetime, int]]] = {}
+        self.by_tag: dict[str, list[tuple[datetime, int]]] = {}
+
+    def add(self, key: tuple[datetime, int], episode: Episode) -> None:
+        self.episodes[key[1]] = episode
+        _insert_sorted(self.timeline, key, lo=self.start)
+        if episode.entity:
+            _insert_sorted(self.by_entity.setdefault(episode.entity, []), key)
+        if episode.domain:
+            _insert_sorted(self.by_domain.setdefault(episode.domain, []), key)
+        for tag in set(episode.tags):
+            _insert_sorted(self.by_tag.setdefault(tag, []), key)
+
+    def evict_oldest(self) -> None:
+        _, seq = self.timeline[self.start]
+        self.start += 1
+        del self.episodes[seq]
+        if self.start > len(self.episodes):
+            self._compact()
+
+    def _compact(self) -> None:
+        del self.timeline[:self.start]
+        self.start = 0
+        live = self.episodes
+        for index in (self.by_entity, self.by_domain, self.by_tag):
+            for name in list(index):
+                kept = [k for k in index[name] if k[1] in live]
+                if kept:
+                    index[name] = kept
+                else:
+                    del index[name]
+
+    def query(
+        self,
+        entity: str | None,
+        domain: str | None,
+        tags: list[str] | None,
+        since: datetime | None,
+        limit: int,
+    ) -> list[Episode]:
+        # Pick the smallest posting list; check the other filters per item.
+        sources: list[list[tuple[datetime, int]]] = []
+        if entity:
+            sources.append(self.by_entity.get(entity, []))
+        if domain:
+            sources.append(self.by_domain.get(domain, []))
+        tag_lists = [self.by_tag.get(t, []) for t in set(tags or [])]
+        smallest = min(sources, key=len) if sources else None
+
+        if tags and (
+            smallest is None or sum(map(len, tag_lists)) < len(smallest)
+        ):
+            keys = _merge_newest_first(tag_lists, since)
+        elif smallest is not None:
+            keys = _newest_first(smallest, since)
+        else:
+            keys = _newest_first(self.timeline, since, lo=self.start)
+
+        tag_set = set(tags) if tags else None
+        results: list[Episode] = []
+        if limit <= 0:
+            return results
+        for _, seq in keys:
+            e = self.episodes.get(seq)
+            if e is None:
+                continue
+            if entity and e.entity != entity:
+                continue
+            if domain and e.domain != domain:
+                continue
+            if tag_set and tag_set.isdisjoint(e.tags):
+                continue
+            results.append(e)
+            if len(results) >= limit:
+                break
+        return results
+
+
+def _insert_sorted(items: list, key: Any, lo: int = 0) -> None:
+    """Append in the common in-order case; bisect otherwise."""
+    if not items or key >= items[-1]:
+        items.append(key)
+    else:
+        bisect.insort(items, key, lo=lo)
+
+
+def _newest_first(
+    items: list, since: datetime | None, lo: int = 0
+) -> Iterator[Any]:
+    """Iterate a time-sorted key list backwards, stopping at ``since``."""
+    if since is not None:
+        lo = bisect.bisect_left(items, (since,), lo=lo)
+    for i in range(len(items) - 1, lo - 1, -1):
+        yield items[i]
+
+
+def _merge_newest_first(
+    lists: list[list], since: datetime | None
+) -> Iterator[Any]:
+    """Union of time-sorted key lists, newest first, deduplicated."""
+    seen: set[int] = set()
+    merged = heapq.merge(
+        *(_newest_first(lst, since) for lst in lists), reverse=True
+    )
+    for key in merged:
+        if key[1] not in seen:
+            seen.add(key[1])
+            yield key
+
+
+class InMemoryEpisodicStore:
+    """In-memory EpisodicStore with per-agent secondary indexes.
+
+    Per agent: a time-sorted timeline plus entity/domain/tag posting lists.
+    A query walks the most selective list newest-first, bisects to
+    ``since`` and stops at ``limit``, so cost follows the result size, not
+    the number of stored episodes. Results are newest-first.
+
+    Retention: max_episodes_per_agent and max_age evict the oldest episodes
+    on write (None = unbounded).
+    """
+
+    def __init__(
+        self,
+        max_episodes_per_agent: int | None = None,
+        max_age: timedelta | None = None,
+    ) -> None:
+        self.max_episodes_per_agent = max_episodes_per_agent
+        self.max_age = max_age
+        self._agents: dict[str, _AgentEpisodes] = {}
+        self._seq = itertools.count()
+        self._lock = threading.RLock()
 
     def store(self, episode: Episode) -> None:
-        self._episodes.append(episode)
+        with self._lock:
+            agent = self._agents.get(episode.agent_id)
+            if agent is None:
+                agent = self._agents[episode.agent_id] = _AgentEpisodes()
+            agent.add((episode.timestamp, next(self._seq)), episode)
+            self._evict(agent)
+
+    def _evict(self, agent: _AgentEpisodes) -> None:
+        cap = self.max_episodes_per_agent
+        if cap is not None:
+            while len(agent.episodes) > cap:
+                agent.evict_oldest()
+        if self.max_age is not None:
+            cutoff = datetime.now(timezone.utc) - self.max_age
+            while (
+                agent.episodes
+                and agent.timeline[agent.start][0] < cutoff
+            ):
+                agent.evict_oldest()
 
     def query(
         self,
@@ -102,26 +328,143 @@ class InMemoryEpisodicStore:
         since: datetime | None = None,
         limit: int = 50,
     ) -> list[Episode]:
-        results = [e for e in self._episodes if e.agent_id == agent_id]
+        with self._lock:
+            agent = self._agents.get(agent_id)
+            if agent is None:
+                return []
+            return agent.query(entity, domain, tags, since, limit)
+
+    def count(self, agent_id: str) -> int:
+        with self._lock:
+            agent = self._agents.get(agent_id)
+            return len(agent.episodes) if agent else 0
+
+
+class _AgentInsights:
+    """One agent's insights + entity/domain/tag id sets + created_at order."""
+
+    __slots__ = (
+        "insights", "order_keys", "timeline", "indexed",
+        "by_entity", "by_domain", "by_tag", "text",
+    )
+
+    def __init__(self, embedder: Embedder | None = None) -> None:
+        self.insights: dict[str, Insight] = {}
+        self.order_keys: dict[str, tuple[datetime, int]] = {}
+        self.timeline: list[tuple[datetime, int, str]] = []
+        # Field values as last indexed — insights are mutated in place
+        # before update(), so the old postings must be remembered.
+        self.indexed: dict[str, tuple[str, str, tuple[str, ...]]] = {}
+        self.by_entity: dict[str, set[str]] = {}
+        self.by_domain: dict[str, set[str]] = {}
+        self.by_tag: dict[str, set[str]] = {}
+        self.text = RetrievalIndex(embedder)
+
+    def add(self, insight: Insight, seq: int) -> None:
+        iid = insight.id
+        self.insights[iid] = insight
+        key = (insight.created_at, seq)
+        self.order_keys[iid] = key
+        _insert_sorted(self.timeline, (*key, iid))
+        self._index(insight)
+
+    def reindex(self, insight: Insight) -> None:
+        iid = insight.id
+        self.insights[iid] = insight
+        self._unindex(iid)
+        self._index(insight)
+        created_at, seq = self.order_keys[iid]
+        if insight.created_at != created_at:
+            self.timeline.remove((created_at, seq, iid))
+            self.order_keys[iid] = (insight.created_at, seq)
+            _insert_sorted(self.timeline, (insight.created_at, seq, iid))
+
+    def remove(self, iid: str) -> None:
+        self._unindex(iid)
+        created_at, seq = self.order_keys.pop(iid)
+        self.timeline.remove((created_at, seq, iid))
+        del self.insights[iid]
+
+    def _index(self, insight: Insight) -> None:
+        iid = insight.id
+        tags = tuple(set(insight.tags))
+        self.indexed[iid] = (insight.entity, insight.domain, tags)
+        if insight.entity:
+            self.by_entity.setdefault(insight.entity, set()).add(iid)
+        if insight.domain:
+            self.by_domain.setdefault(insight.domain, set()).add(iid)
+        for tag in tags:
+            self.by_tag.setdefault(tag, set()).add(iid)
+        self.text.add(iid, insight.content)
+
+    def _unindex(self, iid: str) -> None:
+        self.text.remove(iid)
+        entity, domain, tags = self.indexed.pop(iid)
+        postings = [(self.by_entity, entity), (self.by_domain, domain)]
+        postings += [(self.by_tag, tag) for tag in tags]
+        for index, value in postings:
+            ids = index.get(value)
+            if ids is not None:
+                ids.discard(iid)
+                if not ids:
+                    del index[value]
+
+    def candidates(
+        self,
+        entity: str | None,
+        domain: str | None,
+        tags: list[str] | None,
+    ) -> set[str] | None:
+        """Ids matching the addressing filters (None = no filter)."""
+        sets: list[set[str]] = []
         if entity:
-            results = [e for e in results if e.entity == entity]
+            sets.append(self.by_entity.get(entity, set()))
         if domain:
-            results = [e for e in results if e.domain == domain]
+            sets.append(self.by_domain.get(domain, set()))
         if tags:
-            results = [e for e in results if any(t in e.tags for t in tags)]
-        if since:
-            results = [e for e in results if e.timestamp >= since]
-        return results[:limit]
+            sets.append(set().union(*(self.by_tag.get(t, set()) for t in tags)))
+        if not sets:
+            return None
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+
+    def newest_first(self, ids: set[str] | None) -> Iterator[Insight]:
+        if ids is None:
+            for _, _, iid in reversed(self.timeline):
+                yield self.insights[iid]
+        else:
+            for iid in sorted(ids, key=self.order_keys.__getitem__, reverse=True):
+                yield self.insights[iid]
 
 
 class InMemoryInsightStore:
-    """In-memory InsightStore for development and testing."""
+    """In-memory InsightStore with per-agent entity/domain/tag indexes.
 
-    def __init__(self) -> None:
-        self._insights: dict[str, Insight] = {}
+    Results are newest-first by created_at. query= matches like
+    SQLiteInsightStore (case-insensitive substring of the content); matches
+    are ranked by BM25, fused with embedding similarity when an embedder is
+    given, ties newest-first.
+    """
+
+    def __init__(self, embedder: Embedder | None = None) -> None:
+        self._embedder = embedder
+        self._agents: dict[str, _AgentInsights] = {}
+        self._owner: dict[str, str] = {}  # insight id -> agent_id
+        self._seq = itertools.count()
+        self._lock = threading.RLock()
 
     def store(self, insight: Insight) -> None:
-        self._insights[insight.id] = insight
+        with self._lock:
+            owner = self._owner.get(insight.id)
+            if owner is not None:
+                self._agents[owner].remove(insight.id)
+            agent = self._agents.get(insight.agent_id)
+            if agent is None:
+                agent = self._agents[insight.agent_id] = _AgentInsights(
+                    self._embedder
+                )
+            agent.add(insight, next(self._seq))
+            self._owner[insight.id] = insight.agent_id
 
     def query(
         self,
@@ -132,29 +475,51 @@ class InMemoryInsightStore:
         query: str = "",
         limit: int = 10,
     ) -> list[Insight]:
-        results = [i for i in self._insights.values() if i.agent_id == agent_id]
-        if entity:
-            results = [i for i in results if i.entity == entity]
-        if domain:
-            results = [i for i in results if i.domain == domain]
-        if tags:
-            results = [i for i in results if any(t in i.tags for t in tags)]
-        if query:
-            q = query.lower()
-            results = [i for i in results if q in i.content.lower()]
-        return results[:limit]
+        with self._lock:
+            agent = self._agents.get(agent_id)
+            if agent is None or limit <= 0:
+                return []
+            ids = agent.candidates(entity, domain, tags)
+            if query:
+                q = query.lower()
+                matches = {
+                    iid for iid in (agent.insights if ids is None else ids)
+                    if q in agent.insights[iid].content.lower()
+                }
+                scores = _match_scores(agent.text, query, matches, ids)
+                matches.update(scores)
+                ranked = sorted(
+                    matches, key=agent.order_keys.__getitem__, reverse=True
+                )
+                ranked.sort(key=lambda iid: scores.get(iid, 0.0), reverse=True)
+                return [agent.insights[iid] for iid in ranked[:limit]]
+            return list(itertools.islice(agent.newest_first(ids), limit))
 
     def update(self, insight: Insight) -> None:
-        self._insights[insight.id] = insight
+        with self._lock:
+            owner = self._owner.get(insight.id)
+            if owner is None or owner != insight.agent_id:
+                self.store(insight)
+            else:
+                self._agents[owner].reindex(insight)
 
     def find_similar(self, agent_id: str, content: str) -> Insight | None:
-        q = content.lower()
-        for ins in self._insights.values():
-            if ins.agent_id == agent_id:
+        with self._lock:
+            agent = self._agents.get(agent_id)
+            if agent is None:
+                return None
+            q_words = set(content.lower().split())
+            if not q_words:
+                return next(iter(agent.insights.values()), None)
+            # Only insights sharing an indexed term can overlap
+            matches = agent.text.matching(content)
+            candidates = sorted(
+                matches, key=lambda iid: agent.order_keys[iid][1]
+            )
+            for ins in map(agent.insights.__getitem__, candidates):
                 # Simple word overlap similarity
-                q_words = set(q.split())
                 ins_words = set(ins.content.lower().split())
                 overlap = len(q_words & ins_words)
                 if overlap >= min(3, len(q_words)):
                     return ins
-        return None
+            return None
@@ -0,0 +1,132 @@
+"""Incremental reflection — watermarks, per-batch reports, multi-agent runs.
+
+AgentMemory.reflect_incremental reflects one agent's unreflected episodes
+in fixed-size batches. reflect_many fans that out over many agents (the
+Archivist's scheduled sweep), one thread per agent up to max_concurrency.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Iterable
+
+from openvibe_sdk.memory.types import Episode, Insight
+
+if TYPE_CHECKING:
+    from openvibe_sdk.memory.agent_memory import AgentMemory
+
+
+@dataclass(frozen=True)
+class Watermark:
+    """High-water mark: newest reflected timestamp + the ids reflected at it.
+
+    Episodes can share a timestamp, so the ids at the boundary are kept to
+    tell reflected from unreflected ones without a strict ``>``.
+    """
+
+    timestamp: datetime
+    episode_ids: frozenset[str] = frozenset()
+
+    def covers(self, episode: Episode) -> bool:
+        return episode.timestamp < self.timestamp or (
+            episode.timestamp == self.timestamp
+            and episode.id in self.episode_ids
+        )
+
+    @staticmethod
+    def advance(
+        mark: Watermark | None, episodes: list[Episode]
+    ) -> Watermark | None:
+        """Mark after reflecting on episodes (any order)."""
+        if not episodes:
+            return mark
+        newest = max(e.timestamp for e in episodes)
+        if mark is not None and mark.timestamp > newest:
+            return mark
+        ids = {e.id for e in episodes if e.timestamp == newest}
+        if mark is not None and mark.timestamp == newest:
+            ids |= mark.episode_ids
+        return Watermark(timestamp=newest, episode_ids=frozenset(ids))
+
+
+@dataclass
+class ReflectionBatch:
+    """One LLM reflection call over a batch of episodes."""
+
+    agent_id: str
+    episode_ids: list[str]
+    insights: list[Insight]
+    tokens_in: int = 0
+    tokens_out: int = 0
+
+
+@dataclass
+class ReflectionReport:
+    """Outcome of a reflect_many sweep."""
+
+    batches: list[ReflectionBatch] = field(default_factory=list)
+    errors: dict[str, str] = field(default_factory=dict)  # agent_id -> error
+    watermarks: dict[str, Watermark] = field(default_factory=dict)
+
+    @property
+    def tokens_in(self) -> int:
+        return sum(b.tokens_in for b in self.batches)
+
+    @property
+    def tokens_out(self) -> int:
+        return sum(b.tokens_out for b in self.batches)
+
+    @property
+    def episodes(self) -> int:
+        return sum(len(b.episode_ids) for b in self.batches)
+
+    @property
+    def insights(self) -> list[Insight]:
+        return [i for b in self.batches for i in b.insights]
+
+
+def reflect_many(
+    memories: Iterable[AgentMemory],
+    llm: Any,
+    batch_size: int = 20,
+    max_concurrency: int = 8,
+    role_context: str = "",
+    watermarks: dict[str, Watermark] | None = None,
+) -> ReflectionReport:
+    """Incrementally reflect many agents concurrently.
+
+    watermarks seeds each agent's mark (e.g. loaded from a previous run)
+    and the report returns the advanced marks. A failing agent is recorded
+    in report.errors; its completed batches are kept.
+    """
+    memories = list(memories)
+    report = ReflectionReport()
+    if watermarks:
+        for memory in memories:
+            if memory.agent_id in watermarks:
+                memory.reflection_watermark = watermarks[memory.agent_id]
+
+    def run(memory: AgentMemory) -> tuple[list[ReflectionBatch], str]:
+        batches: list[ReflectionBatch] = []
+        try:
+            for batch in memory.iter_reflection(
+                llm, role_context=role_context, batch_size=batch_size
+            ):
+                batches.append(batch)
+        except Exception as exc:
+            return batches, str(exc)
+        return batches, ""
+
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+        futures = {pool.submit(run, memory): memory for memory in memories}
+        for future in as_completed(futures):
+            batches, error = future.result()
+            report.batches.extend(batches)
+            if error:
+                report.errors[futures[future].agent_id] = error
+    for memory in memories:
+        if memory.reflection_watermark is not None:
+            report.watermarks[memory.agent_id] = memory.reflection_watermark
+    return report
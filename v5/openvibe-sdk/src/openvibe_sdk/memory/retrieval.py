@@ -0,0 +1,295 @@
+"""Retrieval — ranked text search for the in-memory fact/insight stores.
+
+BM25Index: inverted index (term -> {doc_id: term frequency}) with Okapi
+BM25 scoring. Only documents sharing a query term are touched.
+
+EmbeddingIndex: optional dense index (requires numpy). Vectors live in one
+float32 matrix; search is a single matrix-vector product + top-k. Any
+Embedder works — HashingEmbedder is a dependency-free local default.
+
+RetrievalIndex combines the two with reciprocal rank fusion.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import zlib
+from collections import Counter
+from typing import Any, Protocol, runtime_checkable
+
+try:
+    import numpy as np
+except ImportError:  # optional: pip install openvibe-sdk[vector]
+    np = None
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens."""
+    return _TOKEN.findall(text.lower())
+
+
+class BM25Index:
+    """Inverted index with BM25 scoring."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[str, int]] = {}
+        self._lengths: dict[str, int] = {}
+        self._terms: dict[str, tuple[str, ...]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._lengths
+
+    def add(self, doc_id: str, text: str) -> None:
+        """Index (or re-index) a document."""
+        if doc_id in self._lengths:
+            self.remove(doc_id)
+        tokens = tokenize(text)
+        counts = Counter(tokens)
+        for term, tf in counts.items():
+            self._postings.setdefault(term, {})[doc_id] = tf
+        self._lengths[doc_id] = len(tokens)
+        self._terms[doc_id] = tuple(counts)
+        self._total_length += len(tokens)
+
+    def remove(self, doc_id: str) -> None:
+        length = self._lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self._total_length -= length
+        for term in self._terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+
+    def matching(self, text: str) -> set[str]:
+        """Ids of documents sharing at least one term with text."""
+        ids: set[str] = set()
+        for term in set(tokenize(text)):
+            ids.update(self._postings.get(term, ()))
+        return ids
+
+    def scores(
+        self, query: str, candidates: set[str] | None = None
+    ) -> dict[str, float]:
+        """BM25 score for every document matching a query term.
+
+        candidates restricts scoring to those ids (None = all documents).
+        """
+        n = len(self._lengths)
+        if n == 0:
+            return {}
+        avg_length = self._total_length / n or 1.0
+        k1, b = self.k1, self.b
+        scores: dict[str, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            if candidates is not None and len(candidates) < df:
+                hits: Any = (
+                    (d, postings[d]) for d in candidates if d in postings
+                )
+            else:
+                hits = postings.items()
+            for doc_id, tf in hits:
+                if candidates is not None and doc_id not in candidates:
+                    continue
+                norm = k1 * (1 - b + b * self._lengths[doc_id] / avg_length)
+                scores[doc_id] = (
+                    scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+                )
+        return scores
+
+    def search(
+        self, query: str, limit: int = 10, candidates: set[str] | None = None
+    ) -> list[tuple[str, float]]:
+        """Top ``limit`` (doc_id, score) pairs, best first."""
+        scores = self.scores(query, candidates)
+        return heapq.nlargest(limit, scores.items(), key=lambda kv: kv[1])
+
+
+@runtime_checkable
+class Embedder(Protocol):
+    """Maps texts to fixed-size vectors. Returns an array of shape (n, dim)."""
+
+    dim: int
+
+    def embed(self, texts: list[str]) -> Any: ...
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "Embedding retrieval requires numpy: "
+            "pip install 'openvibe-sdk[vector]'"
+        )
+
+
+class HashingEmbedder:
+    """Local feature-hashing embedder (word unigrams + bigrams).
+
+    No model download; captures lexical overlap only. Swap in any Embedder
+    (sentence-transformers, an embeddings API) for semantic recall.
+    """
+
+    def __init__(self, dim: int = 512) -> None:
+        _require_numpy()
+        self.dim = dim
+
+    def embed(self, texts: list[str]) -> Any:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = tokenize(text)
+            features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+            for feature in features:
+                h = zlib.crc32(feature.encode())
+                vectors[row, h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+
+class EmbeddingIndex:
+    """Dense vectors in a growable matrix; cosine top-k via matmul."""
+
+    def __init__(self, embedder: Embedder, initial_capacity: int = 1024) -> None:
+        _require_numpy()
+        self.embedder = embedder
+        self._matrix = np.zeros((initial_capacity, embedder.dim), np.float32)
+        self._ids: list[str | None] = []
+        self._rows: dict[str, int] = {}
+        self._free: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, doc_id: str, text: str) -> None:
+        vector = np.asarray(self.embedder.embed([text])[0], dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm:
+            vector = vector / norm
+        row = self._rows.get(doc_id)
+        if row is None:
+            if self._free:
+                row = self._free.pop()
+                self._ids[row] = doc_id
+            else:
+                row = len(self._ids)
+                if row == len(self._matrix):
+                    grown = np.zeros(
+                        (2 * len(self._matrix), self._matrix.shape[1]),
+                        np.float32,
+                    )
+                    grown[:row] = self._matrix
+                    self._matrix = grown
+                self._ids.append(doc_id)
+            self._rows[doc_id] = row
+        self._matrix[row] = vector
+
+    def remove(self, doc_id: str) -> None:
+        row = self._rows.pop(doc_id, None)
+        if row is None:
+            return
+        self._matrix[row] = 0.0
+        self._ids[row] = None
+        self._free.append(row)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        candidates: set[str] | None = None,
+        min_similarity: float = 0.0,
+    ) -> list[tuple[str, float]]:
+        """Top ``limit`` (doc_id, cosine) pairs above min_similarity."""
+        if not self._rows or limit <= 0:
+            return []
+        q = np.asarray(self.embedder.embed([query])[0], dtype=np.float32)
+        norm = float(np.linalg.norm(q))
+        if norm:
+            q = q / norm
+        if candidates is None:
+            rows = np.arange(len(self._ids))
+        else:
+            rows = np.fromiter(
+                (self._rows[c] for c in candidates if c in self._rows),
+                dtype=np.int64,
+            )
+            if rows.size == 0:
+                return []
+        sims = self._matrix[rows] @ q
+        k = min(limit, sims.size)
+        top = np.argpartition(-sims, k - 1)[:k]
+        top = top[np.argsort(-sims[top])]
+        results = []
+        for i in top:
+            doc_id = self._ids[rows[i]]
+            if doc_id is not None and sims[i] > min_similarity:
+                results.append((doc_id, float(sims[i])))
+        return results
+
+
+class RetrievalIndex:
+    """BM25 + optional embedding index over one set of documents.
+
+    Without an embedder, scores are BM25. With one, BM25 and vector
+    rankings are merged by reciprocal rank fusion, so documents can match
+    on meaning without sharing a query term.
+    """
+
+    RRF_K = 60
+
+    def __init__(
+        self,
+        embedder: Embedder | None = None,
+        min_similarity: float = 0.2,
+        vector_depth: int = 50,
+    ) -> None:
+        self.bm25 = BM25Index()
+        self.vectors = EmbeddingIndex(embedder) if embedder else None
+        self.min_similarity = min_similarity
+        self.vector_depth = vector_depth
+
+    def add(self, doc_id: str, text: str) -> None:
+        self.bm25.add(doc_id, text)
+        if self.vectors is not None:
+            self.vectors.add(doc_id, text)
+
+    def remove(self, doc_id: str) -> None:
+        self.bm25.remove(doc_id)
+        if self.vectors is not None:
+            self.vectors.remove(doc_id)
+
+    def matching(self, text: str) -> set[str]:
+        return self.bm25.matching(text)
+
+    def scores(
+        self, query: str, candidates: set[str] | None = None
+    ) -> dict[str, float]:
+        """Relevance score per matching document (higher is better)."""
+        lexical = self.bm25.scores(query, candidates)
+        if self.vectors is None:
+            return lexical
+        dense = self.vectors.search(
+            query, self.vector_depth, candidates, self.min_similarity
+        )
+        fused: dict[str, float] = {}
+        ranked = sorted(lexical, key=lexical.__getitem__, reverse=True)
+        for rank, doc_id in enumerate(ranked):
+            fused[doc_id] = 1.0 / (self.RRF_K + rank + 1)
+        for rank, (doc_id, _) in enumerate(dense):
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (self.RRF_K + rank + 1)
+        return fused
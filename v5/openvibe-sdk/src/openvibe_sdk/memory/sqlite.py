@@ -0,0 +1,590 @@
+"""SQLite stores — durable FactStore / EpisodicStore / InsightStore.
+
+All three stores can share one database file through a SQLiteMemoryDB:
+
+    db = SQLiteMemoryDB("memory.db")
+    episodic = SQLiteEpisodicStore(db, batch_size=20)
+    insights = SQLiteInsightStore(db)
+    facts = SQLiteFactStore(db)
+
+Concurrency: WAL mode, a bounded pool of reader connections (readers never
+block the writer) and one writer connection serialized by a process-wide lock. Several worker
+processes may open the same file; SQLite's busy timeout arbitrates.
+
+Search: entity/domain/timestamp B-tree indexes, a join table per store for
+tags, and an FTS5 trigram index for ``query=`` substring search, ranked by
+bm25 (falls back to unranked LIKE when FTS5 is unavailable or the query is
+under 3 characters).
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict
+from datetime import datetime
+from enum import Enum
+from typing import Any, Iterator
+
+from openvibe_sdk.memory.types import Classification, Episode, Fact, Insight
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS facts (
+    id TEXT PRIMARY KEY,
+    entity TEXT NOT NULL DEFAULT '',
+    domain TEXT NOT NULL DEFAULT '',
+    confidence REAL NOT NULL DEFAULT 1.0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_facts_entity ON facts (entity);
+CREATE INDEX IF NOT EXISTS idx_facts_domain ON facts (domain);
+CREATE TABLE IF NOT EXISTS fact_tags (
+    tag TEXT NOT NULL,
+    fact_id TEXT NOT NULL,
+    PRIMARY KEY (tag, fact_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS episodes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    agent_id TEXT NOT NULL,
+    entity TEXT NOT NULL DEFAULT '',
+    domain TEXT NOT NULL DEFAULT '',
+    ts REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_episodes_agent_ts ON episodes (agent_id, ts);
+CREATE INDEX IF NOT EXISTS idx_episodes_agent_entity_ts
+    ON episodes (agent_id, entity, ts);
+CREATE INDEX IF NOT EXISTS idx_episodes_agent_domain_ts
+    ON episodes (agent_id, domain, ts);
+CREATE TABLE IF NOT EXISTS episode_tags (
+    tag TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    PRIMARY KEY (tag, seq)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS insights (
+    id TEXT PRIMARY KEY,
+    agent_id TEXT NOT NULL,
+    entity TEXT NOT NULL DEFAULT '',
+    domain TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_insights_agent_created
+    ON insights (agent_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_insights_agent_entity
+    ON insights (agent_id, entity);
+CREATE INDEX IF NOT EXISTS idx_insights_agent_domain
+    ON insights (agent_id, domain);
+CREATE TABLE IF NOT EXISTS insight_tags (
+    tag TEXT NOT NULL,
+    insight_id TEXT NOT NULL,
+    PRIMARY KEY (tag, insight_id)
+) WITHOUT ROWID;
+
+-- Per-table write counters, bumped by triggers so writes from every
+-- connection and process are counted (keys MemoryAssembler's cache).
+CREATE TABLE IF NOT EXISTS memory_changes (
+    name TEXT PRIMARY KEY,
+    n INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO memory_changes (name, n) VALUES ('facts', 0), ('insights', 0);
+"""
+
+_CHANGE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS {table}_{event}_changes AFTER {event} ON {table}
+BEGIN
+    UPDATE memory_changes SET n = n + 1 WHERE name = '{table}';
+END;
+"""
+
+_TRIGGERS = "".join(
+    _CHANGE_TRIGGER.format(table=table, event=event)
+    for table in ("facts", "insights")
+    for event in ("INSERT", "UPDATE", "DELETE")
+)
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS facts_fts
+    USING fts5(id UNINDEXED, content, tokenize='trigram');
+CREATE VIRTUAL TABLE IF NOT EXISTS insights_fts
+    USING fts5(id UNINDEXED, content, tokenize='trigram');
+"""
+
+
+class SQLiteMemoryDB:
+    """Shared connection source + schema for the SQLite memory stores.
+
+    File databases use one writer connection (behind the write lock) and a
+    bounded pool of at most max_readers reader connections, checked out per
+    read() — short-lived worker threads borrow a connection instead of each
+    opening their own. ":memory:" uses a single connection guarded by the
+    write lock for reads as well.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        busy_timeout_ms: int = 5000,
+        max_readers: int = 8,
+    ):
+        self.path = path
+        self._busy_timeout_ms = busy_timeout_ms
+        self._write_lock = threading.RLock()
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._reader_slots = threading.BoundedSemaphore(max_readers)
+        self._closed = False
+        self._shared = self._connect() if path == ":memory:" else None
+        self._writer: sqlite3.Connection | None = None
+        with self.write() as conn:
+            conn.executescript(_SCHEMA)
+            conn.executescript(_TRIGGERS)
+            try:
+                conn.executescript(_FTS_SCHEMA)
+                self.fts = True
+            except sqlite3.OperationalError:
+                self.fts = False  # SQLite built without FTS5 / trigram
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self._busy_timeout_ms / 1000,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={self._busy_timeout_ms}")
+        return conn
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        if self._shared is not None:
+            with self._write_lock:
+                yield self._shared
+            return
+        with self._reader_slots:
+            try:
+                conn = self._readers.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            try:
+                yield conn
+            finally:
+                if self._closed:
+                    conn.close()
+                else:
+                    self._readers.put(conn)
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """One transaction; commits on success, rolls back on error."""
+        with self._write_lock:
+            conn = self._shared
+            if conn is None:
+                if self._writer is None:
+                    self._writer = self._connect()
+                conn = self._writer
+            with conn:
+                yield conn
+
+    def change_count(self, table: str) -> int:
+        """Writes to table ("facts" or "insights") from any connection or process."""
+        with self.read() as conn:
+            row = conn.execute(
+                "SELECT n FROM memory_changes WHERE name = ?", (table,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def close(self) -> None:
+        """Close idle connections; readers still checked out close on return."""
+        self._closed = True
+        with self._write_lock:
+            for conn in (self._shared, self._writer):
+                if conn is not None:
+                    conn.close()
+            self._shared = self._writer = None
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+def _resolve_db(db: SQLiteMemoryDB | str) -> SQLiteMemoryDB:
+    return db if isinstance(db, SQLiteMemoryDB) else SQLiteMemoryDB(db)
+
+
+# --- Row (de)serialization ---
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
+
+
+def _dump(obj: Any) -> str:
+    return json.dumps(asdict(obj), default=_json_default)
+
+
+def _parse_datetimes(data: dict, fields: tuple[str, ...]) -> dict:
+    for name in fields:
+        if data.get(name):
+            data[name] = datetime.fromisoformat(data[name])
+    return data
+
+
+def _load_fact(text: str) -> Fact:
+    data = _parse_datetimes(
+        json.loads(text), ("last_accessed", "created_at", "updated_at")
+    )
+    data["classification"] = Classification(data["classification"])
+    return Fact(**data)
+
+
+def _load_episode(text: str) -> Episode:
+    return Episode(**_parse_datetimes(json.loads(text), ("timestamp",)))
+
+
+def _load_insight(text: str) -> Insight:
+    return Insight(
+        **_parse_datetimes(json.loads(text), ("created_at", "last_confirmed"))
+    )
+
+
+# --- Query helpers ---
+
+
+def _tag_clause(column: str, table: str, key: str, tags: list[str]) -> str:
+    marks = ", ".join("?" * len(tags))
+    return f"{column} IN (SELECT {key} FROM {table} WHERE tag IN ({marks}))"
+
+
+def _text_search(
+    db: SQLiteMemoryDB, table: str, fts_table: str, query: str
+) -> tuple[str, str, str]:
+    """(JOIN, WHERE condition, parameter) for a case-insensitive substring match.
+
+    FTS5 matches come back through a join exposing ``fts_rank`` (bm25, lower
+    is better) for ORDER BY; the LIKE fallback has no join and no rank.
+    """
+    if db.fts and len(query) >= 3:
+        phrase = '"' + query.replace('"', '""') + '"'
+        join = (
+            f" JOIN (SELECT id AS fts_id, rank AS fts_rank FROM {fts_table}"
+            f" WHERE content MATCH ?) ON fts_id = {table}.id"
+        )
+        return join, "", phrase
+    escaped = (
+        query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    )
+    return (
+        "",
+        f"json_extract({table}.data, '$.content') LIKE ? ESCAPE '\\'",
+        f"%{escaped}%",
+    )
+
+
+class SQLiteFactStore:
+    """FactStore backed by SQLite.
+
+    Results in insertion order; query= results most relevant first.
+    """
+
+    def __init__(self, db: SQLiteMemoryDB | str = ":memory:") -> None:
+        self._db = _resolve_db(db)
+
+    def store(self, fact: Fact) -> None:
+        with self._db.write() as conn:
+            conn.execute(
+                "INSERT INTO facts (id, entity, domain, confidence, data)"
+                " VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT(id) DO UPDATE SET entity = excluded.entity,"
+                " domain = excluded.domain, confidence = excluded.confidence,"
+                " data = excluded.data",
+                (fact.id, fact.entity, fact.domain, fact.confidence, _dump(fact)),
+            )
+            conn.execute("DELETE FROM fact_tags WHERE fact_id = ?", (fact.id,))
+            conn.executemany(
+                "INSERT OR IGNORE INTO fact_tags (tag, fact_id) VALUES (?, ?)",
+                [(tag, fact.id) for tag in fact.tags],
+            )
+            if self._db.fts:
+                conn.execute("DELETE FROM facts_fts WHERE id = ?", (fact.id,))
+                conn.execute(
+                    "INSERT INTO facts_fts (id, content) VALUES (?, ?)",
+                    (fact.id, fact.content),
+                )
+
+    def get(self, fact_id: str) -> Fact | None:
+        with self._db.read() as conn:
+            row = conn.execute(
+                "SELECT data FROM facts WHERE id = ?", (fact_id,)
+            ).fetchone()
+        return _load_fact(row[0]) if row else None
+
+    def query(
+        self,
+        entity: str | None = None,
+        domain: str | None = None,
+        tags: list[str] | None = None,
+        query: str = "",
+        min_confidence: float = 0.0,
+        limit: int = 10,
+    ) -> list[Fact]:
+        join, order = "", "facts.rowid"
+        where: list[str] = []
+        params: list[Any] = []
+        if query:
+            join, clause, param = _text_search(
+                self._db, "facts", "facts_fts", query
+            )
+            if join:
+                order = "fts_rank, facts.rowid"
+            else:
+                where.append(clause)
+            params.append(param)
+        if entity:
+            where.append("entity = ?")
+            params.append(entity)
+        if domain:
+            where.append("domain = ?")
+            params.append(domain)
+        if tags:
+            where.append(_tag_clause("facts.id", "fact_tags", "fact_id", tags))
+            params.extend(tags)
+        if min_confidence > 0:
+            where.append("confidence >= ?")
+            params.append(min_confidence)
+        sql = "SELECT data FROM facts" + join
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order} LIMIT ?"
+        params.append(limit)
+        with self._db.read() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [_load_fact(r[0]) for r in rows]
+
+    def update(self, fact: Fact) -> None:
+        self.store(fact)
+
+    def change_count(self) -> int:
+        return self._db.change_count("facts")
+
+    def delete(self, fact_id: str) -> None:
+        with self._db.write() as conn:
+            conn.execute("DELETE FROM facts WHERE id = ?", (fact_id,))
+            conn.execute("DELETE FROM fact_tags WHERE fact_id = ?", (fact_id,))
+            if self._db.fts:
+                conn.execute("DELETE FROM facts_fts WHERE id = ?", (fact_id,))
+
+
+class SQLiteEpisodicStore:
+    """EpisodicStore backed by SQLite. Results newest-first.
+
+    batch_size > 1 buffers store() calls and writes them in one transaction
+    when the buffer fills. Queries flush first, so reads always see prior
+    writes; call flush() (or close()) before shutdown.
+    """
+
+    def __init__(
+        self, db: SQLiteMemoryDB | str = ":memory:", batch_size: int = 1
+    ) -> None:
+        self._db = _resolve_db(db)
+        self.batch_size = batch_size
+        self._pending: list[Episode] = []
+        self._pending_lock = threading.Lock()
+
+    def store(self, episode: Episode) -> None:
+        with self._pending_lock:
+            self._pending.append(episode)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def store_many(self, episodes: list[Episode]) -> None:
+        """Write several episodes in a single transaction."""
+        with self._db.write() as conn:
+            for episode in episodes:
+                cursor = conn.execute(
+                    "INSERT INTO episodes"
+                    " (id, agent_id, entity, domain, ts, data)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        episode.id, episode.agent_id, episode.entity,
+                        episode.domain, episode.timestamp.timestamp(),
+                        _dump(episode),
+                    ),
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO episode_tags (tag, seq)"
+                    " VALUES (?, ?)",
+                    [(tag, cursor.lastrowid) for tag in episode.tags],
+                )
+
+    def flush(self) -> None:
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if pending:
+            self.store_many(pending)
+
+    def query(
+        self,
+        agent_id: str,
+        entity: str | None = None,
+        domain: str | None = None,
+        tags: list[str] | None = None,
+        since: datetime | None = None,
+        limit: int = 50,
+    ) -> list[Episode]:
+        self.flush()
+        where = ["agent_id = ?"]
+        params: list[Any] = [agent_id]
+        if entity:
+            where.append("entity = ?")
+            params.append(entity)
+        if domain:
+            where.append("domain = ?")
+            params.append(domain)
+        if tags:
+            where.append(_tag_clause("seq", "episode_tags", "seq", tags))
+            params.extend(tags)
+        if since:
+            where.append("ts >= ?")
+            params.append(since.timestamp())
+        params.append(limit)
+        sql = (
+            "SELECT data FROM episodes WHERE " + " AND ".join(where)
+            + " ORDER BY ts DESC, seq DESC LIMIT ?"
+        )
+        with self._db.read() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [_load_episode(r[0]) for r in rows]
+
+    def close(self) -> None:
+        self.flush()
+
+
+class SQLiteInsightStore:
+    """InsightStore backed by SQLite.
+
+    Results newest-first by created_at; query= results most relevant first.
+    """
+
+    def __init__(self, db: SQLiteMemoryDB | str = ":memory:") -> None:
+        self._db = _resolve_db(db)
+
+    def store(self, insight: Insight) -> None:
+        with self._db.write() as conn:
+            conn.execute(
+                "INSERT INTO insights"
+                " (id, agent_id, entity, domain, created_at, data)"
+                " VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(id) DO UPDATE SET agent_id = excluded.agent_id,"
+                " entity = excluded.entity, domain = excluded.domain,"
+                " created_at = excluded.created_at, data = excluded.data",
+                (
+                    insight.id, insight.agent_id, insight.entity,
+                    insight.domain, insight.created_at.timestamp(),
+                    _dump(insight),
+                ),
+            )
+            conn.execute(
+                "DELETE FROM insight_tags WHERE insight_id = ?", (insight.id,)
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO insight_tags (tag, insight_id)"
+                " VALUES (?, ?)",
+                [(tag, insight.id) for tag in insight.tags],
+            )
+            if self._db.fts:
+                conn.execute(
+                    "DELETE FROM insights_fts WHERE id = ?", (insight.id,)
+                )
+                conn.execute(
+                    "INSERT INTO insights_fts (id, content) VALUES (?, ?)",
+                    (insight.id, insight.content),
+                )
+
+    def query(
+        self,
+        agent_id: str,
+        entity: str | None = None,
+        domain: str | None = None,
+        tags: list[str] | None = None,
+        query: str = "",
+        limit: int = 10,
+    ) -> list[Insight]:
+        join, order = "", "created_at DESC, insights.rowid DESC"
+        where: list[str] = []
+        params: list[Any] = []
+        if query:
+            join, clause, param = _text_search(
+                self._db, "insights", "insights_fts", query
+            )
+            if join:
+                order = "fts_rank, " + order
+            else:
+                where.append(clause)
+            params.append(param)
+        where.append("agent_id = ?")
+        params.append(agent_id)
+        if entity:
+            where.append("entity = ?")
+            params.append(entity)
+        if domain:
+            where.append("domain = ?")
+            params.append(domain)
+        if tags:
+            where.append(
+                _tag_clause("insights.id", "insight_tags", "insight_id", tags)
+            )
+            params.extend(tags)
+        params.append(limit)
+        sql = (
+            "SELECT data FROM insights" + join + " WHERE "
+            + " AND ".join(where) + f" ORDER BY {order} LIMIT ?"
+        )
+        with self._db.read() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [_load_insight(r[0]) for r in rows]
+
+    def update(self, insight: Insight) -> None:
+        self.store(insight)
+
+    def change_count(self) -> int:
+        return self._db.change_count("insights")
+
+    def find_similar(self, agent_id: str, content: str) -> Insight | None:
+        q_words = set(content.lower().split())
+        sql = (
+            "SELECT json_extract(data, '$.content'), data FROM insights"
+            " WHERE agent_id = ?"
+        )
+        params: list[Any] = [agent_id]
+        # A match needs min(3, n) shared words; when short words alone can't
+        # reach that, trigram FTS can narrow to insights sharing a 3+ char word.
+        words = [w for w in q_words if len(w) >= 3]
+        if self._db.fts and len(q_words) - len(words) < min(3, len(q_words)):
+            sql += (
+                " AND id IN (SELECT id FROM insights_fts"
+                " WHERE content MATCH ?)"
+            )
+            params.append(" OR ".join(
+                '"' + w.replace('"', '""') + '"' for w in words
+            ))
+        with self._db.read() as conn:
+            rows = conn.execute(sql + " ORDER BY rowid", params).fetchall()
+        for text, data in rows:
+            # Simple word overlap similarity (same rule as InMemoryInsightStore)
+            overlap = len(q_words & set(text.lower().split()))
+            if overlap >= min(3, len(q_words)):
+                return _load_insight(data)
+        return None
@@ -33,7 +33,7 @@ class FactStore(Protocol):
 
 @runtime_checkable
 class EpisodicStore(Protocol):
-    """Protocol for L2 episode storage."""
+    """Protocol for L2 episode storage. query() returns newest first."""
 
     def store(self, episode: Episode) -> None: ...
 
@@ -50,7 +50,7 @@ class EpisodicStore(Protocol):
 
 @runtime_checkable
 class InsightStore(Protocol):
-    """Protocol for L3 insight storage."""
+    """Protocol for L3 insight storage. query() returns newest first."""
 
     def store(self, insight: Insight) -> None: ...
 
@@ -67,3 +67,13 @@ class InsightStore(Protocol):
     def update(self, insight: Insight) -> None: ...
 
     def find_similar(self, agent_id: str, content: str) -> Insight | None: ...
+
+
+def store_change_count(store: object) -> int | None:
+    """Store-level write counter, for stores other processes can also write.
+
+    Such stores (SQLite) implement change_count(); process-local stores
+    don't, and their writes are counted by the caller instead.
+    """
+    change_count = getattr(store, "change_count", None)
+    return change_count() if change_count is not None else None
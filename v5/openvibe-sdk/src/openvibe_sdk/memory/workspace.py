@@ -6,7 +6,7 @@ from datetime import datetime, timezone
 
 from openvibe_sdk.memory.access import ClearanceProfile
 from openvibe_sdk.memory.in_memory import InMemoryFactStore
-from openvibe_sdk.memory.stores import FactStore
+from openvibe_sdk.memory.stores import FactStore, store_change_count
 from openvibe_sdk.memory.types import Fact
 
 
@@ -19,9 +19,20 @@ class WorkspaceMemory:
 
     def __init__(self, fact_store: FactStore | None = None) -> None:
         self._store: FactStore = fact_store or InMemoryFactStore()
+        self._writes = 0
+
+    @property
+    def version(self) -> tuple[int, int | None]:
+        """Changes on every fact write; keys assembler caches.
+
+        Stores shared with other processes (SQLite) expose change_count(),
+        which also counts writes made elsewhere.
+        """
+        return (self._writes, store_change_count(self._store))
 
     def store_fact(self, fact: Fact) -> None:
         self._store.store(fact)
+        self._writes += 1
 
     def query(
         self,
@@ -31,6 +42,7 @@ class WorkspaceMemory:
         tags: list[str] | None = None,
         query: str = "",
         limit: int = 10,
+        track_access: bool = True,
     ) -> list[Fact]:
         # Over-fetch to account for filtering
         candidates = self._store.query(
@@ -41,12 +53,17 @@ class WorkspaceMemory:
             limit=limit * 3,
         )
         filtered = [f for f in candidates if clearance.can_access(f)]
-        # Track access
+        if track_access:
+            self.record_access(filtered[:limit])
+        return filtered[:limit]
+
+    def record_access(self, facts: list[Fact]) -> None:
+        """Bump access_count/last_accessed for facts actually used."""
         now = datetime.now(timezone.utc)
-        for f in filtered[:limit]:
+        for f in facts:
             f.access_count += 1
             f.last_accessed = now
-        return filtered[:limit]
 
     def update_fact(self, fact: Fact) -> None:
         self._store.update(fact)
+        self._writes += 1
@@ -243,3 +243,11 @@ class RoleInstance(BaseModel):
     template_id: str
     soul: dict[str, Any] = Field(default_factory=dict)
     capabilities: list[str] = Field(default_factory=list)
+
+
+class MemoryConfig(BaseModel):
+    """Memory store backend selection for RoleRuntime."""
+
+    backend: str = "in_memory"  # "in_memory" | "sqlite"
+    path: str = ":memory:"  # sqlite database file
+    episode_batch_size: int = 1
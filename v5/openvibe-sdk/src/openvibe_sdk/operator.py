@@ -1,11 +1,21 @@
-"""Operator base class + @llm_node and @agent_node decorators."""
+"""Operator base class + @llm_node and @agent_node decorators.
+
+async_llm_node / async_agent_node are coroutine variants for graphs run
+with ``ainvoke`` — the LLM round-trip is awaited instead of holding a thread.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import functools
+import inspect
 import json
+import queue
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeout
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from typing import Any
 
@@ -46,21 +56,17 @@ def llm_node(
     def decorator(method: Any) -> Any:
         @functools.wraps(method)
         def wrapper(self: Operator, state: dict) -> dict:
-            system_prompt = (method.__doc__ or "").strip()
             user_message = method(self, state)
-
-            # Resolve memory scope and assemble context
-            resolved_scope = None
-            if memory_scope:
-                resolved_scope = _resolve_scope(memory_scope, state)
-                assembler = getattr(self, "_memory_assembler", None)
-                if assembler:
-                    context = assembler.assemble(resolved_scope)
-                    system_prompt = f"{system_prompt}\n\n{context}"
+            system_prompt, cache_prefix, resolved_scope = _build_system_prompt(
+                self, method, memory_scope, state
+            )
 
             t0 = time.monotonic()
-            response = self.llm.call(
+            response = _call_llm(
+                self.llm,
+                method.__name__,
                 system=system_prompt,
+                cache_prefix=cache_prefix,
                 messages=[{"role": "user", "content": user_message}],
                 model=model,
                 max_tokens=max_tokens,
@@ -74,8 +80,15 @@ def llm_node(
                 state[output_key] = result
 
             # Record episode
+            cache_stats: dict = {}
+            _count_cache(cache_stats, response)
             _record_episode(
-                self, method.__name__, resolved_scope, response, duration_ms
+                self,
+                method.__name__,
+                resolved_scope,
+                response,
+                duration_ms,
+                _node_outcome([], cache_stats),
             )
 
             return state
@@ -92,6 +105,38 @@ def llm_node(
     return decorator
 
 
+def _call_llm(llm: Any, node_name: str, **kwargs: Any) -> Any:
+    """One LLM call for a node; streamed to the active stream_to() sink."""
+    from openvibe_sdk.llm import call_llm, current_stream_sink, stream_llm
+
+    sink = current_stream_sink()
+    if sink is None:
+        return call_llm(llm, **kwargs)
+    response = None
+    for event in stream_llm(llm, **kwargs):
+        event.node = node_name
+        if event.type == "done":
+            response = event.response
+        sink(event)
+    return response
+
+
+async def _acall_llm(llm: Any, node_name: str, **kwargs: Any) -> Any:
+    """Async _call_llm: acall, or astream into the active sink."""
+    from openvibe_sdk.llm import acall_llm, astream_llm, current_stream_sink
+
+    sink = current_stream_sink()
+    if sink is None:
+        return await acall_llm(llm, **kwargs)
+    response = None
+    async for event in astream_llm(llm, **kwargs):
+        event.node = node_name
+        if event.type == "done":
+            response = event.response
+        sink(event)
+    return response
+
+
 def _try_json_parse(text: str) -> Any:
     """Try to parse text as JSON; return raw string on failure."""
     try:
@@ -100,6 +145,42 @@ def _try_json_parse(text: str) -> Any:
         return text
 
 
+def _build_system_prompt(
+    operator: Operator, method: Any, memory_scope: dict | None, state: dict
+) -> tuple[str, str, dict | None]:
+    """Docstring system prompt + assembled memory context.
+
+    Returns (system_prompt, cache_prefix, resolved_scope). cache_prefix is
+    the docstring — the part that is identical on every call — so memory
+    context stays in the uncached suffix.
+    """
+    docstring = (method.__doc__ or "").strip()
+    system_prompt = docstring
+    resolved_scope = None
+    if memory_scope:
+        resolved_scope = _resolve_scope(memory_scope, state)
+        assembler = getattr(operator, "_memory_assembler", None)
+        if assembler:
+            context = assembler.assemble(resolved_scope)
+            system_prompt = f"{system_prompt}\n\n{context}"
+    return system_prompt, docstring, resolved_scope
+
+
+async def _abuild_system_prompt(
+    operator: Operator, method: Any, memory_scope: dict | None, state: dict
+) -> tuple[str, str, dict | None]:
+    """_build_system_prompt for coroutine nodes.
+
+    Memory assembly reads the stores (SQLite: blocking queries), so it runs
+    in a worker thread to keep the event loop free.
+    """
+    if memory_scope and getattr(operator, "_memory_assembler", None):
+        return await asyncio.to_thread(
+            _build_system_prompt, operator, method, memory_scope, state
+        )
+    return _build_system_prompt(operator, method, memory_scope, state)
+
+
 def _resolve_scope(memory_scope: dict, state: dict) -> dict:
     """Resolve a memory_scope dict, calling any callables with state."""
     resolved = {}
@@ -114,6 +195,7 @@ def _record_episode(
     resolved_scope: dict | None,
     response: Any,
     duration_ms: int,
+    outcome: dict | None = None,
 ) -> None:
     """Record an Episode via the operator's _episode_recorder if set."""
     recorder = getattr(operator, "_episode_recorder", None)
@@ -131,7 +213,7 @@ def _record_episode(
         action=node_name,
         input_summary="",
         output_summary=response.content[:200] if response.content else "",
-        outcome={},
+        outcome=outcome or {},
         duration_ms=duration_ms,
         tokens_in=getattr(response, "tokens_in", 0),
         tokens_out=getattr(response, "tokens_out", 0),
@@ -142,6 +224,271 @@ def _record_episode(
     recorder(episode)
 
 
+async def _arecord_episode(
+    operator: Operator,
+    node_name: str,
+    resolved_scope: dict | None,
+    response: Any,
+    duration_ms: int,
+    outcome: dict | None = None,
+) -> None:
+    """_record_episode for coroutine nodes; the store write runs in a thread."""
+    if getattr(operator, "_episode_recorder", None) and response:
+        await asyncio.to_thread(
+            _record_episode, operator, node_name, resolved_scope, response,
+            duration_ms, outcome,
+        )
+
+
+def _assistant_message(response: Any) -> dict:
+    """Build the assistant message (text + tool_use blocks) for a tool turn."""
+    assistant_content: list[dict] = []
+    if response.content:
+        assistant_content.append({"type": "text", "text": response.content})
+    for tc in response.tool_calls:
+        assistant_content.append(
+            {
+                "type": "tool_use",
+                "id": tc.id,
+                "name": tc.name,
+                "input": tc.input,
+            }
+        )
+    return {"role": "assistant", "content": assistant_content}
+
+
+def _tool_result(tc: Any, content: str) -> dict:
+    return {"type": "tool_result", "tool_use_id": tc.id, "content": content}
+
+
+def _execute_tool(tool_functions: dict, tc: Any) -> str:
+    """Run one tool call. Errors are returned to the LLM, never raised."""
+    func = tool_functions.get(tc.name)
+    if not func:
+        return f"Unknown tool: {tc.name}"
+    try:
+        return str(func(**tc.input))
+    except Exception as e:
+        return f"Error: {e}"
+
+
+def _tool_timing(
+    tc: Any, latency_ms: int, timed_out: bool = False, not_run: bool = False
+) -> dict:
+    return {
+        "tool_use_id": tc.id,
+        "name": tc.name,
+        "latency_ms": latency_ms,
+        "timed_out": timed_out,
+        "not_run": not_run,
+    }
+
+
+def _timed_execute(tool_functions: dict, tc: Any) -> tuple[str, dict]:
+    t0 = time.monotonic()
+    content = _execute_tool(tool_functions, tc)
+    return content, _tool_timing(tc, int((time.monotonic() - t0) * 1000))
+
+
+def _timeout_outcome(tc: Any, tool_timeout: float) -> tuple[str, dict]:
+    return (
+        f"Error: tool '{tc.name}' timed out after {tool_timeout}s",
+        _tool_timing(tc, int(tool_timeout * 1000), timed_out=True),
+    )
+
+
+def _not_run_outcome(tc: Any) -> tuple[str, dict]:
+    return (
+        f"Error: tool '{tc.name}' was not run: every worker was held by a "
+        "timed-out tool",
+        _tool_timing(tc, 0, not_run=True),
+    )
+
+
+def _run_pooled(
+    tool_functions: dict,
+    tool_calls: list,
+    workers: int,
+    tool_timeout: float | None,
+) -> list[tuple[str, dict]]:
+    """Run tool calls on a pool of workers threads, all submitted at once.
+
+    Each tool's timeout runs from when a worker picks it up, not from
+    submission, so tools queued behind max_concurrency get their full time.
+    A timed-out tool keeps its worker until it returns; once every worker
+    is held that way, tools still queued are cancelled and reported as
+    not run.
+    """
+    events: queue.Queue[tuple[str, int]] = queue.Queue()
+
+    def run(i: int, tc: Any) -> tuple[str, dict]:
+        events.put(("start", i))
+        return _timed_execute(tool_functions, tc)
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = []
+        for i, tc in enumerate(tool_calls):
+            future = pool.submit(run, i, tc)
+            future.add_done_callback(lambda _, i=i: events.put(("done", i)))
+            futures.append(future)
+
+        outcomes: list = [None] * len(tool_calls)
+        deadlines: dict[int, float] = {}  # running tools
+        held: set[int] = set()  # timed out, still occupying a worker
+        pending = len(tool_calls)
+        while pending:
+            timeout = (
+                max(0.0, min(deadlines.values()) - time.monotonic())
+                if deadlines else None
+            )
+            try:
+                kind, i = events.get(timeout=timeout)
+            except queue.Empty:
+                kind, i = "tick", -1
+            if kind == "start" and outcomes[i] is None and tool_timeout is not None:
+                deadlines[i] = time.monotonic() + tool_timeout
+            elif kind == "done":
+                held.discard(i)
+                if outcomes[i] is None:
+                    deadlines.pop(i, None)
+                    outcomes[i] = futures[i].result()
+                    pending -= 1
+
+            now = time.monotonic()
+            for j, deadline in list(deadlines.items()):
+                if deadline <= now:
+                    del deadlines[j]
+                    held.add(j)
+                    outcomes[j] = _timeout_outcome(tool_calls[j], tool_timeout)
+                    pending -= 1
+            if len(held) >= workers:
+                for j, future in enumerate(futures):
+                    if outcomes[j] is None and future.cancel():
+                        outcomes[j] = _not_run_outcome(tool_calls[j])
+                        pending -= 1
+        return outcomes
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_tools(
+    tool_functions: dict,
+    tool_calls: list,
+    parallel: bool = False,
+    max_concurrency: int | None = None,
+    tool_timeout: float | None = None,
+) -> tuple[list[dict], list[dict]]:
+    """Execute one turn of tool calls.
+
+    Returns (tool_result blocks, per-tool timings), both in tool_use order.
+    parallel=True dispatches on a thread pool capped at max_concurrency.
+    tool_timeout abandons a tool that has not finished within that many
+    seconds of starting — the worker thread is left to finish on its own,
+    the LLM gets an error.
+    """
+    if parallel:
+        workers = len(tool_calls)
+        if max_concurrency:
+            workers = min(workers, max_concurrency)
+        outcomes = _run_pooled(tool_functions, tool_calls, workers, tool_timeout)
+    elif tool_timeout is None:
+        outcomes = [_timed_execute(tool_functions, tc) for tc in tool_calls]
+    else:
+        pool = ThreadPoolExecutor(max_workers=len(tool_calls))
+        try:
+            # One at a time; an abandoned tool keeps its own worker so the
+            # next one still starts.
+            outcomes = []
+            for tc in tool_calls:
+                future = pool.submit(_timed_execute, tool_functions, tc)
+                try:
+                    outcomes.append(future.result(timeout=tool_timeout))
+                except FuturesTimeout:
+                    outcomes.append(_timeout_outcome(tc, tool_timeout))
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    results = [
+        _tool_result(tc, content)
+        for tc, (content, _) in zip(tool_calls, outcomes)
+    ]
+    return results, [timing for _, timing in outcomes]
+
+
+def _count_cache(cache_stats: dict, response: Any) -> None:
+    """Tally a response-cache hit/miss (LLMResponse.cache_status)."""
+    status = getattr(response, "cache_status", "")
+    if status in ("hit", "miss"):
+        key = "hits" if status == "hit" else "misses"
+        cache_stats[key] = cache_stats.get(key, 0) + 1
+
+
+def _node_outcome(tool_timings: list[dict], cache_stats: dict) -> dict:
+    """Episode outcome: per-tool timings + response-cache hits/misses."""
+    outcome: dict = {}
+    if tool_timings:
+        outcome["tool_calls"] = tool_timings
+    if cache_stats:
+        outcome["response_cache"] = {
+            "hits": cache_stats.get("hits", 0),
+            "misses": cache_stats.get("misses", 0),
+        }
+    return outcome
+
+
+async def _aexecute_tool(tool_functions: dict, tc: Any) -> str:
+    """Async _execute_tool: awaits coroutine tools, threads sync ones."""
+    func = tool_functions.get(tc.name)
+    if not func:
+        return f"Unknown tool: {tc.name}"
+    try:
+        if inspect.iscoroutinefunction(func):
+            result = await func(**tc.input)
+        else:
+            result = await asyncio.to_thread(func, **tc.input)
+        return str(result)
+    except Exception as e:
+        return f"Error: {e}"
+
+
+async def _arun_tools(
+    tool_functions: dict,
+    tool_calls: list,
+    parallel: bool = False,
+    max_concurrency: int | None = None,
+    tool_timeout: float | None = None,
+) -> tuple[list[dict], list[dict]]:
+    """Async _run_tools: asyncio.gather under a semaphore when parallel."""
+    semaphore = (
+        asyncio.Semaphore(max_concurrency)
+        if parallel and max_concurrency else None
+    )
+
+    async def run_one(tc: Any) -> tuple[str, dict]:
+        async with semaphore or nullcontext():
+            t0 = time.monotonic()
+            try:
+                content = await asyncio.wait_for(
+                    _aexecute_tool(tool_functions, tc), tool_timeout
+                )
+            except asyncio.TimeoutError:
+                return _timeout_outcome(tc, tool_timeout)
+            latency_ms = int((time.monotonic() - t0) * 1000)
+            return content, _tool_timing(tc, latency_ms)
+
+    if parallel:
+        outcomes = await asyncio.gather(*(run_one(tc) for tc in tool_calls))
+    else:
+        outcomes = [await run_one(tc) for tc in tool_calls]
+
+    results = [
+        _tool_result(tc, content)
+        for tc, (content, _) in zip(tool_calls, outcomes)
+    ]
+    return results, [timing for _, timing in outcomes]
+
+
 def agent_node(
     tools: list | None = None,
     model: str = "sonnet",
@@ -150,6 +497,9 @@ def agent_node(
     output_key: str | None = None,
     max_steps: int | None = None,
     memory_scope: dict | None = None,
+    parallel_tools: bool = False,
+    max_concurrency: int | None = None,
+    tool_timeout: float | None = None,
 ) -> Any:
     """Decorator: Pi-style agent loop.
 
@@ -157,7 +507,11 @@ def agent_node(
     - Loops until LLM responds with text (no tool calls)
     - Optional max_steps safety valve
     - memory_scope = optional dict for memory assembly + episode recording
+    - parallel_tools = run one turn's tool calls concurrently (thread pool,
+      capped at max_concurrency); tool_timeout = seconds per tool call
+    - Per-tool latency is recorded on episode.outcome["tool_calls"]
     """
+    from openvibe_sdk.llm import call_llm
     from openvibe_sdk.tools import function_to_schema
 
     tool_functions = {t.__name__: t for t in (tools or [])}
@@ -166,31 +520,28 @@ def agent_node(
     def decorator(method: Any) -> Any:
         @functools.wraps(method)
         def wrapper(self: Operator, state: dict) -> dict:
-            system_prompt = (method.__doc__ or "").strip()
             user_message = method(self, state)
-
-            # Resolve memory scope and assemble context
-            resolved_scope = None
-            if memory_scope:
-                resolved_scope = _resolve_scope(memory_scope, state)
-                assembler = getattr(self, "_memory_assembler", None)
-                if assembler:
-                    context = assembler.assemble(resolved_scope)
-                    system_prompt = f"{system_prompt}\n\n{context}"
+            system_prompt, cache_prefix, resolved_scope = _build_system_prompt(
+                self, method, memory_scope, state
+            )
 
             messages: list[dict] = [
                 {"role": "user", "content": user_message}
             ]
             steps = 0
             last_response = None
+            tool_timings: list[dict] = []
+            cache_stats: dict = {}
             t0 = time.monotonic()
 
             while True:
                 if max_steps is not None and steps >= max_steps:
                     break
 
-                response = self.llm.call(
+                response = call_llm(
+                    self.llm,
                     system=system_prompt,
+                    cache_prefix=cache_prefix,
                     messages=messages,
                     model=model,
                     max_tokens=max_tokens,
@@ -198,6 +549,7 @@ def agent_node(
                     tools=tool_schemas or None,
                 )
                 last_response = response
+                _count_cache(cache_stats, response)
 
                 if not response.tool_calls:
                     result = _try_json_parse(response.content)
@@ -211,46 +563,21 @@ def agent_node(
                         resolved_scope,
                         response,
                         duration_ms,
+                        _node_outcome(tool_timings, cache_stats),
                     )
                     return state
 
-                # Build assistant message with tool_use blocks
-                assistant_content: list[dict] = []
-                if response.content:
-                    assistant_content.append(
-                        {"type": "text", "text": response.content}
-                    )
-                for tc in response.tool_calls:
-                    assistant_content.append(
-                        {
-                            "type": "tool_use",
-                            "id": tc.id,
-                            "name": tc.name,
-                            "input": tc.input,
-                        }
-                    )
-                messages.append(
-                    {"role": "assistant", "content": assistant_content}
-                )
+                messages.append(_assistant_message(response))
 
                 # Execute tools and build tool_result message
-                tool_results: list[dict] = []
-                for tc in response.tool_calls:
-                    func = tool_functions.get(tc.name)
-                    if func:
-                        try:
-                            tool_result = func(**tc.input)
-                        except Exception as e:
-                            tool_result = f"Error: {e}"
-                    else:
-                        tool_result = f"Unknown tool: {tc.name}"
-                    tool_results.append(
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": tc.id,
-                            "content": str(tool_result),
-                        }
-                    )
+                tool_results, timings = _run_tools(
+                    tool_functions,
+                    response.tool_calls,
+                    parallel=parallel_tools,
+                    max_concurrency=max_concurrency,
+                    tool_timeout=tool_timeout,
+                )
+                tool_timings.extend(timings)
                 messages.append({"role": "user", "content": tool_results})
 
                 steps += 1
@@ -266,6 +593,200 @@ def agent_node(
                 resolved_scope,
                 last_response,
                 duration_ms,
+                _node_outcome(tool_timings, cache_stats),
+            )
+            return state
+
+        wrapper._is_agent_node = True
+        wrapper._node_config = {
+            "model": model,
+            "tools": [t.__name__ for t in (tools or [])],
+            "output_key": output_key,
+            "max_steps": max_steps,
+            "memory_scope": memory_scope,
+            "parallel_tools": parallel_tools,
+            "max_concurrency": max_concurrency,
+            "tool_timeout": tool_timeout,
+        }
+        return wrapper
+
+    return decorator
+
+
+async def _user_message(method: Any, operator: Operator, state: dict) -> Any:
+    """Call the decorated method; await it if it is a coroutine function."""
+    result = method(operator, state)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def async_llm_node(
+    model: str = "haiku",
+    temperature: float = 0.7,
+    max_tokens: int = 4096,
+    output_key: str | None = None,
+    memory_scope: dict | None = None,
+) -> Any:
+    """Decorator: single LLM call as a native coroutine.
+
+    Same contract as @llm_node. The decorated method may be sync or async.
+    Uses self.llm.acall when available, else runs self.llm.call in a thread.
+    """
+
+    def decorator(method: Any) -> Any:
+        @functools.wraps(method)
+        async def wrapper(self: Operator, state: dict) -> dict:
+            user_message = await _user_message(method, self, state)
+            prompt = await _abuild_system_prompt(
+                self, method, memory_scope, state
+            )
+            system_prompt, cache_prefix, resolved_scope = prompt
+
+            t0 = time.monotonic()
+            response = await _acall_llm(
+                self.llm,
+                method.__name__,
+                system=system_prompt,
+                cache_prefix=cache_prefix,
+                messages=[{"role": "user", "content": user_message}],
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+            duration_ms = int((time.monotonic() - t0) * 1000)
+
+            result = _try_json_parse(response.content)
+
+            if output_key:
+                state[output_key] = result
+
+            cache_stats: dict = {}
+            _count_cache(cache_stats, response)
+            await _arecord_episode(
+                self,
+                method.__name__,
+                resolved_scope,
+                response,
+                duration_ms,
+                _node_outcome([], cache_stats),
+            )
+
+            return state
+
+        wrapper._is_llm_node = True
+        wrapper._node_config = {
+            "model": model,
+            "temperature": temperature,
+            "output_key": output_key,
+            "memory_scope": memory_scope,
+            "is_async": True,
+        }
+        return wrapper
+
+    return decorator
+
+
+def async_agent_node(
+    tools: list | None = None,
+    model: str = "sonnet",
+    temperature: float = 0.7,
+    max_tokens: int = 4096,
+    output_key: str | None = None,
+    max_steps: int | None = None,
+    memory_scope: dict | None = None,
+    parallel_tools: bool = False,
+    max_concurrency: int | None = None,
+    tool_timeout: float | None = None,
+) -> Any:
+    """Decorator: Pi-style agent loop as a native coroutine.
+
+    Same contract as @agent_node. Tools may be plain functions (run in a
+    worker thread) or coroutine functions (awaited directly).
+    """
+    from openvibe_sdk.llm import acall_llm
+    from openvibe_sdk.tools import function_to_schema
+
+    tool_functions = {t.__name__: t for t in (tools or [])}
+    tool_schemas = [function_to_schema(t) for t in (tools or [])]
+
+    def decorator(method: Any) -> Any:
+        @functools.wraps(method)
+        async def wrapper(self: Operator, state: dict) -> dict:
+            user_message = await _user_message(method, self, state)
+            prompt = await _abuild_system_prompt(
+                self, method, memory_scope, state
+            )
+            system_prompt, cache_prefix, resolved_scope = prompt
+
+            messages: list[dict] = [
+                {"role": "user", "content": user_message}
+            ]
+            steps = 0
+            last_response = None
+            tool_timings: list[dict] = []
+            cache_stats: dict = {}
+            t0 = time.monotonic()
+
+            while True:
+                if max_steps is not None and steps >= max_steps:
+                    break
+
+                response = await acall_llm(
+                    self.llm,
+                    system=system_prompt,
+                    cache_prefix=cache_prefix,
+                    messages=messages,
+                    model=model,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    tools=tool_schemas or None,
+                )
+                last_response = response
+                _count_cache(cache_stats, response)
+
+                if not response.tool_calls:
+                    result = _try_json_parse(response.content)
+                    if output_key:
+                        state[output_key] = result
+
+                    duration_ms = int((time.monotonic() - t0) * 1000)
+                    await _arecord_episode(
+                        self,
+                        method.__name__,
+                        resolved_scope,
+                        response,
+                        duration_ms,
+                        _node_outcome(tool_timings, cache_stats),
+                    )
+                    return state
+
+                messages.append(_assistant_message(response))
+
+                tool_results, timings = await _arun_tools(
+                    tool_functions,
+                    response.tool_calls,
+                    parallel=parallel_tools,
+                    max_concurrency=max_concurrency,
+                    tool_timeout=tool_timeout,
+                )
+                tool_timings.extend(timings)
+                messages.append({"role": "user", "content": tool_results})
+
+                steps += 1
+
+            # max_steps reached — use last response
+            if last_response and output_key:
+                state[output_key] = last_response.content
+
+            duration_ms = int((time.monotonic() - t0) * 1000)
+            await _arecord_episode(
+                self,
+                method.__name__,
+                resolved_scope,
+                last_response,
+                duration_ms,
+                _node_outcome(tool_timings, cache_stats),
             )
             return state
 
@@ -276,6 +797,10 @@ def agent_node(
             "output_key": output_key,
             "max_steps": max_steps,
             "memory_scope": memory_scope,
+            "parallel_tools": parallel_tools,
+            "max_concurrency": max_concurrency,
+            "tool_timeout": tool_timeout,
+            "is_async": True,
         }
         return wrapper
 
@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, AsyncIterator, Iterator
 
-from openvibe_sdk.llm import LLMProvider, LLMResponse
+from openvibe_sdk.llm import (
+    LLMProvider, LLMResponse, StreamEvent, acall_llm, astream_llm, call_llm,
+    stream_llm,
+)
+from openvibe_sdk.llm.ratelimit import Priority, llm_context
 from openvibe_sdk.memory.access import ClearanceProfile
 from openvibe_sdk.memory.agent_memory import AgentMemory
 from openvibe_sdk.memory.assembler import MemoryAssembler
@@ -19,15 +23,84 @@ from openvibe_sdk.operator import Operator
 
 
 class _RoleAwareLLM:
-    """LLM wrapper that injects Role identity and memory into every call."""
+    """LLM wrapper that injects Role identity and memory into every call.
+
+    The soul is prepended to both the system prompt and its cache_prefix,
+    so soul + docstring form the stable, cacheable prefix.
+    """
 
     def __init__(self, role: Role, inner: LLMProvider) -> None:
         self._role = role
         self._inner = inner
 
     def call(
-        self, *, system: str, messages: list[dict], **kwargs: Any
+        self,
+        *,
+        system: str,
+        messages: list[dict],
+        cache_prefix: str = "",
+        **kwargs: Any,
+    ) -> LLMResponse:
+        augmented_system = self._augment(system, messages)
+        return call_llm(
+            self._inner,
+            system=augmented_system,
+            messages=messages,
+            cache_prefix=self._role.build_system_prompt(cache_prefix),
+            **kwargs,
+        )
+
+    async def acall(
+        self,
+        *,
+        system: str,
+        messages: list[dict],
+        cache_prefix: str = "",
+        **kwargs: Any,
     ) -> LLMResponse:
+        augmented_system = self._augment(system, messages)
+        return await acall_llm(
+            self._inner,
+            system=augmented_system,
+            messages=messages,
+            cache_prefix=self._role.build_system_prompt(cache_prefix),
+            **kwargs,
+        )
+
+    def stream(
+        self,
+        *,
+        system: str,
+        messages: list[dict],
+        cache_prefix: str = "",
+        **kwargs: Any,
+    ) -> Iterator[StreamEvent]:
+        yield from stream_llm(
+            self._inner,
+            system=self._augment(system, messages),
+            messages=messages,
+            cache_prefix=self._role.build_system_prompt(cache_prefix),
+            **kwargs,
+        )
+
+    async def astream(
+        self,
+        *,
+        system: str,
+        messages: list[dict],
+        cache_prefix: str = "",
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamEvent]:
+        async for event in astream_llm(
+            self._inner,
+            system=self._augment(system, messages),
+            messages=messages,
+            cache_prefix=self._role.build_system_prompt(cache_prefix),
+            **kwargs,
+        ):
+            yield event
+
+    def _augment(self, system: str, messages: list[dict]) -> str:
         context = ""
         if messages:
             first_content = messages[0].get("content", "")
@@ -36,10 +109,7 @@ class _RoleAwareLLM:
                 if isinstance(first_content, str)
                 else str(first_content)
             )
-        augmented_system = self._role.build_system_prompt(system, context)
-        return self._inner.call(
-            system=augmented_system, messages=messages, **kwargs
-        )
+        return self._role.build_system_prompt(system, context)
 
 
 class Role:
@@ -95,6 +165,45 @@ class Role:
 
     def respond(self, message: str, context: str = "") -> LLMResponse:
         """Respond to a message with soul + memory context (V2 only)."""
+        system, soul_text = self._respond_prompt(message)
+        # Someone is waiting on this reply: jump rate-limit queues.
+        with llm_context(priority=Priority.INTERACTIVE):
+            response = call_llm(
+                self.llm,
+                system=system,
+                messages=[{"role": "user", "content": message}],
+                cache_prefix=soul_text,
+            )
+        self._record_response(message, response)
+        return response
+
+    def respond_stream(
+        self, message: str, context: str = ""
+    ) -> Iterator[StreamEvent]:
+        """Streaming respond: text deltas as they arrive, then "done".
+
+        The episode is recorded once the final response is in.
+        """
+        system, soul_text = self._respond_prompt(message)
+        events = stream_llm(
+            self.llm,
+            system=system,
+            messages=[{"role": "user", "content": message}],
+            cache_prefix=soul_text,
+        )
+        while True:
+            # Re-enter the context per step: consumers (e.g. an HTTP
+            # response) may pull each event from a different thread.
+            with llm_context(priority=Priority.INTERACTIVE):
+                event = next(events, None)
+            if event is None:
+                return
+            if event.type == "done":
+                self._record_response(message, event.response)
+            yield event
+
+    def _respond_prompt(self, message: str) -> tuple[str, str]:
+        """(system prompt, cacheable soul prefix) for respond."""
         if not self.llm:
             raise ValueError(f"Role '{self.role_id}' has no LLM configured")
 
@@ -109,12 +218,9 @@ class Role:
                 lines = [f"- {i.content}" for i in insights]
                 parts.append("## Knowledge\n" + "\n".join(lines))
 
-        system = "\n\n".join(parts)
-        response = self.llm.call(
-            system=system,
-            messages=[{"role": "user", "content": message}],
-        )
+        return "\n\n".join(parts), soul_text
 
+    def _record_response(self, message: str, response: LLMResponse) -> None:
         if self.agent_memory:
             self.agent_memory.record_episode(Episode(
                 id=str(uuid.uuid4()),
@@ -131,8 +237,6 @@ class Role:
                 tokens_out=getattr(response, "tokens_out", 0),
             ))
 
-        return response
-
     @property
     def memory_fs(self) -> MemoryFilesystem | None:
         """Virtual filesystem over this Role's memory. None if no agent_memory."""
@@ -6,25 +6,44 @@ These re-exports will be removed in v1.0.
 
 from __future__ import annotations
 
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator
 
+from openvibe_sdk.batch import (
+    ActivationRequest,
+    ActivationResult,
+    run_activations,
+)
 from openvibe_sdk.config import load_operator_configs
-from openvibe_sdk.llm import LLMProvider
-from openvibe_sdk.models import OperatorConfig
+from openvibe_sdk.llm import LLMProvider, StreamEvent
+from openvibe_sdk.memory.backends import create_memory_stores
+from openvibe_sdk.memory.reflection import (
+    ReflectionReport,
+    Watermark,
+    reflect_many,
+)
+from openvibe_sdk.memory.workspace import WorkspaceMemory
+from openvibe_sdk.models import MemoryConfig, OperatorConfig
 from openvibe_sdk.operator import Operator
 from openvibe_sdk.role import Role
+from openvibe_sdk.streaming import stream_graph
 
 
 class OperatorRuntime:
     """Central runtime for operators.
 
     Loads operators.yaml, indexes by ID, dispatches activations.
+    Compiled graphs are cached per (operator, workflow) unless
+    cache_graphs=False; re-registering a workflow drops its graph.
     """
 
-    def __init__(self, config_path: str | None = None) -> None:
+    def __init__(
+        self, config_path: str | None = None, cache_graphs: bool = True
+    ) -> None:
         self._config_path = config_path
         self.operators: dict[str, OperatorConfig] = {}
         self._workflow_factories: dict[str, dict[str, Callable]] = {}
+        self.cache_graphs = cache_graphs
+        self._graphs: dict[tuple[str, str], Any] = {}
 
     @classmethod
     def from_yaml(
@@ -44,6 +63,7 @@ class OperatorRuntime:
         if operator_id not in self._workflow_factories:
             self._workflow_factories[operator_id] = {}
         self._workflow_factories[operator_id][workflow_id] = factory
+        self._graphs.pop((operator_id, workflow_id), None)
 
     def get_workflow_factory(
         self, operator_id: str, workflow_id: str
@@ -65,13 +85,18 @@ class OperatorRuntime:
             raise ValueError(
                 f"Unknown trigger '{trigger_id}' for operator '{operator_id}'"
             )
-        factory = self.get_workflow_factory(operator_id, trigger.workflow)
-        if not factory:
-            raise ValueError(
-                f"No graph factory registered for "
-                f"{operator_id}/{trigger.workflow}"
-            )
-        graph = factory()
+        key = (operator_id, trigger.workflow)
+        graph = self._graphs.get(key)
+        if graph is None:
+            factory = self.get_workflow_factory(operator_id, trigger.workflow)
+            if not factory:
+                raise ValueError(
+                    f"No graph factory registered for "
+                    f"{operator_id}/{trigger.workflow}"
+                )
+            graph = factory()
+            if self.cache_graphs:
+                graph = self._graphs.setdefault(key, graph)
         return graph.invoke(input_data)
 
     def list_operators(self) -> list[OperatorConfig]:
@@ -114,6 +139,12 @@ class RoleRuntime:
 
     Workflow factories receive an Operator instance (with Role-aware LLM).
     Factory signature: (operator: Operator) -> CompiledGraph
+
+    memory: MemoryConfig (or dict) selecting a shared store backend, e.g.
+    {"backend": "sqlite", "path": "memory.db"}. Without it each role keeps
+    its own in-memory stores.
+    cache_graphs: compile each (role, operator, workflow) graph once and
+    reuse it; re-registering a workflow drops its compiled graphs.
     """
 
     def __init__(
@@ -122,12 +153,20 @@ class RoleRuntime:
         llm: LLMProvider,
         workspace: Any = None,
         scheduler: Any = None,
+        memory: MemoryConfig | dict[str, Any] | None = None,
+        cache_graphs: bool = True,
     ) -> None:
         self.llm = llm
+        self.memory_stores = create_memory_stores(memory) if memory else None
+        if self.memory_stores and workspace is None:
+            workspace = WorkspaceMemory(fact_store=self.memory_stores.facts)
         self.workspace = workspace
         self.scheduler = scheduler
         self._roles: dict[str, Role] = {}
         self._workflow_factories: dict[str, dict[str, Callable]] = {}
+        self.cache_graphs = cache_graphs
+        self._graphs: dict[tuple[str, str, str], Any] = {}
+        self._shutdown_hooks: list[Callable[[], Any]] = []
 
         for role_class in roles:
             from openvibe_sdk.memory.agent_memory import AgentMemory
@@ -135,6 +174,12 @@ class RoleRuntime:
             agent_mem = AgentMemory(
                 agent_id=role_class.role_id,
                 workspace=workspace,
+                episodic=(
+                    self.memory_stores.episodic if self.memory_stores else None
+                ),
+                insights=(
+                    self.memory_stores.insights if self.memory_stores else None
+                ),
             )
             role = role_class(llm=llm, agent_memory=agent_mem)
             self._roles[role.role_id] = role
@@ -159,6 +204,10 @@ class RoleRuntime:
         if operator_id not in self._workflow_factories:
             self._workflow_factories[operator_id] = {}
         self._workflow_factories[operator_id][workflow_id] = factory
+        for key in [
+            k for k in self._graphs if k[1:] == (operator_id, workflow_id)
+        ]:
+            self._graphs.pop(key, None)
 
     def activate(
         self,
@@ -168,6 +217,89 @@ class RoleRuntime:
         input_data: dict,
     ) -> dict:
         """Activate: Role -> Operator -> workflow -> result."""
+        graph = self._get_graph(role_id, operator_id, workflow_id)
+        return graph.invoke(input_data)
+
+    async def aactivate(
+        self,
+        role_id: str,
+        operator_id: str,
+        workflow_id: str,
+        input_data: dict,
+    ) -> dict:
+        """Async activate: runs the workflow with ``ainvoke`` on the event loop.
+
+        Use with async_llm_node/async_agent_node operators so concurrent
+        activations share one loop instead of one thread each.
+        """
+        graph = self._get_graph(role_id, operator_id, workflow_id)
+        return await graph.ainvoke(input_data)
+
+    def stream(
+        self,
+        role_id: str,
+        operator_id: str,
+        workflow_id: str,
+        input_data: dict,
+    ) -> Iterator[StreamEvent]:
+        """Activate and stream: LLM deltas per llm_node, then node outputs.
+
+        Unknown roles/workflows raise here, before the first event.
+        """
+        graph = self._get_graph(role_id, operator_id, workflow_id)
+        return stream_graph(graph, input_data)
+
+    def activate_many(
+        self,
+        requests: Iterable[ActivationRequest | dict[str, Any]],
+        max_concurrency: int = 8,
+        per_provider_limits: dict[str, int] | None = None,
+    ) -> Iterator[ActivationResult]:
+        """Run many activations concurrently; yield results as they finish.
+
+        All activations share this runtime's LLM provider, roles, and
+        compiled graphs. per_provider_limits caps concurrent activations per
+        request.provider (default: operator_id), e.g. {"meta_ad_ops": 2}.
+        Errors are returned on the result, never raised.
+        """
+        return run_activations(
+            self.activate,
+            requests,
+            max_concurrency=max_concurrency,
+            per_provider_limits=per_provider_limits,
+        )
+
+    def add_shutdown_hook(self, hook: Callable[[], Any]) -> None:
+        """Register a callback for close() (e.g. closing shared HTTP clients)."""
+        self._shutdown_hooks.append(hook)
+
+    def close(self) -> None:
+        """Run shutdown hooks, most recently added first. Safe to call twice."""
+        while self._shutdown_hooks:
+            self._shutdown_hooks.pop()()
+
+    def __enter__(self) -> RoleRuntime:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def list_roles(self) -> list[Role]:
+        """List all registered roles."""
+        return list(self._roles.values())
+
+    def clear_graph_cache(self) -> None:
+        """Drop all compiled graphs (next activation recompiles)."""
+        self._graphs.clear()
+
+    def _get_graph(
+        self, role_id: str, operator_id: str, workflow_id: str
+    ) -> Any:
+        """Compiled graph for (role, operator, workflow), built once."""
+        key = (role_id, operator_id, workflow_id)
+        graph = self._graphs.get(key)
+        if graph is not None:
+            return graph
         role = self.get_role(role_id)
         operator = role.get_operator(operator_id)
 
@@ -180,8 +312,28 @@ class RoleRuntime:
             )
 
         graph = factory(operator)
-        return graph.invoke(input_data)
+        if self.cache_graphs:
+            graph = self._graphs.setdefault(key, graph)
+        return graph
 
-    def list_roles(self) -> list[Role]:
-        """List all registered roles."""
-        return list(self._roles.values())
+    def reflect_all(
+        self,
+        batch_size: int = 20,
+        max_concurrency: int = 8,
+        watermarks: dict[str, Watermark] | None = None,
+    ) -> ReflectionReport:
+        """Incremental reflection over every role's memory (Archivist sweep).
+
+        Pass the previous report's watermarks to resume across processes.
+        """
+        memories = [
+            role.agent_memory for role in self._roles.values()
+            if role.agent_memory
+        ]
+        return reflect_many(
+            memories,
+            self.llm,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            watermarks=watermarks,
+        )
@@ -0,0 +1,47 @@
+"""Workflow streaming — run a compiled graph and yield events as they happen.
+
+RoleRuntime.stream builds on stream_graph: LLM text deltas from llm_node
+calls (tagged with the node name) arrive as they are generated, and each
+node's output follows as a "node" event when the node finishes.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Iterator
+
+from openvibe_sdk.llm import StreamEvent, stream_to
+
+_END = object()
+
+
+def stream_graph(graph: Any, input_data: dict) -> Iterator[StreamEvent]:
+    """Run graph.stream on a worker thread; yield StreamEvents in order.
+
+    Errors raised by the workflow are re-raised from the iterator. If the
+    consumer stops early the run still finishes in the background.
+    """
+    events: queue.Queue = queue.Queue()
+
+    def run() -> None:
+        try:
+            with stream_to(events.put):
+                for update in graph.stream(input_data, stream_mode="updates"):
+                    for node, output in update.items():
+                        events.put(
+                            StreamEvent(type="node", node=node, output=output)
+                        )
+        except Exception as exc:
+            events.put(exc)
+        finally:
+            events.put(_END)
+
+    threading.Thread(target=run, name="openvibe-stream", daemon=True).start()
+    while True:
+        item = events.get()
+        if item is _END:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
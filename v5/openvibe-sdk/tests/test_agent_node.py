@@ -1,6 +1,8 @@
 """Tests for @agent_node — Pi-style tool loop decorator."""
 
 import json
+import threading
+import time
 
 from openvibe_sdk.llm import LLMResponse, ToolCall
 from openvibe_sdk.operator import Operator, agent_node
@@ -165,3 +167,214 @@ def test_agent_node_unknown_tool():
     op = ResearchOp(llm=llm)
     result = op.investigate({"topic": "x"})
     assert result["findings"] == "ok"
+
+
+def _multi_tool_response(names_and_inputs):
+    return LLMResponse(
+        content="",
+        tool_calls=[
+            ToolCall(id=f"tc_{i}", name=name, input=inp)
+            for i, (name, inp) in enumerate(names_and_inputs)
+        ],
+        stop_reason="tool_use",
+    )
+
+
+def slow_report(name: str, delay: float) -> str:
+    """Fetch a slow report."""
+    time.sleep(delay)
+    return f"report:{name}"
+
+
+def test_agent_node_parallel_tools_run_concurrently_in_order():
+    class ParallelOp(Operator):
+        @agent_node(tools=[slow_report], output_key="out", parallel_tools=True)
+        def investigate(self, state):
+            """You pull reports."""
+            return "go"
+
+    llm = FakeAgentLLM([
+        _multi_tool_response([
+            ("slow_report", {"name": f"r{i}", "delay": 0.2 - i * 0.03})
+            for i in range(6)
+        ]),
+        _text_response("done"),
+    ])
+    op = ParallelOp(llm=llm)
+    t0 = time.monotonic()
+    op.investigate({})
+    elapsed = time.monotonic() - t0
+    assert elapsed < 0.5  # sequential would be ~0.75s
+    results = llm.calls[1]["messages"][-1]["content"]
+    assert [r["tool_use_id"] for r in results] == [f"tc_{i}" for i in range(6)]
+    assert [r["content"] for r in results] == [f"report:r{i}" for i in range(6)]
+
+
+def test_agent_node_max_concurrency_caps_workers():
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def tracked(n: int) -> str:
+        """Tracked tool."""
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return str(n)
+
+    class CappedOp(Operator):
+        @agent_node(
+            tools=[tracked], output_key="out",
+            parallel_tools=True, max_concurrency=2,
+        )
+        def investigate(self, state):
+            """You pull reports."""
+            return "go"
+
+    llm = FakeAgentLLM([
+        _multi_tool_response([("tracked", {"n": i}) for i in range(6)]),
+        _text_response("done"),
+    ])
+    CappedOp(llm=llm).investigate({})
+    assert active["peak"] == 2
+
+
+def test_agent_node_tool_timeout_returns_error():
+    class TimeoutOp(Operator):
+        @agent_node(
+            tools=[slow_report], output_key="out",
+            parallel_tools=True, tool_timeout=0.05,
+        )
+        def investigate(self, state):
+            """You pull reports."""
+            return "go"
+
+    llm = FakeAgentLLM([
+        _multi_tool_response([
+            ("slow_report", {"name": "fast", "delay": 0}),
+            ("slow_report", {"name": "slow", "delay": 1.0}),
+        ]),
+        _text_response("done"),
+    ])
+    TimeoutOp(llm=llm).investigate({})
+    results = llm.calls[1]["messages"][-1]["content"]
+    assert results[0]["content"] == "report:fast"
+    assert "timed out" in results[1]["content"]
+
+
+
+def test_agent_node_tool_timeout_counts_from_tool_start():
+    from openvibe_sdk.memory.types import Episode
+
+    class QueuedOp(Operator):
+        @agent_node(
+            tools=[slow_report], output_key="out",
+            parallel_tools=True, max_concurrency=1, tool_timeout=0.3,
+        )
+        def investigate(self, state):
+            """You pull reports."""
+            return "go"
+
+    recorded: list[Episode] = []
+    llm = FakeAgentLLM([
+        _multi_tool_response([
+            ("slow_report", {"name": f"r{i}", "delay": 0.1}) for i in range(4)
+        ]),
+        _text_response("done"),
+    ])
+    op = QueuedOp(llm=llm)
+    op._episode_recorder = recorded.append
+    op.investigate({})
+    # The batch takes ~0.4s, longer than tool_timeout, but no tool does
+    results = llm.calls[1]["messages"][-1]["content"]
+    assert [r["content"] for r in results] == [f"report:r{i}" for i in range(4)]
+    assert not any(t["timed_out"] for t in recorded[0].outcome["tool_calls"])
+
+
+def test_agent_node_reports_tools_queued_behind_timeouts_as_not_run():
+    from openvibe_sdk.memory.types import Episode
+
+    class HungOp(Operator):
+        @agent_node(
+            tools=[slow_report], output_key="out",
+            parallel_tools=True, max_concurrency=1, tool_timeout=0.05,
+        )
+        def investigate(self, state):
+            """You pull reports."""
+            return "go"
+
+    recorded: list[Episode] = []
+    llm = FakeAgentLLM([
+        _multi_tool_response([
+            ("slow_report", {"name": "hang", "delay": 1.0}),
+            ("slow_report", {"name": "queued", "delay": 0}),
+        ]),
+        _text_response("done"),
+    ])
+    op = HungOp(llm=llm)
+    op._episode_recorder = recorded.append
+    t0 = time.monotonic()
+    op.investigate({})
+    assert time.monotonic() - t0 < 0.5
+    results = llm.calls[1]["messages"][-1]["content"]
+    assert "timed out" in results[0]["content"]
+    assert "not run" in results[1]["content"]
+    timings = recorded[0].outcome["tool_calls"]
+    assert [(t["timed_out"], t["not_run"]) for t in timings] == [
+        (True, False), (False, True),
+    ]
+
+def test_agent_node_records_per_tool_latency():
+    from openvibe_sdk.memory.types import Episode
+
+    recorded: list[Episode] = []
+    llm = FakeAgentLLM([
+        _multi_tool_response([
+            ("search", {"query": "a"}),
+            ("search", {"query": "b"}),
+        ]),
+        _text_response("done"),
+    ])
+    op = ResearchOp(llm=llm)
+    op._episode_recorder = recorded.append
+    op.investigate({"topic": "x"})
+    timings = recorded[0].outcome["tool_calls"]
+    assert [t["tool_use_id"] for t in timings] == ["tc_0", "tc_1"]
+    assert all(t["name"] == "search" for t in timings)
+    assert all(isinstance(t["latency_ms"], int) for t in timings)
+    assert not any(t["timed_out"] for t in timings)
+
+
+def test_async_agent_node_parallel_tools():
+    import asyncio
+
+    from openvibe_sdk.operator import async_agent_node
+
+    async def aslow(name: str, delay: float) -> str:
+        """Async report."""
+        await asyncio.sleep(delay)
+        return name
+
+    class AsyncParallelOp(Operator):
+        @async_agent_node(
+            tools=[aslow], output_key="out",
+            parallel_tools=True, max_concurrency=4, tool_timeout=0.5,
+        )
+        def investigate(self, state):
+            """You pull reports."""
+            return "go"
+
+    llm = FakeAgentLLM([
+        _multi_tool_response([
+            ("aslow", {"name": f"r{i}", "delay": 0.1}) for i in range(4)
+        ] + [("aslow", {"name": "hang", "delay": 5})]),
+        _text_response("done"),
+    ])
+    t0 = time.monotonic()
+    asyncio.run(AsyncParallelOp(llm=llm).investigate({}))
+    assert time.monotonic() - t0 < 1.5
+    results = llm.calls[1]["messages"][-1]["content"]
+    assert [r["content"] for r in results[:4]] == ["r0", "r1", "r2", "r3"]
+    assert "timed out" in results[4]["content"]
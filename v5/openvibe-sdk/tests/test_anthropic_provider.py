@@ -1,9 +1,10 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
 
 from openvibe_sdk.llm import LLMError, LLMResponse, ToolCall
-from openvibe_sdk.llm.anthropic import AnthropicProvider
+from openvibe_sdk.llm.anthropic import AnthropicProvider, AsyncAnthropicProvider
 
 
 def _mock_text_response(text="Hello", model="claude-haiku-4-5-20251001"):
@@ -100,3 +101,114 @@ def test_call_wraps_api_error_in_llm_error(mocker):
         provider.call(system="test", messages=[{"role": "user", "content": "hi"}])
     assert exc_info.value.provider == "anthropic"
     assert isinstance(exc_info.value.cause, RuntimeError)
+
+
+def test_async_provider_acall(mocker):
+    mock_client = MagicMock()
+    mock_client.messages.create = mocker.AsyncMock(
+        return_value=_mock_tool_response()
+    )
+    mocker.patch(
+        "openvibe_sdk.llm.anthropic.AsyncAnthropic", return_value=mock_client
+    )
+    provider = AsyncAnthropicProvider(api_key="test-key")
+    result = asyncio.run(provider.acall(
+        system="test",
+        messages=[{"role": "user", "content": "search"}],
+        model="sonnet",
+    ))
+    assert result.tool_calls[0].id == "toolu_123"
+    assert result.model == "claude-sonnet-4-5-20250929"
+
+
+def test_async_provider_wraps_errors(mocker):
+    mock_client = MagicMock()
+    mock_client.messages.create = mocker.AsyncMock(
+        side_effect=RuntimeError("boom")
+    )
+    mocker.patch(
+        "openvibe_sdk.llm.anthropic.AsyncAnthropic", return_value=mock_client
+    )
+    provider = AsyncAnthropicProvider()
+    with pytest.raises(LLMError, match="boom"):
+        asyncio.run(provider.acall(system="s", messages=[]))
+
+
+def test_cache_prefix_splits_system_into_cached_block(mocker):
+    mock_client = MagicMock()
+    mock_client.messages.create.return_value = _mock_text_response()
+    mocker.patch("openvibe_sdk.llm.anthropic.Anthropic", return_value=mock_client)
+    provider = AnthropicProvider()
+    provider.call(
+        system="SOUL\n\nDOCSTRING\n\n## Insights\n- fresh",
+        cache_prefix="SOUL\n\nDOCSTRING",
+        messages=[{"role": "user", "content": "hi"}],
+    )
+    system = mock_client.messages.create.call_args[1]["system"]
+    assert system[0] == {
+        "type": "text",
+        "text": "SOUL\n\nDOCSTRING",
+        "cache_control": {"type": "ephemeral"},
+    }
+    assert system[1] == {"type": "text", "text": "## Insights\n- fresh"}
+
+
+def test_cache_prefix_without_suffix_is_single_block(mocker):
+    mock_client = MagicMock()
+    mock_client.messages.create.return_value = _mock_text_response()
+    mocker.patch("openvibe_sdk.llm.anthropic.Anthropic", return_value=mock_client)
+    provider = AnthropicProvider()
+    tools = [{"name": "t", "description": "T", "input_schema": {}}]
+    provider.call(system="DOC", cache_prefix="DOC", messages=[], tools=tools)
+    kwargs = mock_client.messages.create.call_args[1]
+    assert len(kwargs["system"]) == 1
+    # System breakpoint already covers tools
+    assert "cache_control" not in kwargs["tools"][0]
+
+
+def test_tools_marked_when_no_cache_prefix(mocker):
+    mock_client = MagicMock()
+    mock_client.messages.create.return_value = _mock_text_response()
+    mocker.patch("openvibe_sdk.llm.anthropic.Anthropic", return_value=mock_client)
+    provider = AnthropicProvider()
+    tools = [
+        {"name": "a", "description": "A", "input_schema": {}},
+        {"name": "b", "description": "B", "input_schema": {}},
+    ]
+    provider.call(system="plain", messages=[], tools=tools)
+    kwargs = mock_client.messages.create.call_args[1]
+    assert kwargs["system"] == "plain"
+    assert "cache_control" not in kwargs["tools"][0]
+    assert kwargs["tools"][1]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in tools[1]  # caller's schema untouched
+
+
+def test_prompt_caching_disabled_sends_plain_system(mocker):
+    mock_client = MagicMock()
+    mock_client.messages.create.return_value = _mock_text_response()
+    mocker.patch("openvibe_sdk.llm.anthropic.Anthropic", return_value=mock_client)
+    provider = AnthropicProvider(prompt_caching=False)
+    provider.call(system="DOC\n\nctx", cache_prefix="DOC", messages=[])
+    assert mock_client.messages.create.call_args[1]["system"] == "DOC\n\nctx"
+
+
+def test_cache_usage_surfaced_on_response(mocker):
+    response = _mock_text_response()
+    response.usage.cache_read_input_tokens = 1800
+    response.usage.cache_creation_input_tokens = 0
+    mock_client = MagicMock()
+    mock_client.messages.create.return_value = response
+    mocker.patch("openvibe_sdk.llm.anthropic.Anthropic", return_value=mock_client)
+    result = AnthropicProvider().call(system="s", messages=[])
+    assert result.cache_read_input_tokens == 1800
+    assert result.cache_creation_input_tokens == 0
+
+
+def test_missing_cache_usage_defaults_to_zero(mocker):
+    response = _mock_text_response()
+    response.usage.cache_read_input_tokens = None
+    mock_client = MagicMock()
+    mock_client.messages.create.return_value = response
+    mocker.patch("openvibe_sdk.llm.anthropic.Anthropic", return_value=mock_client)
+    result = AnthropicProvider().call(system="s", messages=[])
+    assert result.cache_read_input_tokens == 0
@@ -0,0 +1,179 @@
+"""Tests for async_llm_node / async_agent_node and the async LLM path."""
+
+import asyncio
+from typing import TypedDict
+
+from langgraph.graph import StateGraph
+
+from openvibe_sdk.llm import LLMResponse, ToolCall, acall_llm
+from openvibe_sdk.operator import Operator, async_agent_node, async_llm_node
+from openvibe_sdk.role import Role, _RoleAwareLLM
+
+
+class FakeAsyncLLM:
+    def __init__(self, responses: list[LLMResponse]):
+        self.responses = list(responses)
+        self.calls: list[dict] = []
+
+    async def acall(self, *, system, messages, **kwargs):
+        self.calls.append({"system": system, "messages": list(messages), **kwargs})
+        return self.responses.pop(0)
+
+
+class FakeSyncLLM:
+    def __init__(self, content="sync"):
+        self.content = content
+
+    def call(self, *, system, messages, **kwargs):
+        return LLMResponse(content=self.content)
+
+
+def lookup(key: str) -> str:
+    """Look up a key."""
+    return f"value:{key}"
+
+
+async def alookup(key: str) -> str:
+    """Look up a key asynchronously."""
+    return f"avalue:{key}"
+
+
+class AsyncOp(Operator):
+    operator_id = "async_op"
+
+    @async_llm_node(model="haiku", output_key="summary")
+    def summarize(self, state):
+        """You summarize."""
+        return f"Summarize: {state['text']}"
+
+    @async_agent_node(tools=[lookup, alookup], output_key="answer")
+    async def research(self, state):
+        """You research."""
+        return f"Research: {state['text']}"
+
+
+def test_async_llm_node_is_coroutine_function():
+    op = AsyncOp(llm=FakeAsyncLLM([]))
+    assert asyncio.iscoroutinefunction(op.summarize)
+    assert op.summarize._is_llm_node is True
+    assert op.summarize._node_config["is_async"] is True
+
+
+def test_async_llm_node_awaits_acall():
+    llm = FakeAsyncLLM([LLMResponse(content='{"ok": true}')])
+    op = AsyncOp(llm=llm)
+    state = asyncio.run(op.summarize({"text": "hello"}))
+    assert state["summary"] == {"ok": True}
+    assert llm.calls[0]["system"] == "You summarize."
+    assert llm.calls[0]["messages"][0]["content"] == "Summarize: hello"
+
+
+def test_async_llm_node_falls_back_to_sync_provider():
+    op = AsyncOp(llm=FakeSyncLLM("threaded"))
+    state = asyncio.run(op.summarize({"text": "x"}))
+    assert state["summary"] == "threaded"
+
+
+def test_async_agent_node_runs_sync_and_async_tools():
+    llm = FakeAsyncLLM([
+        LLMResponse(
+            content="",
+            tool_calls=[
+                ToolCall(id="a", name="lookup", input={"key": "k1"}),
+                ToolCall(id="b", name="alookup", input={"key": "k2"}),
+            ],
+            stop_reason="tool_use",
+        ),
+        LLMResponse(content="done"),
+    ])
+    op = AsyncOp(llm=llm)
+    state = asyncio.run(op.research({"text": "q"}))
+    assert state["answer"] == "done"
+    results = llm.calls[1]["messages"][-1]["content"]
+    assert [r["tool_use_id"] for r in results] == ["a", "b"]
+    assert results[0]["content"] == "value:k1"
+    assert results[1]["content"] == "avalue:k2"
+
+
+def test_async_nodes_run_inside_ainvoke():
+    class S(TypedDict, total=False):
+        text: str
+        summary: str
+
+    llm = FakeAsyncLLM([LLMResponse(content="graph result")])
+    op = AsyncOp(llm=llm)
+    graph = StateGraph(S)
+    graph.add_node("summarize", op.summarize)
+    graph.set_entry_point("summarize")
+    graph.set_finish_point("summarize")
+    result = asyncio.run(graph.compile().ainvoke({"text": "t"}))
+    assert result["summary"] == "graph result"
+
+
+def test_role_aware_llm_acall_injects_soul():
+    class R(Role):
+        role_id = "r"
+        soul = "You are R."
+
+    inner = FakeAsyncLLM([LLMResponse(content="hi")])
+    wrapped = _RoleAwareLLM(R(), inner)
+    asyncio.run(acall_llm(wrapped, system="base", messages=[{"role": "user", "content": "m"}]))
+    assert inner.calls[0]["system"] == "You are R.\n\nbase"
+
+
+def test_concurrent_async_nodes_share_event_loop():
+    class SlowLLM:
+        def __init__(self):
+            self.in_flight = 0
+            self.peak = 0
+
+        async def acall(self, **kwargs):
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return LLMResponse(content="ok")
+
+    llm = SlowLLM()
+    op = AsyncOp(llm=llm)
+
+    async def run_many():
+        return await asyncio.gather(
+            *(op.summarize({"text": str(i)}) for i in range(20))
+        )
+
+    results = asyncio.run(run_many())
+    assert len(results) == 20
+    assert llm.peak == 20
+
+
+def test_async_nodes_assemble_and_record_memory_off_the_event_loop():
+    import threading
+
+    class ScopedOp(Operator):
+        @async_llm_node(output_key="out", memory_scope={"domain": "revenue"})
+        def summarize(self, state):
+            """You summarize."""
+            return "go"
+
+        @async_agent_node(output_key="out", memory_scope={"domain": "revenue"})
+        def research(self, state):
+            """You research."""
+            return "go"
+
+    threads = []
+
+    class Assembler:
+        def assemble(self, scope):
+            threads.append(threading.current_thread())
+            return "## Insights"
+
+    op = ScopedOp(
+        llm=FakeAsyncLLM([LLMResponse(content="a"), LLMResponse(content="b")]),
+        memory_assembler=Assembler(),
+    )
+    op._episode_recorder = lambda episode: threads.append(threading.current_thread())
+    asyncio.run(op.summarize({}))
+    asyncio.run(op.research({}))
+    assert len(threads) == 4
+    assert threading.main_thread() not in threads
@@ -0,0 +1,86 @@
+"""Tests for batch activation (run_activations / RoleRuntime.activate_many)."""
+
+import threading
+import time
+
+from openvibe_sdk.batch import ActivationRequest, run_activations
+
+
+class _Recorder:
+    """activate() stand-in tracking peak concurrency per operator."""
+
+    def __init__(self, delay=0.02, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.lock = threading.Lock()
+        self.running = {}
+        self.peak = {}
+        self.total_running = 0
+        self.total_peak = 0
+
+    def __call__(self, role_id, operator_id, workflow_id, input_data):
+        with self.lock:
+            self.running[operator_id] = self.running.get(operator_id, 0) + 1
+            self.peak[operator_id] = max(
+                self.peak.get(operator_id, 0), self.running[operator_id]
+            )
+            self.total_running += 1
+            self.total_peak = max(self.total_peak, self.total_running)
+        time.sleep(input_data.get("delay", self.delay))
+        with self.lock:
+            self.running[operator_id] -= 1
+            self.total_running -= 1
+        if workflow_id in self.fail:
+            raise RuntimeError(f"{workflow_id} failed")
+        return {"workflow": workflow_id}
+
+
+def test_run_activations_returns_every_result():
+    activate = _Recorder()
+    requests = [
+        ActivationRequest("d2c_growth", "meta_ad_ops", f"wf{i}") for i in range(6)
+    ]
+    results = list(run_activations(activate, requests, max_concurrency=3))
+    assert sorted(r.output["workflow"] for r in results) == [
+        f"wf{i}" for i in range(6)
+    ]
+    assert all(r.ok and r.duration_ms >= 15 for r in results)
+    assert activate.total_peak == 3
+
+
+def test_run_activations_streams_in_completion_order():
+    activate = _Recorder()
+    requests = [
+        {"role_id": "r", "operator_id": "op", "workflow_id": "slow",
+         "input_data": {"delay": 0.2}},
+        {"role_id": "r", "operator_id": "op", "workflow_id": "fast",
+         "input_data": {"delay": 0.01}},
+    ]
+    results = run_activations(activate, requests, max_concurrency=2)
+    assert next(results).request.workflow_id == "fast"
+    assert next(results).request.workflow_id == "slow"
+
+
+def test_failures_are_collected_without_cancelling_batch():
+    activate = _Recorder(fail={"wf1"})
+    requests = [ActivationRequest("r", "op", f"wf{i}") for i in range(4)]
+    results = list(run_activations(activate, requests, max_concurrency=2))
+    failed = [r for r in results if not r.ok]
+    assert [r.request.workflow_id for r in failed] == ["wf1"]
+    assert str(failed[0].error) == "wf1 failed"
+    assert len([r for r in results if r.ok]) == 3
+
+
+def test_per_provider_limits_cap_concurrency():
+    activate = _Recorder()
+    requests = [ActivationRequest("r", "meta_ad_ops", f"m{i}") for i in range(4)]
+    requests += [
+        ActivationRequest("r", "google_ad_ops", f"g{i}", provider="google")
+        for i in range(4)
+    ]
+    results = list(run_activations(
+        activate, requests, max_concurrency=8,
+        per_provider_limits={"meta_ad_ops": 1, "google": 2},
+    ))
+    assert len(results) == 8
+    assert activate.peak == {"meta_ad_ops": 1, "google_ad_ops": 2}
@@ -1,5 +1,6 @@
 """Tests for InMemory V2 store implementations."""
 
+import threading
 from datetime import datetime, timezone
 
 from openvibe_sdk.memory.stores import EpisodicStore, FactStore, InsightStore
@@ -246,3 +247,132 @@ def test_insight_store_find_similar_no_match():
     store.store(_make_insight("ins1", content="Completely different"))
     found = store.find_similar("cro", "webinar leads")
     assert found is None
+
+
+# --- Indexed EpisodicStore ---
+
+
+def _ts(day, hour=0):
+    return datetime(2026, 3, day, hour, tzinfo=timezone.utc)
+
+
+def test_episodic_store_returns_newest_first():
+    store = InMemoryEpisodicStore()
+    for i, day in enumerate([3, 1, 5, 2, 4]):
+        store.store(_make_episode(f"ep{day}", ts=_ts(day)))
+    results = store.query("cro", limit=3)
+    assert [e.id for e in results] == ["ep5", "ep4", "ep3"]
+
+
+def test_episodic_store_since_with_limit_and_filters():
+    store = InMemoryEpisodicStore()
+    for day in range(1, 11):
+        store.store(_make_episode(
+            f"ep{day}", ts=_ts(day),
+            domain="revenue" if day % 2 else "marketing",
+            entity="acme" if day <= 5 else "beta",
+        ))
+    results = store.query("cro", domain="revenue", since=_ts(4), limit=10)
+    assert [e.id for e in results] == ["ep9", "ep7", "ep5"]
+    results = store.query("cro", domain="revenue", entity="acme", limit=10)
+    assert [e.id for e in results] == ["ep5", "ep3", "ep1"]
+
+
+def test_episodic_store_tags_match_any_without_duplicates():
+    store = InMemoryEpisodicStore()
+    store.store(_make_episode("a", tags=["x"], ts=_ts(1)))
+    store.store(_make_episode("b", tags=["x", "y"], ts=_ts(2)))
+    store.store(_make_episode("c", tags=["y"], ts=_ts(3)))
+    store.store(_make_episode("d", tags=["z"], ts=_ts(4)))
+    results = store.query("cro", tags=["x", "y"])
+    assert [e.id for e in results] == ["c", "b", "a"]
+    results = store.query("cro", tags=["x", "y"], entity="missing")
+    assert results == []
+
+
+def test_episodic_store_evicts_beyond_max_per_agent():
+    store = InMemoryEpisodicStore(max_episodes_per_agent=3)
+    for day in range(1, 8):
+        store.store(_make_episode(f"ep{day}", ts=_ts(day), domain="revenue"))
+    store.store(_make_episode("other", agent_id="cmo", ts=_ts(1)))
+    assert store.count("cro") == 3
+    assert [e.id for e in store.query("cro")] == ["ep7", "ep6", "ep5"]
+    assert [e.id for e in store.query("cro", domain="revenue")] == [
+        "ep7", "ep6", "ep5",
+    ]
+    assert store.count("cmo") == 1
+
+
+def test_episodic_store_evicts_by_age():
+    from datetime import timedelta
+
+    store = InMemoryEpisodicStore(max_age=timedelta(days=7))
+    now = datetime.now(timezone.utc)
+    store.store(_make_episode("old", ts=now - timedelta(days=30)))
+    store.store(_make_episode("new", ts=now))
+    assert [e.id for e in store.query("cro")] == ["new"]
+
+
+# --- Indexed InsightStore ---
+
+
+def test_insight_store_newest_first_and_tag_index():
+    store = InMemoryInsightStore()
+    for i in range(5):
+        ins = _make_insight(f"ins{i}", tags=["a"] if i % 2 else ["b"])
+        ins.created_at = _ts(i + 1)
+        store.store(ins)
+    assert [i.id for i in store.query("cro")] == [
+        "ins4", "ins3", "ins2", "ins1", "ins0",
+    ]
+    assert [i.id for i in store.query("cro", tags=["a"])] == ["ins3", "ins1"]
+
+
+def test_insight_store_update_reindexes_mutated_fields():
+    store = InMemoryInsightStore()
+    ins = _make_insight("ins1", domain="revenue", tags=["old"])
+    store.store(ins)
+    ins.domain = "marketing"
+    ins.tags = ["new"]
+    store.update(ins)
+    assert store.query("cro", domain="revenue") == []
+    assert store.query("cro", tags=["old"]) == []
+    assert [i.id for i in store.query("cro", domain="marketing", tags=["new"])] == [
+        "ins1",
+    ]
+
+
+def test_insight_store_restore_same_id_replaces():
+    store = InMemoryInsightStore()
+    store.store(_make_insight("ins1", content="first"))
+    store.store(_make_insight("ins1", content="second"))
+    results = store.query("cro")
+    assert len(results) == 1
+    assert results[0].content == "second"
+
+
+def test_stores_take_concurrent_writes_and_reads():
+    store = InMemoryEpisodicStore(max_episodes_per_agent=50)
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(200):
+                store.store(Episode(
+                    id=f"{n}-{i}", agent_id="cro", operator_id="op",
+                    node_name="node", timestamp=datetime.now(timezone.utc),
+                    action="act", input_summary="", output_summary="",
+                    outcome={}, duration_ms=1, tokens_in=0, tokens_out=0,
+                    tags=[str(i % 5)],
+                ))
+                store.query("cro", tags=[str(i % 5)], limit=5)
+        except Exception as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert store.count("cro") == 50
@@ -1,8 +1,14 @@
+import threading
 from datetime import datetime, timezone
 
 from openvibe_sdk.memory.access import ClearanceProfile
 from openvibe_sdk.memory.agent_memory import AgentMemory
 from openvibe_sdk.memory.assembler import MemoryAssembler
+from openvibe_sdk.memory.sqlite import (
+    SQLiteFactStore,
+    SQLiteInsightStore,
+    SQLiteMemoryDB,
+)
 from openvibe_sdk.memory.types import Classification, Episode, Fact, Insight
 from openvibe_sdk.memory.workspace import WorkspaceMemory
 
@@ -100,3 +106,171 @@ def test_assemble_empty():
     assembler = MemoryAssembler(mem, profile)
     result = assembler.assemble({})
     assert result == ""
+
+
+def test_assemble_ranks_query_matches_by_relevance():
+    ws = WorkspaceMemory()
+    ws.store_fact(Fact(id="f1", content="Pricing page redesign shipped",
+                       classification=Classification.PUBLIC))
+    ws.store_fact(Fact(id="f2", content="Enterprise pricing objections: pricing too high",
+                       classification=Classification.PUBLIC))
+    ws.store_fact(Fact(id="f3", content="Webinar signups doubled",
+                       classification=Classification.PUBLIC))
+    mem = AgentMemory(agent_id="cro", workspace=ws)
+    profile = ClearanceProfile(agent_id="cro", domain_clearance={})
+    result = MemoryAssembler(mem, profile).assemble({"query": "pricing"})
+    assert result.index("Enterprise pricing") < result.index("Pricing page")
+    assert "Webinar" not in result
+
+
+def test_count_tokens_approximates_bpe():
+    from openvibe_sdk.memory.assembler import count_tokens
+
+    assert count_tokens("") == 0
+    assert count_tokens("The lead qualified at 85.") == 7
+    assert count_tokens("internationalization") == 4
+    assert 90 <= count_tokens("word " * 100) <= 110
+
+
+def test_assemble_packs_whole_items_only():
+    mem = AgentMemory(agent_id="cro")
+    for i in range(10):
+        mem.store_insight(Insight(
+            id=f"ins{i}", agent_id="cro",
+            content=f"Insight {i} " + "detail " * 15 + "END",
+            confidence=0.9, evidence_count=1, source_episode_ids=[],
+            created_at=datetime.now(timezone.utc),
+        ))
+    profile = ClearanceProfile(agent_id="cro", domain_clearance={})
+    result = MemoryAssembler(mem, profile).assemble({}, token_budget=200)
+    lines = result.split("\n")[1:]
+    assert 0 < len(lines) < 10
+    assert all(line.endswith("(confidence: 0.9)") for line in lines)
+
+
+def test_assemble_ranks_by_confidence_recency_and_usage():
+    from datetime import timedelta
+
+    now = datetime.now(timezone.utc)
+    ws = WorkspaceMemory()
+    ws.store_fact(Fact(id="stale", content="Stale fact", confidence=0.9,
+                       updated_at=now - timedelta(days=120),
+                       classification=Classification.PUBLIC))
+    ws.store_fact(Fact(id="fresh", content="Fresh fact", confidence=0.9,
+                       classification=Classification.PUBLIC))
+    ws.store_fact(Fact(id="used", content="Used fact", confidence=0.9,
+                       access_count=20, classification=Classification.PUBLIC))
+    ws.store_fact(Fact(id="shaky", content="Shaky fact", confidence=0.1,
+                       classification=Classification.PUBLIC))
+    mem = AgentMemory(agent_id="cro", workspace=ws)
+    profile = ClearanceProfile(agent_id="cro", domain_clearance={})
+    result = MemoryAssembler(mem, profile).assemble({})
+    order = [line[2:] for line in result.split("\n")[1:]]
+    assert order == ["Used fact", "Fresh fact", "Shaky fact", "Stale fact"]
+
+
+def test_assemble_section_budget_leaves_room_for_episodes():
+    mem = AgentMemory(agent_id="cro")
+    for i in range(30):
+        mem.store_insight(Insight(
+            id=f"ins{i}", agent_id="cro", content=f"Insight number {i} " * 5,
+            confidence=0.9, evidence_count=1, source_episode_ids=[],
+            created_at=datetime.now(timezone.utc),
+        ))
+    mem.record_episode(Episode(
+        id="ep1", agent_id="cro", operator_id="test", node_name="test",
+        timestamp=datetime.now(timezone.utc), action="qualify",
+        input_summary="in", output_summary="Score 85",
+        outcome={}, duration_ms=1, tokens_in=1, tokens_out=1,
+    ))
+    profile = ClearanceProfile(agent_id="cro", domain_clearance={})
+    result = MemoryAssembler(mem, profile).assemble({}, token_budget=300)
+    assert "Recent Activity" in result
+    assert "qualify: Score 85" in result
+
+
+def test_assemble_caches_until_memory_changes():
+    ws = WorkspaceMemory()
+    ws.store_fact(Fact(id="f1", content="Acme has 200 employees",
+                       classification=Classification.PUBLIC))
+    mem = AgentMemory(agent_id="cro", workspace=ws)
+    profile = ClearanceProfile(agent_id="cro", domain_clearance={})
+    assembler = MemoryAssembler(mem, profile)
+
+    first = assembler.assemble({"domain": None})
+    assert assembler.assemble({"domain": None}) == first
+    assert (assembler.cache_hits, assembler.cache_misses) == (1, 1)
+    # Episodes don't invalidate the cache but still show up
+    mem.record_episode(Episode(
+        id="ep1", agent_id="cro", operator_id="test", node_name="test",
+        timestamp=datetime.now(timezone.utc), action="qualify",
+        input_summary="in", output_summary="Score 85",
+        outcome={}, duration_ms=1, tokens_in=1, tokens_out=1,
+    ))
+    assert "Score 85" in assembler.assemble({"domain": None})
+    assert assembler.cache_hits == 2
+    # Fact writes do
+    ws.store_fact(Fact(id="f2", content="Acme renewed",
+                       classification=Classification.PUBLIC))
+    assert "Acme renewed" in assembler.assemble({"domain": None})
+    assert assembler.cache_misses == 2
+    assert ws.query(clearance=profile, track_access=False)[0].access_count == 4
+
+
+def test_assemble_cache_sees_writes_from_other_processes(tmp_path):
+    path = str(tmp_path / "memory.db")
+    db = SQLiteMemoryDB(path)
+    mem = AgentMemory(
+        agent_id="cro",
+        workspace=WorkspaceMemory(SQLiteFactStore(db)),
+        insights=SQLiteInsightStore(db),
+    )
+    profile = ClearanceProfile(agent_id="cro", domain_clearance={})
+    assembler = MemoryAssembler(mem, profile)
+    assert assembler.assemble({}) == ""
+
+    # A second connection to the file stands in for another worker process
+    other = SQLiteMemoryDB(path)
+    SQLiteFactStore(other).store(Fact(
+        id="f1", content="Acme has 200 employees",
+        classification=Classification.PUBLIC,
+    ))
+    assert "Acme has 200 employees" in assembler.assemble({})
+    SQLiteInsightStore(other).store(Insight(
+        id="ins1", agent_id="cro", content="VP sponsor predicts conversion",
+        confidence=0.9, evidence_count=5, source_episode_ids=[],
+        created_at=datetime.now(timezone.utc),
+    ))
+    assert "VP sponsor" in assembler.assemble({})
+    assert "VP sponsor" in assembler.assemble({})
+    assert (assembler.cache_hits, assembler.cache_misses) == (1, 3)
+    other.close()
+    db.close()
+
+
+def test_assemble_cache_is_thread_safe():
+    mem = AgentMemory(agent_id="cro", workspace=WorkspaceMemory())
+    for n in range(5):
+        mem.workspace.store_fact(Fact(
+            id=f"f{n}", content=f"Account {n} renewed",
+            classification=Classification.PUBLIC,
+        ))
+    profile = ClearanceProfile(agent_id="cro", domain_clearance={})
+    assembler = MemoryAssembler(mem, profile, cache_size=4)
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(200):
+                assembler.assemble({"tags": [str((offset + i) % 8)]})
+        except Exception as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert assembler.cache_hits + assembler.cache_misses == 1600
+    assert len(assembler._cache) <= 4
@@ -0,0 +1,188 @@
+"""Tests for LLM rate limiting (RateLimiter + RateLimitedLLMProvider)."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from openvibe_sdk.llm import LLMError, LLMResponse, resolve_model
+from openvibe_sdk.llm.ratelimit import (
+    Priority,
+    RateLimit,
+    RateLimitedLLMProvider,
+    RateLimiter,
+    TokenBucket,
+    current_priority,
+    current_tenant,
+    is_rate_limited,
+    llm_context,
+)
+from openvibe_sdk.role import Role
+
+
+class _Status(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = type("R", (), {"headers": headers or {}})()
+
+
+class FlakyLLM:
+    """Fails with the given errors first, then answers."""
+
+    def __init__(self, errors=()):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def call(self, *, system, messages, **kwargs):
+        self.calls += 1
+        if self.errors:
+            cause = self.errors.pop(0)
+            raise LLMError(str(cause), provider="fake", cause=cause)
+        return LLMResponse(content="ok", tokens_in=10, tokens_out=5)
+
+
+def _req(**overrides):
+    req = dict(
+        system="sys", messages=[{"role": "user", "content": "hi"}],
+        model="haiku", max_tokens=100,
+    )
+    req.update(overrides)
+    return req
+
+
+def test_token_bucket_refills_over_time():
+    bucket = TokenBucket(60, now=0.0)  # 1 token/second
+    assert bucket.wait_time(60, now=0.0) == 0
+    bucket.take(60, now=0.0)
+    assert bucket.wait_time(1, now=0.0) == pytest.approx(1.0)
+    assert bucket.wait_time(1, now=1.0) == 0
+    # Oversized requests wait for a full bucket, not forever
+    assert bucket.wait_time(500, now=1.0) == pytest.approx(59.0)
+
+
+def test_limits_keyed_by_resolved_model():
+    limiter = RateLimiter({"haiku": RateLimit(requests_per_minute=6000)})
+    lease = limiter.acquire(resolve_model("haiku"), tokens=10)
+    assert lease.model == resolve_model("haiku")
+    limiter.release(lease)
+    stats = limiter.stats()[resolve_model("haiku")]
+    assert stats.granted == 1
+    assert stats.in_flight == 0
+    assert stats.queue_depth == 0
+
+
+def test_token_reservation_reconciled_on_release():
+    limiter = RateLimiter({"haiku": RateLimit(tokens_per_minute=1000)})
+    lease = limiter.acquire("haiku", tokens=800)
+    limiter.release(lease, used_tokens=100)
+    bucket = limiter._models[resolve_model("haiku")].tokens
+    assert bucket.level == pytest.approx(900, abs=1)
+
+
+def test_priority_then_tenant_round_robin():
+    limiter = RateLimiter({"haiku": RateLimit(max_concurrency=1)})
+    holder = limiter.acquire("haiku")
+    order = []
+
+    def worker(tenant, priority, label):
+        lease = limiter.acquire("haiku", tenant=tenant, priority=priority)
+        order.append(label)
+        limiter.release(lease)
+
+    waiters = [
+        ("a", Priority.BATCH, "cron"),
+        ("a", Priority.DEFAULT, "a1"),
+        ("a", Priority.DEFAULT, "a2"),
+        ("b", Priority.DEFAULT, "b1"),
+        ("c", Priority.INTERACTIVE, "chat"),
+    ]
+    threads = []
+    for args in waiters:
+        thread = threading.Thread(target=worker, args=args)
+        thread.start()
+        threads.append(thread)
+        while limiter.queue_depth("haiku") < len(threads):
+            time.sleep(0.001)
+
+    limiter.release(holder)
+    for thread in threads:
+        thread.join(timeout=5)
+    assert order == ["chat", "a1", "b1", "a2", "cron"]
+    assert limiter.stats()[resolve_model("haiku")].wait_s_max > 0
+
+
+def test_retries_rate_limited_calls_with_backoff():
+    inner = FlakyLLM(errors=[_Status(429), _Status(529)])
+    delays = []
+    llm = RateLimitedLLMProvider(
+        inner, base_delay=0.01, max_delay=0.02, sleep=delays.append
+    )
+    response = llm.call(**_req())
+    assert response.content == "ok"
+    assert inner.calls == 3
+    assert len(delays) == 2
+    assert llm.limiter.stats()[resolve_model("haiku")].throttled == 2
+
+
+def test_retry_honors_retry_after_header():
+    inner = FlakyLLM(errors=[_Status(429, {"retry-after": "0.05"})])
+    delays = []
+    llm = RateLimitedLLMProvider(inner, base_delay=0.01, sleep=delays.append)
+    llm.call(**_req())
+    assert delays[0] >= 0.05
+
+
+def test_gives_up_after_max_retries_and_skips_other_errors():
+    inner = FlakyLLM(errors=[_Status(429)] * 3)
+    llm = RateLimitedLLMProvider(
+        inner, max_retries=1, base_delay=0.001, sleep=lambda s: None
+    )
+    with pytest.raises(LLMError):
+        llm.call(**_req())
+    assert inner.calls == 2
+
+    bad = FlakyLLM(errors=[ValueError("bad request")])
+    with pytest.raises(LLMError):
+        RateLimitedLLMProvider(bad, sleep=lambda s: None).call(**_req())
+    assert bad.calls == 1
+
+
+def test_is_rate_limited_detects_overloaded_messages():
+    assert is_rate_limited(LLMError("x", cause=_Status(429)))
+    assert is_rate_limited(LLMError("x", cause=RuntimeError("Overloaded")))
+    assert not is_rate_limited(LLMError("x", cause=_Status(400)))
+
+
+def test_async_call_retries_and_releases():
+    inner = FlakyLLM(errors=[_Status(529)])
+    llm = RateLimitedLLMProvider(inner, base_delay=0.001, max_delay=0.002)
+    response = asyncio.run(llm.acall(**_req()))
+    assert response.content == "ok"
+    stats = llm.limiter.stats()[resolve_model("haiku")]
+    assert stats.in_flight == 0
+    assert stats.granted == 2
+
+
+def test_llm_context_scopes_tenant_and_priority():
+    assert current_tenant() == "default"
+    with llm_context(tenant="acme", priority=Priority.BATCH):
+        assert current_tenant() == "acme"
+        assert current_priority() is Priority.BATCH
+    assert current_priority() is Priority.DEFAULT
+
+
+def test_role_respond_is_interactive():
+    seen = []
+
+    class RecordingLLM:
+        def call(self, *, system, messages, **kwargs):
+            seen.append(current_priority())
+            return LLMResponse(content="hi")
+
+    class Helper(Role):
+        role_id = "helper"
+
+    Helper(llm=RecordingLLM()).respond("hello")
+    assert seen == [Priority.INTERACTIVE]
@@ -0,0 +1,124 @@
+"""Tests for incremental, batched reflection."""
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+from openvibe_sdk.llm import LLMResponse
+from openvibe_sdk.memory.agent_memory import AgentMemory
+from openvibe_sdk.memory.reflection import Watermark, reflect_many
+from openvibe_sdk.memory.sqlite import SQLiteInsightStore
+from openvibe_sdk.memory.types import Episode
+
+BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _episode(id, minutes, agent_id="cro"):
+    return Episode(
+        id=id, agent_id=agent_id, operator_id="op", node_name="node",
+        timestamp=BASE + timedelta(minutes=minutes), action="act",
+        input_summary="in", output_summary=f"out {id}", outcome={},
+        duration_ms=1, tokens_in=1, tokens_out=1,
+    )
+
+
+class FakeLLM:
+    """Returns one insight per call, named after the first episode seen."""
+
+    def __init__(self, fail_for=None):
+        self.calls = []
+        self.fail_for = fail_for
+        self._lock = threading.Lock()
+
+    def call(self, *, system, messages, **kwargs):
+        text = messages[0]["content"]
+        with self._lock:
+            self.calls.append(text)
+        if self.fail_for and self.fail_for in text:
+            raise RuntimeError("llm down")
+        first = text.split("out ")[1].split()[0]
+        return LLMResponse(
+            content=json.dumps([{"content": f"pattern seen in {first}"}]),
+            tokens_in=100, tokens_out=20,
+        )
+
+
+def test_reflect_incremental_batches_oldest_first():
+    mem = AgentMemory(agent_id="cro")
+    for i in range(5):
+        mem.record_episode(_episode(f"ep{i}", i))
+    llm = FakeLLM()
+    batches = mem.reflect_incremental(llm, batch_size=2)
+    assert [b.episode_ids for b in batches] == [
+        ["ep0", "ep1"], ["ep2", "ep3"], ["ep4"],
+    ]
+    assert [(b.tokens_in, b.tokens_out) for b in batches] == [(100, 20)] * 3
+    assert mem.reflection_watermark.timestamp == BASE + timedelta(minutes=4)
+
+
+def test_reflect_incremental_skips_reflected_episodes():
+    mem = AgentMemory(agent_id="cro")
+    mem.record_episode(_episode("ep0", 0))
+    mem.record_episode(_episode("ep1", 1))
+    llm = FakeLLM()
+    mem.reflect_incremental(llm)
+    assert mem.reflect_incremental(llm) == []
+    assert len(llm.calls) == 1
+
+    # Same timestamp as the watermark, but not yet reflected
+    mem.record_episode(_episode("ep1b", 1))
+    mem.record_episode(_episode("ep2", 2))
+    batches = mem.reflect_incremental(llm)
+    assert batches[0].episode_ids == ["ep1b", "ep2"]
+    assert len(llm.calls) == 2
+
+
+def test_reflect_incremental_dedupes_against_existing_insights():
+    mem = AgentMemory(agent_id="cro", insights=SQLiteInsightStore())
+    for i in range(4):
+        mem.record_episode(_episode("same", i))
+
+    class RepeatLLM:
+        def call(self, **kwargs):
+            return LLMResponse(content=json.dumps(
+                [{"content": "enterprise deals close slower", "confidence": 0.5}]
+            ))
+
+    mem.reflect_incremental(RepeatLLM(), batch_size=1)
+    stored = mem.recall_insights()
+    assert len(stored) == 1
+    assert stored[0].evidence_count == 4
+
+
+def test_watermark_advance_keeps_boundary_ids():
+    a, b = _episode("a", 1), _episode("b", 1)
+    mark = Watermark.advance(None, [a])
+    mark = Watermark.advance(mark, [b])
+    assert mark.episode_ids == {"a", "b"}
+    assert mark.covers(a) and mark.covers(_episode("old", 0))
+    assert not mark.covers(_episode("c", 1))
+
+
+def test_reflect_many_runs_agents_concurrently_and_collects_errors():
+    memories = []
+    for agent in ("a1", "a2", "broken"):
+        mem = AgentMemory(agent_id=agent)
+        for i in range(3):
+            mem.record_episode(_episode(f"{agent}_{i}", i, agent_id=agent))
+        memories.append(mem)
+    llm = FakeLLM(fail_for="broken_2")
+
+    report = reflect_many(memories, llm, batch_size=2, max_concurrency=3)
+    assert set(report.errors) == {"broken"}
+    # broken's first batch completed before the failure and is kept
+    assert sorted(len(b.episode_ids) for b in report.batches) == [1, 1, 2, 2, 2]
+    assert report.tokens_in == 500
+    assert report.episodes == 8
+    assert set(report.watermarks) == {"a1", "a2", "broken"}
+
+    # Resuming with the returned watermarks only retries the failed batch
+    fresh = AgentMemory(agent_id="broken")
+    for i in range(3):
+        fresh.record_episode(_episode(f"broken_{i}", i, agent_id="broken"))
+    retry = reflect_many([fresh], FakeLLM(), watermarks=report.watermarks)
+    assert [b.episode_ids for b in retry.batches] == [["broken_2"]]
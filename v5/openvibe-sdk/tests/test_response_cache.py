@@ -0,0 +1,224 @@
+"""Tests for the LLM response cache (CachingLLMProvider + backends)."""
+
+import asyncio
+import time
+
+from openvibe_sdk.llm import LLMResponse, ToolCall
+from openvibe_sdk.llm.cache import (
+    CachingLLMProvider,
+    InMemoryResponseCache,
+    ResponseCache,
+    SQLiteResponseCache,
+    cache_key,
+)
+from openvibe_sdk.operator import Operator, agent_node, llm_node
+
+
+class CountingLLM:
+    def __init__(self, content="answer"):
+        self.content = content
+        self.calls = 0
+
+    def call(self, *, system, messages, **kwargs):
+        self.calls += 1
+        return LLMResponse(
+            content=f"{self.content}-{self.calls}", tokens_in=100, tokens_out=50,
+        )
+
+
+def _req(**overrides):
+    req = dict(
+        system="sys", messages=[{"role": "user", "content": "hi"}],
+        model="haiku", max_tokens=100, temperature=0.0,
+    )
+    req.update(overrides)
+    return req
+
+
+def test_cache_key_resolves_model_alias():
+    assert cache_key(**_req(model="haiku")) == cache_key(
+        **_req(model="claude-haiku-4-5-20251001")
+    )
+
+
+def test_cache_key_varies_by_each_component():
+    base = cache_key(**_req())
+    assert cache_key(**_req(system="other")) != base
+    assert cache_key(**_req(messages=[{"role": "user", "content": "yo"}])) != base
+    assert cache_key(**_req(temperature=0.5)) != base
+    assert cache_key(**_req(max_tokens=200)) != base
+    assert cache_key(**_req(tools=[{"name": "t"}])) != base
+
+
+def test_caching_provider_hit_and_miss():
+    inner = CountingLLM()
+    llm = CachingLLMProvider(inner)
+    first = llm.call(**_req())
+    second = llm.call(**_req())
+    assert inner.calls == 1
+    assert first.cache_status == "miss"
+    assert second.cache_status == "hit"
+    assert second.content == first.content
+    assert second.tokens_in == 0 and second.tokens_out == 0
+    assert (llm.hits, llm.misses) == (1, 1)
+
+
+def test_caching_provider_ignores_cache_prefix_in_key():
+    inner = CountingLLM()
+    llm = CachingLLMProvider(inner)
+    llm.call(**_req(), cache_prefix="sys")
+    llm.call(**_req())
+    assert inner.calls == 1
+
+
+def test_caching_provider_skips_high_temperature():
+    inner = CountingLLM()
+    llm = CachingLLMProvider(inner, max_temperature=0.3)
+    llm.call(**_req(temperature=0.7))
+    response = llm.call(**_req(temperature=0.7))
+    assert inner.calls == 2
+    assert response.cache_status == ""
+    llm.call(**_req(temperature=0.3))
+    assert llm.call(**_req(temperature=0.3)).cache_status == "hit"
+
+
+def test_caching_provider_caches_only_zero_temperature_by_default():
+    inner = CountingLLM()
+    llm = CachingLLMProvider(inner)
+    llm.call(**_req(temperature=0.2))
+    assert llm.call(**_req(temperature=0.2)).cache_status == ""
+    llm.call(**_req(temperature=0.0))
+    assert llm.call(**_req(temperature=0.0)).cache_status == "hit"
+    assert inner.calls == 3
+
+    opted_in = CachingLLMProvider(CountingLLM(), max_temperature=None)
+    opted_in.call(**_req(temperature=1.0))
+    assert opted_in.call(**_req(temperature=1.0)).cache_status == "hit"
+
+
+def test_caching_provider_acall_with_sync_inner():
+    inner = CountingLLM()
+    llm = CachingLLMProvider(inner)
+    asyncio.run(llm.acall(**_req()))
+    response = asyncio.run(llm.acall(**_req()))
+    assert inner.calls == 1
+    assert response.cache_status == "hit"
+
+
+def test_in_memory_cache_lru_eviction():
+    cache = InMemoryResponseCache(max_entries=2)
+    assert isinstance(cache, ResponseCache)
+    cache.set("a", LLMResponse(content="a"))
+    cache.set("b", LLMResponse(content="b"))
+    cache.get("a")  # a is now most recent
+    cache.set("c", LLMResponse(content="c"))
+    assert cache.get("b") is None
+    assert cache.get("a").content == "a"
+    assert len(cache) == 2
+
+
+def test_in_memory_cache_ttl():
+    cache = InMemoryResponseCache(ttl_seconds=0.01)
+    cache.set("a", LLMResponse(content="a"))
+    time.sleep(0.02)
+    assert cache.get("a") is None
+
+
+def test_sqlite_cache_roundtrip_and_persistence(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SQLiteResponseCache(path)
+    assert isinstance(cache, ResponseCache)
+    cache.set("k", LLMResponse(
+        content="c",
+        tool_calls=[ToolCall(id="t1", name="search", input={"q": "x"})],
+        tokens_in=5, model="m", stop_reason="tool_use",
+    ))
+    cache.close()
+
+    reopened = SQLiteResponseCache(path)
+    loaded = reopened.get("k")
+    assert loaded.content == "c"
+    assert loaded.tool_calls[0] == ToolCall(id="t1", name="search", input={"q": "x"})
+    assert loaded.stop_reason == "tool_use"
+
+
+def test_sqlite_cache_ttl_and_size_eviction(tmp_path):
+    cache = SQLiteResponseCache(str(tmp_path / "c.db"), max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, LLMResponse(content=key))
+    assert len(cache) == 2
+    assert cache.get("a") is None
+
+    expiring = SQLiteResponseCache(str(tmp_path / "t.db"), ttl_seconds=0.01)
+    expiring.set("x", LLMResponse(content="x"))
+    time.sleep(0.02)
+    assert expiring.get("x") is None
+
+
+def test_llm_node_records_cache_hits_on_episode():
+    class InterpretOp(Operator):
+        operator_id = "interpret"
+
+        @llm_node(model="haiku", temperature=0.0, output_key="out")
+        def interpret(self, state):
+            """You interpret reports."""
+            return state["report"]
+
+    episodes = []
+    op = InterpretOp(llm=CachingLLMProvider(CountingLLM()))
+    op._episode_recorder = episodes.append
+    op.interpret({"report": "r"})
+    op.interpret({"report": "r"})
+    assert episodes[0].outcome["response_cache"] == {"hits": 0, "misses": 1}
+    assert episodes[1].outcome["response_cache"] == {"hits": 1, "misses": 0}
+
+
+def test_default_temperature_nodes_are_not_cached_by_default():
+    class InterpretOp(Operator):
+        operator_id = "interpret"
+
+        @llm_node(model="haiku", output_key="out")  # temperature=0.7
+        def interpret(self, state):
+            """You interpret reports."""
+            return state["report"]
+
+    inner = CountingLLM()
+    episodes = []
+    op = InterpretOp(llm=CachingLLMProvider(inner))
+    op._episode_recorder = episodes.append
+    op.interpret({"report": "r"})
+    op.interpret({"report": "r"})
+    assert inner.calls == 2
+    assert "response_cache" not in episodes[1].outcome
+
+
+def test_agent_node_counts_cache_stats_across_steps():
+    def lookup(key: str) -> str:
+        """Lookup."""
+        return key
+
+    class ScriptedLLM:
+        def __init__(self):
+            self.responses = [
+                LLMResponse(content="", tool_calls=[
+                    ToolCall(id="t", name="lookup", input={"key": "k"}),
+                ]),
+                LLMResponse(content="done"),
+            ]
+
+        def call(self, **kwargs):
+            return self.responses.pop(0)
+
+    class AgentOp(Operator):
+        operator_id = "agent"
+
+        @agent_node(tools=[lookup], temperature=0.0, output_key="out")
+        def run(self, state):
+            """You run."""
+            return "go"
+
+    episodes = []
+    op = AgentOp(llm=CachingLLMProvider(ScriptedLLM()))
+    op._episode_recorder = episodes.append
+    op.run({})
+    assert episodes[0].outcome["response_cache"] == {"hits": 0, "misses": 2}
@@ -0,0 +1,233 @@
+"""Tests for BM25 / embedding retrieval behind the in-memory stores."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from openvibe_sdk.memory.in_memory import InMemoryFactStore, InMemoryInsightStore
+from openvibe_sdk.memory.retrieval import BM25Index, RetrievalIndex, tokenize
+from openvibe_sdk.memory.sqlite import (
+    SQLiteFactStore,
+    SQLiteInsightStore,
+    SQLiteMemoryDB,
+)
+from openvibe_sdk.memory.types import Fact, Insight
+
+
+def _insight(id, content, agent_id="cro", domain="", minutes=0):
+    return Insight(
+        id=id, agent_id=agent_id, content=content, confidence=0.8,
+        evidence_count=1, source_episode_ids=[],
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc)
+        + timedelta(minutes=minutes),
+        domain=domain,
+    )
+
+
+# --- BM25Index ---
+
+
+def test_tokenize_lowercases_words():
+    assert tokenize("VP-sponsor, Q4!") == ["vp", "sponsor", "q4"]
+
+
+def test_bm25_ranks_rarer_and_denser_terms_higher():
+    index = BM25Index()
+    index.add("a", "pricing objections in enterprise deals")
+    index.add("b", "pricing page redesign")
+    index.add("c", "enterprise enterprise enterprise rollout")
+    index.add("d", "webinar signups")
+    ranked = [doc for doc, _ in index.search("enterprise pricing")]
+    assert ranked[0] == "a"  # only doc with both terms
+    assert set(ranked) == {"a", "b", "c"}
+
+
+def test_bm25_remove_and_reindex():
+    index = BM25Index()
+    index.add("a", "alpha beta")
+    index.add("a", "gamma")
+    assert index.search("alpha") == []
+    assert [d for d, _ in index.search("gamma")] == ["a"]
+    index.remove("a")
+    assert len(index) == 0
+    assert index.search("gamma") == []
+
+
+def test_bm25_scores_restricted_to_candidates():
+    index = BM25Index()
+    for i in range(10):
+        index.add(f"d{i}", "shared term")
+    assert set(index.scores("term", candidates={"d1", "d7"})) == {"d1", "d7"}
+
+
+# --- Stores ---
+
+
+def test_fact_store_query_returns_ranked_results():
+    store = InMemoryFactStore()
+    store.store(Fact(id="f1", content="Pricing page redesign shipped"))
+    store.store(Fact(id="f2", content="Enterprise pricing objections rising"))
+    store.store(Fact(id="f3", content="Webinar signups doubled"))
+    store.store(Fact(id="f4", content="Pricing pricing pricing"))
+    assert [f.id for f in store.query(query="pricing")] == ["f4", "f1", "f2"]
+    # The whole query must appear, not just one of its words
+    assert [f.id for f in store.query(query="enterprise pricing")] == ["f2"]
+
+
+def test_fact_store_query_falls_back_to_substring():
+    store = InMemoryFactStore()
+    store.store(Fact(id="f1", content="Acme renewal"))
+    assert [f.id for f in store.query(query="acm")] == ["f1"]
+
+
+def test_fact_store_delete_removes_from_index():
+    store = InMemoryFactStore()
+    store.store(Fact(id="f1", content="Acme renewal"))
+    store.delete("f1")
+    assert store.query(query="renewal") == []
+
+
+def test_insight_store_query_ranks_within_filters():
+    store = InMemoryInsightStore()
+    store.store(_insight("i1", "email timing matters", domain="sales"))
+    store.store(_insight("i2", "email subject lines", domain="sales"))
+    store.store(_insight("i3", "email timing", domain="marketing"))
+    store.store(_insight("i4", "email email email", domain="sales"))
+    results = store.query("cro", domain="sales", query="email")
+    assert [i.id for i in results] == ["i4", "i2", "i1"]
+    results = store.query("cro", domain="sales", query="email timing")
+    assert [i.id for i in results] == ["i1"]
+
+
+def test_insight_store_ties_are_newest_first():
+    store = InMemoryInsightStore()
+    store.store(_insight("old", "churn risk", minutes=0))
+    store.store(_insight("new", "churn risk", minutes=5))
+    assert [i.id for i in store.query("cro", query="churn")] == ["new", "old"]
+
+
+def test_insight_store_find_similar_uses_index():
+    store = InMemoryInsightStore()
+    store.store(_insight("i1", "webinar attendance drops in summer"))
+    store.store(_insight("i2", "enterprise deals close slower in december"))
+    assert store.find_similar("cro", "enterprise deals close slower").id == "i2"
+    assert store.find_similar("cro", "completely unrelated words here") is None
+
+
+def test_insight_store_update_reindexes_content():
+    store = InMemoryInsightStore()
+    insight = _insight("i1", "pricing objections")
+    store.store(insight)
+    insight.content = "discount approvals"
+    store.update(insight)
+    assert store.query("cro", query="pricing") == []
+    assert [i.id for i in store.query("cro", query="discount")] == ["i1"]
+
+
+def test_sqlite_fact_store_ranks_by_bm25():
+    store = SQLiteFactStore()
+    store.store(Fact(id="f1", content="pricing mentioned once in a long sentence about many other things"))
+    store.store(Fact(id="f2", content="pricing pricing pricing"))
+    assert [f.id for f in store.query(query="pricing")] == ["f2", "f1"]
+
+
+
+# --- Query semantics shared by the in-memory and SQLite stores ---
+
+
+def _stores(backend):
+    if backend == "memory":
+        return InMemoryFactStore(), InMemoryInsightStore()
+    db = SQLiteMemoryDB()
+    if backend == "sqlite-like":
+        db.fts = False  # SQLite built without FTS5
+    return SQLiteFactStore(db), SQLiteInsightStore(db)
+
+
+_CONTENTS = {
+    "1": "Pricing page redesign shipped",
+    "2": "Enterprise pricing objections rising",
+    "3": "Webinar signups doubled",
+    "4": "pricing pricing pricing",
+    "5": "Acme renewal at risk",
+}
+
+_QUERIES = [
+    ("pricing", {"1", "2", "4"}),
+    ("PRICING", {"1", "2", "4"}),
+    ("enterprise pricing", {"2"}),  # a phrase, not any of its words
+    ("pricing enterprise", set()),
+    ("acm", {"5"}),  # part of a word
+    ("ng pa", {"1"}),  # across a word boundary
+    ("r", {"1", "2", "3", "4", "5"}),
+    ("100%", set()),
+]
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite", "sqlite-like"])
+def test_query_matches_the_same_facts_and_insights(backend):
+    facts, insights = _stores(backend)
+    for n, content in _CONTENTS.items():
+        facts.store(Fact(id=f"f{n}", content=content, domain="sales"))
+        insights.store(_insight(f"i{n}", content, domain="sales", minutes=int(n)))
+    insights.store(_insight("other", "pricing", agent_id="cmo"))
+
+    for query, expected in _QUERIES:
+        assert {f.id[1:] for f in facts.query(query=query)} == expected, query
+        found = insights.query("cro", domain="sales", query=query)
+        assert {i.id[1:] for i in found} == expected, query
+    if backend != "sqlite-like":  # the LIKE fallback doesn't rank
+        assert facts.query(query="pricing")[0].id == "f4"
+        assert insights.query("cro", query="pricing")[0].id == "i4"
+
+# --- Embeddings (optional numpy) ---
+
+
+class _SynonymEmbedder:
+    """Maps a tiny vocabulary onto shared concept axes."""
+
+    dim = 3
+    concepts = {"price": 0, "pricing": 0, "cost": 0, "webinar": 1, "churn": 2}
+
+    def embed(self, texts):
+        np = pytest.importorskip("numpy")
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in tokenize(text):
+                if token in self.concepts:
+                    out[row, self.concepts[token]] += 1.0
+        return out
+
+
+def test_embedding_index_cosine_top_k():
+    pytest.importorskip("numpy")
+    from openvibe_sdk.memory.retrieval import EmbeddingIndex, HashingEmbedder
+
+    index = EmbeddingIndex(HashingEmbedder(dim=256), initial_capacity=2)
+    index.add("a", "pricing objections enterprise")
+    index.add("b", "webinar signups doubled")
+    index.add("c", "pricing objections")  # forces matrix growth
+    index.remove("b")
+    results = index.search("pricing objections", limit=2)
+    assert [doc for doc, _ in results] == ["c", "a"]
+    assert results[0][1] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_store_with_embedder_matches_without_shared_terms():
+    pytest.importorskip("numpy")
+    store = InMemoryFactStore(embedder=_SynonymEmbedder())
+    store.store(Fact(id="f1", content="cost concerns from procurement"))
+    store.store(Fact(id="f2", content="webinar recap"))
+    assert [f.id for f in store.query(query="pricing")] == ["f1"]
+
+
+def test_retrieval_index_fuses_lexical_and_dense():
+    pytest.importorskip("numpy")
+    index = RetrievalIndex(embedder=_SynonymEmbedder())
+    index.add("lexical", "pricing review")
+    index.add("dense", "cost review")
+    index.add("other", "churn review")
+    scores = index.scores("pricing")
+    assert max(scores, key=scores.get) == "lexical"
+    assert "dense" in scores
+    assert "other" not in scores
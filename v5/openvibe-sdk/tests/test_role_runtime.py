@@ -98,3 +98,25 @@ def test_activate_unknown_workflow():
         runtime.activate("cro", "revenue_ops", "missing_wf", {})
 
 
+
+
+def test_activate_caches_compiled_graph():
+    runtime = RoleRuntime(roles=[CRO], llm=FakeLLM())
+    factory = MagicMock(return_value=MagicMock())
+    runtime.register_workflow("revenue_ops", "qualify", factory)
+    runtime.activate("cro", "revenue_ops", "qualify", {})
+    runtime.activate("cro", "revenue_ops", "qualify", {})
+    factory.assert_called_once()
+
+    runtime.register_workflow("revenue_ops", "qualify", factory)
+    runtime.activate("cro", "revenue_ops", "qualify", {})
+    assert factory.call_count == 2
+
+
+def test_activate_without_graph_cache():
+    runtime = RoleRuntime(roles=[CRO], llm=FakeLLM(), cache_graphs=False)
+    factory = MagicMock(return_value=MagicMock())
+    runtime.register_workflow("revenue_ops", "qualify", factory)
+    runtime.activate("cro", "revenue_ops", "qualify", {})
+    runtime.activate("cro", "revenue_ops", "qualify", {})
+    assert factory.call_count == 2
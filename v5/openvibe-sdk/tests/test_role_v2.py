@@ -17,9 +17,11 @@ class FakeLLM:
     def __init__(self, content="output"):
         self.content = content
         self.last_system = None
+        self.last_cache_prefix = None
 
     def call(self, *, system, messages, **kwargs):
         self.last_system = system
+        self.last_cache_prefix = kwargs.get("cache_prefix")
         return LLMResponse(content=self.content, tokens_in=10, tokens_out=20)
 
 
@@ -112,6 +114,80 @@ def test_memory_scope_assembled_via_role():
     assert "Test insight for revenue" in llm.last_system
 
 
+def test_cache_prefix_is_soul_plus_docstring_without_memory():
+    llm = FakeLLM()
+    agent_mem = AgentMemory(agent_id="cro")
+    agent_mem.store_insight(Insight(
+        id="ins1", agent_id="cro", content="Test insight for revenue",
+        confidence=0.9, evidence_count=5, source_episode_ids=[],
+        created_at=datetime.now(timezone.utc), domain="revenue",
+    ))
+    role = CRO(llm=llm, agent_memory=agent_mem)
+    role.get_operator("revenue_ops").qualify({"lead": "Acme"})
+
+    assert llm.last_cache_prefix == (
+        "You are the CRO. Data-driven.\n\nYou are a lead qualifier."
+    )
+    assert llm.last_system.startswith(llm.last_cache_prefix)
+    assert "Test insight" not in llm.last_cache_prefix
+
+
+def test_respond_caches_soul_prefix():
+    llm = FakeLLM()
+    role = CRO(llm=llm, agent_memory=AgentMemory(agent_id="cro"))
+    role.respond("hello")
+    assert llm.last_cache_prefix == "You are the CRO. Data-driven."
+
+
+
+class BaselineLLM:
+    """A provider written to the LLMProvider protocol before cache_prefix."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def call(self, *, system, messages, model="haiku", max_tokens=4096,
+             temperature=0.7, tools=None):
+        self.calls += 1
+        return LLMResponse(content="output")
+
+
+def test_providers_without_cache_prefix_still_work():
+    import asyncio
+
+    from openvibe_sdk.llm import acall_llm
+    from openvibe_sdk.llm.cache import CachingLLMProvider
+    from openvibe_sdk.llm.ratelimit import RateLimitedLLMProvider
+    from openvibe_sdk.operator import agent_node
+
+    class Research(Operator):
+        @agent_node(output_key="out")
+        def investigate(self, state):
+            """You research."""
+            return "go"
+
+    for llm in (
+        BaselineLLM(),
+        CachingLLMProvider(BaselineLLM(), max_temperature=None),
+        RateLimitedLLMProvider(BaselineLLM()),
+    ):
+        role = CRO(llm=llm, agent_memory=AgentMemory(agent_id="cro"))
+        assert role.get_operator("revenue_ops").qualify({"lead": "Acme"})["score"] == "output"
+        assert role.respond("hello").content == "output"
+        assert list(role.respond_stream("hello"))[-1].type == "done"
+        assert Research(llm=llm).investigate({})["out"] == "output"
+        assert asyncio.run(acall_llm(
+            llm, system="s", messages=[], cache_prefix="s",
+        )).content == "output"
+
+
+def test_supports_cache_prefix_overrides_signature_check():
+    llm = FakeLLM()
+    llm.supports_cache_prefix = False
+    CRO(llm=llm, agent_memory=AgentMemory(agent_id="cro")).respond("hello")
+    assert llm.last_cache_prefix is None
+
+
 # --- _RoleAwareLLM: soul-only when agent_memory ---
 
 def test_role_aware_llm_soul_only_with_agent_memory():
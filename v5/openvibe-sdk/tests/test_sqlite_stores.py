@@ -0,0 +1,277 @@
+"""Tests for SQLite V2 store implementations."""
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+from openvibe_sdk.memory.backends import create_memory_stores
+from openvibe_sdk.memory.in_memory import InMemoryEpisodicStore
+from openvibe_sdk.memory.sqlite import (
+    SQLiteEpisodicStore,
+    SQLiteFactStore,
+    SQLiteInsightStore,
+    SQLiteMemoryDB,
+)
+from openvibe_sdk.memory.stores import EpisodicStore, FactStore, InsightStore
+from openvibe_sdk.memory.types import Classification, Episode, Fact, Insight
+from openvibe_sdk.models import MemoryConfig
+
+
+def _make_episode(id, agent_id="cro", entity="", domain="", tags=None, ts=None):
+    return Episode(
+        id=id,
+        agent_id=agent_id,
+        operator_id="test_op",
+        node_name="test_node",
+        timestamp=ts or datetime.now(timezone.utc),
+        action="test_action",
+        input_summary="input",
+        output_summary="output",
+        outcome={"tool_calls": []},
+        duration_ms=100,
+        tokens_in=10,
+        tokens_out=20,
+        entity=entity,
+        domain=domain,
+        tags=tags or [],
+    )
+
+
+def _make_insight(id, agent_id="cro", content="test", entity="", domain="",
+                  tags=None, created_at=None):
+    return Insight(
+        id=id,
+        agent_id=agent_id,
+        content=content,
+        confidence=0.8,
+        evidence_count=3,
+        source_episode_ids=["ep1"],
+        created_at=created_at or datetime.now(timezone.utc),
+        entity=entity,
+        domain=domain,
+        tags=tags or [],
+    )
+
+
+# --- FactStore ---
+
+
+def test_sqlite_stores_implement_protocols():
+    db = SQLiteMemoryDB()
+    assert isinstance(SQLiteFactStore(db), FactStore)
+    assert isinstance(SQLiteEpisodicStore(db), EpisodicStore)
+    assert isinstance(SQLiteInsightStore(db), InsightStore)
+
+
+def test_fact_store_round_trips_all_fields():
+    store = SQLiteFactStore()
+    fact = Fact(
+        id="f1", content="Acme has 200 employees", entity="acme",
+        domain="customer", tags=["size"], confidence=0.9,
+        classification=Classification.CONFIDENTIAL,
+        last_accessed=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+    store.store(fact)
+    assert store.get("f1") == fact
+    assert store.get("missing") is None
+
+
+def test_fact_store_filters():
+    store = SQLiteFactStore()
+    store.store(Fact(id="f1", content="Acme info", entity="acme", domain="customer", tags=["a"]))
+    store.store(Fact(id="f2", content="Beta info", entity="beta", domain="customer", tags=["b"]))
+    store.store(Fact(id="f3", content="Acme churn", entity="acme", domain="risk", confidence=0.2))
+    assert [f.id for f in store.query(entity="acme")] == ["f1", "f3"]
+    assert [f.id for f in store.query(domain="customer")] == ["f1", "f2"]
+    assert [f.id for f in store.query(tags=["b", "a"])] == ["f1", "f2"]
+    assert [f.id for f in store.query(min_confidence=0.5)] == ["f1", "f2"]
+    assert [f.id for f in store.query(limit=1)] == ["f1"]
+
+
+def test_fact_store_text_query_is_case_insensitive_substring():
+    store = SQLiteFactStore()
+    store.store(Fact(id="f1", content="Acme raised Series B"))
+    store.store(Fact(id="f2", content="Beta is hiring"))
+    assert [f.id for f in store.query(query="series b")] == ["f1"]
+    assert [f.id for f in store.query(query="ETA")] == ["f2"]
+    # Short queries fall back to LIKE
+    assert [f.id for f in store.query(query="b")] == ["f1", "f2"]
+
+
+def test_fact_store_update_reindexes_and_delete():
+    store = SQLiteFactStore()
+    fact = Fact(id="f1", content="old text", tags=["x"])
+    store.store(fact)
+    fact.content = "new text"
+    fact.tags = ["y"]
+    store.update(fact)
+    assert store.query(query="old") == []
+    assert store.query(tags=["x"]) == []
+    assert store.query(tags=["y"])[0].content == "new text"
+    store.delete("f1")
+    assert store.get("f1") is None
+    assert store.query(query="new") == []
+
+
+# --- EpisodicStore ---
+
+
+def test_episodic_store_newest_first_with_filters():
+    store = SQLiteEpisodicStore()
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i in range(6):
+        store.store(_make_episode(
+            f"ep{i}", entity="acme" if i % 2 else "beta",
+            tags=["x"] if i < 3 else ["y"], ts=base + timedelta(hours=i),
+        ))
+    store.store(_make_episode("other", agent_id="cmo", ts=base))
+    assert [e.id for e in store.query("cro", limit=3)] == ["ep5", "ep4", "ep3"]
+    assert [e.id for e in store.query("cro", entity="acme")] == ["ep5", "ep3", "ep1"]
+    assert [e.id for e in store.query("cro", tags=["x"])] == ["ep2", "ep1", "ep0"]
+    since = base + timedelta(hours=4)
+    assert [e.id for e in store.query("cro", since=since)] == ["ep5", "ep4"]
+    assert [e.id for e in store.query("cmo")] == ["other"]
+
+
+def test_episodic_store_round_trips_episode():
+    store = SQLiteEpisodicStore()
+    episode = _make_episode("ep1", domain="sales", tags=["t"])
+    store.store(episode)
+    assert store.query("cro") == [episode]
+
+
+def test_episodic_store_batches_writes_until_full_or_read():
+    db = SQLiteMemoryDB()
+    store = SQLiteEpisodicStore(db, batch_size=3)
+    store.store(_make_episode("ep1"))
+    store.store(_make_episode("ep2"))
+    with db.read() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM episodes").fetchone()[0] == 0
+    store.store(_make_episode("ep3"))
+    with db.read() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM episodes").fetchone()[0] == 3
+    store.store(_make_episode("ep4"))
+    assert len(store.query("cro")) == 4  # query flushes pending writes
+
+
+def test_episodic_store_matches_in_memory_results():
+    sqlite_store = SQLiteEpisodicStore()
+    memory_store = InMemoryEpisodicStore()
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i in range(50):
+        ep = _make_episode(
+            f"ep{i}", agent_id=f"a{i % 3}", domain=f"d{i % 4}",
+            tags=[f"t{i % 5}"], ts=base + timedelta(minutes=i),
+        )
+        sqlite_store.store(ep)
+        memory_store.store(ep)
+    for kwargs in ({}, {"domain": "d1"}, {"tags": ["t2", "t3"]},
+                   {"since": base + timedelta(minutes=20), "limit": 5}):
+        for agent in ("a0", "a1", "a2"):
+            assert (
+                [e.id for e in sqlite_store.query(agent, **kwargs)]
+                == [e.id for e in memory_store.query(agent, **kwargs)]
+            )
+
+
+# --- InsightStore ---
+
+
+def test_insight_store_query_and_update():
+    store = SQLiteInsightStore()
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    store.store(_make_insight("i1", content="Pricing objections rise in Q4",
+                              domain="sales", created_at=base))
+    store.store(_make_insight("i2", content="Webinars convert well",
+                              domain="marketing", tags=["channel"],
+                              created_at=base + timedelta(days=1)))
+    assert [i.id for i in store.query("cro")] == ["i2", "i1"]
+    assert [i.id for i in store.query("cro", domain="sales")] == ["i1"]
+    assert [i.id for i in store.query("cro", tags=["channel"])] == ["i2"]
+    assert [i.id for i in store.query("cro", query="pricing")] == ["i1"]
+
+    insight = store.query("cro", domain="sales")[0]
+    insight.content = "Discounting wins Q4 deals"
+    insight.evidence_count = 7
+    store.update(insight)
+    assert store.query("cro", query="pricing") == []
+    assert store.query("cro", query="discount")[0].evidence_count == 7
+
+
+def test_insight_store_find_similar():
+    store = SQLiteInsightStore()
+    store.store(_make_insight("i1", content="enterprise deals close slower in december"))
+    assert store.find_similar("cro", "enterprise deals close slower").id == "i1"
+    assert store.find_similar("cro", "webinar attendance is low") is None
+    assert store.find_similar("cmo", "enterprise deals close slower") is None
+
+
+# --- Durability + concurrency ---
+
+
+def test_stores_persist_across_reopen(tmp_path):
+    path = str(tmp_path / "memory.db")
+    db = SQLiteMemoryDB(path)
+    SQLiteFactStore(db).store(Fact(id="f1", content="durable fact"))
+    episodic = SQLiteEpisodicStore(db, batch_size=10)
+    episodic.store(_make_episode("ep1"))
+    episodic.close()
+    SQLiteInsightStore(db).store(_make_insight("i1", content="durable insight"))
+    db.close()
+
+    reopened = SQLiteMemoryDB(path)
+    assert SQLiteFactStore(reopened).get("f1").content == "durable fact"
+    assert [e.id for e in SQLiteEpisodicStore(reopened).query("cro")] == ["ep1"]
+    assert SQLiteInsightStore(reopened).query("cro", query="durable")[0].id == "i1"
+    reopened.close()
+
+
+def test_concurrent_writers_share_file_database(tmp_path):
+    db = SQLiteMemoryDB(str(tmp_path / "memory.db"))
+    store = SQLiteEpisodicStore(db, batch_size=5)
+
+    def worker(n):
+        for i in range(20):
+            store.store(_make_episode(f"ep{n}_{i}", agent_id=f"agent{n}"))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    store.flush()
+    for n in range(4):
+        assert len(store.query(f"agent{n}", limit=100)) == 20
+    db.close()
+
+
+def test_create_memory_stores_sqlite_backend(tmp_path):
+    stores = create_memory_stores(
+        MemoryConfig(backend="sqlite", path=str(tmp_path / "m.db"))
+    )
+    assert isinstance(stores.facts, SQLiteFactStore)
+    assert isinstance(stores.episodic, SQLiteEpisodicStore)
+    assert isinstance(stores.insights, SQLiteInsightStore)
+
+
+def test_short_lived_threads_share_a_bounded_set_of_connections(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+    from unittest.mock import patch
+
+    db = SQLiteMemoryDB(str(tmp_path / "memory.db"), max_readers=4)
+    store = SQLiteFactStore(db)
+    store.store(Fact(id="f1", content="pooled fact"))
+    opened = []
+    connect = db._connect
+
+    def counting_connect():
+        conn = connect()
+        opened.append(conn)
+        return conn
+
+    with patch.object(db, "_connect", counting_connect):
+        for _ in range(50):  # a fresh executor per round: new threads every time
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                assert all(pool.map(lambda _: store.get("f1"), range(8)))
+
+    assert len(opened) <= 4
+    db.close()
@@ -0,0 +1,200 @@
+"""Tests for streaming LLM calls, llm_node sinks, and runtime streams."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+
+from openvibe_sdk.llm import (
+    LLMError,
+    LLMResponse,
+    StreamEvent,
+    astream_llm,
+    stream_llm,
+    stream_to,
+)
+from openvibe_sdk.llm.anthropic import AnthropicProvider
+from openvibe_sdk.llm.cache import CachingLLMProvider
+from openvibe_sdk.llm.ratelimit import RateLimitedLLMProvider
+from openvibe_sdk.memory.agent_memory import AgentMemory
+from openvibe_sdk.operator import Operator, async_llm_node, llm_node
+from openvibe_sdk.role import Role
+from openvibe_sdk.runtime import RoleRuntime
+
+
+class ChunkedLLM:
+    def __init__(self, chunks=("a", "b", "c")):
+        self.chunks = list(chunks)
+        self.calls = 0
+
+    def call(self, *, system, messages, **kwargs):
+        self.calls += 1
+        return LLMResponse(content="".join(self.chunks), tokens_in=4, tokens_out=3)
+
+    def stream(self, *, system, messages, **kwargs):
+        self.calls += 1
+        for chunk in self.chunks:
+            yield StreamEvent(type="text", text=chunk)
+        yield StreamEvent(
+            type="done",
+            response=LLMResponse(
+                content="".join(self.chunks), tokens_in=4, tokens_out=3
+            ),
+        )
+
+
+class PlainLLM:
+    def call(self, *, system, messages, **kwargs):
+        return LLMResponse(content="whole", tokens_in=1, tokens_out=1)
+
+
+def _req():
+    return dict(system="sys", messages=[{"role": "user", "content": "hi"}])
+
+
+def _text(events):
+    return "".join(e.text for e in events if e.type == "text")
+
+
+def test_stream_llm_falls_back_to_call():
+    events = list(stream_llm(PlainLLM(), **_req()))
+    assert [e.type for e in events] == ["text", "done"]
+    assert events[-1].response.content == "whole"
+
+
+def test_astream_llm_falls_back_to_call():
+    async def collect():
+        return [e async for e in astream_llm(PlainLLM(), **_req())]
+
+    events = asyncio.run(collect())
+    assert _text(events) == "whole"
+
+
+def test_anthropic_stream_maps_events(mocker):
+    text_event = MagicMock(type="text", text="Hel")
+    tool_block = MagicMock(type="tool_use", id="t1", input={"q": 1})
+    tool_block.name = "search"
+    stop_event = MagicMock(type="content_block_stop", content_block=tool_block)
+    final = MagicMock()
+    final.content = []
+    final.usage.input_tokens = 5
+    final.usage.output_tokens = 7
+    final.stop_reason = "tool_use"
+
+    stream = MagicMock()
+    stream.__enter__.return_value = stream
+    stream.__iter__.return_value = iter([text_event, stop_event])
+    stream.get_final_message.return_value = final
+    client = MagicMock()
+    client.messages.stream.return_value = stream
+    mocker.patch("openvibe_sdk.llm.anthropic.Anthropic", return_value=client)
+
+    events = list(AnthropicProvider(api_key="k").stream(**_req()))
+    assert [e.type for e in events] == ["text", "tool_use", "done"]
+    assert events[1].tool_call.name == "search"
+    assert events[2].response.tokens_out == 7
+
+
+def test_anthropic_stream_wraps_errors(mocker):
+    client = MagicMock()
+    client.messages.stream.side_effect = RuntimeError("boom")
+    mocker.patch("openvibe_sdk.llm.anthropic.Anthropic", return_value=client)
+    with pytest.raises(LLMError):
+        list(AnthropicProvider(api_key="k").stream(**_req()))
+
+
+class SummaryOps(Operator):
+    operator_id = "summary_ops"
+
+    @llm_node(output_key="summary")
+    def summarize(self, state):
+        """Summarize."""
+        return "data"
+
+    @async_llm_node(output_key="summary")
+    async def asummarize(self, state):
+        """Summarize."""
+        return "data"
+
+
+def test_llm_node_streams_into_sink():
+    seen = []
+    op = SummaryOps(llm=ChunkedLLM())
+    with stream_to(seen.append):
+        state = op.summarize({})
+    assert state["summary"] == "abc"
+    assert [e.type for e in seen] == ["text", "text", "text", "done"]
+    assert {e.node for e in seen} == {"summarize"}
+
+
+def test_llm_node_without_sink_uses_call():
+    llm = ChunkedLLM()
+    llm.stream = MagicMock()
+    SummaryOps(llm=llm).summarize({})
+    llm.stream.assert_not_called()
+
+
+def test_async_llm_node_streams_into_sink():
+    seen = []
+
+    async def run():
+        with stream_to(seen.append):
+            return await SummaryOps(llm=ChunkedLLM()).asummarize({})
+
+    assert asyncio.run(run())["summary"] == "abc"
+    assert _text(seen) == "abc"
+    assert seen[-1].node == "asummarize"
+
+
+def test_caching_provider_streams_miss_then_replays_hit():
+    inner = ChunkedLLM()
+    llm = CachingLLMProvider(inner)
+    first = list(llm.stream(**_req(), temperature=0.0))
+    second = list(llm.stream(**_req(), temperature=0.0))
+    assert inner.calls == 1
+    assert first[-1].response.cache_status == "miss"
+    assert second[-1].response.cache_status == "hit"
+    assert _text(second) == "abc"
+
+
+def test_rate_limited_stream_releases_slot():
+    llm = RateLimitedLLMProvider(ChunkedLLM())
+    events = list(llm.stream(**_req()))
+    assert _text(events) == "abc"
+    stats = next(iter(llm.limiter.stats().values()))
+    assert stats.in_flight == 0
+    assert stats.granted == 1
+
+
+class Writer(Role):
+    role_id = "writer"
+    operators = [SummaryOps]
+
+
+def test_respond_stream_records_episode():
+    memory = AgentMemory(agent_id="writer")
+    role = Writer(llm=ChunkedLLM(), agent_memory=memory)
+    events = list(role.respond_stream("hello"))
+    assert _text(events) == "abc"
+    episodes = memory.recall_episodes(limit=5)
+    assert episodes[0].action == "respond"
+    assert episodes[0].output_summary == "abc"
+
+
+def test_runtime_stream_yields_deltas_and_node_outputs():
+    def factory(operator):
+        graph = StateGraph(dict)
+        graph.add_node("summarize", operator.summarize)
+        graph.add_edge(START, "summarize")
+        graph.add_edge("summarize", END)
+        return graph.compile()
+
+    runtime = RoleRuntime(roles=[Writer], llm=ChunkedLLM())
+    runtime.register_workflow("summary_ops", "daily", factory)
+    events = list(runtime.stream("writer", "summary_ops", "daily", {}))
+    assert [e.type for e in events] == ["text", "text", "text", "done", "node"]
+    assert events[-1].output["summary"] == "abc"
+
+    with pytest.raises(ValueError):
+        runtime.stream("writer", "summary_ops", "missing", {})
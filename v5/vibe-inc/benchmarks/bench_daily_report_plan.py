@@ -0,0 +1,202 @@
+"""Benchmark: daily report fetch — per-window queries vs merged scans.
+
+Replays the daily report query plan against a SQLite stand-in for Redshift
+(synthetic fct_order / fct_ads_ad_metrics / session / conversion tables
+attached as schema ``common``). Three modes:
+
+    sequential  one query per window, one after another (the old fetch)
+    concurrent  one query per window, all in flight at once
+    merged      same-table windows merged into one scan, all in flight
+
+Each worker thread opens its own connection, as pooled Redshift
+connections would. Results of all modes are checked for equality.
+
+SQLite runs in-process on a page-cached file, so it has none of the per-query
+cost that dominates on Redshift (WLM queueing, leader-node compile, network
+round trip). --latency-ms adds that fixed cost to every query and --slots
+caps queries in flight like a WLM queue (Redshift's default is 5). With
+--latency-ms 0 the numbers show pure scan/aggregate CPU on a row store,
+where a merged scan evaluates more CASE expressions per row than the
+per-window queries do and so gains little; on a columnar warehouse the
+merged scan also reads each column block once instead of once per window.
+
+    python benchmarks/bench_daily_report_plan.py [--days 60] [--rows-per-day 3000]
+        [--repeat 5] [--latency-ms 40] [--slots 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+for sibling in ("openvibe-sdk", "openvibe-runtime"):
+    sys.path.insert(0, str(ROOT.parent / sibling / "src"))
+
+from vibe_inc.roles.d2c_growth.daily_report_queries import build_plan, run_plan  # noqa: E402
+
+_SCHEMA = """
+CREATE TABLE common.fct_order (
+    created_at TEXT, board_net_sales REAL, bot_net_sales REAL, net_sales REAL);
+CREATE TABLE common.fct_ads_ad_metrics (
+    date TEXT, platform TEXT, dim_ads_campaign_sk TEXT, spend_in_usd REAL,
+    impressions INT, clicks INT, purchase_count INT);
+CREATE TABLE common.dim_ads_campaign (dim_ads_campaign_sk TEXT, campaign_name TEXT);
+CREATE TABLE common.fct_ads_amazon_ad_group_metrics (
+    date TEXT, channel TEXT, spend_in_usd REAL, impressions INT, clicks INT,
+    conversions14d INT, sales14d REAL);
+CREATE TABLE common.fct_website_session (
+    session_first_page_tstamp TEXT, session_traffic_channel TEXT,
+    session_page_viewed INT, session_time_engaged_in_s REAL);
+CREATE TABLE common.fct_website_visitor_conversion (
+    original_tstamp TEXT, conversion TEXT, conversion_value REAL);
+"""
+
+_PLATFORMS = ["facebook", "google", "tiktok", "linkedin", "pinterest", "bing"]
+_CHANNELS = ["paid_social", "paid_search", "organic", "direct", "email", "referral"]
+_CONVERSIONS = ["visitor_add_to_cart", "visitor_init_checkout", "visitor_close_won"]
+
+
+def _load(path: str, days: int, rows_per_day: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    conn = sqlite3.connect(":memory:")
+    conn.execute(f"ATTACH DATABASE '{path}' AS common")
+    conn.executescript(_SCHEMA)
+    today = datetime.now(UTC).date()
+    campaigns = [f"c{i}" for i in range(200)]
+    conn.executemany(
+        "INSERT INTO common.dim_ads_campaign VALUES (?, ?)",
+        [(c, f"Campaign {c}") for c in campaigns],
+    )
+    for offset in range(days):
+        day = (today - timedelta(days=offset)).isoformat()
+        stamp = f"{day} 12:00:00"
+        conn.executemany("INSERT INTO common.fct_order VALUES (?, ?, ?, ?)", [
+            (stamp, rng.random() * 500, rng.random() * 300, rng.random() * 800)
+            for _ in range(rows_per_day // 10)
+        ])
+        conn.executemany("INSERT INTO common.fct_ads_ad_metrics VALUES (?, ?, ?, ?, ?, ?, ?)", [
+            (day, rng.choice(_PLATFORMS), rng.choice(campaigns), rng.random() * 100,
+             rng.randint(0, 5000), rng.randint(0, 200), rng.randint(0, 5))
+            for _ in range(rows_per_day)
+        ])
+        conn.executemany("INSERT INTO common.fct_ads_amazon_ad_group_metrics VALUES (?, ?, ?, ?, ?, ?, ?)", [
+            (day, rng.choice(["sp", "sb", "sd"]), rng.random() * 50, rng.randint(0, 3000),
+             rng.randint(0, 100), rng.randint(0, 4), rng.random() * 200)
+            for _ in range(rows_per_day // 10)
+        ])
+        conn.executemany("INSERT INTO common.fct_website_session VALUES (?, ?, ?, ?)", [
+            (stamp, rng.choice(_CHANNELS), rng.randint(1, 12), rng.random() * 300)
+            for _ in range(rows_per_day)
+        ])
+        conn.executemany("INSERT INTO common.fct_website_visitor_conversion VALUES (?, ?, ?)", [
+            (stamp, rng.choice(_CONVERSIONS), rng.random() * 100)
+            for _ in range(rows_per_day // 2)
+        ])
+    conn.commit()
+    conn.close()
+
+
+class _Executor:
+    """analytics_query_sql_group stand-in: {name: (sql, params)} -> {name: result}."""
+
+    def __init__(self, path: str, concurrent: bool, latency_ms: float, slots: int):
+        self.path = path
+        self.concurrent = concurrent
+        self.latency = latency_ms / 1000
+        self._local = threading.local()
+        self._pool = ThreadPoolExecutor(max_workers=slots) if concurrent else None
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            conn.execute(f"ATTACH DATABASE '{self.path}' AS common")
+            self._local.conn = conn
+        return conn
+
+    def _run(self, sql: str, params: tuple) -> dict:
+        time.sleep(self.latency)
+        cur = self._conn().execute(sql.replace("%s", "?"), params)
+        columns = [d[0] for d in cur.description]
+        return {"rows": [dict(zip(columns, row)) for row in cur.fetchall()], "columns": columns}
+
+    def __call__(self, queries: dict) -> dict:
+        if not self.concurrent:
+            return {name: self._run(*q) for name, q in queries.items()}
+        futures = {name: self._pool.submit(self._run, *q) for name, q in queries.items()}
+        return {name: f.result() for name, f in futures.items()}
+
+
+def _round(value):
+    if isinstance(value, float):
+        return round(value, 6)
+    if isinstance(value, dict):
+        return {k: _round(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_round(v) for v in value]
+    return value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--rows-per-day", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--slots", type=int, default=5)
+    args = parser.parse_args()
+    cost = (args.latency_ms, args.slots)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "warehouse.sqlite")
+        _load(path, args.days, args.rows_per_day)
+        date = (datetime.now(UTC) - timedelta(days=1)).strftime("%Y-%m-%d")
+
+        modes = {
+            "sequential": (build_plan(date, merge=False), _Executor(path, False, *cost)),
+            "concurrent": (build_plan(date, merge=False), _Executor(path, True, *cost)),
+            "merged": (build_plan(date), _Executor(path, True, *cost)),
+        }
+        timings: dict[str, list[float]] = {}
+        outputs = {}
+        for mode, (plan, execute) in modes.items():
+            outputs[mode] = _round(run_plan(plan, execute))  # warm-up + result check
+            samples = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                run_plan(plan, execute)
+                samples.append((time.perf_counter() - start) * 1000)
+            timings[mode] = samples
+
+        assert outputs["merged"] == outputs["sequential"] == outputs["concurrent"], "plans disagree"
+
+        print(
+            f"{args.days} days x {args.rows_per_day} rows/day, {args.repeat} runs per mode, "
+            f"{args.latency_ms:g} ms per-query latency, {args.slots} slots"
+        )
+        for mode, samples in timings.items():
+            queries = len(modes[mode][0])
+            print(
+                f"{mode:<11} {queries:>2} queries   "
+                f"p50 {statistics.median(samples):8.1f} ms   "
+                f"mean {statistics.fmean(samples):8.1f} ms"
+            )
+        print(
+            f"speedup vs sequential (median): "
+            f"{statistics.median(timings['sequential']) / statistics.median(timings['merged']):.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
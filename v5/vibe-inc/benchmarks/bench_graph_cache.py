@@ -0,0 +1,85 @@
+"""Benchmark: cold vs warm RoleRuntime.activate across every Vibe Inc workflow.
+
+Cold = graph compiled on this activation (cache cleared first); warm =
+compiled graph reused from the runtime's cache. A stub LLM answers
+instantly, so the difference is graph construction + compile overhead.
+
+    python benchmarks/bench_graph_cache.py [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+for sibling in ("openvibe-sdk", "openvibe-runtime"):
+    sys.path.insert(0, str(ROOT.parent / sibling / "src"))
+
+from openvibe_sdk.llm import LLMResponse  # noqa: E402
+
+from vibe_inc.main import create_runtime  # noqa: E402
+
+
+class _StubLLM:
+    def call(self, **kwargs):
+        return LLMResponse(content="{}")
+
+
+def _workflows(runtime):
+    owners = {}
+    for role in runtime.list_roles():
+        for operator_id in role.list_operators():
+            owners.setdefault(operator_id, role.role_id)
+    for operator_id, factories in runtime._workflow_factories.items():
+        for workflow_id in factories:
+            yield owners[operator_id], operator_id, workflow_id
+
+
+def _time_ms(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    runtime = create_runtime(_StubLLM())
+    workflows = list(_workflows(runtime))
+    cold: list[float] = []
+    warm: list[float] = []
+    for key in workflows:
+        run = lambda: runtime.activate(*key, {})  # noqa: E731
+        for _ in range(args.repeat):
+            runtime.clear_graph_cache()
+            cold.append(_time_ms(run))
+        run()  # populate cache
+        for _ in range(args.repeat):
+            warm.append(_time_ms(run))
+
+    def row(label: str, samples: list[float]) -> str:
+        samples = sorted(samples)
+        p95 = samples[int(len(samples) * 0.95) - 1]
+        return (
+            f"{label:<6} p50 {statistics.median(samples):7.3f} ms   "
+            f"p95 {p95:7.3f} ms   mean {statistics.fmean(samples):7.3f} ms"
+        )
+
+    print(f"{len(workflows)} workflows x {args.repeat} activations")
+    print(row("cold", cold))
+    print(row("warm", warm))
+    print(
+        f"speedup (median): "
+        f"{statistics.median(cold) / statistics.median(warm):.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -72,12 +72,13 @@ def run_workflow(
     console.print(f"[dim]Input: {json.dumps(parsed)}[/dim]\n")
 
     try:
-        result = runtime.activate(
-            role_id=role,
-            operator_id=operator,
-            workflow_id=workflow,
-            input_data=parsed,
-        )
+        with runtime:
+            result = runtime.activate(
+                role_id=role,
+                operator_id=operator,
+                workflow_id=workflow,
+                input_data=parsed,
+            )
     except Exception as exc:
         console.print(f"[red]Error: {exc}[/red]")
         raise typer.Exit(1)
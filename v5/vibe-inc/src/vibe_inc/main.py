@@ -68,14 +68,27 @@ from vibe_inc.roles.data_ops.workflows import (
     create_data_query_graph,
     create_freshness_check_graph,
 )
+from vibe_inc.tools.ads.report_jobs import close_scheduler
+from vibe_inc.tools.analytics.redshift import close_pool
+from vibe_inc.tools.http_clients import close_clients
+from vibe_inc.tools.memory_backend import close_backends
+from vibe_inc.tools.shared_memory import preload_memory
 
 
 def create_runtime(llm) -> RoleRuntime:
     """Create and configure the Vibe Inc RoleRuntime.
 
-    Registers all roles and workflow factories.
+    Registers all roles and workflow factories and parses the shared_memory
+    tree into the read cache. Closing the runtime closes the shared HTTP
+    clients, the report-job loop, the Redshift connection pool and the
+    shared_memory backends used by the tools.
     """
+    preload_memory()
     runtime = RoleRuntime(roles=[D2CGrowth, D2CStrategy, DataOps], llm=llm)
+    runtime.add_shutdown_hook(close_scheduler)
+    runtime.add_shutdown_hook(close_clients)
+    runtime.add_shutdown_hook(close_pool)
+    runtime.add_shutdown_hook(close_backends)
 
     # MetaAdOps workflows
     runtime.register_workflow("meta_ad_ops", "campaign_create", create_meta_campaign_create_graph)
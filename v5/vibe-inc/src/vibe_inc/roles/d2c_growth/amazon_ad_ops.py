@@ -3,12 +3,16 @@ from openvibe_sdk import Operator, agent_node
 
 from vibe_inc.tools.ads.amazon_ads import (
     amazon_ads_report,
+    amazon_ads_reports,
+    amazon_ads_report_submit,
+    amazon_ads_report_status,
     amazon_ads_campaigns,
     amazon_ads_keywords,
     amazon_ads_bid_update,
     amazon_ads_budget,
     amazon_ads_search_terms,
 )
+from vibe_inc.tools.ads.metrics_sync import ad_metrics_read
 
 
 class AmazonAdOps(Operator):
@@ -36,14 +40,17 @@ class AmazonAdOps(Operator):
         return f"Create Amazon Ads campaign from brief: {brief}"
 
     @agent_node(
-        tools=[amazon_ads_report, amazon_ads_bid_update, amazon_ads_budget],
+        tools=[
+            ad_metrics_read, amazon_ads_report, amazon_ads_reports,
+            amazon_ads_bid_update, amazon_ads_budget,
+        ],
         output_key="optimization_result",
     )
     def daily_optimize(self, state):
         """You are an Amazon Ads performance optimizer for Vibe hardware products.
 
         Review all active campaign performance from the last 24 hours:
-        1. Pull campaign and ad group reports via async reporting.
+        1. Pull campaign and ad group reports via async reporting (one amazon_ads_reports call).
         2. Calculate ACOS by campaign — compare against targets (Bot: 20%, Dot: 18%).
         3. Monitor TACoS (Total Advertising Cost of Sales) — target 10%.
         4. Optimization rules:
@@ -58,7 +65,10 @@ class AmazonAdOps(Operator):
         return f"Review and optimize all active Amazon campaigns for {date}."
 
     @agent_node(
-        tools=[amazon_ads_search_terms, amazon_ads_keywords, amazon_ads_bid_update],
+        tools=[
+            amazon_ads_search_terms, amazon_ads_keywords, amazon_ads_bid_update,
+            amazon_ads_report_submit, amazon_ads_report_status,
+        ],
         output_key="search_terms_result",
     )
     def search_term_harvesting(self, state):
@@ -80,14 +90,14 @@ class AmazonAdOps(Operator):
         return f"Harvest search terms for campaign {campaign_id}."
 
     @agent_node(
-        tools=[amazon_ads_report],
+        tools=[ad_metrics_read, amazon_ads_report, amazon_ads_reports],
         output_key="report",
     )
     def weekly_report(self, state):
         """You are an Amazon Ads performance analyst for Vibe.
 
         Generate a weekly performance report:
-        1. Pull campaign reports for all ad products (SP, SB, SD).
+        1. Pull campaign reports for all ad products (SP, SB, SD) in one amazon_ads_reports call.
         2. Calculate ACOS and TACoS by product (Bot, Dot).
         3. Report by ad product type: which is most efficient?
         4. Highlight top 5 keywords by orders and worst 5 by ACOS.
@@ -1,24 +1,35 @@
 """DailyReportOps operator — daily growth report from Redshift data."""
 
-import json
-
 from openvibe_sdk import Operator, agent_node
 
+from vibe_inc.tools.analytics.columnar import ColumnarResult
 from vibe_inc.tools.shared_memory import read_memory
 
-from .daily_report_queries import fetch_l1, fetch_l2, fetch_l3
+from .daily_report_queries import fetch_all
+
+
+def _format_layer(layer: dict) -> str:
+    """One compact markdown table per section, instead of indented JSON rows."""
+    return "\n\n".join(
+        f"{name}:\n{ColumnarResult.from_rows(rows).to_markdown(max_rows=25)}"
+        for name, rows in layer.items()
+    )
 
 
 class DailyReportOps(Operator):
     operator_id = "daily_report_ops"
 
     def fetch_data(self, state):
-        """Deterministic data fetching — runs pre-written SQL against Redshift."""
-        date = state.get("date")
+        """Deterministic data fetching — runs pre-written SQL against Redshift.
+
+        One merged query plan covers all three layers: same-table windows
+        share a scan and the remaining queries run concurrently.
+        """
+        layers = fetch_all(state.get("date"))
         return {
-            "l1_data": fetch_l1(date),
-            "l2_data": fetch_l2(date),
-            "l3_data": fetch_l3(date),
+            "l1_data": layers["l1"],
+            "l2_data": layers["l2"],
+            "l3_data": layers["l3"],
         }
 
     @agent_node(
@@ -62,9 +73,9 @@ class DailyReportOps(Operator):
         - Use read_memory("performance/cac-benchmarks") and
           read_memory("performance/platform_benchmarks") for exact thresholds.
         - Every number must have context: vs target, vs 7d avg, or vs 28d avg."""
-        l1 = json.dumps(state.get("l1_data", {}), indent=2, default=str)
-        l2 = json.dumps(state.get("l2_data", {}), indent=2, default=str)
-        l3 = json.dumps(state.get("l3_data", {}), indent=2, default=str)
+        l1 = _format_layer(state.get("l1_data", {}))
+        l2 = _format_layer(state.get("l2_data", {}))
+        l3 = _format_layer(state.get("l3_data", {}))
         date = state.get("date", "yesterday")
         return (
             f"Generate the Daily Growth Report for {date}.\n\n"
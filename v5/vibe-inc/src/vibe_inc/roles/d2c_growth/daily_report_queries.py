@@ -6,14 +6,23 @@ Queries follow Ricky's 3-layer framework:
 - L3: Funnel Signal (traffic, conversion rates)
 
 All queries are pre-written (deterministic). The LLM interprets results, not SQL.
+
+The report reads the same fact tables for several windows (yesterday, 7d
+and 28d averages). build_plan() merges those into one scan per table using
+conditional aggregation — ``SUM(CASE WHEN <window> THEN col END)`` — then
+the remaining independent queries all run as one concurrent group on pooled
+warehouse connections. Twelve queries become six, and the fetch takes as
+long as the slowest of them.
 """
 
 import re
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 
-from vibe_inc.tools.analytics_tools import analytics_query_sql
+from vibe_inc.tools.analytics_tools import analytics_query_sql_group
 
 _DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_REF_RE = re.compile(r"\{(\w+)\}")
 
 
 def _yesterday() -> str:
@@ -39,170 +48,311 @@ def _safe_date(date: str | None) -> str:
     return d
 
 
-def fetch_l1(date: str | None = None) -> dict:
-    """L1 Business Outcomes: revenue by product, orders, ad spend for CAC."""
+@dataclass(frozen=True)
+class PlannedQuery:
+    """One warehouse query and the report sections its rows feed.
+
+    outputs maps a column prefix to (layer, section). Prefix "" means the
+    rows belong to that section as-is; otherwise the query is a merged scan
+    whose ``<prefix>__<col>`` columns are split back into per-window rows.
+    """
+
+    name: str
+    sql: str
+    params: tuple
+    outputs: dict[str, tuple[str, str]]
+    keep_empty: frozenset[str] = frozenset()  # prefixes whose row is kept when the window is empty
+
+
+@dataclass
+class _Window:
+    prefix: str
+    target: tuple[str, str]
+    start: str
+    end: str
+    measures: dict[str, str]
+    keep_empty: bool
+
+
+def _next_day(day: str) -> str:
+    return (datetime.strptime(day, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+@dataclass
+class _Scan:
+    """Several date windows over one table, computed in one pass.
+
+    Measures are aggregate templates where ``{col}`` stands for the column
+    restricted to the window and ``{1}`` counts the window's rows, e.g.
+    ``"SUM({net_sales}) / 7.0"``. Merged, that renders as
+    ``SUM(CASE WHEN <window> THEN net_sales END) / 7.0`` over the union of
+    the windows; alone, as plain ``SUM(net_sales) / 7.0``.
+
+    Windows filter the raw date column (``created_at >= %s AND created_at
+    < %s``) rather than ``DATE(created_at)``, so sort-key/zone-map pruning
+    still applies.
+    """
+
+    name: str
+    table: str
+    date_column: str
+    timestamp: bool = False
+    group_by: str | None = None
+    windows: list[_Window] = field(default_factory=list)
+
+    def window(self, prefix, target, start, end=None, keep_empty=False, **measures) -> "_Scan":
+        self.windows.append(_Window(prefix, target, start, end or start, measures, keep_empty))
+        return self
+
+    def _cond(self, w: _Window, params: list) -> str:
+        col = self.date_column
+        if self.timestamp:
+            params.extend([w.start, _next_day(w.end)])
+            return f"{col} >= %s AND {col} < %s"
+        if w.start == w.end:
+            params.append(w.start)
+            return f"{col} = %s"
+        params.extend([w.start, w.end])
+        return f"{col} BETWEEN %s AND %s"
+
+    def _render(self, windows: list[_Window], name: str) -> PlannedQuery:
+        merged = len(windows) > 1
+        select = [self.group_by] if self.group_by else []
+        params: list = []
+        for w in windows:
+            def expand(match, w=w):
+                if not merged:
+                    return match.group(1)
+                return f"CASE WHEN {self._cond(w, params)} THEN {match.group(1)} END"
+
+            for alias, template in {"n": "COUNT({1})", **w.measures}.items():
+                select.append(f"{_REF_RE.sub(expand, template)} AS {w.prefix}__{alias}")
+        where = " OR ".join(f"({self._cond(w, params)})" for w in windows)
+        sql = f"SELECT {', '.join(select)} FROM {self.table} WHERE {where}"
+        if self.group_by:
+            sql += f" GROUP BY {self.group_by} ORDER BY {self.group_by}"
+        return PlannedQuery(
+            name=name,
+            sql=sql,
+            params=tuple(params),
+            outputs={w.prefix: w.target for w in windows},
+            keep_empty=frozenset(w.prefix for w in windows if w.keep_empty),
+        )
+
+    def plan(self, merge: bool = True) -> list[PlannedQuery]:
+        """One merged query, or (merge=False) one query per window."""
+        if merge:
+            return [self._render(self.windows, self.name)]
+        return [self._render([w], f"{self.name}_{w.prefix}") for w in self.windows]
+
+
+def _cpa(spend: str, purchases: str) -> str:
+    return (
+        f"CASE WHEN SUM({{{purchases}}}) > 0"
+        f" THEN SUM({{{spend}}}) / SUM({{{purchases}}}) ELSE NULL END"
+    )
+
+
+def build_plan(date: str | None = None, merge: bool = True) -> list[PlannedQuery]:
+    """Every query the daily report needs, same-table windows merged."""
     d = _safe_date(date)
     start_7d, end_7d = _rolling_window(7)
     start_28d, end_28d = _rolling_window(28)
 
-    revenue_yesterday = analytics_query_sql(
-        f"SELECT DATE(created_at) as date,"
-        f" SUM(board_net_sales) as board_revenue,"
-        f" SUM(bot_net_sales) as bot_revenue,"
-        f" SUM(net_sales) as total_revenue,"
-        f" COUNT(*) as order_count"
-        f" FROM common.fct_order"
-        f" WHERE DATE(created_at) = '{d}'"
-        f" GROUP BY 1"
+    orders = (
+        _Scan("orders", "common.fct_order", "created_at", timestamp=True)
+        .window(
+            "y", ("l1", "yesterday"), d,
+            date="DATE(MIN({created_at}))",
+            board_revenue="SUM({board_net_sales})",
+            bot_revenue="SUM({bot_net_sales})",
+            total_revenue="SUM({net_sales})",
+            order_count="COUNT({1})",
+        )
+        .window(
+            "w7", ("l1", "avg_7d"), start_7d, end_7d, keep_empty=True,
+            board_revenue_avg="SUM({board_net_sales}) / 7.0",
+            bot_revenue_avg="SUM({bot_net_sales}) / 7.0",
+            total_revenue_avg="SUM({net_sales}) / 7.0",
+            order_count_avg="COUNT({1}) / 7.0",
+        )
+        .window(
+            "w28", ("l1", "avg_28d"), start_28d, end_28d, keep_empty=True,
+            board_revenue_avg="SUM({board_net_sales}) / 28.0",
+            bot_revenue_avg="SUM({bot_net_sales}) / 28.0",
+            total_revenue_avg="SUM({net_sales}) / 28.0",
+            order_count_avg="COUNT({1}) / 28.0",
+        )
     )
 
-    revenue_7d = analytics_query_sql(
-        f"SELECT"
-        f" SUM(board_net_sales) / 7.0 as board_revenue_avg,"
-        f" SUM(bot_net_sales) / 7.0 as bot_revenue_avg,"
-        f" SUM(net_sales) / 7.0 as total_revenue_avg,"
-        f" COUNT(*) / 7.0 as order_count_avg"
-        f" FROM common.fct_order"
-        f" WHERE DATE(created_at) BETWEEN '{start_7d}' AND '{end_7d}'"
+    # L1 ad_spend (total spend yesterday) is derived from these rows in _derive().
+    platforms = (
+        _Scan("platforms", "common.fct_ads_ad_metrics", "date", group_by="platform")
+        .window(
+            "y", ("l2", "yesterday"), d,
+            spend="SUM({spend_in_usd})",
+            impressions="SUM({impressions})",
+            clicks="SUM({clicks})",
+            purchases="SUM({purchase_count})",
+            cpa=_cpa("spend_in_usd", "purchase_count"),
+        )
+        .window(
+            "w7", ("l2", "avg_7d"), start_7d, end_7d,
+            spend_avg="SUM({spend_in_usd}) / 7.0",
+            purchases_avg="SUM({purchase_count}) / 7.0",
+            cpa_avg=_cpa("spend_in_usd", "purchase_count"),
+        )
     )
 
-    revenue_28d = analytics_query_sql(
-        f"SELECT"
-        f" SUM(board_net_sales) / 28.0 as board_revenue_avg,"
-        f" SUM(bot_net_sales) / 28.0 as bot_revenue_avg,"
-        f" SUM(net_sales) / 28.0 as total_revenue_avg,"
-        f" COUNT(*) / 28.0 as order_count_avg"
-        f" FROM common.fct_order"
-        f" WHERE DATE(created_at) BETWEEN '{start_28d}' AND '{end_28d}'"
+    sessions = (
+        _Scan(
+            "sessions", "common.fct_website_session", "session_first_page_tstamp",
+            timestamp=True, group_by="session_traffic_channel",
+        )
+        .window(
+            "y", ("l3", "sessions_yesterday"), d,
+            sessions="COUNT({1})",
+            avg_pages="AVG({session_page_viewed})",
+            avg_time_s="AVG({session_time_engaged_in_s})",
+        )
+        .window("w7", ("l3", "sessions_7d"), start_7d, end_7d, sessions_avg="COUNT({1}) / 7.0")
     )
 
-    ad_spend = analytics_query_sql(
-        f"SELECT SUM(spend_in_usd) as total_spend"
-        f" FROM common.fct_ads_ad_metrics"
-        f" WHERE date = '{d}'"
+    funnel = (
+        _Scan(
+            "funnel", "common.fct_website_visitor_conversion", "original_tstamp",
+            timestamp=True, group_by="conversion",
+        )
+        .window("y", ("l3", "funnel_yesterday"), d, count="COUNT({1})", value="SUM({conversion_value})")
+        .window(
+            "w7", ("l3", "funnel_7d"), start_7d, end_7d,
+            count_avg="COUNT({1}) / 7.0",
+            value_avg="SUM({conversion_value}) / 7.0",
+        )
     )
 
-    return {
-        "yesterday": revenue_yesterday.get("rows", []),
-        "avg_7d": revenue_7d.get("rows", []),
-        "avg_28d": revenue_28d.get("rows", []),
-        "ad_spend": ad_spend.get("rows", []),
-    }
+    amazon = PlannedQuery(
+        name="amazon",
+        sql=(
+            "SELECT channel,"
+            " SUM(spend_in_usd) as spend,"
+            " SUM(impressions) as impressions,"
+            " SUM(clicks) as clicks,"
+            " SUM(conversions14d) as conversions,"
+            " SUM(sales14d) as sales,"
+            " CASE WHEN SUM(sales14d) > 0"
+            "   THEN SUM(spend_in_usd) / SUM(sales14d)"
+            "   ELSE NULL END as acos"
+            " FROM common.fct_ads_amazon_ad_group_metrics"
+            " WHERE date = %s"
+            " GROUP BY channel"
+        ),
+        params=(d,),
+        outputs={"": ("l2", "amazon")},
+    )
 
+    worst_campaigns = PlannedQuery(
+        name="worst_cpa_campaigns",
+        sql=(
+            "SELECT c.campaign_name, f.platform,"
+            " SUM(f.spend_in_usd) as spend,"
+            " SUM(f.purchase_count) as purchases,"
+            " CASE WHEN SUM(f.purchase_count) > 0"
+            "   THEN SUM(f.spend_in_usd) / SUM(f.purchase_count)"
+            "   ELSE NULL END as cpa"
+            " FROM common.fct_ads_ad_metrics f"
+            " JOIN common.dim_ads_campaign c"
+            "   ON f.dim_ads_campaign_sk = c.dim_ads_campaign_sk"
+            " WHERE f.date = %s AND f.spend_in_usd > 0"
+            " GROUP BY c.campaign_name, f.platform"
+            " ORDER BY cpa DESC NULLS LAST LIMIT 10"
+        ),
+        params=(d,),
+        outputs={"": ("l2", "worst_cpa_campaigns")},
+    )
 
-def fetch_l2(date: str | None = None) -> dict:
-    """L2 Channel Efficiency: per-platform metrics, Amazon, top campaigns."""
-    d = _safe_date(date)
-    start_7d, end_7d = _rolling_window(7)
+    plan = []
+    for scan in (orders, platforms, sessions, funnel):
+        plan.extend(scan.plan(merge))
+    plan.extend([amazon, worst_campaigns])
+    return plan
+
+
+def split_rows(query: PlannedQuery, rows: list[dict]) -> dict[tuple[str, str], list[dict]]:
+    """Map a query's result rows back onto report sections."""
+    if "" in query.outputs:
+        return {query.outputs[""]: rows}
+    sections = {target: [] for target in query.outputs.values()}
+    for row in rows:
+        keys = {k: v for k, v in row.items() if "__" not in k}
+        for prefix, target in query.outputs.items():
+            if not row.get(f"{prefix}__n") and prefix not in query.keep_empty:
+                continue  # no rows in this window for this group
+            values = {
+                k.split("__", 1)[1]: v
+                for k, v in row.items()
+                if k.startswith(f"{prefix}__") and k != f"{prefix}__n"
+            }
+            sections[target].append({**keys, **values})
+    return sections
+
+
+def _derive(sections: dict[tuple[str, str], list[dict]]) -> None:
+    """Sections computed from other sections instead of their own scan."""
+    spends = [r["spend"] for r in sections.get(("l2", "yesterday"), []) if r.get("spend") is not None]
+    sections[("l1", "ad_spend")] = [{"total_spend": sum(spends) if spends else None}]
+
+
+def run_plan(plan: list[PlannedQuery], execute=None) -> dict[str, dict[str, list]]:
+    """Execute a plan as one concurrent group; return {layer: {section: rows}}.
+
+    execute(queries) takes {name: (sql, params)} and returns {name: result};
+    it defaults to analytics_query_sql_group on the warehouse.
+    """
+    if execute is None:
+        def execute(queries):
+            return analytics_query_sql_group(queries, max_concurrency=len(queries))
 
-    platform_yesterday = analytics_query_sql(
-        f"SELECT platform,"
-        f" SUM(spend_in_usd) as spend,"
-        f" SUM(impressions) as impressions,"
-        f" SUM(clicks) as clicks,"
-        f" SUM(purchase_count) as purchases,"
-        f" CASE WHEN SUM(purchase_count) > 0"
-        f"   THEN SUM(spend_in_usd) / SUM(purchase_count)"
-        f"   ELSE NULL END as cpa"
-        f" FROM common.fct_ads_ad_metrics"
-        f" WHERE date = '{d}'"
-        f" GROUP BY platform"
-    )
+    results = execute({q.name: (q.sql, q.params) for q in plan})
+    sections: dict[tuple[str, str], list[dict]] = {}
+    for q in plan:
+        sections.update(split_rows(q, results[q.name].get("rows", [])))
+    _derive(sections)
+    layers: dict[str, dict[str, list]] = {}
+    for (layer, section), rows in sections.items():
+        layers.setdefault(layer, {})[section] = rows
+    return layers
 
-    platform_7d = analytics_query_sql(
-        f"SELECT platform,"
-        f" SUM(spend_in_usd) / 7.0 as spend_avg,"
-        f" SUM(purchase_count) / 7.0 as purchases_avg,"
-        f" CASE WHEN SUM(purchase_count) > 0"
-        f"   THEN SUM(spend_in_usd) / SUM(purchase_count)"
-        f"   ELSE NULL END as cpa_avg"
-        f" FROM common.fct_ads_ad_metrics"
-        f" WHERE date BETWEEN '{start_7d}' AND '{end_7d}'"
-        f" GROUP BY platform"
-    )
 
-    amazon = analytics_query_sql(
-        f"SELECT channel,"
-        f" SUM(spend_in_usd) as spend,"
-        f" SUM(impressions) as impressions,"
-        f" SUM(clicks) as clicks,"
-        f" SUM(conversions14d) as conversions,"
-        f" SUM(sales14d) as sales,"
-        f" CASE WHEN SUM(sales14d) > 0"
-        f"   THEN SUM(spend_in_usd) / SUM(sales14d)"
-        f"   ELSE NULL END as acos"
-        f" FROM common.fct_ads_amazon_ad_group_metrics"
-        f" WHERE date = '{d}'"
-        f" GROUP BY channel"
-    )
+# Sections _derive() reads to build another layer's sections.
+_DERIVED_FROM = {"l1": {("l2", "yesterday")}}
 
-    top_campaigns = analytics_query_sql(
-        f"SELECT c.campaign_name, f.platform,"
-        f" SUM(f.spend_in_usd) as spend,"
-        f" SUM(f.purchase_count) as purchases,"
-        f" CASE WHEN SUM(f.purchase_count) > 0"
-        f"   THEN SUM(f.spend_in_usd) / SUM(f.purchase_count)"
-        f"   ELSE NULL END as cpa"
-        f" FROM common.fct_ads_ad_metrics f"
-        f" JOIN common.dim_ads_campaign c"
-        f"   ON f.dim_ads_campaign_sk = c.dim_ads_campaign_sk"
-        f" WHERE f.date = '{d}' AND f.spend_in_usd > 0"
-        f" GROUP BY c.campaign_name, f.platform"
-        f" ORDER BY cpa DESC NULLS LAST LIMIT 10"
-    )
 
-    return {
-        "yesterday": platform_yesterday.get("rows", []),
-        "avg_7d": platform_7d.get("rows", []),
-        "amazon": amazon.get("rows", []),
-        "worst_cpa_campaigns": top_campaigns.get("rows", []),
-    }
+def _needs(layer: str, plan: list[PlannedQuery]) -> list[PlannedQuery]:
+    extra = _DERIVED_FROM.get(layer, set())
+    return [q for q in plan if any(t[0] == layer or t in extra for t in q.outputs.values())]
 
 
-def fetch_l3(date: str | None = None) -> dict:
-    """L3 Funnel Signal: website sessions, conversion funnel, drop-offs."""
-    d = _safe_date(date)
-    start_7d, end_7d = _rolling_window(7)
+def fetch_all(date: str | None = None) -> dict[str, dict[str, list]]:
+    """All three layers from one concurrent run of the merged plan."""
+    return run_plan(build_plan(date))
 
-    sessions_yesterday = analytics_query_sql(
-        f"SELECT session_traffic_channel,"
-        f" COUNT(*) as sessions,"
-        f" AVG(session_page_viewed) as avg_pages,"
-        f" AVG(session_time_engaged_in_s) as avg_time_s"
-        f" FROM common.fct_website_session"
-        f" WHERE DATE(session_first_page_tstamp) = '{d}'"
-        f" GROUP BY session_traffic_channel"
-    )
 
-    sessions_7d = analytics_query_sql(
-        f"SELECT session_traffic_channel,"
-        f" COUNT(*) / 7.0 as sessions_avg"
-        f" FROM common.fct_website_session"
-        f" WHERE DATE(session_first_page_tstamp) BETWEEN '{start_7d}' AND '{end_7d}'"
-        f" GROUP BY session_traffic_channel"
-    )
+def _fetch_layer(layer: str, sections: tuple[str, ...], date: str | None) -> dict:
+    layers = run_plan(_needs(layer, build_plan(date)))
+    return {name: layers[layer][name] for name in sections}
 
-    funnel_yesterday = analytics_query_sql(
-        f"SELECT conversion,"
-        f" COUNT(*) as count,"
-        f" SUM(conversion_value) as value"
-        f" FROM common.fct_website_visitor_conversion"
-        f" WHERE DATE(original_tstamp) = '{d}'"
-        f" GROUP BY conversion"
-    )
 
-    funnel_7d = analytics_query_sql(
-        f"SELECT conversion,"
-        f" COUNT(*) / 7.0 as count_avg,"
-        f" SUM(conversion_value) / 7.0 as value_avg"
-        f" FROM common.fct_website_visitor_conversion"
-        f" WHERE DATE(original_tstamp) BETWEEN '{start_7d}' AND '{end_7d}'"
-        f" GROUP BY conversion"
-    )
+def fetch_l1(date: str | None = None) -> dict:
+    """L1 Business Outcomes: revenue by product, orders, ad spend for CAC."""
+    return _fetch_layer("l1", ("yesterday", "avg_7d", "avg_28d", "ad_spend"), date)
+
 
-    return {
-        "sessions_yesterday": sessions_yesterday.get("rows", []),
-        "sessions_7d": sessions_7d.get("rows", []),
-        "funnel_yesterday": funnel_yesterday.get("rows", []),
-        "funnel_7d": funnel_7d.get("rows", []),
-    }
+def fetch_l2(date: str | None = None) -> dict:
+    """L2 Channel Efficiency: per-platform metrics, Amazon, top campaigns."""
+    return _fetch_layer("l2", ("yesterday", "avg_7d", "amazon", "worst_cpa_campaigns"), date)
+
+
+def fetch_l3(date: str | None = None) -> dict:
+    """L3 Funnel Signal: website sessions, conversion funnel, drop-offs."""
+    return _fetch_layer("l3", ("sessions_yesterday", "sessions_7d", "funnel_yesterday", "funnel_7d"), date)
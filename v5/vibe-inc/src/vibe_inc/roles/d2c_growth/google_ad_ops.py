@@ -8,6 +8,7 @@ from vibe_inc.tools.ads.google_ads import (
     google_ads_recommendations,
     google_ads_conversions,
 )
+from vibe_inc.tools.ads.metrics_sync import ad_metrics_read
 
 
 class GoogleAdOps(Operator):
@@ -36,7 +37,7 @@ class GoogleAdOps(Operator):
         return f"Create Google Ads campaign from brief: {brief}"
 
     @agent_node(
-        tools=[google_ads_query, google_ads_mutate, google_ads_budget],
+        tools=[ad_metrics_read, google_ads_query, google_ads_mutate, google_ads_budget],
         output_key="optimization_result",
     )
     def daily_optimize(self, state):
@@ -76,7 +77,7 @@ class GoogleAdOps(Operator):
         return f"Mine search terms for campaign {campaign_id}."
 
     @agent_node(
-        tools=[google_ads_query, google_ads_conversions],
+        tools=[ad_metrics_read, google_ads_query, google_ads_conversions],
         output_key="report",
     )
     def weekly_report(self, state):
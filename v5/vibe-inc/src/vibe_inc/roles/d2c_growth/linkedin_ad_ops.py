@@ -9,6 +9,7 @@ from vibe_inc.tools.ads.linkedin_ads import (
     linkedin_ads_audiences,
     linkedin_ads_conversions,
 )
+from vibe_inc.tools.ads.metrics_sync import ad_metrics_read
 
 
 class LinkedInAdOps(Operator):
@@ -35,7 +36,7 @@ class LinkedInAdOps(Operator):
         return f"Create LinkedIn Ads campaign from brief: {brief}"
 
     @agent_node(
-        tools=[linkedin_ads_analytics, linkedin_ads_update],
+        tools=[ad_metrics_read, linkedin_ads_analytics, linkedin_ads_update],
         output_key="optimization_result",
     )
     def daily_optimize(self, state):
@@ -77,7 +78,7 @@ class LinkedInAdOps(Operator):
         return f"Manage LinkedIn audiences. Action: {action}."
 
     @agent_node(
-        tools=[linkedin_ads_analytics, linkedin_ads_conversions],
+        tools=[ad_metrics_read, linkedin_ads_analytics, linkedin_ads_conversions],
         output_key="report",
     )
     def weekly_report(self, state):
@@ -8,6 +8,7 @@ from vibe_inc.tools.ads.meta_ads import (
     meta_ads_rules,
     meta_audiences,
 )
+from vibe_inc.tools.ads.metrics_sync import ad_metrics_read
 
 
 class MetaAdOps(Operator):
@@ -33,7 +34,7 @@ class MetaAdOps(Operator):
         return f"Create campaign from brief: {brief}"
 
     @agent_node(
-        tools=[meta_ads_read, meta_ads_update, meta_ads_rules],
+        tools=[ad_metrics_read, meta_ads_read, meta_ads_update, meta_ads_rules],
         output_key="optimization_result",
     )
     def daily_optimize(self, state):
@@ -55,7 +56,7 @@ class MetaAdOps(Operator):
         return f"Review and optimize all active Meta campaigns for {date}."
 
     @agent_node(
-        tools=[meta_ads_read],
+        tools=[ad_metrics_read, meta_ads_read],
         output_key="report",
     )
     def weekly_report(self, state):
@@ -99,7 +100,7 @@ class MetaAdOps(Operator):
         """You are a Meta Ads creative performance analyst for Vibe.
 
         Detect creative fatigue across active campaigns:
-        1. Read ad-level performance for last 14 days.
+        1. Read ad-level performance for last 14 days with daily=True (one row per ad per day).
         2. Calculate trend: is CTR declining? Is CPC rising?
         3. Fatigue signals: CTR drop >20% week-over-week, frequency >3.0.
         4. For each fatigued creative, recommend: pause, refresh copy, or new creative.
@@ -1,6 +1,7 @@
 """PinterestAdOps operator — manages Pinterest ad campaigns."""
 from openvibe_sdk import Operator, agent_node
 
+from vibe_inc.tools.ads.metrics_sync import ad_metrics_read
 from vibe_inc.tools.ads.pinterest_ads import (
     pinterest_ads_report,
     pinterest_ads_campaigns,
@@ -36,7 +37,7 @@ class PinterestAdOps(Operator):
         return f"Create Pinterest Ads campaign from brief: {brief}"
 
     @agent_node(
-        tools=[pinterest_ads_report, pinterest_ads_update],
+        tools=[ad_metrics_read, pinterest_ads_report, pinterest_ads_update],
         output_key="optimization_result",
     )
     def daily_optimize(self, state):
@@ -83,7 +84,7 @@ class PinterestAdOps(Operator):
         return f"Check Pinterest creative fatigue over last {lookback} days."
 
     @agent_node(
-        tools=[pinterest_ads_report],
+        tools=[ad_metrics_read, pinterest_ads_report],
         output_key="report",
     )
     def weekly_report(self, state):
@@ -1,6 +1,7 @@
 """TikTokAdOps operator — manages TikTok ad campaigns."""
 from openvibe_sdk import Operator, agent_node
 
+from vibe_inc.tools.ads.metrics_sync import ad_metrics_read
 from vibe_inc.tools.ads.tiktok_ads import (
     tiktok_ads_report,
     tiktok_ads_campaigns,
@@ -35,7 +36,7 @@ class TikTokAdOps(Operator):
         return f"Create TikTok Ads campaign from brief: {brief}"
 
     @agent_node(
-        tools=[tiktok_ads_report, tiktok_ads_update],
+        tools=[ad_metrics_read, tiktok_ads_report, tiktok_ads_update],
         output_key="optimization_result",
     )
     def daily_optimize(self, state):
@@ -80,7 +81,7 @@ class TikTokAdOps(Operator):
         return f"Check TikTok creative fatigue over last {lookback} days."
 
     @agent_node(
-        tools=[tiktok_ads_report],
+        tools=[ad_metrics_read, tiktok_ads_report],
         output_key="report",
     )
     def weekly_report(self, state):
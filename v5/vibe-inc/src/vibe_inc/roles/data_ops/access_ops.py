@@ -2,11 +2,14 @@
 from openvibe_sdk import Operator, agent_node
 
 from vibe_inc.tools.analytics_tools import (
+    analytics_cache_invalidate,
+    analytics_cache_stats,
     analytics_query_cohort,
     analytics_query_events,
     analytics_query_funnel,
     analytics_query_metrics,
     analytics_query_sql,
+    analytics_query_table,
 )
 from vibe_inc.tools.shared_memory import read_memory, write_memory
 
@@ -15,7 +18,8 @@ class AccessOps(Operator):
     operator_id = "access_ops"
 
     @agent_node(
-        tools=[analytics_query_metrics, analytics_query_funnel, analytics_query_sql, read_memory],
+        tools=[analytics_query_metrics, analytics_query_funnel, analytics_query_sql,
+               analytics_query_table, read_memory],
         output_key="query_result",
     )
     def route_query(self, state):
@@ -28,6 +32,8 @@ class AccessOps(Operator):
            - analytics_query_metrics for aggregated KPIs (spend, impressions, CAC)
            - analytics_query_funnel for conversion funnel analysis
            - analytics_query_sql for complex joins or custom queries
+           - analytics_query_table for large row-level pulls (compact table,
+             top_k ranking, describe summary)
         4. Execute the query and format the result.
         5. Always include the SQL that was executed for transparency.
 
@@ -37,7 +43,8 @@ class AccessOps(Operator):
 
     @agent_node(
         tools=[analytics_query_metrics, analytics_query_funnel, analytics_query_cohort,
-               analytics_query_events, analytics_query_sql, read_memory, write_memory],
+               analytics_query_events, analytics_query_sql, analytics_query_table,
+               read_memory, write_memory],
         output_key="report_result",
     )
     def build_report(self, state):
@@ -57,7 +64,8 @@ class AccessOps(Operator):
         return f"Build {report_type} report."
 
     @agent_node(
-        tools=[analytics_query_sql, read_memory, write_memory],
+        tools=[analytics_query_sql, analytics_cache_stats, analytics_cache_invalidate,
+               read_memory, write_memory],
         output_key="cache_result",
     )
     def cache_refresh(self, state):
@@ -70,8 +78,11 @@ class AccessOps(Operator):
            - Funnel conversion rates
         2. Write the results to shared memory performance/ directory.
         3. Include timestamps so consumers know data freshness.
-        4. This runs on a schedule — keep it fast and focused.
+        4. Check the warehouse query cache with analytics_cache_stats. Cached
+           results expire on their own when a table's MAX(date) advances; call
+           analytics_cache_invalidate only after a backfill or full refresh.
+        5. This runs on a schedule — keep it fast and focused.
 
-        Return: what was refreshed, row counts, timestamps."""
+        Return: what was refreshed, row counts, timestamps, cache hit rate."""
         scope = state.get("scope", "daily")
         return f"Refresh data cache. Scope: {scope}."
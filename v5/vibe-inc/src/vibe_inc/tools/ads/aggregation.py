@@ -0,0 +1,206 @@
+"""Vectorized cross-platform metrics engine.
+
+Daily per-platform metrics (metrics_store rows grouped by platform, date)
+are loaded once into a PlatformFrame: one float64 array per measure, aligned
+with an integer platform code and a day index. Every per-platform figure is
+an np.bincount reduction over those arrays, so a report over six platforms
+and 90 days is a handful of array passes rather than Python loops over rows.
+
+Response curves model diminishing returns per platform:
+
+    conversions_per_day = a * spend_per_day ** b,   0 < b < 1
+
+b is the log-log regression slope over days with spend and conversions,
+shrunk toward B_PRIOR when there are few such days and clipped to
+[B_MIN, B_MAX]; a is then set so the curve reproduces the observed total.
+The marginal CPA at spend s is 1 / (a * b * s ** (b - 1)).
+
+allocate() maximizes sum(a_i * x_i ** b_i) subject to sum(x_i) == total and
+per-platform bounds. The optimum equalizes marginal returns: for a Lagrange
+multiplier lam, x_i = (a_i * b_i / lam) ** (1 / (1 - b_i)) clipped to the
+bounds; lam is found by bisection on its logarithm.
+"""
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+
+from vibe_inc.tools.ads.metrics_store import METRIC_COLUMNS
+
+B_PRIOR = 0.6
+B_MIN = 0.2
+B_MAX = 0.9
+PRIOR_DAYS = 14  # weight of B_PRIOR, in days of evidence
+
+
+def _safe_div(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """num / den with NaN where den == 0."""
+    out = np.full(np.broadcast(num, den).shape, np.nan)
+    np.divide(num, den, out=out, where=den != 0)
+    return out
+
+
+@dataclass
+class PlatformFrame:
+    """Daily metrics as aligned arrays: row i is (platforms[code[i]], day[i])."""
+
+    platforms: list[str]
+    code: np.ndarray
+    day: np.ndarray  # date ordinals
+    measures: dict[str, np.ndarray]
+
+    @classmethod
+    def from_rows(cls, rows: list[dict], platforms: list[str] | None = None) -> "PlatformFrame":
+        """Rows with 'platform', 'date' (ISO) and the METRIC_COLUMNS measures."""
+        names = list(platforms) if platforms else sorted({r["platform"] for r in rows})
+        index = {p: i for i, p in enumerate(names)}
+        rows = [r for r in rows if r["platform"] in index]
+        return cls(
+            platforms=names,
+            code=np.fromiter((index[r["platform"]] for r in rows), dtype=np.int64, count=len(rows)),
+            day=np.fromiter((date.fromisoformat(r["date"]).toordinal() for r in rows), dtype=np.int64, count=len(rows)),
+            measures={m: np.fromiter((r[m] for r in rows), dtype=np.float64, count=len(rows)) for m in METRIC_COLUMNS},
+        )
+
+    def __len__(self) -> int:
+        return len(self.code)
+
+    def __getitem__(self, measure: str) -> np.ndarray:
+        return self.measures[measure]
+
+    def mask(self, keep: np.ndarray) -> "PlatformFrame":
+        return PlatformFrame(
+            self.platforms, self.code[keep], self.day[keep],
+            {m: v[keep] for m, v in self.measures.items()},
+        )
+
+    def between(self, first: int, last: int) -> "PlatformFrame":
+        """Rows with first <= day ordinal <= last."""
+        return self.mask((self.day >= first) & (self.day <= last))
+
+    def sum(self, values: np.ndarray) -> np.ndarray:
+        """Per-platform sum of an array aligned with the rows."""
+        return np.bincount(self.code, weights=values, minlength=len(self.platforms))
+
+    def totals(self) -> dict[str, np.ndarray]:
+        """Per-platform sums of every measure, plus 'rows' and 'days' with spend."""
+        totals = {m: self.sum(v) for m, v in self.measures.items()}
+        totals["rows"] = np.bincount(self.code, minlength=len(self.platforms))
+        totals["days"] = self.sum((self["spend"] > 0).astype(np.float64))
+        return totals
+
+    def last_day(self) -> np.ndarray:
+        """Latest day ordinal with rows per platform (0 where none)."""
+        last = np.zeros(len(self.platforms), dtype=np.int64)
+        np.maximum.at(last, self.code, self.day)
+        return last
+
+
+@dataclass
+class ResponseCurves:
+    """y = a * spend ** b per platform (y: conversions or revenue per day)."""
+
+    platforms: list[str]
+    a: np.ndarray
+    b: np.ndarray
+    points: np.ndarray  # days the slope was fitted on
+
+    def predict(self, spend: np.ndarray) -> np.ndarray:
+        return self.a * np.power(np.maximum(spend, 0.0), self.b)
+
+    def marginal(self, spend: np.ndarray) -> np.ndarray:
+        """dy/dspend; infinite at zero spend for a > 0, zero where a == 0."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = self.a * self.b * np.power(np.maximum(spend, 0.0), self.b - 1)
+        return np.where(self.a > 0, slope, 0.0)
+
+    def marginal_cost(self, spend: np.ndarray) -> np.ndarray:
+        """Spend per extra unit of y at this spend (marginal CPA for conversions)."""
+        return _safe_div(np.ones_like(spend, dtype=np.float64), self.marginal(spend))
+
+
+def fit_curves(frame: PlatformFrame, target: str = "conversions") -> ResponseCurves:
+    """Fit a diminishing-returns curve of target vs spend for every platform at once."""
+    spend, y = frame["spend"], frame[target]
+    usable = (spend > 0) & (y > 0)
+    x = np.log(np.where(usable, spend, 1.0))
+    ly = np.log(np.where(usable, y, 1.0))
+    w = usable.astype(np.float64)
+
+    n = frame.sum(w)
+    sx, sy = frame.sum(x * w), frame.sum(ly * w)
+    sxx, sxy = frame.sum(x * x * w), frame.sum(x * ly * w)
+    denom = n * sxx - sx * sx
+    slope = _safe_div(n * sxy - sx * sy, denom)
+    fitted = np.isfinite(slope) & (n >= 3)
+    slope = np.where(fitted, slope, B_PRIOR)
+    weight = np.where(fitted, n, 0.0)
+    b = np.clip((weight * slope + PRIOR_DAYS * B_PRIOR) / (weight + PRIOR_DAYS), B_MIN, B_MAX)
+
+    spent = spend > 0
+    basis = frame.sum(np.where(spent, np.power(np.where(spent, spend, 1.0), b[frame.code]), 0.0))
+    a = np.nan_to_num(_safe_div(frame.sum(y), basis))
+    return ResponseCurves(frame.platforms, a, b, n)
+
+
+def allocate(
+    curves: ResponseCurves,
+    total: float,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    iterations: int = 100,
+) -> np.ndarray:
+    """Spend per platform maximizing sum(curves.predict(x)) with sum(x) == total.
+
+    Bounds are relaxed in proportion if they cannot meet total: lower bounds
+    are scaled down when they sum above it, upper bounds lifted when below.
+    Platforms without returns (a == 0) stay at their lower bound unless the
+    others cannot absorb the budget. The result always sums to total.
+    """
+    lower = np.asarray(lower, dtype=np.float64)
+    upper = np.maximum(np.asarray(upper, dtype=np.float64), lower)
+    if lower.sum() > total:
+        return lower * (total / lower.sum()) if lower.sum() else lower
+    if upper.sum() < total:
+        slack = upper - lower
+        upper = upper + (total - upper.sum()) * (slack / slack.sum() if slack.sum() else 1.0 / len(upper))
+
+    active = (curves.a > 0) & (upper > lower)
+    if not active.any():
+        slack = upper - lower
+        return lower + (total - lower.sum()) * slack / slack.sum() if slack.sum() else lower
+
+    a, b = curves.a[active], curves.b[active]
+    lo, hi = lower[active], upper[active]
+    budget = total - lower[~active].sum()
+
+    def spend_at(log_lam: float) -> np.ndarray:
+        return np.clip(np.exp((np.log(a * b) - log_lam) / (1 - b)), lo, hi)
+
+    grad_lo = np.log(a * b) + (b - 1) * np.log(np.maximum(lo, 1e-9))
+    grad_hi = np.log(a * b) + (b - 1) * np.log(hi)
+    left, right = grad_hi.min() - 1.0, grad_lo.max() + 1.0  # spend_at(left) is all hi, right all lo
+    for _ in range(iterations):
+        mid = (left + right) / 2
+        if spend_at(mid).sum() > budget:
+            left = mid
+        else:
+            right = mid
+    spend = spend_at((left + right) / 2)
+
+    # Hand the bisection residual to platforms with room, in proportion to it.
+    residual = budget - spend.sum()
+    room = (hi - spend) if residual > 0 else (spend - lo)
+    if room.sum() > 0:
+        spend = spend + residual * room / room.sum()
+
+    out = lower.copy()
+    out[active] = spend
+
+    # Active platforms all at their upper bound: the rest of the budget goes to
+    # the others' headroom (upper.sum() >= total, so it always fits).
+    leftover = total - out.sum()
+    room = upper - out
+    if leftover > 0 and room.sum() > 0:
+        out = out + room * min(leftover / room.sum(), 1.0)
+    return out
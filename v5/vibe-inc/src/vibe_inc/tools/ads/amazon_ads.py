@@ -1,10 +1,18 @@
 """Amazon Ads API tools for D2C Growth role."""
-import gzip
-import json
 import os
-import time
+import re
+from datetime import date
 
-import httpx
+from vibe_inc.tools.ads.report_jobs import (
+    Backoff,
+    ReportJob,
+    ReportJobManager,
+    poll_until,
+    stream_gzip_json,
+)
+from vibe_inc.tools.http_clients import provider_client
+
+_http = provider_client("amazon_ads")
 
 
 def _get_client():
@@ -27,102 +35,92 @@ def _get_profile_id() -> str:
     return os.environ["AMAZON_ADS_PROFILE_ID"]
 
 
-def _request_report(credentials: dict, ad_product: str, report_type: str, columns: list[str], date_range: str) -> str:
-    """Request an async report and return the report ID.
+_REGION_URLS = {
+    "NA": "https://advertising-api.amazon.com",
+    "EU": "https://advertising-api-eu.amazon.com",
+    "FE": "https://advertising-api-fe.amazon.com",
+}
 
-    Args:
-        credentials: Amazon Ads API credentials dict.
-        ad_product: SPONSORED_PRODUCTS, SPONSORED_BRANDS, or SPONSORED_DISPLAY.
-        report_type: Report type — spSearchTerm, spCampaigns, sbCampaigns, etc.
-        columns: List of metric/dimension column names to include.
-        date_range: Date range — last_24h, last_7d, last_30d, or YYYY-MM-DD,YYYY-MM-DD.
+# Report generation takes seconds to tens of minutes; poll at 2s, 4s, 8s ... 60s.
+REPORT_BACKOFF = Backoff(initial=2.0, factor=2.0, max_interval=60.0, timeout=1800.0)
 
-    Returns:
-        Report ID string for polling.
-    """
-    region_map = {
-        "NA": "https://advertising-api.amazon.com",
-        "EU": "https://advertising-api-eu.amazon.com",
-        "FE": "https://advertising-api-fe.amazon.com",
-    }
+_EXPLICIT_RANGE_RE = re.compile(r"^\d{4}-\d{2}-\d{2},\d{4}-\d{2}-\d{2}$")
+
+
+def _base_url() -> str:
     region = os.environ.get("AMAZON_ADS_REGION", "NA")
-    base_url = region_map.get(region, region_map["NA"])
+    return _REGION_URLS.get(region, _REGION_URLS["NA"])
 
-    body = {
-        "reportType": report_type,
-        "columns": columns,
-        "dateRange": date_range,
-    }
 
-    resp = httpx.post(
-        f"{base_url}/reporting/reports",
-        json=body,
-        headers={
-            "Amazon-Advertising-API-ClientId": credentials["client_id"],
-            "Amazon-Advertising-API-Scope": credentials["profile_id"],
-            "Authorization": f"Bearer {credentials['refresh_token']}",
-            "Content-Type": "application/vnd.createasyncreportrequest.v3+json",
-        },
-    )
-    resp.raise_for_status()
-    return resp.json()["reportId"]
+def _auth_headers(credentials: dict) -> dict:
+    return {
+        "Amazon-Advertising-API-ClientId": credentials["client_id"],
+        "Amazon-Advertising-API-Scope": credentials["profile_id"],
+        "Authorization": f"Bearer {credentials['refresh_token']}",
+    }
 
 
-def _poll_report(credentials: dict, report_id: str, max_retries: int = 10, sleep_seconds: float = 5.0) -> str:
-    """Poll until an async report completes, then return the download URL.
+def _report_key(profile_id: str, ad_product: str, report_type: str, columns: list[str], date_range: str) -> tuple:
+    """Cache key for a report. Relative ranges (last_7d) also key on today's date."""
+    key = (profile_id, ad_product, report_type, tuple(columns), date_range)
+    if not _EXPLICIT_RANGE_RE.match(date_range):
+        key += (date.today().isoformat(),)
+    return key
 
-    Args:
-        credentials: Amazon Ads API credentials dict.
-        report_id: Report ID from _request_report.
-        max_retries: Maximum number of poll attempts.
-        sleep_seconds: Seconds to wait between polls.
 
-    Returns:
-        Download URL for the completed report.
+async def _run_report(
+    job: ReportJob,
+    credentials: dict,
+    ad_product: str,
+    report_type: str,
+    columns: list[str],
+    date_range: str,
+) -> list[dict]:
+    """Request a report, poll its status with backoff, then stream the gzip download."""
+    base_url = _base_url()
+    headers = _auth_headers(credentials)
 
-    Raises:
-        TimeoutError: If the report does not complete within max_retries.
-    """
-    region_map = {
-        "NA": "https://advertising-api.amazon.com",
-        "EU": "https://advertising-api-eu.amazon.com",
-        "FE": "https://advertising-api-fe.amazon.com",
-    }
-    region = os.environ.get("AMAZON_ADS_REGION", "NA")
-    base_url = region_map.get(region, region_map["NA"])
+    resp = await _http.apost(
+        f"{base_url}/reporting/reports",
+        json={"reportType": report_type, "columns": columns, "dateRange": date_range},
+        headers={**headers, "Content-Type": "application/vnd.createasyncreportrequest.v3+json"},
+    )
+    resp.raise_for_status()
+    job.report_id = resp.json()["reportId"]
 
-    for _ in range(max_retries):
-        resp = httpx.get(
-            f"{base_url}/reporting/reports/{report_id}",
-            headers={
-                "Amazon-Advertising-API-ClientId": credentials["client_id"],
-                "Amazon-Advertising-API-Scope": credentials["profile_id"],
-                "Authorization": f"Bearer {credentials['refresh_token']}",
-            },
-        )
+    async def check():
+        resp = await _http.aget(f"{base_url}/reporting/reports/{job.report_id}", headers=headers)
         resp.raise_for_status()
         data = resp.json()
-        if data.get("status") == "COMPLETED":
-            return data["url"]
-        time.sleep(sleep_seconds)
+        job.status = data.get("status", job.status)
+        if job.status == "FAILED":
+            raise RuntimeError(f"Report {job.report_id} failed: {data.get('failureReason', 'unknown')}")
+        return data.get("url") if job.status == "COMPLETED" else None
 
-    raise TimeoutError(f"Report {report_id} did not complete after {max_retries} attempts")
+    download_url = await poll_until(check, REPORT_BACKOFF, job)
+    job.status = "DOWNLOADING"
+    return await stream_gzip_json(_http, download_url)
 
 
-def _download_report(credentials: dict, download_url: str) -> list[dict]:
-    """Download and decompress a completed report.
+_reports = ReportJobManager(_run_report)
 
-    Args:
-        credentials: Amazon Ads API credentials dict.
-        download_url: URL returned by _poll_report.
 
-    Returns:
-        List of row dicts from the report.
-    """
-    resp = httpx.get(download_url)
-    resp.raise_for_status()
-    decompressed = gzip.decompress(resp.content)
-    return json.loads(decompressed)
+def submit_report(ad_product: str, report_type: str, columns: list[str], date_range: str) -> ReportJob:
+    """Submit an async report job and return its handle (await it, or call result())."""
+    credentials = _get_client()
+    key = _report_key(credentials["profile_id"], ad_product, report_type, columns, date_range)
+    return _reports.submit(key, credentials, ad_product, report_type, columns, date_range)
+
+
+def _job_result(job: ReportJob, ad_product: str, report_type: str) -> dict:
+    """Tool-facing dict for a finished job: rows, or the error it failed with."""
+    result = {"ad_product": ad_product, "report_type": report_type, **job.as_dict()}
+    error = job.exception()
+    if error is not None:
+        result["error"] = str(error) or type(error).__name__
+    else:
+        result["rows"] = job.result()
+    return result
 
 
 def amazon_ads_report(
@@ -138,6 +136,8 @@ def amazon_ads_report(
     2. Poll the report status until COMPLETED.
     3. Download and decompress the gzip result.
 
+    Identical reports requested within the hour are served from cache.
+
     Args:
         ad_product: Ad product — SPONSORED_PRODUCTS, SPONSORED_BRANDS, or SPONSORED_DISPLAY.
         report_type: Report type — spSearchTerm, spCampaigns, sbCampaigns, sdCampaigns, etc.
@@ -147,13 +147,82 @@ def amazon_ads_report(
     Returns:
         Dict with 'rows' (list of report row dicts), 'ad_product', and 'report_type'.
     """
-    credentials = _get_client()
-    report_id = _request_report(credentials, ad_product, report_type, columns, date_range)
-    download_url = _poll_report(credentials, report_id)
-    rows = _download_report(credentials, download_url)
+    rows = submit_report(ad_product, report_type, columns, date_range).result()
     return {"rows": rows, "ad_product": ad_product, "report_type": report_type}
 
 
+def amazon_ads_reports(reports: list[dict]) -> dict:
+    """Generate several Amazon Ads reports at once and wait for all of them.
+
+    The reports are requested together and polled concurrently, so the wait is
+    roughly that of the slowest report rather than the sum.
+
+    Args:
+        reports: List of report specs, each a dict with 'ad_product', 'report_type',
+            'columns', and 'date_range' (same meaning as in amazon_ads_report).
+
+    Returns:
+        Dict with 'reports': one entry per spec, in order, with 'ad_product',
+        'report_type', 'status', and either 'rows' or 'error'.
+    """
+    jobs = [
+        submit_report(r["ad_product"], r["report_type"], r["columns"], r["date_range"])
+        for r in reports
+    ]
+    _reports.wait(jobs)
+    return {
+        "reports": [
+            _job_result(job, r["ad_product"], r["report_type"])
+            for job, r in zip(jobs, reports)
+        ]
+    }
+
+
+def amazon_ads_report_submit(
+    ad_product: str,
+    report_type: str,
+    columns: list[str],
+    date_range: str,
+) -> dict:
+    """Start an Amazon Ads report without waiting for it.
+
+    Use for long reports (e.g. 30-day search terms): submit, continue with other
+    work, then collect the rows with amazon_ads_report_status.
+
+    Args:
+        ad_product: Ad product — SPONSORED_PRODUCTS, SPONSORED_BRANDS, or SPONSORED_DISPLAY.
+        report_type: Report type — spSearchTerm, spCampaigns, sbCampaigns, sdCampaigns, etc.
+        columns: List of metric/dimension columns.
+        date_range: Date range — last_24h, last_7d, last_30d, or YYYY-MM-DD,YYYY-MM-DD.
+
+    Returns:
+        Dict with 'job_id' and 'status' (COMPLETED immediately if cached).
+    """
+    job = submit_report(ad_product, report_type, columns, date_range)
+    return {"ad_product": ad_product, "report_type": report_type, **job.as_dict()}
+
+
+def amazon_ads_report_status(job_id: str, wait_seconds: float = 0.0) -> dict:
+    """Check a report started with amazon_ads_report_submit; rows once it completes.
+
+    Args:
+        job_id: Job ID returned by amazon_ads_report_submit.
+        wait_seconds: Seconds to wait for completion before returning the current status.
+
+    Returns:
+        Dict with 'job_id', 'status', and 'rows' when COMPLETED (or 'error' when FAILED).
+    """
+    job = _reports.get(job_id)
+    if job is None:
+        return {"job_id": job_id, "error": "Unknown job_id"}
+    if wait_seconds > 0:
+        _reports.wait([job], timeout=wait_seconds)
+    if not job.done():
+        return job.as_dict()
+    ad_product, report_type = job.key[1], job.key[2]
+    return _job_result(job, ad_product, report_type)
+
+
 def amazon_ads_campaigns(
     ad_product: str = "SPONSORED_PRODUCTS",
     state: str | None = None,
@@ -187,7 +256,7 @@ def amazon_ads_campaigns(
     if state:
         params["stateFilter"] = state
 
-    resp = httpx.get(
+    resp = _http.get(
         f"{base_url}/v2/{path}/campaigns",
         params=params,
         headers={
@@ -226,7 +295,7 @@ def amazon_ads_keywords(
     if ad_group_id:
         params["adGroupIdFilter"] = ad_group_id
 
-    resp = httpx.get(
+    resp = _http.get(
         f"{base_url}/v2/sp/keywords",
         params=params,
         headers={
@@ -272,7 +341,7 @@ def amazon_ads_bid_update(
         }
     ]
 
-    resp = httpx.put(
+    resp = _http.put(
         f"{base_url}/v2/sp/keywords",
         json=body,
         headers={
@@ -317,7 +386,7 @@ def amazon_ads_budget(
     }
 
     if new_budget is None:
-        resp = httpx.get(
+        resp = _http.get(
             f"{base_url}/v2/sp/campaigns/{campaign_id}",
             headers=headers,
         )
@@ -335,7 +404,7 @@ def amazon_ads_budget(
             "dailyBudget": new_budget,
         }
     ]
-    resp = httpx.put(
+    resp = _http.put(
         f"{base_url}/v2/sp/campaigns",
         json=body,
         headers={**headers, "Content-Type": "application/json"},
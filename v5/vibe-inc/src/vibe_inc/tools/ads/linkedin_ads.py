@@ -1,10 +1,11 @@
 """LinkedIn Ads API tools for D2C Growth role."""
 import os
 
-import httpx
+from vibe_inc.tools.http_clients import provider_client
 
 _BASE_URL = "https://api.linkedin.com/rest"
 _API_VERSION = "202402"  # LinkedIn API version YYYYMM format
+_http = provider_client("linkedin_ads")
 
 
 def _get_headers():
@@ -80,7 +81,7 @@ def linkedin_ads_analytics(
     else:
         params["accounts"] = f"urn:li:sponsoredAccount:{account_id}"
 
-    resp = httpx.get(f"{_BASE_URL}/adAnalytics", headers=headers, params=params)
+    resp = _http.get(f"{_BASE_URL}/adAnalytics", headers=headers, params=params)
     resp.raise_for_status()
     data = resp.json()
     return {"rows": data.get("elements", []), "date_range": date_range, "granularity": granularity}
@@ -106,7 +107,7 @@ def linkedin_ads_campaigns(
     if status:
         params["search.status.values[0]"] = status
 
-    resp = httpx.get(f"{_BASE_URL}/adCampaigns", headers=headers, params=params)
+    resp = _http.get(f"{_BASE_URL}/adCampaigns", headers=headers, params=params)
     resp.raise_for_status()
     data = resp.json()
     return {"campaigns": data.get("elements", [])}
@@ -140,7 +141,7 @@ def linkedin_ads_create(
         "targetingCriteria": audience,
     }
 
-    resp = httpx.post(f"{_BASE_URL}/adCampaigns", headers=headers, json=body)
+    resp = _http.post(f"{_BASE_URL}/adCampaigns", headers=headers, json=body)
     resp.raise_for_status()
     # LinkedIn returns the campaign ID in the x-restli-id header or response body
     campaign_id = resp.headers.get("x-restli-id", resp.json().get("id", "unknown"))
@@ -161,7 +162,7 @@ def linkedin_ads_update(
         Dict with 'updated' (True) and 'campaign_id'.
     """
     headers = _get_headers()
-    resp = httpx.post(
+    resp = _http.post(
         f"{_BASE_URL}/adCampaigns/{campaign_id}",
         headers={**headers, "X-Restli-Method": "PARTIAL_UPDATE"},
         json={"patch": {"$set": updates}},
@@ -188,7 +189,7 @@ def linkedin_ads_audiences(
         "account": f"urn:li:sponsoredAccount:{account_id}",
     }
 
-    resp = httpx.get(f"{_BASE_URL}/dmpSegments", headers=headers, params=params)
+    resp = _http.get(f"{_BASE_URL}/dmpSegments", headers=headers, params=params)
     resp.raise_for_status()
     data = resp.json()
     return {"audiences": data.get("elements", [])}
@@ -216,7 +217,7 @@ def linkedin_ads_conversions(
         **_date_range_params(date_range),
     }
 
-    resp = httpx.get(f"{_BASE_URL}/adAnalytics", headers=headers, params=params)
+    resp = _http.get(f"{_BASE_URL}/adAnalytics", headers=headers, params=params)
     resp.raise_for_status()
     data = resp.json()
     return {"conversions": data.get("elements", []), "date_range": date_range}
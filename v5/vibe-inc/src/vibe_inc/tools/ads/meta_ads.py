@@ -1,6 +1,8 @@
 """Meta Ads API tools for D2C Growth role."""
 import os
 
+from vibe_inc.tools.ads.meta_insights import extract_daily, resolve_range
+
 
 def _get_account():
     """Initialize Meta Ads API client from environment.
@@ -28,28 +30,48 @@ def meta_ads_read(
     level: str = "campaign",
     date_range: str = "last_7d",
     fields: list[str] | None = None,
+    daily: bool = False,
 ) -> dict:
     """Read Meta Ads performance data.
 
+    With daily=True, returns one row per entity per day (date_start), pulled
+    through Meta's async report runs and kept in a local store, so repeated
+    reads only fetch days that may have changed. Use it for ad-level trends
+    over 14-30 days (e.g. creative fatigue).
+
     Args:
         level: Reporting level — campaign, adset, or ad.
         date_range: Date range — last_24h, last_7d, last_30d, or YYYY-MM-DD,YYYY-MM-DD.
         fields: Metrics to retrieve (default: spend, impressions, clicks, cpc, cpm, ctr, actions).
+        daily: Break rows down by day (bulk async extraction).
 
     Returns:
         Dict with 'level', 'date_range', and 'rows' (list of performance records).
+        Daily reads also return 'fetched_days' (days pulled from Meta this call).
     """
     account = _get_account()
     if isinstance(fields, str):
         fields = [f.strip() for f in fields.split(",")]
     report_fields = fields or _DEFAULT_FIELDS
 
+    span = resolve_range(date_range) if daily else None
+    if span is not None:
+        extraction = extract_daily(account, level, report_fields, *span)
+        return {
+            "level": level,
+            "date_range": date_range,
+            "rows": extraction.result.to_rows(),
+            "fetched_days": len(extraction.fetched_days),
+        }
+
     params = {"level": level}
     if "," in date_range:
         start, end = date_range.split(",", 1)
         params["time_range"] = {"since": start.strip(), "until": end.strip()}
     else:
         params["date_preset"] = date_range
+    if daily:
+        params["time_increment"] = 1
 
     # Single account-level request — avoids N+1 per-campaign iteration.
     rows = []
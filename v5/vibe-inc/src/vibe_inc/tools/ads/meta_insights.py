@@ -0,0 +1,296 @@
+"""Bulk Meta Insights extraction through async report runs.
+
+A synchronous account.get_insights() over ad-level x 14-30 days pages through
+thousands of rows one cursor request at a time. Here a range is cut into date
+slices, each slice becomes an async AdReportRun (is_async=True) polled with
+backoff on the shared report scheduler, and finished runs are paged into a
+ColumnarResult instead of a list of dicts.
+
+Rows land in a local InsightsStore, one entry per (account, level, fields,
+day). Later reads only fetch days that are missing, or that were still inside
+Meta's attribution window when they were fetched and have not been refreshed
+for REFRESH_SECONDS; settled days are served from the store.
+"""
+import asyncio
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from vibe_inc.tools.ads.report_jobs import Backoff, ReportJob, ReportJobManager, poll_until
+from vibe_inc.tools.analytics.columnar import ColumnarResult
+
+INSIGHTS_BACKOFF = Backoff(initial=1.0, factor=2.0, max_interval=30.0, timeout=1800.0)
+PAGE_LIMIT = 500
+
+# Days per async run: ad-level runs over long ranges are the ones Meta times out.
+SLICE_DAYS = {"account": 31, "campaign": 31, "adset": 14, "ad": 7}
+
+# Conversions keep arriving for a day until the 7-day click window closes.
+RESTATEMENT_DAYS = 7
+REFRESH_SECONDS = 6 * 3600
+
+_LEVEL_KEYS = {"campaign": "campaign_id", "adset": "adset_id", "ad": "ad_id"}
+_LAST_N_RE = re.compile(r"^last_(\d+)d$")
+
+
+def resolve_range(date_range: str, today: date | None = None) -> tuple[date, date] | None:
+    """Dates covered by an explicit range or a last_Nd/yesterday/today preset.
+
+    Meta's last_Nd presets end yesterday. Returns None for presets without a
+    fixed day span (e.g. this_month), which stay on the synchronous path.
+    """
+    today = today or date.today()
+    if "," in date_range:
+        start, end = date_range.split(",", 1)
+        return date.fromisoformat(start.strip()), date.fromisoformat(end.strip())
+    if date_range == "today":
+        return today, today
+    if date_range in ("yesterday", "last_24h"):
+        return today - timedelta(days=1), today - timedelta(days=1)
+    match = _LAST_N_RE.match(date_range)
+    if match:
+        return today - timedelta(days=int(match.group(1))), today - timedelta(days=1)
+    return None
+
+
+def date_slices(days: list[date], slice_days: int) -> list[tuple[date, date]]:
+    """Group days into contiguous (since, until) runs of at most slice_days."""
+    slices = []
+    for day in sorted(days):
+        if slices:
+            since, until = slices[-1]
+            if day == until + timedelta(days=1) and (day - since).days < slice_days:
+                slices[-1] = (since, day)
+                continue
+        slices.append((day, day))
+    return slices
+
+
+def report_columns(level: str, fields: list[str]) -> list[str]:
+    """Requested fields plus the level's id and the day column, without duplicates."""
+    columns = list(fields)
+    key = _LEVEL_KEYS.get(level)
+    if key and key not in columns:
+        columns.insert(0, key)
+    if "date_start" not in columns:
+        columns.insert(0, "date_start")
+    return columns
+
+
+class InsightsStore:
+    """Daily insights rows in SQLite, keyed by (account, level, fields, day)."""
+
+    def __init__(self, path: str | None = None):
+        self._conn = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        self._lock = threading.Lock()
+        if path:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta_insights_daily ("
+            " account TEXT NOT NULL,"
+            " level TEXT NOT NULL,"
+            " fields TEXT NOT NULL,"
+            " day TEXT NOT NULL,"
+            " columns TEXT NOT NULL,"
+            " rows TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " PRIMARY KEY (account, level, fields, day))"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _fields_key(fields: list[str]) -> str:
+        return ",".join(sorted(fields))
+
+    def fetched_at(self, account: str, level: str, fields: list[str], start: date, end: date) -> dict[date, float]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT day, fetched_at FROM meta_insights_daily"
+                " WHERE account = ? AND level = ? AND fields = ? AND day BETWEEN ? AND ?",
+                (account, level, self._fields_key(fields), start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return {date.fromisoformat(day): at for day, at in rows}
+
+    def stale_days(
+        self,
+        account: str,
+        level: str,
+        fields: list[str],
+        start: date,
+        end: date,
+        now: float | None = None,
+    ) -> list[date]:
+        """Days in [start, end] that are missing or may have been restated since fetched."""
+        now = time.time() if now is None else now
+        fetched = self.fetched_at(account, level, fields, start, end)
+        stale = []
+        day = start
+        while day <= end:
+            at = fetched.get(day)
+            settled_at = day + timedelta(days=RESTATEMENT_DAYS + 1)
+            if at is None or (
+                date.fromtimestamp(at) < settled_at and now - at > REFRESH_SECONDS
+            ):
+                stale.append(day)
+            day += timedelta(days=1)
+        return stale
+
+    def save(
+        self,
+        account: str,
+        level: str,
+        fields: list[str],
+        result: ColumnarResult,
+        days: list[date],
+        fetched_at: float | None = None,
+    ) -> None:
+        """Replace the stored rows for each of days (days without rows are stored empty)."""
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        by_day: dict[str, list[list]] = {d.isoformat(): [] for d in days}
+        arrays = [result.column(c) for c in result.columns]
+        for i, day in enumerate(result.column("date_start")):
+            by_day.setdefault(day, []).append([a[i] for a in arrays])
+        columns = json.dumps(result.columns)
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO meta_insights_daily"
+                " (account, level, fields, day, columns, rows, fetched_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (account, level, self._fields_key(fields), day, columns,
+                     json.dumps(rows, separators=(",", ":"), default=str), fetched_at)
+                    for day, rows in by_day.items()
+                ],
+            )
+            self._conn.commit()
+
+    def load(self, account: str, level: str, fields: list[str], start: date, end: date) -> ColumnarResult:
+        """Stored rows for [start, end], oldest day first."""
+        with self._lock:
+            stored = self._conn.execute(
+                "SELECT columns, rows FROM meta_insights_daily"
+                " WHERE account = ? AND level = ? AND fields = ? AND day BETWEEN ? AND ?"
+                " ORDER BY day",
+                (account, level, self._fields_key(fields), start.isoformat(), end.isoformat()),
+            ).fetchall()
+        result = ColumnarResult(json.loads(stored[0][0]) if stored else report_columns(level, fields))
+        for columns, rows in stored:
+            if json.loads(columns) != result.columns:
+                continue  # written by an older column layout; refetched next time
+            result.append_batch(json.loads(rows))
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_store: InsightsStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> InsightsStore:
+    """Process-wide store; in memory unless META_INSIGHTS_STORE_PATH names a SQLite file."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = InsightsStore(os.environ.get("META_INSIGHTS_STORE_PATH") or None)
+        return _store
+
+
+def reset_store() -> None:
+    global _store
+    with _store_lock:
+        if _store is not None:
+            _store.close()
+        _store = None
+
+
+def _drain(report_run, columns: list[str]) -> ColumnarResult:
+    """Page through a finished run's rows straight into column arrays."""
+    result = ColumnarResult(columns)
+    batch = []
+    for row in report_run.get_result(params={"limit": PAGE_LIMIT}):
+        batch.append([row.get(c) for c in columns])
+        if len(batch) >= PAGE_LIMIT:
+            result.append_batch(batch)
+            batch = []
+    result.append_batch(batch)
+    return result
+
+
+async def _run_slice(job: ReportJob, account, level: str, fields: list[str], since: date, until: date) -> ColumnarResult:
+    """One async insights run for [since, until] with one row per entity per day."""
+    columns = report_columns(level, fields)
+    params = {
+        "level": level,
+        "time_range": {"since": since.isoformat(), "until": until.isoformat()},
+        "time_increment": 1,
+    }
+    report_run = await asyncio.to_thread(
+        account.get_insights, fields=[c for c in columns if c != "date_start"], params=params, is_async=True,
+    )
+    job.report_id = report_run.get_id()
+
+    async def check():
+        await asyncio.to_thread(report_run.api_get, fields=["async_status", "async_percent_completion"])
+        job.status = report_run["async_status"]
+        if job.status in ("Job Failed", "Job Skipped"):
+            raise RuntimeError(f"Insights run {job.report_id} ended with {job.status!r}")
+        return True if job.status == "Job Completed" else None
+
+    await poll_until(check, INSIGHTS_BACKOFF, job)
+    return await asyncio.to_thread(_drain, report_run, columns)
+
+
+_runs = ReportJobManager(_run_slice, max_cached=0)
+
+
+@dataclass
+class Extraction:
+    result: ColumnarResult
+    fetched_days: list[date] = field(default_factory=list)
+    runs: int = 0
+
+
+def extract_daily(
+    account,
+    level: str,
+    fields: list[str],
+    start: date,
+    end: date,
+    store: InsightsStore | None = None,
+) -> Extraction:
+    """Daily insights rows for [start, end], fetching only stale days.
+
+    Stale days are cut into slices of SLICE_DAYS[level]; every slice is an
+    async report run and all of them are polled concurrently.
+
+    Raises:
+        RuntimeError: If any run fails (stored days from runs that
+            succeeded are kept).
+    """
+    store = store or get_store()
+    account_id = str(account.get_id())
+    stale = store.stale_days(account_id, level, fields, start, end)
+    slices = date_slices(stale, SLICE_DAYS.get(level, 7))
+    jobs = [
+        _runs.submit((account_id, level, tuple(fields), since, until), account, level, fields, since, until)
+        for since, until in slices
+    ]
+    _runs.wait(jobs)
+    errors = []
+    for job, (since, until) in zip(jobs, slices):
+        if job.exception() is not None:
+            errors.append(job.exception())
+            continue
+        days = [since + timedelta(days=i) for i in range((until - since).days + 1)]
+        store.save(account_id, level, fields, job.result(), days)
+    if errors:
+        raise errors[0]
+    return Extraction(store.load(account_id, level, fields, start, end), stale, len(slices))
@@ -0,0 +1,175 @@
+"""Local store of daily ad-platform metrics in one cross-platform schema.
+
+One row per (platform, date, campaign_id) holding the measures unified_metrics
+reports on: spend, impressions, clicks, conversions, revenue. Ratios (CPA,
+ROAS, CTR, CPC) are derived at read time from the summed measures, never
+stored or averaged.
+
+A watermark table records when each (platform, date) was last synced, with
+how many rows it had, so the sync engine only goes back to the platform APIs
+for days that are missing or may still be restated.
+"""
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+
+METRIC_COLUMNS = ("spend", "impressions", "clicks", "conversions", "revenue")
+COLUMNS = ("platform", "date", "campaign_id", "campaign_name", *METRIC_COLUMNS)
+GROUP_COLUMNS = frozenset({"platform", "date", "campaign_id"})
+
+
+def _number(value) -> float:
+    if value in (None, ""):
+        return 0.0
+    return float(value)
+
+
+def normalize_row(platform: str, day, campaign_id, campaign_name=None, **metrics) -> dict:
+    """A row in the unified schema; missing measures are 0."""
+    unknown = set(metrics) - set(METRIC_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown metric columns: {sorted(unknown)}")
+    row = {
+        "platform": platform,
+        "date": day.isoformat() if isinstance(day, date) else str(day)[:10],
+        "campaign_id": str(campaign_id),
+        "campaign_name": campaign_name,
+    }
+    row.update({m: _number(metrics.get(m)) for m in METRIC_COLUMNS})
+    return row
+
+
+def with_ratios(row: dict) -> dict:
+    """Add cpa / roas / ctr / cpc computed from the row's summed measures."""
+    spend, clicks = row["spend"], row["clicks"]
+    row["cpa"] = round(spend / row["conversions"], 2) if row["conversions"] else None
+    row["roas"] = round(row["revenue"] / spend, 2) if spend else None
+    row["ctr"] = round(clicks / row["impressions"] * 100, 2) if row["impressions"] else None
+    row["cpc"] = round(spend / clicks, 2) if clicks else None
+    return row
+
+
+class MetricsStore:
+    """SQLite-backed daily metrics plus per-(platform, date) sync watermarks."""
+
+    def __init__(self, path: str | None = None):
+        self.path = path or ":memory:"
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        if path:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS ad_metrics_daily ("
+            " platform TEXT NOT NULL,"
+            " date TEXT NOT NULL,"
+            " campaign_id TEXT NOT NULL,"
+            " campaign_name TEXT,"
+            " spend REAL NOT NULL,"
+            " impressions REAL NOT NULL,"
+            " clicks REAL NOT NULL,"
+            " conversions REAL NOT NULL,"
+            " revenue REAL NOT NULL,"
+            " PRIMARY KEY (platform, date, campaign_id));"
+            "CREATE INDEX IF NOT EXISTS idx_ad_metrics_daily_date ON ad_metrics_daily (date);"
+            "CREATE TABLE IF NOT EXISTS ad_metrics_watermark ("
+            " platform TEXT NOT NULL,"
+            " date TEXT NOT NULL,"
+            " synced_at REAL NOT NULL,"
+            " row_count INTEGER NOT NULL,"
+            " PRIMARY KEY (platform, date));"
+        )
+        self._conn.commit()
+
+    def watermarks(self, platform: str, start: date, end: date) -> dict[date, float]:
+        """{day: synced_at} for the days of [start, end] already synced."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, synced_at FROM ad_metrics_watermark"
+                " WHERE platform = ? AND date BETWEEN ? AND ?",
+                (platform, start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return {date.fromisoformat(d): at for d, at in rows}
+
+    def replace_days(self, platform: str, days: list[date], rows: list[dict], synced_at: float | None = None) -> int:
+        """Atomically replace platform's rows for days and advance their watermarks.
+
+        Rows dated outside days are ignored. Returns rows written.
+        """
+        synced_at = time.time() if synced_at is None else synced_at
+        wanted = {d.isoformat() for d in days}
+        rows = [r for r in rows if r["date"] in wanted and r["platform"] == platform]
+        counts = dict.fromkeys(wanted, 0)
+        for r in rows:
+            counts[r["date"]] += 1
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM ad_metrics_daily WHERE platform = ? AND date = ?",
+                [(platform, d) for d in wanted],
+            )
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO ad_metrics_daily ({', '.join(COLUMNS)})"
+                f" VALUES ({', '.join('?' * len(COLUMNS))})",
+                [tuple(r[c] for c in COLUMNS) for r in rows],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO ad_metrics_watermark (platform, date, synced_at, row_count)"
+                " VALUES (?, ?, ?, ?)",
+                [(platform, d, synced_at, n) for d, n in counts.items()],
+            )
+        return len(rows)
+
+    def query(
+        self,
+        start: date,
+        end: date,
+        platforms: list[str] | None = None,
+        group_by: tuple[str, ...] = ("platform",),
+    ) -> list[dict]:
+        """Summed measures for [start, end] grouped by group_by, with ratios."""
+        bad = set(group_by) - GROUP_COLUMNS
+        if bad:
+            raise ValueError(f"Cannot group by {sorted(bad)}; use {sorted(GROUP_COLUMNS)}")
+        keys = list(group_by)
+        if "campaign_id" in keys:
+            keys.append("MAX(campaign_name) AS campaign_name")
+        sums = [f"SUM({m}) AS {m}" for m in METRIC_COLUMNS]
+        sql = f"SELECT {', '.join(keys + sums)} FROM ad_metrics_daily WHERE date BETWEEN ? AND ?"
+        params: list = [start.isoformat(), end.isoformat()]
+        if platforms:
+            sql += f" AND platform IN ({', '.join('?' * len(platforms))})"
+            params.extend(platforms)
+        if group_by:
+            sql += f" GROUP BY {', '.join(group_by)} ORDER BY {', '.join(group_by)}"
+        with self._lock:
+            cur = self._conn.execute(sql, params)
+            names = [d[0] for d in cur.description]
+            fetched = cur.fetchall()
+        rows = [dict(zip(names, values)) for values in fetched]
+        return [with_ratios(r) for r in rows if r["spend"] is not None]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_store: MetricsStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> MetricsStore:
+    """Process-wide store; in memory unless AD_METRICS_STORE_PATH names a SQLite file."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = MetricsStore(os.environ.get("AD_METRICS_STORE_PATH") or None)
+        return _store
+
+
+def reset_store() -> None:
+    global _store
+    with _store_lock:
+        if _store is not None:
+            _store.close()
+        _store = None
@@ -0,0 +1,376 @@
+"""Incremental sync of daily ad-platform metrics into the local MetricsStore.
+
+Each platform has a fetcher that pulls campaign x day metrics for a date
+range and normalizes them to the unified schema (metrics_store.COLUMNS).
+A sync only asks the API for:
+
+- days with no watermark yet, and
+- days inside the platform's restatement lookback (conversions keep being
+  attributed to a day for up to a week; 14 days on Amazon) whose watermark
+  is older than REFRESH_SECONDS.
+
+Everything else is answered from the store. Platforms sync concurrently;
+one platform failing leaves its stored days as they were and does not stop
+the others.
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from vibe_inc.tools.ads.meta_insights import date_slices, resolve_range
+from vibe_inc.tools.ads.metrics_store import (
+    METRIC_COLUMNS,
+    MetricsStore,
+    get_store,
+    normalize_row,
+    with_ratios,
+)
+
+PLATFORMS = ("meta", "google", "amazon", "tiktok", "linkedin", "pinterest")
+
+RESTATEMENT_DAYS = {
+    "meta": 7, "google": 7, "tiktok": 7, "linkedin": 7, "pinterest": 7, "amazon": 14,
+}
+REFRESH_SECONDS = 3600
+MAX_SLICE_DAYS = 31
+
+
+def lookback_days(platform: str) -> int:
+    """Restatement lookback; AD_SYNC_LOOKBACK_DAYS overrides it for every platform."""
+    override = os.environ.get("AD_SYNC_LOOKBACK_DAYS")
+    return int(override) if override else RESTATEMENT_DAYS.get(platform, 7)
+
+
+# --- Platform fetchers: (start, end) -> rows in the unified schema ---
+
+_META_PURCHASE_TYPES = ("purchase", "omni_purchase", "offsite_conversion.fb_pixel_purchase")
+
+
+def _meta_purchases(actions) -> float:
+    """First purchase action type present (Meta reports the same purchases under several)."""
+    by_type = {a.get("action_type"): a.get("value") for a in actions or []}
+    for action_type in _META_PURCHASE_TYPES:
+        if action_type in by_type:
+            return float(by_type[action_type])
+    return 0.0
+
+
+def _fetch_meta(start: date, end: date) -> list[dict]:
+    from vibe_inc.tools.ads import meta_ads
+
+    account = meta_ads._get_account()
+    insights = account.get_insights(
+        fields=["campaign_id", "campaign_name", "spend", "impressions", "clicks", "actions", "action_values"],
+        params={
+            "level": "campaign",
+            "time_range": {"since": start.isoformat(), "until": end.isoformat()},
+            "time_increment": 1,
+        },
+    )
+    return [
+        normalize_row(
+            "meta", r["date_start"], r["campaign_id"], r.get("campaign_name"),
+            spend=r.get("spend"), impressions=r.get("impressions"), clicks=r.get("clicks"),
+            conversions=_meta_purchases(r.get("actions")),
+            revenue=_meta_purchases(r.get("action_values")),
+        )
+        for r in insights
+    ]
+
+
+def _fetch_google(start: date, end: date) -> list[dict]:
+    from vibe_inc.tools.ads import google_ads
+
+    query = (
+        "SELECT segments.date, campaign.id, campaign.name, metrics.cost_micros,"
+        " metrics.impressions, metrics.clicks, metrics.conversions, metrics.conversions_value"
+        " FROM campaign"
+        f" WHERE segments.date BETWEEN '{start.isoformat()}' AND '{end.isoformat()}'"
+    )
+    service = google_ads._get_client().get_service("GoogleAdsService")
+    return [
+        normalize_row(
+            "google", row.segments.date, row.campaign.id, row.campaign.name,
+            spend=row.metrics.cost_micros / 1_000_000, impressions=row.metrics.impressions,
+            clicks=row.metrics.clicks, conversions=row.metrics.conversions,
+            revenue=row.metrics.conversions_value,
+        )
+        for row in service.search(customer_id=google_ads._get_customer_id(), query=query)
+    ]
+
+
+def _fetch_tiktok(start: date, end: date) -> list[dict]:
+    from vibe_inc.tools.ads import tiktok_ads
+
+    rows, page = [], 1
+    while True:
+        resp = tiktok_ads._http.post(
+            f"{tiktok_ads._BASE_URL}/report/integrated/get/",
+            headers=tiktok_ads._get_headers(),
+            json={
+                "advertiser_id": tiktok_ads._get_advertiser_id(),
+                "report_type": "BASIC",
+                "data_level": "AUCTION_CAMPAIGN",
+                "dimensions": ["campaign_id", "stat_time_day"],
+                # total_complete_payment_rate is TikTok's name for total purchase value.
+                "metrics": ["campaign_name", "spend", "impressions", "clicks",
+                            "conversion", "total_complete_payment_rate"],
+                "start_date": start.isoformat(),
+                "end_date": end.isoformat(),
+                "page": page,
+                "page_size": 1000,
+            },
+        )
+        resp.raise_for_status()
+        payload = resp.json()
+        if payload.get("code", 0) != 0:
+            raise RuntimeError(f"TikTok report failed: {payload.get('message')}")
+        data = payload.get("data", {})
+        for item in data.get("list", []):
+            dims, m = item.get("dimensions", {}), item.get("metrics", {})
+            rows.append(normalize_row(
+                "tiktok", dims["stat_time_day"], dims["campaign_id"], m.get("campaign_name"),
+                spend=m.get("spend"), impressions=m.get("impressions"), clicks=m.get("clicks"),
+                conversions=m.get("conversion"), revenue=m.get("total_complete_payment_rate"),
+            ))
+        if page >= data.get("page_info", {}).get("total_page", 1):
+            return rows
+        page += 1
+
+
+def _fetch_linkedin(start: date, end: date) -> list[dict]:
+    from vibe_inc.tools.ads import linkedin_ads
+
+    params = {
+        "q": "analytics",
+        "pivot": "CAMPAIGN",
+        "timeGranularity": "DAILY",
+        "accounts": f"urn:li:sponsoredAccount:{linkedin_ads._get_account_id()}",
+        "fields": "dateRange,pivotValues,impressions,clicks,costInLocalCurrency,"
+                  "externalWebsiteConversions,conversionValueInLocalCurrency",
+        "dateRange.start.year": start.year,
+        "dateRange.start.month": start.month,
+        "dateRange.start.day": start.day,
+        "dateRange.end.year": end.year,
+        "dateRange.end.month": end.month,
+        "dateRange.end.day": end.day,
+    }
+    resp = linkedin_ads._http.get(
+        f"{linkedin_ads._BASE_URL}/adAnalytics", headers=linkedin_ads._get_headers(), params=params,
+    )
+    resp.raise_for_status()
+    rows = []
+    for e in resp.json().get("elements", []):
+        day = e["dateRange"]["start"]
+        rows.append(normalize_row(
+            "linkedin", date(day["year"], day["month"], day["day"]),
+            e["pivotValues"][0].rsplit(":", 1)[-1],
+            spend=e.get("costInLocalCurrency"), impressions=e.get("impressions"),
+            clicks=e.get("clicks"), conversions=e.get("externalWebsiteConversions"),
+            revenue=e.get("conversionValueInLocalCurrency"),
+        ))
+    return rows
+
+
+def _fetch_pinterest(start: date, end: date) -> list[dict]:
+    from vibe_inc.tools.ads import pinterest_ads
+
+    resp = pinterest_ads._http.get(
+        f"{pinterest_ads._BASE_URL}/ad_accounts/{pinterest_ads._get_ad_account_id()}/reports",
+        headers=pinterest_ads._get_headers(),
+        params={
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "granularity": "DAY",
+            "level": "CAMPAIGN",
+            "columns": "CAMPAIGN_ID,CAMPAIGN_NAME,SPEND_IN_DOLLAR,IMPRESSION,OUTBOUND_CLICK,"
+                       "TOTAL_CONVERSIONS,TOTAL_CHECKOUT_VALUE_IN_MICRO_DOLLAR",
+        },
+    )
+    resp.raise_for_status()
+    data = resp.json()
+    return [
+        normalize_row(
+            "pinterest", r["DATE"], r["CAMPAIGN_ID"], r.get("CAMPAIGN_NAME"),
+            spend=r.get("SPEND_IN_DOLLAR"), impressions=r.get("IMPRESSION"),
+            clicks=r.get("OUTBOUND_CLICK"), conversions=r.get("TOTAL_CONVERSIONS"),
+            revenue=(r.get("TOTAL_CHECKOUT_VALUE_IN_MICRO_DOLLAR") or 0) / 1_000_000,
+        )
+        for r in (data if isinstance(data, list) else data.get("rows", []))
+    ]
+
+
+def _fetch_amazon(start: date, end: date) -> list[dict]:
+    from vibe_inc.tools.ads import amazon_ads
+
+    job = amazon_ads.submit_report(
+        "SPONSORED_PRODUCTS", "spCampaigns",
+        ["date", "campaignId", "campaignName", "cost", "impressions", "clicks", "purchases14d", "sales14d"],
+        f"{start.isoformat()},{end.isoformat()}",
+    )
+    return [
+        normalize_row(
+            "amazon", r["date"], r["campaignId"], r.get("campaignName"),
+            spend=r.get("cost"), impressions=r.get("impressions"), clicks=r.get("clicks"),
+            conversions=r.get("purchases14d"), revenue=r.get("sales14d"),
+        )
+        for r in job.result()
+    ]
+
+
+FETCHERS = {
+    "meta": _fetch_meta,
+    "google": _fetch_google,
+    "amazon": _fetch_amazon,
+    "tiktok": _fetch_tiktok,
+    "linkedin": _fetch_linkedin,
+    "pinterest": _fetch_pinterest,
+}
+
+
+# --- Sync engine ---
+
+def days_to_sync(
+    store: MetricsStore,
+    platform: str,
+    start: date,
+    end: date,
+    today: date | None = None,
+    now: float | None = None,
+    lookback: int | None = None,
+) -> list[date]:
+    """Days of [start, end] that are unsynced, or restatable and due a refresh."""
+    today = today or date.today()
+    now = time.time() if now is None else now
+    lookback = lookback_days(platform) if lookback is None else lookback
+    restatable_from = today - timedelta(days=lookback)
+    marks = store.watermarks(platform, start, end)
+    due = []
+    day = start
+    while day <= end:
+        synced_at = marks.get(day)
+        if synced_at is None or (day >= restatable_from and now - synced_at > REFRESH_SECONDS):
+            due.append(day)
+        day += timedelta(days=1)
+    return due
+
+
+def sync_platform(
+    platform: str,
+    start: date,
+    end: date,
+    store: MetricsStore | None = None,
+    today: date | None = None,
+) -> dict:
+    """Fetch platform's due days in [start, end] into the store.
+
+    Returns:
+        Dict with 'days_synced' and 'rows' written.
+    """
+    store = store or get_store()
+    fetch = FETCHERS[platform]
+    due = days_to_sync(store, platform, start, end, today=today)
+    written = 0
+    for since, until in date_slices(due, MAX_SLICE_DAYS):
+        days = [since + timedelta(days=i) for i in range((until - since).days + 1)]
+        written += store.replace_days(platform, days, fetch(since, until))
+    return {"days_synced": len(due), "rows": written}
+
+
+def sync_platforms(
+    platforms: list[str],
+    start: date,
+    end: date,
+    store: MetricsStore | None = None,
+    today: date | None = None,
+) -> dict:
+    """sync_platform for each platform concurrently; a failure is reported as 'error'."""
+    store = store or get_store()
+    unknown = [p for p in platforms if p not in FETCHERS]
+    platforms = [p for p in platforms if p in FETCHERS]
+    results = {p: {"error": "Unknown platform"} for p in unknown}
+    if not platforms:
+        return results
+    with ThreadPoolExecutor(max_workers=len(platforms)) as pool:
+        futures = {p: pool.submit(sync_platform, p, start, end, store, today) for p in platforms}
+    for p, future in futures.items():
+        try:
+            results[p] = future.result()
+        except Exception as exc:
+            results[p] = {"error": f"{type(exc).__name__}: {exc}"}
+    return results
+
+
+def read_metrics(
+    platforms: list[str] | None,
+    date_range: str,
+    group_by: tuple[str, ...] = ("platform",),
+    sync: bool = True,
+) -> dict:
+    """Sync deltas (optional), then aggregate [start, end] from the store."""
+    span = resolve_range(date_range)
+    if span is None:
+        raise ValueError(f"Unsupported date_range for stored metrics: {date_range!r}")
+    start, end = span
+    platforms = list(platforms or PLATFORMS)
+    synced = sync_platforms(platforms, start, end) if sync else {}
+    store = get_store()
+    totals = store.query(start, end, platforms, group_by=())
+    return {
+        "date_range": date_range,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "group_by": list(group_by),
+        "rows": store.query(start, end, platforms, group_by=group_by),
+        "totals": totals[0] if totals else with_ratios(dict.fromkeys(METRIC_COLUMNS, 0.0)),
+        "sync": synced,
+    }
+
+
+def ad_metrics_sync(
+    platforms: list[str] | None = None,
+    date_range: str = "last_30d",
+) -> dict:
+    """Sync daily ad metrics from the platform APIs into the local store.
+
+    Only days never synced, or still inside the platform's restatement window,
+    are fetched; ad_metrics_read calls this automatically.
+
+    Args:
+        platforms: Platforms to sync (meta, google, amazon, tiktok, linkedin, pinterest). Default: all.
+        date_range: last_Nd, yesterday, or YYYY-MM-DD,YYYY-MM-DD.
+
+    Returns:
+        Dict with per-platform 'days_synced' and 'rows' (or 'error').
+    """
+    span = resolve_range(date_range)
+    if span is None:
+        return {"error": f"Unsupported date_range: {date_range}"}
+    return {"date_range": date_range, "platforms": sync_platforms(list(platforms or PLATFORMS), *span)}
+
+
+def ad_metrics_read(
+    platforms: list[str] | None = None,
+    date_range: str = "last_7d",
+    group_by: str = "platform",
+) -> dict:
+    """Read daily ad metrics across platforms from the local store.
+
+    Spend, impressions, clicks, conversions and revenue in one schema for every
+    platform, with CPA, ROAS, CTR and CPC derived from the sums. Only new or
+    restatable days are fetched from the platform APIs first.
+
+    Args:
+        platforms: Platforms to include (meta, google, amazon, tiktok, linkedin, pinterest). Default: all.
+        date_range: last_Nd, yesterday, or YYYY-MM-DD,YYYY-MM-DD.
+        group_by: Comma-separated breakdown — platform, date, campaign_id (e.g. 'platform,date').
+
+    Returns:
+        Dict with 'rows' (one per group), 'totals', and 'sync' (what was fetched per platform).
+    """
+    keys = tuple(k.strip() for k in group_by.split(",") if k.strip())
+    try:
+        return read_metrics(platforms, date_range, group_by=keys)
+    except ValueError as exc:
+        return {"error": str(exc)}
@@ -1,9 +1,10 @@
 """Pinterest Ads API tools for D2C Growth role."""
 import os
 
-import httpx
+from vibe_inc.tools.http_clients import provider_client
 
 _BASE_URL = "https://api.pinterest.com/v5"
+_http = provider_client("pinterest_ads")
 
 
 def _get_headers():
@@ -50,7 +51,7 @@ def pinterest_ads_report(
         "columns": ",".join(metrics),
         "level": entity_type,
     }
-    resp = httpx.get(
+    resp = _http.get(
         f"{_BASE_URL}/ad_accounts/{ad_account_id}/reports",
         headers=_get_headers(),
         params=params,
@@ -74,7 +75,7 @@ def pinterest_ads_campaigns(
     params = {}
     if status:
         params["entity_statuses"] = status
-    resp = httpx.get(
+    resp = _http.get(
         f"{_BASE_URL}/ad_accounts/{ad_account_id}/campaigns",
         headers=_get_headers(),
         params=params,
@@ -110,7 +111,7 @@ def pinterest_ads_create(
         "daily_spend_cap": budget if budget_type == "DAILY" else None,
         "lifetime_spend_cap": budget if budget_type == "LIFETIME" else None,
     }
-    resp = httpx.post(
+    resp = _http.post(
         f"{_BASE_URL}/ad_accounts/{ad_account_id}/campaigns",
         headers=_get_headers(),
         json=body,
@@ -137,7 +138,7 @@ def pinterest_ads_update(
         "id": campaign_id,
         **updates,
     }
-    resp = httpx.patch(
+    resp = _http.patch(
         f"{_BASE_URL}/ad_accounts/{ad_account_id}/campaigns/{campaign_id}",
         headers=_get_headers(),
         json=body,
@@ -162,7 +163,7 @@ def pinterest_ads_pins(
     params = {}
     if campaign_id:
         params["campaign_ids"] = campaign_id
-    resp = httpx.get(
+    resp = _http.get(
         f"{_BASE_URL}/ad_accounts/{ad_account_id}/ad_pins",
         headers=_get_headers(),
         params=params,
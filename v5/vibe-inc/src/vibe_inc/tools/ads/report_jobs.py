@@ -0,0 +1,387 @@
+"""Async report jobs on a shared event loop.
+
+Ad platforms build large reports asynchronously: POST a request, poll its
+status until it completes, then download the result. Polling with
+time.sleep holds the agent loop thread for the whole wait and runs one
+report at a time. Here each report is a coroutine on one event loop
+(ReportScheduler, a daemon thread shared by every platform), polled with
+exponential backoff, and the caller gets a ReportJob handle:
+
+    job = manager.submit(key, *args)
+    rows = job.result()       # block, from sync code
+    rows = await job          # from async code, on any loop
+
+ReportJobManager caches completed reports by key and returns the running
+job when the same key is submitted while it is still in flight.
+"""
+import asyncio
+import codecs
+import itertools
+import json
+import random
+import threading
+import time
+import weakref
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, wait
+from dataclasses import dataclass
+
+from vibe_inc.tools.http_clients import get_registry
+
+SUBMITTED = "SUBMITTED"
+COMPLETED = "COMPLETED"
+FAILED = "FAILED"
+
+
+@dataclass(frozen=True)
+class Backoff:
+    """Poll intervals: initial, then x factor up to max_interval, +/- jitter."""
+
+    initial: float = 2.0
+    factor: float = 2.0
+    max_interval: float = 60.0
+    timeout: float = 900.0
+    jitter: float = 0.1
+
+    def delays(self):
+        delay = self.initial
+        while True:
+            yield delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+            delay = min(self.max_interval, delay * self.factor)
+
+
+async def poll_until(check, backoff: Backoff, job: "ReportJob | None" = None):
+    """Await check() until it returns something other than None.
+
+    Raises:
+        TimeoutError: If backoff.timeout elapses first.
+    """
+    deadline = time.monotonic() + backoff.timeout
+    for delay in backoff.delays():
+        value = await check()
+        if job is not None:
+            job.polls += 1
+        if value is not None:
+            return value
+        if time.monotonic() + delay > deadline:
+            break
+        await asyncio.sleep(delay)
+    name = job.report_id if job is not None and job.report_id else "report"
+    raise TimeoutError(f"{name} did not complete within {backoff.timeout:g}s")
+
+
+class JsonArrayStream:
+    """Incremental decoder for a JSON array fed as text chunks.
+
+    feed() returns the elements completed so far, so only the unparsed
+    tail of the document is held in memory.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._started = False
+        self._expect_comma = False
+        self._ended = False
+
+    def feed(self, text: str, final: bool = False) -> list:
+        buf = self._buf + text
+        items = []
+        pos = 0
+        while True:
+            while pos < len(buf) and buf[pos].isspace():
+                pos += 1
+            if pos == len(buf):
+                break
+            ch = buf[pos]
+            if self._ended:
+                raise ValueError("Unexpected data after JSON array")
+            if not self._started:
+                if ch != "[":
+                    raise ValueError("Expected a JSON array")
+                self._started = True
+                pos += 1
+            elif ch == "]":
+                self._ended = True
+                pos += 1
+            elif self._expect_comma:
+                if ch != ",":
+                    raise ValueError(f"Expected ',' at {buf[pos:pos + 20]!r}")
+                self._expect_comma = False
+                pos += 1
+            else:
+                try:
+                    value, end = self._decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break  # element continues in the next chunk
+                if end == len(buf) and not final and not isinstance(value, (dict, list, str)):
+                    break  # a number or literal may continue in the next chunk
+                items.append(value)
+                self._expect_comma = True
+                pos = end
+        self._buf = buf[pos:]
+        return items
+
+    def close(self) -> list:
+        items = self.feed("", final=True)
+        if not self._ended:
+            raise ValueError("Truncated JSON array")
+        return items
+
+
+class GzipJsonDecoder:
+    """Inflate a gzip (or zlib) body and decode the JSON array inside, chunk by chunk."""
+
+    def __init__(self):
+        self._inflate = zlib.decompressobj(zlib.MAX_WBITS | 32)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._json = JsonArrayStream()
+
+    def feed(self, chunk: bytes) -> list:
+        return self._json.feed(self._text.decode(self._inflate.decompress(chunk)))
+
+    def close(self) -> list:
+        items = self._json.feed(self._text.decode(self._inflate.flush(), final=True))
+        return items + self._json.close()
+
+
+async def stream_gzip_json(http, url: str, chunk_size: int = 64 * 1024, **kwargs) -> list:
+    """GET a gzipped JSON array, inflating and parsing as the bytes arrive."""
+    decoder = GzipJsonDecoder()
+    rows = []
+    async with http.astream("GET", url, **kwargs) as resp:
+        resp.raise_for_status()
+        async for chunk in resp.aiter_raw(chunk_size):
+            rows.extend(decoder.feed(chunk))
+    rows.extend(decoder.close())
+    return rows
+
+
+class ReportJob:
+    """Handle for one submitted report; awaitable, or block with result()."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, key: tuple):
+        self.job_id = f"job-{next(self._ids)}"
+        self.key = key
+        self.status = SUBMITTED
+        self.report_id: str | None = None
+        self.polls = 0
+        self.cached = False
+        self.submitted_at = time.time()
+        self.completed_at: float | None = None
+        self.future: Future = Future()
+        self._task: Future | None = None  # the coroutine's future on the scheduler loop
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def result(self, timeout: float | None = None):
+        return self.future.result(timeout)
+
+    def exception(self, timeout: float | None = None):
+        return self.future.exception(timeout)
+
+    def cancel(self) -> bool:
+        if self._task is not None:
+            self._task.cancel()
+        return self.future.cancel()
+
+    def __await__(self):
+        return asyncio.wrap_future(self.future).__await__()
+
+    def as_dict(self) -> dict:
+        data = {
+            "job_id": self.job_id,
+            "status": self.status,
+            "report_id": self.report_id,
+            "polls": self.polls,
+            "cached": self.cached,
+        }
+        if self.completed_at is not None:
+            data["seconds"] = round(self.completed_at - self.submitted_at, 3)
+        return data
+
+
+class ReportScheduler:
+    """An asyncio event loop on a daemon thread, started on first submit."""
+
+    def __init__(self, name: str = "report-jobs", registry=None):
+        self.name = name
+        self._registry = registry
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=self._run, args=(loop,), name=self.name, daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        finally:
+            loop.close()
+
+    def submit(self, coro) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Close the loop's async HTTP clients, cancel pending jobs, stop the thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        registry = self._registry if self._registry is not None else get_registry()
+        try:
+            asyncio.run_coroutine_threadsafe(registry.aclose_async(), loop).result(timeout)
+        except Exception:
+            pass  # shutting down regardless
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+
+
+_scheduler = ReportScheduler()
+
+
+def get_scheduler() -> ReportScheduler:
+    return _scheduler
+
+
+def close_scheduler() -> None:
+    """Stop the shared report loop (the next submit restarts it)."""
+    _scheduler.close()
+
+
+class ReportJobManager:
+    """Submits report coroutines to a scheduler, with an in-flight map and a result cache.
+
+    run(job, *args) is a coroutine function that returns the report rows;
+    it may set job.report_id / job.status as the platform reports progress.
+    max_cached=0 turns the result cache off: concurrent submits of a key
+    still share one job, later ones start a new run.
+    """
+
+    def __init__(
+        self,
+        run,
+        scheduler: ReportScheduler | None = None,
+        max_concurrency: int = 8,
+        cache_ttl: float = 3600.0,
+        max_cached: int = 128,
+        max_jobs: int = 256,
+    ):
+        self._run_report = run
+        self._scheduler = scheduler
+        self.max_concurrency = max_concurrency
+        self.cache_ttl = cache_ttl
+        self.max_cached = max_cached
+        self.max_jobs = max_jobs
+        self._cache: OrderedDict[tuple, tuple[float, list]] = OrderedDict()
+        self._inflight: dict[tuple, ReportJob] = {}
+        self._jobs: OrderedDict[str, ReportJob] = OrderedDict()
+        self._semaphores = weakref.WeakKeyDictionary()  # one per scheduler loop
+        self._lock = threading.Lock()
+
+    @property
+    def scheduler(self) -> ReportScheduler:
+        return self._scheduler if self._scheduler is not None else _scheduler
+
+    def _cached(self, key: tuple) -> list | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry[0] > self.cache_ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return entry[1]
+
+    def _track(self, job: ReportJob) -> None:
+        self._jobs[job.job_id] = job
+        while len(self._jobs) > self.max_jobs:
+            self._jobs.popitem(last=False)
+
+    def submit(self, key: tuple, *args) -> ReportJob:
+        """Start (or join, or serve from cache) the report for key."""
+        with self._lock:
+            rows = self._cached(key)
+            if rows is not None:
+                job = ReportJob(key)
+                job.status, job.cached, job.completed_at = COMPLETED, True, job.submitted_at
+                job.future.set_result(rows)
+                self._track(job)
+                return job
+            job = self._inflight.get(key)
+            if job is not None:
+                return job
+            job = ReportJob(key)
+            self._inflight[key] = job
+            self._track(job)
+        job._task = self.scheduler.submit(self._execute(job, args))
+        job._task.add_done_callback(lambda f: self._settle(job, f))
+        return job
+
+    async def _execute(self, job: ReportJob, args: tuple) -> list:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.setdefault(loop, asyncio.Semaphore(self.max_concurrency))
+        async with semaphore:
+            return await self._run_report(job, *args)
+
+    def _settle(self, job: ReportJob, future: Future) -> None:
+        """Record the outcome and resolve the job's handle."""
+        job.completed_at = time.time()
+        with self._lock:
+            if self._inflight.get(job.key) is job:
+                del self._inflight[job.key]
+            if self.max_cached > 0 and not future.cancelled() and future.exception() is None:
+                self._cache[job.key] = (job.completed_at, future.result())
+                self._cache.move_to_end(job.key)
+                while len(self._cache) > self.max_cached:
+                    self._cache.popitem(last=False)
+        if future.cancelled() or job.future.done():  # job.future: cancelled through the handle
+            job.status = FAILED
+            job.future.cancel()
+        elif future.exception() is not None:
+            job.status = FAILED
+            job.future.set_exception(future.exception())
+        else:
+            job.status = COMPLETED
+            job.future.set_result(future.result())
+
+    def get(self, job_id: str) -> ReportJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def wait(self, jobs: list[ReportJob], timeout: float | None = None) -> None:
+        """Block until every job is done (or timeout)."""
+        wait([job.future for job in jobs], timeout=timeout)
+
+    def invalidate(self, key: tuple | None = None) -> int:
+        """Drop one cached report, or all of them. Returns count dropped."""
+        with self._lock:
+            if key is None:
+                dropped = len(self._cache)
+                self._cache.clear()
+                return dropped
+            return 1 if self._cache.pop(key, None) is not None else 0
@@ -1,9 +1,10 @@
 """TikTok Ads API tools for D2C Growth role."""
 import os
 
-import httpx
+from vibe_inc.tools.http_clients import provider_client
 
 _BASE_URL = "https://business-api.tiktok.com/open_api/v1.3"
+_http = provider_client("tiktok_ads")
 
 
 def _get_headers():
@@ -48,7 +49,7 @@ def tiktok_ads_report(
         "start_date": start.strip(),
         "end_date": end.strip(),
     }
-    resp = httpx.post(
+    resp = _http.post(
         f"{_BASE_URL}/report/integrated/get/",
         headers=_get_headers(),
         json=body,
@@ -72,7 +73,7 @@ def tiktok_ads_campaigns(
     params = {"advertiser_id": _get_advertiser_id()}
     if status:
         params["filtering"] = {"status": status}
-    resp = httpx.get(
+    resp = _http.get(
         f"{_BASE_URL}/campaign/get/",
         headers=_get_headers(),
         params=params,
@@ -105,7 +106,7 @@ def tiktok_ads_create(
         "budget": budget,
         "budget_mode": budget_mode,
     }
-    resp = httpx.post(
+    resp = _http.post(
         f"{_BASE_URL}/campaign/create/",
         headers=_get_headers(),
         json=body,
@@ -132,7 +133,7 @@ def tiktok_ads_update(
         "campaign_id": campaign_id,
         **updates,
     }
-    resp = httpx.post(
+    resp = _http.post(
         f"{_BASE_URL}/campaign/update/",
         headers=_get_headers(),
         json=body,
@@ -155,7 +156,7 @@ def tiktok_ads_creatives(
     params = {"advertiser_id": _get_advertiser_id()}
     if campaign_id:
         params["filtering"] = {"campaign_ids": [campaign_id]}
-    resp = httpx.get(
+    resp = _http.get(
         f"{_BASE_URL}/creative/get/",
         headers=_get_headers(),
         params=params,
@@ -181,7 +182,7 @@ def tiktok_ads_audiences(
     advertiser_id = _get_advertiser_id()
 
     if action == "list":
-        resp = httpx.get(
+        resp = _http.get(
             f"{_BASE_URL}/dmp/custom_audience/list/",
             headers=headers,
             params={"advertiser_id": advertiser_id},
@@ -189,7 +190,7 @@ def tiktok_ads_audiences(
         data = resp.json().get("data", {})
         return {"audiences": data.get("list", [])}
     elif action == "read" and audience_id:
-        resp = httpx.get(
+        resp = _http.get(
             f"{_BASE_URL}/dmp/custom_audience/get/",
             headers=headers,
             params={"advertiser_id": advertiser_id, "custom_audience_ids": [audience_id]},
@@ -198,7 +199,7 @@ def tiktok_ads_audiences(
         audiences = data.get("list", [])
         return {"audiences": audiences}
     elif action == "refresh" and audience_id:
-        resp = httpx.post(
+        resp = _http.post(
             f"{_BASE_URL}/dmp/custom_audience/update/",
             headers=headers,
             json={"advertiser_id": advertiser_id, "custom_audience_id": audience_id},
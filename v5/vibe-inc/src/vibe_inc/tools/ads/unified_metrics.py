@@ -1,6 +1,43 @@
 """Cross-platform unified metrics tools for D2C Growth."""
+from datetime import date
+
+import numpy as np
+
+from vibe_inc.tools.ads.aggregation import PlatformFrame, allocate, fit_curves
+from vibe_inc.tools.ads.metrics_sync import PLATFORMS, read_metrics
 from vibe_inc.tools.shared_memory import read_memory, write_memory
 
+# Rank direction per metric: lower CPA is better, higher everything else.
+_ASCENDING = {"cpa", "cpc", "marginal_cpa"}
+
+_GOAL_TARGETS = {
+    "minimize_cac": "conversions",
+    "maximize_conversions": "conversions",
+    "maximize_roas": "revenue",
+}
+
+# platform_health_score weights, as in the CrossPlatformOps health check.
+_HEALTH_WEIGHTS = {"cpa": 0.40, "pacing": 0.25, "creative": 0.20, "recency": 0.15}
+
+
+def _round(value, digits: int = 2):
+    value = float(value)
+    return round(value, digits) if np.isfinite(value) else None
+
+
+def _benchmarks() -> dict:
+    return read_memory("performance/platform_benchmarks.yaml") or {}
+
+
+def _load_frame(platforms: list[str], date_range: str) -> tuple[PlatformFrame, dict]:
+    """Daily (platform, date) metrics for date_range as arrays, plus the read's metadata."""
+    data = read_metrics(platforms, date_range, group_by=("platform", "date"))
+    return PlatformFrame.from_rows(data["rows"], platforms), data
+
+
+def _sync_errors(data: dict) -> dict:
+    return {p: s["error"] for p, s in data["sync"].items() if "error" in s}
+
 
 def unified_metrics_read(
     platforms: list[str] | None = None,
@@ -9,18 +46,24 @@ def unified_metrics_read(
 ) -> dict:
     """Read unified metrics across all ad platforms.
 
-    Aggregates spend, conversions, CPA, ROAS from shared_memory performance
-    data written by each platform's weekly_report workflow.
+    With a date_range, aggregates spend, conversions, CPA, ROAS and marginal
+    CPA (cost of the next conversion at current daily spend, from a fitted
+    diminishing-returns curve) from the local daily metrics store, syncing
+    only new or restatable days from the platform APIs first. Without one,
+    returns the shared_memory performance summaries written by each
+    platform's weekly_report workflow.
 
     Args:
         platforms: Filter to specific platforms. Default: all (meta, google, amazon, tiktok, linkedin, pinterest).
-        date_range: Date range string (e.g., "2026-02-01,2026-02-07").
-        metric: Primary metric to rank by (cpa, roas, spend, conversions).
+        date_range: Date range string (e.g., "2026-02-01,2026-02-07" or "last_7d").
+        metric: Primary metric to rank by (cpa, roas, marginal_cpa, spend, conversions).
 
     Returns:
         Dict with per-platform metrics, totals, and rankings.
     """
-    all_platforms = platforms or ["meta", "google", "amazon", "tiktok", "linkedin", "pinterest"]
+    all_platforms = platforms or list(PLATFORMS)
+    if date_range:
+        return _stored_metrics(all_platforms, date_range, metric)
     results = {}
     for p in all_platforms:
         data = read_memory(f"performance/{p}_weekly")
@@ -32,24 +75,169 @@ def unified_metrics_read(
     }
 
 
+def _stored_metrics(platforms: list[str], date_range: str, metric: str) -> dict:
+    try:
+        frame, data = _load_frame(platforms, date_range)
+    except ValueError as exc:
+        return {"error": str(exc)}
+    totals = frame.totals()
+    curves = fit_curves(frame)
+    window_days = (date.fromisoformat(data["end"]) - date.fromisoformat(data["start"])).days + 1
+    daily_spend = totals["spend"] / window_days
+    marginal_cpa = curves.marginal_cost(daily_spend)
+
+    results = {}
+    for i, p in enumerate(frame.platforms):
+        if not totals["rows"][i]:
+            results[p] = {"status": "no_data"}
+            continue
+        spend, conversions, revenue = totals["spend"][i], totals["conversions"][i], totals["revenue"][i]
+        results[p] = {
+            "spend": _round(spend),
+            "impressions": _round(totals["impressions"][i], 0),
+            "clicks": _round(totals["clicks"][i], 0),
+            "conversions": _round(conversions),
+            "revenue": _round(revenue),
+            "cpa": _round(spend / conversions) if conversions else None,
+            "roas": _round(revenue / spend) if spend else None,
+            "marginal_cpa": _round(marginal_cpa[i]) if conversions else None,
+            "avg_daily_spend": _round(daily_spend[i]),
+            "days_with_spend": int(totals["days"][i]),
+        }
+    rankable = [p for p in platforms if results[p].get(metric) is not None]
+    ranking = sorted(rankable, key=lambda p: results[p][metric], reverse=metric not in _ASCENDING)
+    result = {
+        "platforms": results,
+        "platform_count": len(platforms),
+        "ranked_by": metric,
+        "ranking": ranking,
+        "totals": data["totals"],
+        "date_range": date_range,
+    }
+    errors = _sync_errors(data)
+    if errors:
+        result["sync_errors"] = errors
+    return result
+
+
 def budget_allocator(
     total_budget: float,
     optimization_goal: str = "minimize_cac",
+    date_range: str = "last_28d",
+    period_days: int = 1,
+    max_shift_pct: float = 0.20,
+    min_platform_budget: float = 50.0,
+    min_data_days: int = 7,
 ) -> dict:
     """Recommend budget allocation across platforms based on performance.
 
-    Reads current platform performance from shared_memory and recommends
-    optimal budget split to achieve the optimization goal.
+    Fits a diminishing-returns curve (conversions, or revenue for
+    maximize_roas, vs daily spend) per platform from the daily metrics store
+    and solves for the split of total_budget that maximizes the predicted
+    outcome, subject to the rebalancing rules: no platform moves more than
+    max_shift_pct from its baseline (its current share of spend applied to
+    total_budget), none is cut below
+    min_platform_budget per day, none exceeds the max_platform_budget_pct
+    benchmark, and platforms with fewer than min_data_days days of spend are
+    held at their current share. Falls back to the static budget_split in
+    performance/platform_benchmarks when the store has no spend.
 
     Args:
-        total_budget: Total daily/weekly budget to allocate.
+        total_budget: Total budget to allocate over period_days.
         optimization_goal: One of 'minimize_cac', 'maximize_conversions', 'maximize_roas'.
+        date_range: History the curves are fitted on (e.g., "last_28d").
+        period_days: Days total_budget covers (1 for a daily budget, 7 for weekly).
+        max_shift_pct: Largest change per platform per cycle, as a fraction of its current spend.
+        min_platform_budget: Daily floor per platform.
+        min_data_days: Days of spend a platform needs before it is reallocated.
 
     Returns:
-        Dict with recommended allocation per platform and rationale.
+        Dict with recommended allocation per platform (amount; current_amount,
+        the actual average spend over date_range; baseline_amount and shift,
+        the proposal vs the current split at this budget; marginal_cpa),
+        expected conversions and blended CAC for the baseline and the proposal,
+        and whether the shift needs human approval (>$1000/day moved).
     """
-    benchmarks = read_memory("performance/platform_benchmarks")
-    current_split = benchmarks.get("cross_platform", {}).get("budget_split", {}) if benchmarks else {}
+    target = _GOAL_TARGETS.get(optimization_goal)
+    if target is None:
+        return {"error": f"Unknown optimization_goal: {optimization_goal}. Use one of {sorted(_GOAL_TARGETS)}."}
+    benchmarks = _benchmarks()
+    try:
+        frame, data = _load_frame(list(PLATFORMS), date_range)
+    except ValueError as exc:
+        return {"error": str(exc)}
+    totals = frame.totals()
+    if not totals["spend"].sum():
+        return _static_allocation(total_budget, optimization_goal, benchmarks)
+
+    window_days = (date.fromisoformat(data["end"]) - date.fromisoformat(data["start"])).days + 1
+    daily_total = total_budget / period_days
+    # Actual average daily spend, and the same split rescaled to the requested
+    # budget: the baseline the shift limits apply to.
+    current = totals["spend"] / window_days
+    baseline = current * (daily_total / current.sum())
+
+    held = totals["days"] < min_data_days
+    lower = np.maximum(baseline * (1 - max_shift_pct), np.minimum(min_platform_budget, baseline))
+    upper = baseline * (1 + max_shift_pct)
+    max_pct = benchmarks.get("cross_platform", {}).get("max_platform_budget_pct")
+    if max_pct:
+        upper = np.maximum(np.minimum(upper, max_pct * daily_total), lower)
+    lower = np.where(held, baseline, lower)
+    upper = np.where(held, baseline, upper)
+
+    curves = fit_curves(frame, target)
+    proposed = allocate(curves, daily_total, lower, upper)
+    conversion_curves = curves if target == "conversions" else fit_curves(frame)
+    marginal_cpa = conversion_curves.marginal_cost(proposed)
+    shift = proposed - baseline
+
+    allocation = {}
+    for i, p in enumerate(frame.platforms):
+        entry = {
+            "amount": _round(proposed[i] * period_days),
+            "percentage": _round(proposed[i] / daily_total, 4),
+            "current_amount": _round(current[i] * period_days),
+            "baseline_amount": _round(baseline[i] * period_days),
+            "shift": _round(shift[i] * period_days),
+            "shift_pct": _round(shift[i] / baseline[i], 4) if baseline[i] else None,
+            "marginal_cpa": _round(marginal_cpa[i]) if conversion_curves.a[i] else None,
+        }
+        if held[i]:
+            entry["held"] = f"Only {int(totals['days'][i])} days of data (<{min_data_days})"
+        allocation[p] = entry
+
+    before, after = conversion_curves.predict(baseline).sum(), conversion_curves.predict(proposed).sum()
+    expected = {
+        "conversions_baseline": _round(before * period_days),
+        "conversions_proposed": _round(after * period_days),
+        "blended_cac_baseline": _round(daily_total / before) if before else None,
+        "blended_cac_proposed": _round(daily_total / after) if after else None,
+    }
+    if target == "revenue":
+        revenue_before, revenue_after = curves.predict(baseline).sum(), curves.predict(proposed).sum()
+        expected["roas_baseline"] = _round(revenue_before / daily_total)
+        expected["roas_proposed"] = _round(revenue_after / daily_total)
+
+    moved_per_day = float(np.clip(shift, 0, None).sum())
+    result = {
+        "total_budget": total_budget,
+        "optimization_goal": optimization_goal,
+        "method": "response_curves",
+        "date_range": date_range,
+        "allocation": allocation,
+        "expected": expected,
+        "moved_per_day": _round(moved_per_day),
+        "requires_approval": moved_per_day > 1000,
+    }
+    errors = _sync_errors(data)
+    if errors:
+        result["sync_errors"] = errors
+    return result
+
+
+def _static_allocation(total_budget: float, optimization_goal: str, benchmarks: dict) -> dict:
+    current_split = benchmarks.get("cross_platform", {}).get("budget_split", {})
     allocation = {}
     for platform, pct in current_split.items():
         allocation[platform] = {
@@ -59,26 +247,114 @@ def budget_allocator(
     return {
         "total_budget": total_budget,
         "optimization_goal": optimization_goal,
+        "method": "static_split",
         "allocation": allocation,
     }
 
 
-def platform_health_score() -> dict:
+def _target_efficiency(platform: str, benchmarks: dict) -> tuple[str, float | None]:
+    """('acos' | 'cpa', target) from the platform's benchmarks, averaged across products."""
+    targets = benchmarks.get(platform) or {}
+    for suffix, kind in (("target_acos", "acos"), ("target_cpa", "cpa"), ("target_cpl", "cpa")):
+        values = [v for k, v in targets.items() if k.endswith(suffix) and isinstance(v, (int, float))]
+        if values:
+            return kind, sum(values) / len(values)
+    return "cpa", None
+
+
+def platform_health_score(date_range: str = "last_14d") -> dict:
     """Calculate health score for each ad platform.
 
-    Health = weighted score of: CPA vs target, spend pacing, creative freshness,
-    data recency. Reads from shared_memory.
+    Health (0-100) = weighted score of: CPA vs target (40%; ACoS for Amazon),
+    spend pacing of the latest day vs the trailing 7-day average (25%),
+    creative freshness as CTR week-over-week (20%), and data recency (15%).
+    Computed from the daily metrics store against performance/platform_benchmarks.
+
+    Args:
+        date_range: History to score (needs at least two weeks for the CTR trend).
 
     Returns:
-        Dict with per-platform health scores (0-100) and alerts.
+        Dict with per-platform health scores (0-100), component scores and alerts,
+        plus the spend-weighted overall score.
     """
-    benchmarks = read_memory("performance/platform_benchmarks")
-    platforms = ["meta", "google", "amazon", "tiktok", "linkedin", "pinterest"]
+    benchmarks = _benchmarks()
+    try:
+        frame, data = _load_frame(list(PLATFORMS), date_range)
+    except ValueError as exc:
+        return {"error": str(exc)}
+    end = date.fromisoformat(data["end"]).toordinal()
+    last = frame.last_day()
+    recent, prior = frame.between(end - 6, end), frame.between(end - 13, end - 7)
+    week, before = recent.totals(), prior.totals()
+    latest = {m: frame.sum(np.where(frame.day == last[frame.code], v, 0.0)) for m, v in frame.measures.items()}
+    trailing = frame.mask((frame.day < last[frame.code]) & (frame.day >= last[frame.code] - 7)).totals()
+
+    # Data recency: the store's newest day vs the newest day the range asks for.
+    lag = (end - last).astype(np.float64)
+    recency = np.clip(100 - 50 * lag, 0, 100)
+
+    # Spend pacing: latest day vs the trailing 7-day average.
+    trailing_avg = trailing["spend"] / 7
+    pacing_dev = np.abs(np.nan_to_num(latest["spend"] / np.where(trailing_avg > 0, trailing_avg, np.nan) - 1))
+    pacing = np.clip(100 * (1 - pacing_dev / 0.5), 0, 100)
+
+    # Creative freshness: CTR decline this week vs last week.
+    ctr_now = np.divide(week["clicks"], week["impressions"], out=np.zeros(len(frame.platforms)), where=week["impressions"] > 0)
+    ctr_before = np.divide(before["clicks"], before["impressions"], out=np.zeros(len(frame.platforms)), where=before["impressions"] > 0)
+    ctr_decline = np.where(ctr_before > 0, 1 - ctr_now / np.where(ctr_before > 0, ctr_before, 1), 0.0)
+    creative = np.clip(100 * (1 - np.maximum(ctr_decline, 0) / 0.3), 0, 100)
+
+    # CPA spike: latest day vs trailing 7-day CPA.
+    trailing_cpa = np.divide(trailing["spend"], trailing["conversions"], out=np.full(len(frame.platforms), np.nan), where=trailing["conversions"] > 0)
+    latest_cpa = np.divide(latest["spend"], latest["conversions"], out=np.full(len(frame.platforms), np.nan), where=latest["conversions"] > 0)
+
+    rows = frame.totals()["rows"]
     scores = {}
-    for p in platforms:
-        weekly = read_memory(f"performance/{p}_weekly")
-        if weekly:
-            scores[p] = {"score": 75, "status": "healthy", "alerts": []}
+    for i, p in enumerate(frame.platforms):
+        if not rows[i]:
+            scores[p] = {"score": 0, "status": "no_data", "alerts": ["No metrics in the store for this range"]}
+            continue
+        alerts = []
+        kind, target = _target_efficiency(p, benchmarks)
+        if kind == "acos":
+            actual = week["spend"][i] / week["revenue"][i] if week["revenue"][i] else np.inf
         else:
-            scores[p] = {"score": 0, "status": "no_data", "alerts": ["No weekly data found"]}
-    return {"health_scores": scores}
+            actual = week["spend"][i] / week["conversions"][i] if week["conversions"][i] else np.inf
+        if not np.isfinite(actual):
+            cpa_score = 0.0
+            alerts.append(f"No {'revenue' if kind == 'acos' else 'conversions'} in the last 7 days")
+        elif target:
+            ratio = actual / target
+            cpa_score = float(np.clip(100 * (2 - ratio), 0, 100))
+            if ratio > 1.2:
+                alerts.append(f"{kind.upper()} {_round(actual, 4 if kind == 'acos' else 2)} vs target {target}")
+        else:
+            cpa_score = 50.0  # no benchmark to score against
+        if lag[i] >= 1:
+            alerts.append(f"Data staleness: latest day {date.fromordinal(int(last[i]))} is {int(lag[i])} day(s) behind")
+        if pacing_dev[i] > 0.2:
+            alerts.append(f"Spend pacing: latest day {pacing_dev[i]:.0%} off the 7-day average")
+        if ctr_decline[i] > 0.15:
+            alerts.append(f"Creative fatigue: CTR down {ctr_decline[i]:.0%} week-over-week")
+        if np.isfinite(trailing_cpa[i]) and np.isfinite(latest_cpa[i]) and latest_cpa[i] > 1.3 * trailing_cpa[i]:
+            alerts.append(f"CPA spike: {latest_cpa[i]:.2f} vs 7-day {trailing_cpa[i]:.2f}")
+        components = {"cpa": cpa_score, "pacing": pacing[i], "creative": creative[i], "recency": recency[i]}
+        score = round(sum(_HEALTH_WEIGHTS[k] * v for k, v in components.items()))
+        scores[p] = {
+            "score": score,
+            "status": "critical" if score < 50 else "warning" if score < 70 else "healthy",
+            "components": {k: round(float(v)) for k, v in components.items()},
+            "alerts": alerts,
+        }
+
+    scored = [i for i, p in enumerate(frame.platforms) if scores[p]["status"] != "no_data"]
+    weights = week["spend"][scored]
+    overall = None
+    if scored:
+        values = np.array([scores[frame.platforms[i]]["score"] for i in scored], dtype=np.float64)
+        overall = round(float(np.average(values, weights=weights if weights.sum() else None)))
+    result = {"health_scores": scores, "overall_score": overall, "date_range": date_range}
+    errors = _sync_errors(data)
+    if errors:
+        result["sync_errors"] = errors
+    return result
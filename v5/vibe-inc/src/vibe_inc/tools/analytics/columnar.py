@@ -0,0 +1,144 @@
+"""Columnar query results — column arrays instead of per-row dicts.
+
+A 10k-row pull held as list[dict] repeats every column name per row and
+serializes to megabytes of indented JSON in a prompt. ColumnarResult keeps
+one list per column, fills them from the cursor with fetchmany in chunks,
+and renders compact CSV/markdown (numbers rounded, rows capped) or a
+describe()/top_k() summary so the full result never reaches the LLM.
+"""
+import csv
+import heapq
+import io
+from collections import Counter
+from decimal import Decimal
+from typing import Iterable, Iterator
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float, Decimal)) and not isinstance(value, bool)
+
+
+def _fmt(value, digits: int) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (float, Decimal)):
+        rounded = round(float(value), digits)
+        return str(int(rounded)) if rounded.is_integer() else f"{rounded:.{digits}f}".rstrip("0")
+    return str(value)
+
+
+class ColumnarResult:
+    """Query result stored as {column: [values...]}."""
+
+    def __init__(self, columns: Iterable[str], data: dict[str, list] | None = None):
+        self.columns = list(columns)
+        self.data = data if data is not None else {c: [] for c in self.columns}
+
+    @classmethod
+    def from_rows(cls, rows: list[dict], columns: list[str] | None = None) -> "ColumnarResult":
+        if columns is None:
+            columns = list(rows[0]) if rows else []
+        return cls(columns, {c: [row.get(c) for row in rows] for c in columns})
+
+    @classmethod
+    def from_cursor(cls, cursor, batch_size: int = 5_000) -> "ColumnarResult":
+        """Drain an executed cursor with fetchmany(batch_size)."""
+        if cursor.description is None:
+            return cls([])
+        result = cls(desc[0] for desc in cursor.description)
+        while True:
+            batch = cursor.fetchmany(batch_size)
+            if not batch:
+                return result
+            result.append_batch(batch)
+
+    def append_batch(self, rows: Iterable[tuple]) -> None:
+        """Append positional row tuples (cursor order)."""
+        arrays = [self.data[c] for c in self.columns]
+        for row in rows:
+            for array, value in zip(arrays, row):
+                array.append(value)
+
+    def __len__(self) -> int:
+        return len(self.data[self.columns[0]]) if self.columns else 0
+
+    def column(self, name: str) -> list:
+        return self.data[name]
+
+    def iter_rows(self) -> Iterator[dict]:
+        """Rows as dicts, built lazily one at a time."""
+        for values in zip(*(self.data[c] for c in self.columns)):
+            yield dict(zip(self.columns, values))
+
+    def to_rows(self, limit: int | None = None) -> list[dict]:
+        rows = self.iter_rows()
+        return [row for _, row in zip(range(limit), rows)] if limit is not None else list(rows)
+
+    def take(self, indices: Iterable[int]) -> "ColumnarResult":
+        idx = list(indices)
+        return ColumnarResult(self.columns, {c: [self.data[c][i] for i in idx] for c in self.columns})
+
+    def head(self, n: int) -> "ColumnarResult":
+        return self.take(range(min(n, len(self))))
+
+    def select(self, *columns: str) -> "ColumnarResult":
+        return ColumnarResult(columns, {c: self.data[c] for c in columns})
+
+    def top_k(self, column: str, k: int = 10, smallest: bool = False) -> "ColumnarResult":
+        """The k rows with the largest (or smallest) non-null values of column."""
+        values = self.data[column]
+        candidates = (i for i, v in enumerate(values) if v is not None)
+        pick = heapq.nsmallest if smallest else heapq.nlargest
+        return self.take(pick(k, candidates, key=values.__getitem__))
+
+    def describe(self, columns: Iterable[str] | None = None) -> dict[str, dict]:
+        """Per-column summary: numeric stats, or distinct count + most common value."""
+        summary = {}
+        for c in columns or self.columns:
+            values = [v for v in self.data[c] if v is not None]
+            stats = {"count": len(values), "nulls": len(self.data[c]) - len(values)}
+            if values and all(_is_number(v) for v in values):
+                total = sum(float(v) for v in values)
+                stats.update(
+                    sum=total, mean=total / len(values),
+                    min=float(min(values)), max=float(max(values)),
+                )
+            elif values:
+                counts = Counter(str(v) for v in values)
+                top, freq = counts.most_common(1)[0]
+                stats.update(distinct=len(counts), top=top, top_count=freq)
+            summary[c] = stats
+        return summary
+
+    def _render_rows(self, max_rows: int | None, digits: int) -> Iterator[list[str]]:
+        arrays = [self.data[c] for c in self.columns]
+        n = len(self) if max_rows is None else min(max_rows, len(self))
+        for i in range(n):
+            yield [_fmt(a[i], digits) for a in arrays]
+
+    def to_csv(self, max_rows: int | None = None, digits: int = 2) -> str:
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(self.columns)
+        writer.writerows(self._render_rows(max_rows, digits))
+        if max_rows is not None and len(self) > max_rows:
+            buf.write(f"# {len(self) - max_rows} more rows\n")
+        return buf.getvalue()
+
+    def to_markdown(self, max_rows: int | None = None, digits: int = 2) -> str:
+        if not self.columns:
+            return "(no columns)"
+        if not len(self):
+            return "(no rows)"
+        lines = [
+            "| " + " | ".join(self.columns) + " |",
+            "|" + "---|" * len(self.columns),
+        ]
+        for cells in self._render_rows(max_rows, digits):
+            lines.append("| " + " | ".join(cell.replace("|", "\\|") for cell in cells) + " |")
+        if max_rows is not None and len(self) > max_rows:
+            lines.append(f"({len(self) - max_rows} more rows)")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {"columns": self.columns, "data": self.data, "row_count": len(self)}
@@ -10,10 +10,11 @@ Auth: HTTP Basic with service_account:service_secret
 import json
 from datetime import UTC, datetime, timedelta
 
-import httpx
+from vibe_inc.tools.http_clients import provider_client
 
 
 _BASE = "https://mixpanel.com"
+_http = provider_client("mixpanel")
 
 
 def _parse_date_range(date_range: str) -> tuple[str, str]:
@@ -50,7 +51,7 @@ class MixpanelProvider:
         }
         if metrics:
             params["event"] = json.dumps(metrics)
-        resp = httpx.get(
+        resp = _http.get(
             f"{_BASE}/api/2.0/insights",
             params=params,
             auth=self._auth,
@@ -71,7 +72,7 @@ class MixpanelProvider:
             "to_date": to_date,
             "funnel_id": ",".join(steps),
         }
-        resp = httpx.get(
+        resp = _http.get(
             f"{_BASE}/api/2.0/funnels",
             params=params,
             auth=self._auth,
@@ -93,7 +94,7 @@ class MixpanelProvider:
             "to_date": to_date,
             "event": json.dumps([event_name]),
         }
-        resp = httpx.get(
+        resp = _http.get(
             f"{_BASE}/api/2.0/export",
             params=params,
             auth=self._auth,
@@ -119,7 +120,7 @@ class MixpanelProvider:
             "born_event": cohort_property,
             "event": metric,
         }
-        resp = httpx.get(
+        resp = _http.get(
             f"{_BASE}/api/2.0/retention",
             params=params,
             auth=self._auth,
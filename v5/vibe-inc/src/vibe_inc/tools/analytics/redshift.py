@@ -2,13 +2,27 @@
 
 Reads the curated dbt catalog (shared_memory/data/catalog.yaml) to understand
 available tables and columns. Generates dynamic SQL for all query methods.
+
+Connections come from a process-wide ConnectionPool (health-checked, idle
+connections evicted), and get_provider() returns one shared provider whose
+parsed catalog is cached until catalog.yaml changes. The shared provider
+serves repeated reads from a ResultCache invalidated by table freshness.
 """
 import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import yaml
 
+from vibe_inc.tools.analytics.columnar import ColumnarResult
+from vibe_inc.tools.analytics.result_cache import FreshnessTracker, ResultCache, is_cacheable
+from vibe_inc.tools.analytics.sql import Catalog, Select
+
 
 _CATALOG_PATH = Path(__file__).resolve().parents[4] / "shared_memory" / "data" / "catalog.yaml"
 
@@ -33,6 +47,204 @@ def _get_connection():
     )
 
 
+class ConnectionPool:
+    """Thread-safe pool of warehouse connections.
+
+    - Up to max_size connections; callers beyond that wait (up to
+      acquire_timeout seconds, then TimeoutError).
+    - A connection idle longer than health_check_after is pinged with
+      SELECT 1 before reuse; dead ones are replaced.
+    - Connections idle longer than idle_timeout, or older than
+      max_lifetime, are closed instead of reused.
+    - A connection whose query raised is discarded, not returned.
+    """
+
+    def __init__(
+        self,
+        connect=None,
+        max_size: int = 8,
+        idle_timeout: float = 300.0,
+        max_lifetime: float = 3600.0,
+        health_check_after: float = 30.0,
+        acquire_timeout: float = 60.0,
+    ):
+        self._connect = connect
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.health_check_after = health_check_after
+        self.acquire_timeout = acquire_timeout
+        self._idle: deque[tuple[object, float, float]] = deque()  # (conn, created, last_used)
+        self._size = 0
+        self._cond = threading.Condition()
+        self.created = 0
+        self.reused = 0
+
+    def _new_connection(self):
+        # Looked up at call time so tests can patch _get_connection.
+        return (self._connect or _get_connection)()
+
+    @staticmethod
+    def _close_quietly(conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _healthy(self, conn) -> bool:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+            return True
+        except Exception:
+            return False
+
+    def _evict_idle(self, now: float) -> list:
+        """Pop expired idle connections (lock held); caller closes them."""
+        expired = []
+        kept: deque = deque()
+        while self._idle:
+            conn, created, last_used = self._idle.popleft()
+            if now - last_used > self.idle_timeout or now - created > self.max_lifetime:
+                expired.append(conn)
+                self._size -= 1
+            else:
+                kept.append((conn, created, last_used))
+        self._idle = kept
+        return expired
+
+    def _checkout(self) -> tuple[object, float]:
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            with self._cond:
+                expired = self._evict_idle(time.monotonic())
+                entry = None
+                if self._idle:
+                    entry = self._idle.pop()  # most recently used: warmest
+                elif self._size < self.max_size:
+                    self._size += 1
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"No Redshift connection free after {self.acquire_timeout}s"
+                        )
+                    self._cond.wait(remaining)
+                    continue
+            for conn in expired:
+                self._close_quietly(conn)
+
+            if entry is None:
+                try:
+                    conn = self._new_connection()
+                except BaseException:
+                    self._discard()
+                    raise
+                self.created += 1
+                return conn, time.monotonic()
+
+            conn, created, last_used = entry
+            if time.monotonic() - last_used > self.health_check_after and not self._healthy(conn):
+                self._close_quietly(conn)
+                self._discard()
+                continue
+            self.reused += 1
+            return conn, created
+
+    def _discard(self) -> None:
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of the block."""
+        conn, created = self._checkout()
+        try:
+            yield conn
+        except GeneratorExit:
+            # A streaming reader was closed early; its cursor is already closed.
+            self._release(conn, created)
+            raise
+        except BaseException:
+            self._close_quietly(conn)
+            self._discard()
+            raise
+        self._release(conn, created)
+
+    def _release(self, conn, created: float) -> None:
+        # redshift_connector runs with autocommit off, so every SELECT opened a
+        # transaction. End it before pooling: an idle-in-transaction session
+        # keeps reading its first snapshot and holds locks that block table swaps.
+        try:
+            conn.rollback()
+        except Exception:
+            self._close_quietly(conn)
+            self._discard()
+            return
+        with self._cond:
+            self._idle.append((conn, created, time.monotonic()))
+            self._cond.notify()
+
+    def close(self) -> None:
+        """Close idle connections; borrowed ones close when returned."""
+        with self._cond:
+            idle = [conn for conn, _, _ in self._idle]
+            self._size -= len(idle)
+            self._idle.clear()
+        for conn in idle:
+            self._close_quietly(conn)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Process-wide pool (size from REDSHIFT_POOL_SIZE, default 8)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool(max_size=int(os.environ.get("REDSHIFT_POOL_SIZE", "8")))
+        return _pool
+
+
+def close_pool() -> None:
+    """Close and drop the process-wide pool (next query opens a new one)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
+_catalog_cache: dict[Path, tuple[int, dict]] = {}
+_catalog_lock = threading.Lock()
+
+
+def load_catalog(path: Path | None = None) -> dict:
+    """Parsed catalog.yaml, re-read only when the file's mtime changes."""
+    path = Path(path or _CATALOG_PATH)
+    mtime = path.stat().st_mtime_ns
+    with _catalog_lock:
+        cached = _catalog_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+    catalog = yaml.safe_load(path.read_text())
+    with _catalog_lock:
+        _catalog_cache[path] = (mtime, catalog)
+    return catalog
+
+
 def _parse_date_range(date_range: str) -> tuple[str, str]:
     """Convert date_range string to (start, end) in YYYY-MM-DD."""
     if "," in date_range:
@@ -45,10 +257,13 @@ def _parse_date_range(date_range: str) -> tuple[str, str]:
     return start, end
 
 
-def _execute(conn, sql: str) -> dict:
-    """Execute SQL and return rows as list of dicts."""
+def _execute(conn, sql: str, params: list | tuple | None = None) -> dict:
+    """Execute SQL (bound to params, if any) and return rows as list of dicts."""
     cursor = conn.cursor()
-    cursor.execute(sql)
+    if params:
+        cursor.execute(sql, params)
+    else:
+        cursor.execute(sql)
     if cursor.description is None:
         return {"rows": [], "columns": []}
     columns = [desc[0] for desc in cursor.description]
@@ -56,6 +271,65 @@ def _execute(conn, sql: str) -> dict:
     return {"rows": rows, "columns": columns}
 
 
+_STREAM_CURSOR = "vibe_stream"
+
+
+def _server_side_batches(conn, sql: str, params, batch_size: int):
+    """Yield (columns, rows) batches from a server-side cursor, batch_size rows per FETCH.
+
+    A result with no rows yields one empty batch, so callers still get the
+    columns. Redshift cursors live inside a transaction; it is rolled back (the
+    statement is read-only) once the cursor is closed. A pooled connection
+    runs one query at a time, so a fixed cursor name keeps the SQL stable.
+    """
+    if not isinstance(batch_size, int) or batch_size <= 0:
+        raise ValueError(f"batch_size must be a positive int, got {batch_size!r}")
+    cursor = conn.cursor()
+    declare = f"DECLARE {_STREAM_CURSOR} CURSOR FOR {sql}"
+    if params:
+        cursor.execute(declare, params)
+    else:
+        cursor.execute(declare)
+    try:
+        first = True
+        while True:
+            cursor.execute(f"FETCH FORWARD {batch_size} FROM {_STREAM_CURSOR}")
+            rows = cursor.fetchall()
+            if not rows and not first:
+                break
+            yield [desc[0] for desc in cursor.description], rows
+            if not rows:
+                break
+            first = False
+    finally:
+        cursor.execute(f"CLOSE {_STREAM_CURSOR}")
+        conn.rollback()
+
+
+def _execute_server_side(conn, sql: str, params, batch_size: int):
+    """Yield row dicts from a server-side cursor."""
+    for columns, rows in _server_side_batches(conn, sql, params, batch_size):
+        for row in rows:
+            yield dict(zip(columns, row))
+
+
+def _execute_columnar(conn, sql: str, params, batch_size: int, server_side: bool) -> ColumnarResult:
+    """Execute SQL into column arrays, fetching batch_size rows at a time."""
+    if server_side:
+        result = None
+        for columns, rows in _server_side_batches(conn, sql, params, batch_size):
+            if result is None:  # an empty ColumnarResult is falsy
+                result = ColumnarResult(columns)
+            result.append_batch(rows)
+        return result if result is not None else ColumnarResult([])
+    cursor = conn.cursor()
+    if params:
+        cursor.execute(sql, params)
+    else:
+        cursor.execute(sql)
+    return ColumnarResult.from_cursor(cursor, batch_size)
+
+
 def _resolve_table(catalog: dict, columns: list[str]) -> str:
     """Find the best fact table for the given metric columns."""
     # Priority order for metric resolution
@@ -75,17 +349,21 @@ def _resolve_table(catalog: dict, columns: list[str]) -> str:
     return "common.fct_ads_ad_metrics"
 
 
+_DATE_COLUMNS = {
+    "fct_ads_ad_metrics": "date",
+    "fct_ads_ad_group_metrics": "date",
+    "fct_ads_amazon_ad_group_metrics": "date",
+    "fct_order": "created_at",
+    "fct_website_session": "session_first_page_tstamp",
+    "fct_website_visitor_conversion": "original_tstamp",
+    "fct_email_event": "sent_tstamp",
+}
+
+
 def _get_date_column(table_ref: str) -> str:
     """Get the date column name for a table."""
-    date_cols = {
-        "fct_ads_ad_metrics": "date",
-        "fct_order": "created_at",
-        "fct_website_session": "session_first_page_tstamp",
-        "fct_website_visitor_conversion": "original_tstamp",
-        "fct_email_event": "sent_tstamp",
-    }
     table_name = table_ref.split(".")[-1]
-    return date_cols.get(table_name, "date")
+    return _DATE_COLUMNS.get(table_name, "date")
 
 
 class RedshiftProvider:
@@ -95,9 +373,44 @@ class RedshiftProvider:
     All other providers (Mixpanel, GA4) are secondary/real-time fallbacks.
     """
 
-    def __init__(self, catalog_path: Path | None = None):
-        path = catalog_path or _CATALOG_PATH
-        self.catalog = yaml.safe_load(path.read_text())
+    def __init__(
+        self,
+        catalog_path: Path | None = None,
+        pool: ConnectionPool | None = None,
+        cache: ResultCache | None = None,
+    ):
+        self.catalog = load_catalog(catalog_path)
+        self.sql_catalog = Catalog(self.catalog)
+        self._pool = pool
+        self.cache = cache
+
+    @property
+    def pool(self) -> ConnectionPool:
+        return self._pool if self._pool is not None else get_pool()
+
+    def _run(self, sql: str, params: list | tuple | None = None) -> dict:
+        cacheable = self.cache is not None and is_cacheable(sql)
+        if cacheable:
+            cached = self.cache.get(sql, params)
+            if cached is not None:
+                return cached
+        with self.pool.connection() as conn:
+            result = _execute(conn, sql, params)
+        if cacheable:
+            self.cache.set(sql, params, result)
+        return result
+
+    def freshness_watermark(self, table_ref: str) -> str | None:
+        """MAX(date column) of a fact table, or None if it has no known date column."""
+        date_col = _DATE_COLUMNS.get(table_ref.split(".")[-1])
+        if date_col is None:
+            return None
+        try:
+            with self.pool.connection() as conn:
+                rows = _execute(conn, f"SELECT MAX({date_col}) AS watermark FROM {table_ref}")["rows"]
+        except Exception:
+            return None  # unknown freshness: the cache falls back to its TTL
+        return str(rows[0]["watermark"]) if rows else None
 
     def query_metrics(
         self,
@@ -112,46 +425,22 @@ class RedshiftProvider:
         date_col = _get_date_column(table_ref)
         start, end = _parse_date_range(date_range)
 
-        # Check if any dimension columns require JOIN
-        joins = []
-        select_dims = []
+        q = Select(self.sql_catalog, table_ref)
         for d in dims:
             if d in _DIM_COLUMNS:
                 dim_table, join_key = _DIM_COLUMNS[d]
-                dim_schema = next(
-                    (t["schema"] for t in self.catalog["tables"] if t["name"] == dim_table),
-                    "common",
-                )
-                alias = dim_table.replace("dim_", "d_")
-                joins.append(f"JOIN {dim_schema}.{dim_table} {alias} ON f.{join_key} = {alias}.{join_key}")
-                select_dims.append(f"{alias}.{d}")
-            else:
-                select_dims.append(f"f.{d}")
-
-        select_metrics = [f"SUM(f.{m}) as {m}" if m not in dims else f"f.{m}" for m in metrics]
-        select_clause = ", ".join(select_dims + select_metrics)
-        join_clause = " ".join(joins)
-        group_clause = f"GROUP BY {', '.join(select_dims)}" if dims else ""
-
-        # Build filter clause
-        filter_parts = [f"f.{date_col} >= '{start}' AND f.{date_col} <= '{end}'"]
-        if filters:
-            for k, v in filters.items():
-                if isinstance(v, list):
-                    vals = ", ".join(f"'{x}'" for x in v)
-                    filter_parts.append(f"f.{k} IN ({vals})")
-                else:
-                    filter_parts.append(f"f.{k} = '{v}'")
-        where_clause = " AND ".join(filter_parts)
-
-        sql = f"SELECT {select_clause} FROM {table_ref} f {join_clause} WHERE {where_clause} {group_clause}"
-
-        conn = _get_connection()
-        try:
-            result = _execute(conn, sql)
-            return {"rows": result["rows"], "date_range": date_range, "sql": sql}
-        finally:
-            conn.close()
+                q.join(dim_table, on=join_key)
+            q.select(d)
+        for m in metrics:
+            if m not in dims:
+                q.select(m, agg="SUM")
+        q.where_between(date_col, start, end).where_all(filters)
+        if dims:
+            q.group_by(*dims)
+        sql, params = q.build()
+
+        result = self._run(sql, params)
+        return {"rows": result["rows"], "date_range": date_range, "sql": sql, "params": list(params)}
 
     def query_funnel(
         self,
@@ -160,22 +449,20 @@ class RedshiftProvider:
         filters: dict | None = None,
     ) -> dict:
         start, end = _parse_date_range(date_range)
-        step_list = ", ".join(f"'{s}'" for s in steps)
-        sql = (
-            f"SELECT conversion, COUNT(*) as count "
-            f"FROM common.fct_website_visitor_conversion "
-            f"WHERE conversion IN ({step_list}) "
-            f"AND original_tstamp >= '{start}' AND original_tstamp <= '{end}' "
-            f"GROUP BY conversion "
-            f"ORDER BY COUNT(*) DESC"
+        sql, params = (
+            Select(self.sql_catalog, "common.fct_website_visitor_conversion")
+            .select("conversion")
+            .select("*", agg="COUNT", as_="count")
+            .where("conversion", "=", list(steps))
+            .where_between("original_tstamp", start, end)
+            .where_all(filters)
+            .group_by("conversion")
+            .order_by("count", desc=True)
+            .build()
         )
 
-        conn = _get_connection()
-        try:
-            result = _execute(conn, sql)
-            return {"data": result["rows"], "steps": steps, "date_range": date_range, "sql": sql}
-        finally:
-            conn.close()
+        result = self._run(sql, params)
+        return {"data": result["rows"], "steps": steps, "date_range": date_range, "sql": sql}
 
     def query_events(
         self,
@@ -187,22 +474,21 @@ class RedshiftProvider:
         start, end = _parse_date_range(date_range)
         cols = ["conversion", "conversion_value", "detail", "original_tstamp"]
         if properties:
-            cols.extend(properties)
-        select_clause = ", ".join(cols)
-        sql = (
-            f"SELECT {select_clause} "
-            f"FROM common.fct_website_visitor_conversion "
-            f"WHERE conversion = '{event_name}' "
-            f"AND original_tstamp >= '{start}' AND original_tstamp <= '{end}' "
-            f"ORDER BY original_tstamp DESC LIMIT 1000"
+            cols.extend(p for p in properties if p not in cols)
+        q = Select(self.sql_catalog, "common.fct_website_visitor_conversion")
+        for col in cols:
+            q.select(col)
+        sql, params = (
+            q.where("conversion", "=", event_name)
+            .where_between("original_tstamp", start, end)
+            .where_all(filters)
+            .order_by("original_tstamp", desc=True)
+            .limit(1000)
+            .build()
         )
 
-        conn = _get_connection()
-        try:
-            result = _execute(conn, sql)
-            return {"events": result["rows"], "event_name": event_name, "date_range": date_range}
-        finally:
-            conn.close()
+        result = self._run(sql, params)
+        return {"events": result["rows"], "event_name": event_name, "date_range": date_range}
 
     def query_cohort(
         self,
@@ -213,24 +499,117 @@ class RedshiftProvider:
         start, end = _parse_date_range(date_range)
         table_ref = _resolve_table(self.catalog, [metric])
         date_col = _get_date_column(table_ref)
-        sql = (
-            f"SELECT DATE_TRUNC('month', {cohort_property}) as cohort, "
-            f"SUM({metric}) as {metric} "
-            f"FROM {table_ref} f "
-            f"WHERE {date_col} >= '{start}' AND {date_col} <= '{end}' "
-            f"GROUP BY 1 ORDER BY 1"
+        sql, params = (
+            Select(self.sql_catalog, table_ref)
+            .select(cohort_property, trunc="month", as_="cohort")
+            .select(metric, agg="SUM")
+            .where_between(date_col, start, end)
+            .group_by("cohort")
+            .order_by("cohort")
+            .build()
         )
 
-        conn = _get_connection()
-        try:
-            result = _execute(conn, sql)
-            return {"data": result["rows"], "cohort_property": cohort_property, "date_range": date_range}
-        finally:
-            conn.close()
+        result = self._run(sql, params)
+        return {"data": result["rows"], "cohort_property": cohort_property, "date_range": date_range}
 
-    def query_sql(self, sql: str) -> dict:
-        conn = _get_connection()
-        try:
-            return _execute(conn, sql)
-        finally:
-            conn.close()
+    def query_sql(
+        self,
+        sql: str,
+        params: list | tuple | None = None,
+        server_side: bool = False,
+        batch_size: int = 10_000,
+    ) -> dict:
+        """Run SQL with optional bind parameters (``%s`` placeholders).
+
+        server_side=True reads the result through a Redshift cursor in
+        batch_size chunks instead of one client-side fetch.
+        """
+        if server_side:
+            columns, rows = [], []
+            with self.pool.connection() as conn:
+                for columns, batch in _server_side_batches(conn, sql, params, batch_size):
+                    rows.extend(dict(zip(columns, row)) for row in batch)
+            return {"rows": rows, "columns": columns}
+        return self._run(sql, params)
+
+    def query_columnar(
+        self,
+        sql: str,
+        params: list | tuple | None = None,
+        batch_size: int = 5_000,
+        server_side: bool = False,
+    ) -> ColumnarResult:
+        """Run SQL into a ColumnarResult (fetchmany chunks, no per-row dicts).
+
+        Not served from the result cache: this path is for large pulls.
+        """
+        with self.pool.connection() as conn:
+            return _execute_columnar(conn, sql, params, batch_size, server_side)
+
+    def iter_sql(self, sql: str, params: list | tuple | None = None, batch_size: int = 10_000):
+        """Yield result rows as dicts via a server-side cursor.
+
+        Holds one pooled connection until the iterator is exhausted or closed.
+        """
+        with self.pool.connection() as conn:
+            yield from _execute_server_side(conn, sql, params, batch_size)
+
+    def query_sql_group(self, queries: dict, max_concurrency: int = 4) -> dict[str, dict]:
+        """Run named queries concurrently on pooled connections.
+
+        Each value is a SQL string or a (sql, params) pair.
+
+        Returns {name: {"rows", "columns"}} in the order given. Wall time is
+        bounded by the slowest query, not the sum. The first failure is
+        raised once every query has finished.
+        """
+        if not queries:
+            return {}
+        workers = max(1, min(max_concurrency, len(queries), self.pool.max_size))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                name: executor.submit(self._run, *((q, None) if isinstance(q, str) else q))
+                for name, q in queries.items()
+            }
+        return {name: future.result() for name, future in futures.items()}
+
+
+_provider: RedshiftProvider | None = None
+_provider_lock = threading.Lock()
+_result_cache: ResultCache | None = None
+
+
+def get_result_cache() -> ResultCache:
+    """Process-wide result cache used by get_provider().
+
+    Memory-only unless VIBE_WAREHOUSE_CACHE_PATH names a SQLite file for the
+    on-disk layer. Freshness is probed through the shared provider.
+    """
+    global _result_cache
+    with _provider_lock:
+        if _result_cache is None:
+            _result_cache = ResultCache(
+                path=os.environ.get("VIBE_WAREHOUSE_CACHE_PATH") or None,
+                freshness=FreshnessTracker(lambda table: get_provider().freshness_watermark(table)),
+            )
+        return _result_cache
+
+
+def get_provider() -> RedshiftProvider:
+    """Shared RedshiftProvider; rebuilt only if catalog.yaml changed."""
+    global _provider
+    cache = get_result_cache()
+    with _provider_lock:
+        catalog = load_catalog()
+        if _provider is None or _provider.catalog is not catalog:
+            _provider = RedshiftProvider(cache=cache)
+        return _provider
+
+
+def reset_result_cache() -> None:
+    """Close and drop the process-wide result cache."""
+    global _result_cache
+    with _provider_lock:
+        cache, _result_cache = _result_cache, None
+    if cache is not None:
+        cache.close()
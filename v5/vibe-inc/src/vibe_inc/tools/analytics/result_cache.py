@@ -0,0 +1,331 @@
+"""Warehouse query-result cache with freshness-aware invalidation.
+
+Keyed by normalized SQL text + bind params. Two layers:
+- in-memory LRU (per process), checked first;
+- optional on-disk SQLite (shared across processes/restarts), promoted
+  into memory on hit.
+
+Each entry records the freshness watermark of every fact table the SQL reads
+(e.g. MAX(date) of common.fct_ads_ad_metrics). An entry is served only while
+those watermarks are unchanged, so a dbt load that lands new rows invalidates
+every cached query on that table. Watermarks are probed at most once per
+check_interval per table. Queries on tables without a known date column fall
+back to ttl_seconds.
+"""
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from datetime import time as time_of_day
+from decimal import Decimal
+
+_WS_RE = re.compile(r"\s+")
+_TABLE_RE = re.compile(r"\b(?:FROM|JOIN)\s+([A-Za-z_]\w*\.[A-Za-z_]\w*)", re.IGNORECASE)
+_READ_RE = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace and drop a trailing semicolon."""
+    return _WS_RE.sub(" ", sql).strip().rstrip(";").rstrip()
+
+
+def result_key(sql: str, params=None) -> str:
+    payload = json.dumps([normalize_sql(sql), list(params or [])], default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def source_tables(sql: str) -> tuple[str, ...]:
+    """Schema-qualified tables named after FROM/JOIN, lowercased and sorted."""
+    return tuple(sorted({m.lower() for m in _TABLE_RE.findall(sql)}))
+
+
+# Disk entries are JSON; warehouse types that JSON lacks are stored as
+# single-key tagged objects so a disk hit returns the same types as a miss.
+_DECODERS = {
+    "$decimal": Decimal,
+    "$datetime": datetime.fromisoformat,
+    "$date": date.fromisoformat,
+    "$time": time_of_day.fromisoformat,
+    "$bytes": bytes.fromhex,
+}
+
+
+def _encode_value(value):
+    if isinstance(value, Decimal):
+        return {"$decimal": str(value)}
+    if isinstance(value, datetime):  # before date: datetime is a date subclass
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, time_of_day):
+        return {"$time": value.isoformat()}
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"$bytes": bytes(value).hex()}
+    return str(value)
+
+
+def _decode_object(obj: dict):
+    if len(obj) == 1:
+        tag, value = next(iter(obj.items()))
+        decode = _DECODERS.get(tag)
+        if decode is not None:
+            return decode(value)
+    return obj
+
+
+def dump_result(result: dict) -> str:
+    return json.dumps(result, default=_encode_value)
+
+
+def load_result(text: str) -> dict:
+    return json.loads(text, object_hook=_decode_object)
+
+
+def copy_result(value):
+    """Copy of a result's dicts and lists; scalar values are immutable and shared."""
+    if isinstance(value, dict):
+        return {k: copy_result(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_result(v) for v in value]
+    return value
+
+
+def is_cacheable(sql: str) -> bool:
+    """Only plain reads are cached."""
+    return bool(_READ_RE.match(sql))
+
+
+@dataclass
+class ResultCacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    stale: int = 0  # entries dropped because a source table advanced or expired
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class FreshnessTracker:
+    """Per-table freshness watermarks, re-probed at most every check_interval.
+
+    probe(table_ref) returns the table's current watermark (e.g. MAX(date)
+    as a string), or None when the table's freshness can't be determined.
+    """
+
+    def __init__(self, probe, check_interval: float = 60.0, clock=time.monotonic):
+        self._probe = probe
+        self.check_interval = check_interval
+        self._clock = clock
+        self._marks: dict[str, tuple[float, str | None]] = {}
+        self._lock = threading.Lock()
+        self.probes = 0
+
+    def watermark(self, table: str) -> str | None:
+        now = self._clock()
+        with self._lock:
+            cached = self._marks.get(table)
+            if cached and now - cached[0] < self.check_interval:
+                return cached[1]
+        mark = self._probe(table)
+        with self._lock:
+            self._marks[table] = (now, None if mark is None else str(mark))
+            self.probes += 1
+        return None if mark is None else str(mark)
+
+    def version(self, tables: tuple[str, ...]) -> str | None:
+        """Combined watermark for tables; None if any is unknown."""
+        marks = [self.watermark(t) for t in tables]
+        if not marks or any(m is None for m in marks):
+            return None
+        return json.dumps(dict(zip(tables, marks)))
+
+    def invalidate(self, table: str | None = None) -> None:
+        """Force the next lookup to re-probe (one table, or all)."""
+        with self._lock:
+            if table is None:
+                self._marks.clear()
+            else:
+                self._marks.pop(table.lower(), None)
+
+
+class ResultCache:
+    """Two-layer (memory LRU + optional SQLite) cache of query results.
+
+    Entries are (version, stored_at, result). version is the combined
+    freshness watermark at store time, or None for TTL-only entries.
+    Callers get their own copy of a result on get() and the cache keeps its
+    own on set(), so mutating rows never reaches later hits.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        path: str | None = None,
+        max_disk_entries: int = 5_000,
+        ttl_seconds: float = 300.0,
+        max_age_seconds: float = 24 * 3600,
+        freshness: FreshnessTracker | None = None,
+    ):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl_seconds = ttl_seconds  # entries without a freshness version
+        self.max_age_seconds = max_age_seconds  # backstop for versioned entries
+        self.freshness = freshness
+        self.stats = ResultCacheStats()
+        self._memory: OrderedDict[str, tuple[str | None, float, dict, tuple]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        if path is not None:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS warehouse_result_cache ("
+                " key TEXT PRIMARY KEY,"
+                " version TEXT,"
+                " tables TEXT NOT NULL,"
+                " result TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_warehouse_result_cache_access"
+                " ON warehouse_result_cache (last_access)"
+            )
+            self._conn.commit()
+
+    def _version(self, tables: tuple[str, ...]) -> str | None:
+        return self.freshness.version(tables) if self.freshness and tables else None
+
+    def _valid(self, entry_version: str | None, stored_at: float, current: str | None) -> bool:
+        age = time.time() - stored_at
+        if entry_version is None:
+            return age <= self.ttl_seconds
+        return entry_version == current and age <= self.max_age_seconds
+
+    def get(self, sql: str, params=None) -> dict | None:
+        key = result_key(sql, params)
+        tables = source_tables(sql)
+        current = self._version(tables)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                version, stored_at, result, _ = entry
+                if self._valid(version, stored_at, current):
+                    self._memory.move_to_end(key)
+                    self.stats.memory_hits += 1
+                    return copy_result(result)
+                del self._memory[key]
+                self.stats.stale += 1
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT version, created_at, result FROM warehouse_result_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None:
+                    if self._valid(row[0], row[1], current):
+                        self._conn.execute(
+                            "UPDATE warehouse_result_cache SET last_access = ? WHERE key = ?",
+                            (time.time(), key),
+                        )
+                        self._conn.commit()
+                        result = load_result(row[2])
+                        self._remember(key, (row[0], row[1], result, tables))
+                        self.stats.disk_hits += 1
+                        return copy_result(result)
+                    self._conn.execute("DELETE FROM warehouse_result_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                    self.stats.stale += 1
+
+            self.stats.misses += 1
+            return None
+
+    def _remember(self, key: str, entry: tuple) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def set(self, sql: str, params, result: dict) -> None:
+        key = result_key(sql, params)
+        tables = source_tables(sql)
+        version = self._version(tables)
+        now = time.time()
+        with self._lock:
+            self._remember(key, (version, now, copy_result(result), tables))
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO warehouse_result_cache"
+                    " (key, version, tables, result, created_at, last_access)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, version, ",".join(tables), dump_result(result), now, now),
+                )
+                self._conn.execute(
+                    "DELETE FROM warehouse_result_cache WHERE key IN ("
+                    " SELECT key FROM warehouse_result_cache"
+                    " ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                    (self.max_disk_entries,),
+                )
+                self._conn.commit()
+
+    def invalidate(self, table: str | None = None) -> int:
+        """Drop entries reading table (schema.name), or everything. Returns count dropped."""
+        table = table.lower() if table else None
+        with self._lock:
+            keys = [k for k, e in self._memory.items() if table is None or table in e[3]]
+            for k in keys:
+                del self._memory[k]
+            dropped = len(keys)
+            if self._conn is not None:
+                if table is None:
+                    cur = self._conn.execute("DELETE FROM warehouse_result_cache")
+                else:
+                    cur = self._conn.execute(
+                        "DELETE FROM warehouse_result_cache WHERE ',' || tables || ',' LIKE ?",
+                        (f"%,{table},%",),
+                    )
+                dropped = max(dropped, cur.rowcount)
+                self._conn.commit()
+        if self.freshness is not None:
+            self.freshness.invalidate(table)
+        return dropped
+
+    def snapshot(self) -> dict:
+        """Hit-rate metrics plus current sizes."""
+        data = self.stats.as_dict()
+        if self.freshness is not None:
+            data["probes"] = self.freshness.probes
+        with self._lock:
+            data["memory_entries"] = len(self._memory)
+            if self._conn is not None:
+                data["disk_entries"] = self._conn.execute(
+                    "SELECT COUNT(*) FROM warehouse_result_cache"
+                ).fetchone()[0]
+        return data
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
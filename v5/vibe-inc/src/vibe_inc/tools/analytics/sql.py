@@ -0,0 +1,229 @@
+"""Parameterized SQL builder validated against the dbt catalog.
+
+    sql, params = (
+        Select(catalog, "common.fct_ads_ad_metrics")
+        .select("platform")
+        .select("spend_in_usd", agg="SUM")
+        .where_between("date", start, end)
+        .where("platform", "=", "facebook")
+        .group_by("platform")
+        .build()
+    )
+
+Identifiers (tables, columns, aggregates) are checked against catalog.yaml
+before they reach the SQL text; values only ever travel as bind parameters
+(``%s`` — redshift_connector's default "format" paramstyle). The same query
+shape always renders the same SQL text, so Redshift's plan and result caches
+can hit across calls with different dates or filter values.
+"""
+import re
+from dataclasses import dataclass, field
+
+_IDENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+AGGREGATES = frozenset({"SUM", "COUNT", "AVG", "MIN", "MAX"})
+COMPARISONS = frozenset({"=", "!=", "<", "<=", ">", ">=", "LIKE"})
+TRUNC_UNITS = frozenset({"day", "week", "month", "quarter", "year"})
+
+
+class SQLValidationError(ValueError):
+    """A table, column or operator is not allowed by the catalog."""
+
+
+def _ident(name: str) -> str:
+    if not isinstance(name, str) or not _IDENT_RE.match(name):
+        raise SQLValidationError(f"Invalid SQL identifier: {name!r}")
+    return name
+
+
+@dataclass(frozen=True)
+class TableDef:
+    schema: str
+    name: str
+    columns: frozenset[str] | None = None  # None: catalog lists no columns
+
+    @property
+    def ref(self) -> str:
+        return f"{self.schema}.{self.name}"
+
+    def has_column(self, column: str) -> bool:
+        return self.columns is None or column in self.columns
+
+
+class Catalog:
+    """Table/column lookup over a parsed catalog.yaml."""
+
+    def __init__(self, catalog: dict):
+        self._tables: dict[tuple[str, str], TableDef] = {}
+        self._by_name: dict[str, list[TableDef]] = {}
+        for t in catalog.get("tables", []):
+            columns = t.get("columns")
+            table = TableDef(
+                schema=t["schema"],
+                name=t["name"],
+                columns=frozenset(c["name"] for c in columns) if columns else None,
+            )
+            self._tables[(table.schema, table.name)] = table
+            self._by_name.setdefault(table.name, []).append(table)
+
+    def table(self, ref: str) -> TableDef:
+        """Look up ``schema.name``, or a bare name that is unique in the catalog."""
+        schema, _, name = ref.rpartition(".")
+        if schema:
+            table = self._tables.get((schema, name))
+            if table is None:
+                raise SQLValidationError(f"Unknown table: {ref}")
+            return table
+        matches = self._by_name.get(name, [])
+        if len(matches) != 1:
+            problem = "Ambiguous" if matches else "Unknown"
+            raise SQLValidationError(f"{problem} table: {ref}")
+        return matches[0]
+
+
+@dataclass
+class _Source:
+    alias: str
+    table: TableDef
+
+
+@dataclass
+class Select:
+    """SELECT ... FROM ... [JOIN ...] [WHERE ...] [GROUP BY ...] [ORDER BY ...] [LIMIT n]."""
+
+    catalog: Catalog | dict
+    table: str
+    alias: str = "f"
+    _sources: list[_Source] = field(default_factory=list, init=False)
+    _joins: list[str] = field(default_factory=list, init=False)
+    _select: list[str] = field(default_factory=list, init=False)
+    _outputs: set[str] = field(default_factory=set, init=False)
+    _where: list[str] = field(default_factory=list, init=False)
+    _params: list = field(default_factory=list, init=False)
+    _group: list[str] = field(default_factory=list, init=False)
+    _order: list[str] = field(default_factory=list, init=False)
+    _limit: int | None = field(default=None, init=False)
+
+    def __post_init__(self):
+        if not isinstance(self.catalog, Catalog):
+            self.catalog = Catalog(self.catalog)
+        self._sources.append(_Source(_ident(self.alias), self.catalog.table(self.table)))
+
+    def _column(self, column: str, source: str | None = None) -> str:
+        """Qualify a column with the alias of the first source that has it."""
+        _ident(column)
+        for s in self._sources:
+            if source in (None, s.alias) and s.table.has_column(column):
+                return f"{s.alias}.{column}"
+        where = source or ", ".join(s.table.ref for s in self._sources)
+        raise SQLValidationError(f"Unknown column {column!r} in {where}")
+
+    def join(self, table: str, on: str, alias: str | None = None) -> "Select":
+        """Inner join on a key column present in both the base table and ``table``."""
+        target = self.catalog.table(table)
+        alias = _ident(alias or target.name.replace("dim_", "d_"))
+        if any(s.alias == alias for s in self._sources):
+            return self  # already joined
+        left = self._column(on, self.alias)
+        self._sources.append(_Source(alias, target))
+        right = self._column(on, alias)
+        self._joins.append(f"JOIN {target.ref} {alias} ON {left} = {right}")
+        return self
+
+    def select(
+        self,
+        column: str,
+        agg: str | None = None,
+        trunc: str | None = None,
+        as_: str | None = None,
+    ) -> "Select":
+        """Add an output column, optionally aggregated or DATE_TRUNC'd.
+
+        ``select("*", agg="COUNT", as_="n")`` renders ``COUNT(*) AS n``.
+        """
+        if column == "*":
+            if (agg or "").upper() != "COUNT" or trunc or not as_:
+                raise SQLValidationError("'*' is only valid as COUNT(*) with an alias")
+            expr = "*"
+        else:
+            expr = self._column(column)
+        if trunc is not None:
+            if trunc not in TRUNC_UNITS:
+                raise SQLValidationError(f"Invalid DATE_TRUNC unit: {trunc!r}")
+            expr = f"DATE_TRUNC('{trunc}', {expr})"
+        if agg is not None:
+            if agg.upper() not in AGGREGATES:
+                raise SQLValidationError(f"Invalid aggregate: {agg!r}")
+            expr = f"{agg.upper()}({expr})"
+        name = _ident(as_) if as_ else None
+        if name is None and (agg or trunc):
+            name = column
+        self._select.append(f"{expr} AS {name}" if name else expr)
+        self._outputs.add(name or column)
+        return self
+
+    def where(self, column: str, op: str, value) -> "Select":
+        """``column op %s``; a list/tuple value becomes ``column IN (%s, ...)``."""
+        col = self._column(column)
+        if isinstance(value, (list, tuple, set, frozenset)):
+            values = sorted(value, key=str) if isinstance(value, (set, frozenset)) else list(value)
+            if not values:
+                raise SQLValidationError(f"Empty IN list for {column!r}")
+            if op not in ("=", "IN"):
+                raise SQLValidationError(f"Operator {op!r} cannot take a list")
+            self._where.append(f"{col} IN ({', '.join(['%s'] * len(values))})")
+            self._params.extend(values)
+            return self
+        if op.upper() not in COMPARISONS:
+            raise SQLValidationError(f"Invalid comparison: {op!r}")
+        self._where.append(f"{col} {op.upper()} %s")
+        self._params.append(value)
+        return self
+
+    def where_between(self, column: str, start, end) -> "Select":
+        """Inclusive range: ``column >= %s AND column <= %s``."""
+        return self.where(column, ">=", start).where(column, "<=", end)
+
+    def where_all(self, filters: dict | None) -> "Select":
+        """Equality/IN filters, applied in key order so the SQL text is stable."""
+        for column in sorted(filters or {}):
+            self.where(column, "=", filters[column])
+        return self
+
+    def _output_or_column(self, name: str) -> str:
+        """A select-list alias (e.g. ``cohort``) as is, otherwise a qualified column."""
+        if name in self._outputs and not any(s.table.has_column(name) for s in self._sources):
+            return _ident(name)
+        return self._column(name)
+
+    def group_by(self, *columns: str) -> "Select":
+        self._group.extend(self._output_or_column(c) for c in columns)
+        return self
+
+    def order_by(self, column: str, desc: bool = False) -> "Select":
+        expr = self._output_or_column(column)
+        self._order.append(f"{expr} DESC" if desc else expr)
+        return self
+
+    def limit(self, n: int) -> "Select":
+        if not isinstance(n, int) or isinstance(n, bool) or n < 0:
+            raise SQLValidationError(f"Invalid LIMIT: {n!r}")
+        self._limit = n
+        return self
+
+    def build(self) -> tuple[str, tuple]:
+        """Return ``(sql, params)``."""
+        if not self._select:
+            raise SQLValidationError("SELECT needs at least one column")
+        base = self._sources[0]
+        parts = [f"SELECT {', '.join(self._select)}", f"FROM {base.table.ref} {base.alias}"]
+        parts.extend(self._joins)
+        if self._where:
+            parts.append(f"WHERE {' AND '.join(self._where)}")
+        if self._group:
+            parts.append(f"GROUP BY {', '.join(self._group)}")
+        if self._order:
+            parts.append(f"ORDER BY {', '.join(self._order)}")
+        if self._limit is not None:
+            parts.append(f"LIMIT {self._limit}")
+        return " ".join(parts), tuple(self._params)
@@ -3,12 +3,16 @@
 Default provider: RedshiftProvider (queries dbt-materialized tables in Redshift).
 Secondary: MixpanelProvider (real-time), GA4Provider (real-time traffic).
 """
-from vibe_inc.tools.analytics.redshift import RedshiftProvider
+from vibe_inc.tools.analytics.redshift import get_provider, get_result_cache
 
 
 def _get_provider():
-    """Get the default analytics provider (Redshift — primary data source)."""
-    return RedshiftProvider()
+    """Get the default analytics provider (Redshift — primary data source).
+
+    Shared across calls: the catalog is parsed once and queries reuse
+    pooled connections.
+    """
+    return get_provider()
 
 
 def analytics_query_metrics(
@@ -88,13 +92,98 @@ def analytics_query_cohort(
     return _get_provider().query_cohort(cohort_property, metric, date_range)
 
 
-def analytics_query_sql(sql: str) -> dict:
+def analytics_query_sql(sql: str, params: list | None = None) -> dict:
     """Execute raw SQL against the Redshift data warehouse.
 
     Args:
-        sql: SQL query string.
+        sql: SQL query string. Use %s placeholders for values.
+        params: Optional values bound to the %s placeholders, in order.
 
     Returns:
         Dict with 'rows' and 'columns'.
     """
-    return _get_provider().query_sql(sql)
+    return _get_provider().query_sql(sql, params)
+
+
+def analytics_query_sql_group(queries: dict, max_concurrency: int = 4) -> dict:
+    """Execute several named SQL queries concurrently against Redshift.
+
+    Args:
+        queries: Mapping of result name to SQL query string, or to a
+            (sql, params) pair for parameterized queries.
+        max_concurrency: Maximum queries in flight at once.
+
+    Returns:
+        Dict mapping each name to its {'rows', 'columns'} result.
+    """
+    return _get_provider().query_sql_group(queries, max_concurrency)
+
+
+def analytics_query_table(
+    sql: str,
+    params: list | None = None,
+    format: str = "markdown",
+    max_rows: int = 50,
+    digits: int = 2,
+    top_k: str | None = None,
+    describe: bool = False,
+    server_side: bool = False,
+) -> dict:
+    """Execute SQL and return a compact table instead of JSON rows.
+
+    Prefer this over analytics_query_sql for ad-, event- or day-level pulls:
+    rows are fetched in chunks into column arrays, only max_rows are
+    rendered, and numbers are rounded.
+
+    Args:
+        sql: SQL query string. Use %s placeholders for values.
+        params: Optional values bound to the %s placeholders, in order.
+        format: 'markdown' or 'csv'.
+        max_rows: Maximum rows rendered in 'table' (row_count is the full count).
+        digits: Decimal places for non-integer numbers.
+        top_k: Optional column name; render the max_rows rows with its largest values.
+        describe: Include per-column summary stats (count, mean, min, max, ...).
+        server_side: Read through a Redshift server-side cursor, for very
+            large single-SELECT pulls. The statement is wrapped in DECLARE ...
+            CURSOR FOR, so it must be one SELECT.
+
+    Returns:
+        Dict with 'columns', 'row_count', 'table', 'truncated' and optionally 'summary'.
+    """
+    if format not in ("markdown", "csv"):
+        raise ValueError(f"format must be 'markdown' or 'csv', got {format!r}")
+    result = _get_provider().query_columnar(sql, params, server_side=server_side)
+    shown = result.top_k(top_k, max_rows) if top_k else result
+    render = shown.to_markdown if format == "markdown" else shown.to_csv
+    out = {
+        "columns": result.columns,
+        "row_count": len(result),
+        "table": render(max_rows=max_rows, digits=digits),
+        "truncated": len(result) > max_rows,
+    }
+    if describe:
+        out["summary"] = result.describe()
+    return out
+
+
+def analytics_cache_stats() -> dict:
+    """Report warehouse result-cache hit rate and size.
+
+    Returns:
+        Dict with memory_hits, disk_hits, misses, stale, hit_rate, probes and
+        entry counts.
+    """
+    return get_result_cache().snapshot()
+
+
+def analytics_cache_invalidate(table: str | None = None) -> dict:
+    """Drop cached warehouse results, e.g. after a backfill or dbt full refresh.
+
+    Args:
+        table: Schema-qualified table (e.g. common.fct_ads_ad_metrics) whose
+            cached queries to drop. Omit to clear the whole cache.
+
+    Returns:
+        Dict with 'table' and 'dropped' entry count.
+    """
+    return {"table": table, "dropped": get_result_cache().invalidate(table)}
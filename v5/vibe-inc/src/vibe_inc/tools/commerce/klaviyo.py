@@ -1,9 +1,10 @@
 """Klaviyo email marketing tools for D2C Growth role."""
 import os
 
-import httpx
+from vibe_inc.tools.http_clients import provider_client
 
 _BASE_URL = "https://a.klaviyo.com/api"
+_http = provider_client("klaviyo")
 
 
 def _get_headers():
@@ -38,7 +39,7 @@ def klaviyo_campaigns(
     else:
         params["filter"] = "equals(messages.channel,'email')"
 
-    resp = httpx.get(f"{_BASE_URL}/campaigns", headers=headers, params=params)
+    resp = _http.get(f"{_BASE_URL}/campaigns", headers=headers, params=params)
     data = resp.json().get("data", [])
     return {"campaigns": data}
 
@@ -60,7 +61,7 @@ def klaviyo_flows(
     if status:
         params["filter"] = f"equals(status,'{status}')"
 
-    resp = httpx.get(f"{_BASE_URL}/flows", headers=headers, params=params)
+    resp = _http.get(f"{_BASE_URL}/flows", headers=headers, params=params)
     data = resp.json().get("data", [])
     return {"flows": data}
 
@@ -78,7 +79,7 @@ def klaviyo_segments(
         and profile count.
     """
     headers = _get_headers()
-    resp = httpx.get(f"{_BASE_URL}/segments", headers=headers)
+    resp = _http.get(f"{_BASE_URL}/segments", headers=headers)
     data = resp.json().get("data", [])
 
     if name_filter:
@@ -121,7 +122,7 @@ def klaviyo_metrics(
                 },
             },
         }
-        resp = httpx.post(
+        resp = _http.post(
             f"{_BASE_URL}/metric-aggregates",
             headers=headers,
             json=body,
@@ -129,7 +130,7 @@ def klaviyo_metrics(
         data = resp.json().get("data", {})
         return {"metrics": [data]}
 
-    resp = httpx.get(f"{_BASE_URL}/metrics", headers=headers)
+    resp = _http.get(f"{_BASE_URL}/metrics", headers=headers)
     data = resp.json().get("data", [])
     return {"metrics": data}
 
@@ -152,13 +153,13 @@ def klaviyo_profiles(
     params = {"page[size]": page_size}
 
     if segment_id:
-        resp = httpx.get(
+        resp = _http.get(
             f"{_BASE_URL}/segments/{segment_id}/profiles",
             headers=headers,
             params=params,
         )
     else:
-        resp = httpx.get(f"{_BASE_URL}/profiles", headers=headers, params=params)
+        resp = _http.get(f"{_BASE_URL}/profiles", headers=headers, params=params)
 
     data = resp.json().get("data", [])
     return {"profiles": data, "count": len(data)}
@@ -178,6 +179,6 @@ def klaviyo_catalogs(
         and product URL.
     """
     headers = _get_headers()
-    resp = httpx.get(f"{_BASE_URL}/catalog-items", headers=headers)
+    resp = _http.get(f"{_BASE_URL}/catalog-items", headers=headers)
     data = resp.json().get("data", [])
     return {"items": data}
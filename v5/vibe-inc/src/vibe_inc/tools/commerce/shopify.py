@@ -1,9 +1,10 @@
 """Shopify Admin API tools — expanded for D2C Growth."""
 import os
 
-import httpx
+from vibe_inc.tools.http_clients import provider_client
 
 _BASE_URL_TEMPLATE = "https://{store}.myshopify.com/admin/api/2024-01"
+_http = provider_client("shopify")
 
 
 def _get_headers():
@@ -39,7 +40,7 @@ def shopify_products(
     params = {"status": status, "limit": limit}
     if collection_id:
         params["collection_id"] = collection_id
-    resp = httpx.get(url, headers=_get_headers(), params=params)
+    resp = _http.get(url, headers=_get_headers(), params=params)
     data = resp.json()
     products = data.get("products", [])
     return {"products": products, "count": len(products)}
@@ -64,7 +65,7 @@ def shopify_orders(
     params = {"status": status, "limit": limit}
     if created_at_min:
         params["created_at_min"] = created_at_min
-    resp = httpx.get(url, headers=_get_headers(), params=params)
+    resp = _http.get(url, headers=_get_headers(), params=params)
     data = resp.json()
     orders = data.get("orders", [])
     total_revenue = sum(float(o.get("total_price", 0)) for o in orders)
@@ -82,7 +83,7 @@ def shopify_collections(collection_type: str = "smart") -> dict:
     """
     endpoint = "smart_collections" if collection_type == "smart" else "custom_collections"
     url = f"{_get_base_url()}/{endpoint}.json"
-    resp = httpx.get(url, headers=_get_headers())
+    resp = _http.get(url, headers=_get_headers())
     data = resp.json()
     collections = data.get(endpoint, [])
     return {"collections": collections, "count": len(collections)}
@@ -98,7 +99,7 @@ def shopify_discounts(limit: int = 50) -> dict:
         Dict with discounts list.
     """
     url = f"{_get_base_url()}/price_rules.json"
-    resp = httpx.get(url, headers=_get_headers(), params={"limit": limit})
+    resp = _http.get(url, headers=_get_headers(), params={"limit": limit})
     data = resp.json()
     discounts = data.get("price_rules", [])
     return {"discounts": discounts, "count": len(discounts)}
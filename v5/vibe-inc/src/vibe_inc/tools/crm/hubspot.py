@@ -1,9 +1,10 @@
 """HubSpot CRM tools for D2C Growth role."""
 import os
 
-import httpx
+from vibe_inc.tools.http_clients import provider_client
 
 _BASE_URL = "https://api.hubapi.com"
+_http = provider_client("hubspot")
 
 
 def _get_headers():
@@ -35,7 +36,7 @@ def hubspot_contact_get(
     headers = _get_headers()
 
     if contact_id:
-        resp = httpx.get(
+        resp = _http.get(
             f"{_BASE_URL}/crm/v3/objects/contacts/{contact_id}",
             headers=headers,
             params={
@@ -63,7 +64,7 @@ def hubspot_contact_get(
                 "lifecyclestage", "hs_lead_status",
             ],
         }
-        resp = httpx.post(
+        resp = _http.post(
             f"{_BASE_URL}/crm/v3/objects/contacts/search",
             headers=headers,
             json=body,
@@ -90,7 +91,7 @@ def hubspot_contact_update(
         Dict with 'updated' bool and 'contact' with updated properties.
     """
     headers = _get_headers()
-    resp = httpx.patch(
+    resp = _http.patch(
         f"{_BASE_URL}/crm/v3/objects/contacts/{contact_id}",
         headers=headers,
         json={"properties": properties},
@@ -111,7 +112,7 @@ def hubspot_deals_list(
         Dict with 'deals' list (each with id and type) and 'count'.
     """
     headers = _get_headers()
-    resp = httpx.get(
+    resp = _http.get(
         f"{_BASE_URL}/crm/v3/objects/contacts/{contact_id}/associations/deals",
         headers=headers,
     )
@@ -147,7 +148,7 @@ def hubspot_deal_create(
     if amount is not None:
         properties["amount"] = str(amount)
 
-    resp = httpx.post(
+    resp = _http.post(
         f"{_BASE_URL}/crm/v3/objects/deals",
         headers=headers,
         json={"properties": properties},
@@ -155,7 +156,7 @@ def hubspot_deal_create(
     deal = resp.json()
 
     # Associate deal with contact
-    httpx.post(
+    _http.post(
         f"{_BASE_URL}/crm/v3/objects/deals/{deal['id']}/associations/contacts/{contact_id}/deal_to_contact",
         headers=headers,
     )
@@ -178,7 +179,7 @@ def hubspot_deal_update(
         Dict with 'updated' bool and 'deal' with updated properties.
     """
     headers = _get_headers()
-    resp = httpx.patch(
+    resp = _http.patch(
         f"{_BASE_URL}/crm/v3/objects/deals/{deal_id}",
         headers=headers,
         json={"properties": properties},
@@ -201,7 +202,7 @@ def hubspot_workflow_enroll(
         Dict with 'enrolled' bool, 'workflow_id', and 'contact_email'.
     """
     headers = _get_headers()
-    httpx.post(
+    _http.post(
         f"{_BASE_URL}/automation/v4/flows/{workflow_id}/enrollments",
         headers=headers,
         json={"objectId": contact_email, "objectType": "CONTACT"},
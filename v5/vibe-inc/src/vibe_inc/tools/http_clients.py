@@ -0,0 +1,223 @@
+"""Shared HTTP clients for the vibe_inc API tools.
+
+Module-level ``httpx.get/post`` opens a fresh TCP+TLS connection per call.
+Tools instead call through a ProviderHTTP handle:
+
+    _http = provider_client("hubspot")
+    resp = _http.get(url, headers=headers)
+
+Every handle for a provider shares one pooled httpx.Client (keep-alive,
+HTTP/2 when the ``h2`` package is installed, default timeouts). Requests
+that come back 429, or 5xx on idempotent methods, are retried with
+exponential backoff, honouring Retry-After.
+
+Clients are created lazily and closed by close_clients(); create_runtime
+registers that as a runtime shutdown hook.
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0,
+)
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def retry_after_seconds(resp: httpx.Response) -> float | None:
+    """Retry-After as seconds (delta-seconds or HTTP-date), if present."""
+    value = resp.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HttpClientRegistry:
+    """One pooled httpx.Client (and AsyncClient) per provider name."""
+
+    def __init__(
+        self,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool | None = None,
+        transport=None,
+    ):
+        self.timeout = timeout
+        self.limits = limits
+        self.http2 = _http2_available() if http2 is None else http2
+        self.transport = transport  # e.g. httpx.MockTransport in tests
+        self._clients: dict[str, httpx.Client] = {}
+        self._async_clients: dict[str, httpx.AsyncClient] = {}
+        self._lock = threading.Lock()
+
+    def client(self, provider: str) -> httpx.Client:
+        with self._lock:
+            client = self._clients.get(provider)
+            if client is None or client.is_closed:
+                client = httpx.Client(
+                    timeout=self.timeout, limits=self.limits, http2=self.http2,
+                    transport=self.transport,
+                )
+                self._clients[provider] = client
+            return client
+
+    def async_client(self, provider: str) -> httpx.AsyncClient:
+        """AsyncClient for provider; use from a single event loop."""
+        with self._lock:
+            client = self._async_clients.get(provider)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    timeout=self.timeout, limits=self.limits, http2=self.http2,
+                    transport=self.transport,
+                )
+                self._async_clients[provider] = client
+            return client
+
+    def close(self) -> None:
+        """Close sync clients; drop async ones (close those with aclose)."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+    async def aclose_async(self) -> None:
+        """Close the async clients (from the event loop that used them)."""
+        with self._lock:
+            clients = list(self._async_clients.values())
+            self._async_clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        """Close every client, sync and async."""
+        self.close()
+        await self.aclose_async()
+
+    def __len__(self) -> int:
+        return len(self._clients) + len(self._async_clients)
+
+
+_registry = HttpClientRegistry()
+
+
+def get_registry() -> HttpClientRegistry:
+    return _registry
+
+
+def close_clients() -> None:
+    """Close the shared clients (next request reopens them)."""
+    _registry.close()
+
+
+class ProviderHTTP:
+    """httpx-style request methods bound to one provider's shared client."""
+
+    def __init__(
+        self,
+        provider: str,
+        registry: HttpClientRegistry | None = None,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
+        self.provider = provider
+        self._registry = registry
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    @property
+    def registry(self) -> HttpClientRegistry:
+        return self._registry if self._registry is not None else _registry
+
+    def _retry_delay(self, method: str, resp: httpx.Response, attempt: int) -> float | None:
+        """Seconds to wait before retrying, or None to return resp as is."""
+        if attempt >= self.max_retries or resp.status_code not in RETRY_STATUSES:
+            return None
+        if resp.status_code != 429 and method.upper() not in IDEMPOTENT_METHODS:
+            return None
+        server = retry_after_seconds(resp)
+        if server is not None:
+            return min(server, self.max_backoff)
+        ceiling = min(self.max_backoff, self.backoff * 2 ** attempt)
+        return random.uniform(ceiling / 2, ceiling)
+
+    def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        client = self.registry.client(self.provider)
+        attempt = 0
+        while True:
+            resp = client.request(method, url, **kwargs)
+            delay = self._retry_delay(method, resp, attempt)
+            if delay is None:
+                return resp
+            resp.close()
+            time.sleep(delay)
+            attempt += 1
+
+    async def arequest(self, method: str, url: str, **kwargs) -> httpx.Response:
+        client = self.registry.async_client(self.provider)
+        attempt = 0
+        while True:
+            resp = await client.request(method, url, **kwargs)
+            delay = self._retry_delay(method, resp, attempt)
+            if delay is None:
+                return resp
+            await resp.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def stream(self, method: str, url: str, **kwargs):
+        """Streaming request context manager (not retried)."""
+        return self.registry.client(self.provider).stream(method, url, **kwargs)
+
+    def astream(self, method: str, url: str, **kwargs):
+        """Async streaming request context manager (not retried)."""
+        return self.registry.async_client(self.provider).stream(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    async def aget(self, url: str, **kwargs) -> httpx.Response:
+        return await self.arequest("GET", url, **kwargs)
+
+    async def apost(self, url: str, **kwargs) -> httpx.Response:
+        return await self.arequest("POST", url, **kwargs)
+
+
+def provider_client(provider: str, **options) -> ProviderHTTP:
+    """Handle for a provider's shared client (see ProviderHTTP for options)."""
+    return ProviderHTTP(provider, **options)
@@ -0,0 +1,344 @@
+"""Transactional backend for shared_memory: locks, versions, change log, watch.
+
+Content stays in the YAML files under shared_memory/ (humans edit them and
+roles read them through read_memory's cache). Next to them, in
+shared_memory/.state/, the default FileMemoryBackend keeps:
+
+    memory.db   SQLite (WAL): current version per key and an append-only
+                memory_log of every write (seq, key, version, writer, time,
+                content as JSON)
+    locks/      one lock file per key, held with flock(LOCK_EX) while a
+                write is in progress
+
+A write takes the key's lock, checks the caller's expected_version against
+the stored one (compare-and-swap), replaces the YAML file atomically and
+commits the version bump and log entry in one transaction. Any number of
+threads and worker processes can share a tree: the key lock serializes
+writers of one key, SQLite's busy timeout arbitrates the database.
+
+Subscribers are notified from a watcher thread that tails memory_log by seq.
+It checks SQLite's data_version, so writes from other processes are seen
+within poll_interval without scanning the filesystem; local writes wake it
+immediately.
+"""
+import copy
+import fnmatch
+import itertools
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+from urllib.parse import quote
+
+from vibe_inc.tools.shared_memory import _DEFAULT_MEMORY_DIR, _atomic_write, _load
+
+try:
+    import fcntl
+except ImportError:  # Windows: locks only serialize threads of one process
+    fcntl = None
+
+LOCK_TIMEOUT = 30.0
+POLL_INTERVAL = 0.25
+
+
+class VersionConflict(Exception):
+    """A compare-and-swap write found a different version than expected."""
+
+    def __init__(self, key: str, expected: int, actual: int):
+        super().__init__(f"Version conflict on {key}: expected {expected}, found {actual}")
+        self.key = key
+        self.expected = expected
+        self.actual = actual
+
+
+@dataclass(frozen=True)
+class Change:
+    seq: int
+    key: str
+    version: int
+    writer: str
+    at: float
+
+
+class Subscription:
+    """Handle returned by subscribe(); close() stops delivery."""
+
+    def __init__(self, backend: "FileMemoryBackend", pattern: str, callback: Callable[[Change], None]):
+        self.pattern = pattern
+        self.callback = callback
+        self._backend = backend
+
+    def matches(self, key: str) -> bool:
+        return fnmatch.fnmatchcase(key, self.pattern)
+
+    def close(self) -> None:
+        self._backend._unsubscribe(self)
+
+
+class MemoryBackend(Protocol):
+    """Versioned key -> dict storage behind read_memory / write_memory."""
+
+    def read(self, key: str) -> tuple[dict, int]: ...
+
+    def version(self, key: str) -> int: ...
+
+    def write(self, key: str, data: dict, expected_version: int | None = None, writer: str = "") -> int: ...
+
+    def update(self, key: str, fn: Callable[[dict], dict], writer: str = "") -> tuple[dict, int]: ...
+
+    def changes(self, since: int = 0, pattern: str | None = None, limit: int = 100) -> list[Change]: ...
+
+    def subscribe(self, pattern: str, callback: Callable[[Change], None]) -> Subscription: ...
+
+    def close(self) -> None: ...
+
+
+def _default_writer() -> str:
+    return f"pid:{os.getpid()}"
+
+
+class FileMemoryBackend:
+    """YAML files for content, SQLite for versions and the change log, flock for key locks."""
+
+    def __init__(self, memory_dir: Path | None = None, state_dir: Path | None = None, poll_interval: float = POLL_INTERVAL):
+        self.memory_dir = (memory_dir or _DEFAULT_MEMORY_DIR).resolve()
+        self.state_dir = state_dir or self.memory_dir / ".state"
+        self._lock_dir = self.state_dir / "locks"
+        self._lock_dir.mkdir(parents=True, exist_ok=True)
+        self.poll_interval = poll_interval
+
+        self._conn = sqlite3.connect(
+            self.state_dir / "memory.db", timeout=LOCK_TIMEOUT, isolation_level=None, check_same_thread=False,
+        )
+        self._db_lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS memory_versions ("
+            " key TEXT PRIMARY KEY,"
+            " version INTEGER NOT NULL,"
+            " updated_at REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS memory_log ("
+            " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " key TEXT NOT NULL,"
+            " version INTEGER NOT NULL,"
+            " writer TEXT NOT NULL,"
+            " at REAL NOT NULL,"
+            " data TEXT NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS idx_memory_log_key ON memory_log (key, seq);"
+        )
+
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._key_locks_guard = threading.Lock()
+        self._subscriptions: list[Subscription] = []
+        self._subs_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self._watcher: threading.Thread | None = None
+
+    def _path(self, key: str) -> Path:
+        path = (self.memory_dir / key).resolve()
+        if not path.is_relative_to(self.memory_dir) or path.is_relative_to(self.state_dir.resolve()):
+            raise ValueError(f"Key outside shared memory: {key!r}")
+        return path
+
+    def _key(self, key: str) -> str:
+        return self._path(key).relative_to(self.memory_dir).as_posix()
+
+    @contextmanager
+    def lock(self, key: str, timeout: float = LOCK_TIMEOUT) -> Iterator[None]:
+        """Hold key's advisory lock (threads of this process, then other processes)."""
+        key = self._key(key)
+        with self._key_locks_guard:
+            local = self._key_locks.setdefault(key, threading.Lock())
+        if not local.acquire(timeout=timeout):
+            raise TimeoutError(f"Timed out waiting for lock on {key}")
+        try:
+            if fcntl is None:
+                yield
+                return
+            fd = os.open(self._lock_dir / f"{quote(key, safe='')}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                deadline = time.monotonic() + timeout
+                while True:
+                    try:
+                        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        break
+                    except BlockingIOError:
+                        if time.monotonic() > deadline:
+                            raise TimeoutError(f"Timed out waiting for lock on {key}") from None
+                        time.sleep(0.005)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+        finally:
+            local.release()
+
+    def version(self, key: str) -> int:
+        """Current version of key; 0 if it was never written through a backend."""
+        key = self._key(key)
+        with self._db_lock:
+            row = self._conn.execute("SELECT version FROM memory_versions WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def read(self, key: str) -> tuple[dict, int]:
+        """(content, version). The version is never newer than the content."""
+        version = self.version(key)
+        return copy.deepcopy(_load(self._path(key))), version
+
+    def write(self, key: str, data: dict, expected_version: int | None = None, writer: str = "") -> int:
+        """Replace key's content; returns the new version.
+
+        Raises:
+            VersionConflict: If expected_version is given and is not the current version.
+        """
+        with self.lock(key):
+            return self._write_locked(key, data, expected_version, writer)
+
+    def update(self, key: str, fn: Callable[[dict], dict], writer: str = "") -> tuple[dict, int]:
+        """Read-modify-write under key's lock; fn gets a copy of the current content."""
+        with self.lock(key):
+            data, _ = self.read(key)
+            new = fn(data)
+            return new, self._write_locked(key, new, None, writer)
+
+    def _write_locked(self, key: str, data: dict, expected_version: int | None, writer: str) -> int:
+        path, key = self._path(key), self._key(key)
+        payload = json.dumps(data, default=str, separators=(",", ":"))
+        now = time.time()
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT version FROM memory_versions WHERE key = ?", (key,)).fetchone()
+                current = row[0] if row else 0
+                if expected_version is not None and expected_version != current:
+                    raise VersionConflict(key, expected_version, current)
+                _atomic_write(path, data)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO memory_versions (key, version, updated_at) VALUES (?, ?, ?)",
+                    (key, current + 1, now),
+                )
+                self._conn.execute(
+                    "INSERT INTO memory_log (key, version, writer, at, data) VALUES (?, ?, ?, ?, ?)",
+                    (key, current + 1, writer or _default_writer(), now, payload),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        self._wake.set()
+        return current + 1
+
+    def changes(self, since: int = 0, pattern: str | None = None, limit: int = 100) -> list[Change]:
+        """Log entries after seq since, oldest first, optionally filtered by a glob on key."""
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT seq, key, version, writer, at FROM memory_log WHERE seq > ? ORDER BY seq",
+                (since,),
+            )
+            matching = (Change(*row) for row in rows if pattern is None or fnmatch.fnmatchcase(row[1], pattern))
+            return list(itertools.islice(matching, limit))
+
+    def history(self, key: str, limit: int = 20) -> list[dict]:
+        """Past contents of key, newest first, as {'version', 'writer', 'at', 'data'}."""
+        key = self._key(key)
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT version, writer, at, data FROM memory_log WHERE key = ? ORDER BY seq DESC LIMIT ?",
+                (key, limit),
+            ).fetchall()
+        return [{"version": v, "writer": w, "at": at, "data": json.loads(d)} for v, w, at, d in rows]
+
+    def _last_seq(self) -> int:
+        with self._db_lock:
+            return self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM memory_log").fetchone()[0]
+
+    def subscribe(self, pattern: str, callback: Callable[[Change], None]) -> Subscription:
+        """Call callback(change) for every later write to a key matching the glob pattern.
+
+        Callbacks run on the backend's watcher thread, in log order.
+        """
+        subscription = Subscription(self, pattern, callback)
+        with self._subs_lock:
+            self._subscriptions.append(subscription)
+            if self._watcher is None:
+                self._watcher = threading.Thread(
+                    target=self._watch, args=(self._last_seq(),), name="shared-memory-watch", daemon=True,
+                )
+                self._watcher.start()
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._subs_lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def _data_version(self) -> int:
+        with self._db_lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _watch(self, seq: int) -> None:
+        seen_version = None
+        while not self._closed.is_set():
+            woken = self._wake.wait(self.poll_interval)
+            self._wake.clear()
+            if self._closed.is_set():
+                return
+            data_version = self._data_version()
+            if not woken and data_version == seen_version:
+                continue  # nothing committed by other connections
+            seen_version = data_version
+            while True:
+                batch = self.changes(since=seq, limit=1000)
+                for change in batch:
+                    seq = change.seq
+                    self._dispatch(change)
+                if len(batch) < 1000:
+                    break
+
+    def _dispatch(self, change: Change) -> None:
+        with self._subs_lock:
+            targets = [s for s in self._subscriptions if s.matches(change.key)]
+        for subscription in targets:
+            try:
+                subscription.callback(change)
+            except Exception:  # noqa: BLE001 — one bad subscriber must not stop the others
+                pass
+
+    def close(self) -> None:
+        self._closed.set()
+        self._wake.set()
+        if self._watcher is not None and self._watcher is not threading.current_thread():
+            self._watcher.join(timeout=5)
+        with self._db_lock:
+            self._conn.close()
+
+
+_backends: dict[Path, FileMemoryBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def get_backend(memory_dir: Path | None = None) -> FileMemoryBackend:
+    """Process-wide backend for a shared memory tree (default: vibe-inc/shared_memory/)."""
+    root = (memory_dir or _DEFAULT_MEMORY_DIR).resolve()
+    with _backends_lock:
+        backend = _backends.get(root)
+        if backend is None:
+            backend = _backends[root] = FileMemoryBackend(root)
+        return backend
+
+
+def close_backends() -> None:
+    with _backends_lock:
+        backends = list(_backends.values())
+        _backends.clear()
+    for backend in backends:
+        backend.close()
@@ -1,9 +1,10 @@
 """A/B testing tools via Convert.com REST API."""
 import os
 
-import httpx
+from vibe_inc.tools.http_clients import provider_client
 
 _BASE_URL = "https://api.convert.com/api/v1"
+_http = provider_client("ab_testing")
 
 
 def _get_headers():
@@ -44,7 +45,7 @@ def ab_test_read(
     project_id = _get_project_id()
     if experiment_id:
         url = f"{_BASE_URL}/accounts/{account_id}/projects/{project_id}/experiences/{experiment_id}"
-        resp = httpx.get(url, headers=_get_headers())
+        resp = _http.get(url, headers=_get_headers())
         data = resp.json()
         return {"experiment": data}
     else:
@@ -52,7 +53,7 @@ def ab_test_read(
         params = {}
         if status:
             params["status"] = status
-        resp = httpx.get(url, headers=_get_headers(), params=params)
+        resp = _http.get(url, headers=_get_headers(), params=params)
         data = resp.json()
         experiments = data if isinstance(data, list) else data.get("data", [])
         return {"experiments": experiments, "count": len(experiments)}
@@ -77,6 +78,6 @@ def ab_test_manage(
     url = f"{_BASE_URL}/accounts/{account_id}/projects/{project_id}/experiences/{experiment_id}"
     status_map = {"pause": "paused", "activate": "active", "archive": "completed"}
     payload = {"status": status_map.get(action, action)}
-    resp = httpx.patch(url, headers=_get_headers(), json=payload)
+    resp = _http.patch(url, headers=_get_headers(), json=payload)
     data = resp.json()
     return {"action": action, "experiment_id": experiment_id, "result": data}
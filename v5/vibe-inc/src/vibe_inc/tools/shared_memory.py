@@ -1,9 +1,58 @@
-"""Shared memory tools — YAML-based cross-role memory for Phase 1."""
+"""Shared memory tools — YAML-based cross-role memory for Phase 1.
+
+Parsed files are cached in-process, keyed by resolved path and validated
+against the file's (mtime_ns, inode, size) on every read, so a file changed
+by another process is re-parsed and an unchanged one costs one stat().
+write_memory replaces files atomically (temp file + rename): readers in any
+process see the old or the new content, never a partial write, and the new
+inode invalidates every cached copy. The libyaml C loader/dumper are used
+when PyYAML was built with them.
+
+Locking, versions, the change log and subscriptions live in memory_backend.
+"""
+import copy
+import os
+import tempfile
+import threading
 from pathlib import Path
+
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML without libyaml
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
 _DEFAULT_MEMORY_DIR = Path(__file__).resolve().parents[3] / "shared_memory"
 
+_cache: dict[Path, tuple[tuple[int, int, int], dict]] = {}
+_cache_lock = threading.Lock()
+
+
+def _signature(st: os.stat_result) -> tuple[int, int, int]:
+    return st.st_mtime_ns, st.st_ino, st.st_size
+
+
+def _load(file_path: Path) -> dict:
+    """Parsed content of file_path from the cache, re-parsing if the file changed."""
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        with _cache_lock:
+            _cache.pop(file_path, None)
+        return {}
+    signature = _signature(st)
+    with _cache_lock:
+        cached = _cache.get(file_path)
+    if cached is None or cached[0] != signature:
+        data = yaml.load(file_path.read_bytes(), Loader=_Loader) or {}
+        cached = (signature, data)
+        with _cache_lock:
+            _cache[file_path] = cached
+    return cached[1]
+
 
 def read_memory(path: str, memory_dir: Path | None = None) -> dict:
     """Read a shared memory file (YAML).
@@ -16,25 +65,83 @@ def read_memory(path: str, memory_dir: Path | None = None) -> dict:
         Parsed YAML content as dict.
     """
     base = memory_dir or _DEFAULT_MEMORY_DIR
-    file_path = base / path
-    if not file_path.exists():
-        return {}
-    return yaml.safe_load(file_path.read_text()) or {}
+    # Callers get their own copy; the cached parse must not be mutated.
+    return copy.deepcopy(_load((base / path).resolve()))
+
+
+def _atomic_write(file_path: Path, data: dict) -> None:
+    """Replace file_path with data as YAML via a temp file + rename; drops the cached parse."""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    text = yaml.dump(data, Dumper=_Dumper, default_flow_style=False, allow_unicode=True)
+    fd, tmp = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, file_path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    with _cache_lock:
+        _cache.pop(file_path, None)
 
 
-def write_memory(path: str, data: dict, memory_dir: Path | None = None) -> dict:
+def write_memory(
+    path: str,
+    data: dict,
+    memory_dir: Path | None = None,
+    expected_version: int | None = None,
+) -> dict:
     """Write data to a shared memory file (YAML).
 
+    Writes are serialized per file across roles and worker processes, and
+    every write bumps the file's version and is recorded in the change log.
+    Pass expected_version (from memory_version) to write only if nobody else
+    has written the file since it was read.
+
     Args:
         path: Relative path within shared_memory/ (e.g. 'performance/cac-latest.yaml').
         data: Dict to write as YAML.
         memory_dir: Override memory directory (for testing).
+        expected_version: Only write if the file is still at this version.
 
     Returns:
-        Dict with written=True and the path.
+        Dict with written=True, the path and the new version, or written=False
+        with an error and the current version on a conflict.
     """
-    base = memory_dir or _DEFAULT_MEMORY_DIR
-    file_path = base / path
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    file_path.write_text(yaml.dump(data, default_flow_style=False, allow_unicode=True))
-    return {"written": True, "path": str(path)}
+    from vibe_inc.tools.memory_backend import VersionConflict, get_backend
+
+    try:
+        version = get_backend(memory_dir).write(path, data, expected_version=expected_version)
+    except VersionConflict as exc:
+        return {"written": False, "path": str(path), "error": str(exc), "version": exc.actual}
+    except ValueError as exc:
+        return {"written": False, "path": str(path), "error": str(exc)}
+    return {"written": True, "path": str(path), "version": version}
+
+
+def memory_version(path: str, memory_dir: Path | None = None) -> int:
+    """Current version of a shared memory file (0 if never written through write_memory)."""
+    from vibe_inc.tools.memory_backend import get_backend
+
+    return get_backend(memory_dir).version(path)
+
+
+def preload_memory(memory_dir: Path | None = None) -> dict[str, list[str]]:
+    """Parse every YAML file under memory_dir into the cache.
+
+    Returns:
+        Index of relative path -> top-level keys, for each file loaded.
+    """
+    base = (memory_dir or _DEFAULT_MEMORY_DIR).resolve()
+    index = {}
+    for file_path in sorted(base.rglob("*.yaml")):
+        data = _load(file_path)
+        index[file_path.relative_to(base).as_posix()] = list(data) if isinstance(data, dict) else []
+    return index
+
+
+def clear_memory_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
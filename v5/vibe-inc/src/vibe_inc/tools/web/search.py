@@ -1,6 +1,10 @@
 """Web search and fetch tools for competitive intelligence."""
 import os
 
+from vibe_inc.tools.http_clients import provider_client
+
+_http = provider_client("web")
+
 
 def web_search(query: str, count: int = 10) -> dict:
     """Search the web using Brave Search API.
@@ -12,10 +16,8 @@ def web_search(query: str, count: int = 10) -> dict:
     Returns:
         Dict with 'query', 'count', and 'results' (list of {title, url, description}).
     """
-    import httpx
-
     api_key = os.environ["BRAVE_SEARCH_API_KEY"]
-    resp = httpx.get(
+    resp = _http.get(
         "https://api.search.brave.com/res/v1/web/search",
         headers={"X-Subscription-Token": api_key, "Accept": "application/json"},
         params={"q": query, "count": min(count, 20)},
@@ -45,9 +47,7 @@ def web_fetch(url: str, max_chars: int = 4000) -> dict:
     Returns:
         Dict with 'url', 'content', 'truncated' (bool), and 'status_code'.
     """
-    import httpx
-
-    resp = httpx.get(
+    resp = _http.get(
         url,
         headers={"User-Agent": "VibeBot/1.0 (competitive-intel)"},
         timeout=15.0,
@@ -15,7 +15,7 @@ def test_ab_test_read_lists_experiments():
         {"id": 2, "name": "Dot CTA test", "status": "paused"},
     ])
 
-    with patch("vibe_inc.tools.optimization.ab_testing.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.optimization.ab_testing._http") as mock_httpx, \
          patch("vibe_inc.tools.optimization.ab_testing._get_headers", return_value={"Authorization": "Bearer test"}), \
          patch("vibe_inc.tools.optimization.ab_testing._get_account_id", return_value="acc_123"), \
          patch("vibe_inc.tools.optimization.ab_testing._get_project_id", return_value="proj_456"):
@@ -33,7 +33,7 @@ def test_ab_test_read_single_experiment():
         "id": 1, "name": "Bot PDP headline test", "status": "active", "variations": [],
     })
 
-    with patch("vibe_inc.tools.optimization.ab_testing.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.optimization.ab_testing._http") as mock_httpx, \
          patch("vibe_inc.tools.optimization.ab_testing._get_headers", return_value={"Authorization": "Bearer test"}), \
          patch("vibe_inc.tools.optimization.ab_testing._get_account_id", return_value="acc_123"), \
          patch("vibe_inc.tools.optimization.ab_testing._get_project_id", return_value="proj_456"):
@@ -55,7 +55,7 @@ def test_ab_test_manage_pauses_experiment():
 
     mock_resp = _mock_response({"status": "paused"})
 
-    with patch("vibe_inc.tools.optimization.ab_testing.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.optimization.ab_testing._http") as mock_httpx, \
          patch("vibe_inc.tools.optimization.ab_testing._get_headers", return_value={"Authorization": "Bearer test"}), \
          patch("vibe_inc.tools.optimization.ab_testing._get_account_id", return_value="acc_123"), \
          patch("vibe_inc.tools.optimization.ab_testing._get_project_id", return_value="proj_456"):
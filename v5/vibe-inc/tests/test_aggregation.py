@@ -0,0 +1,172 @@
+"""Tests for the vectorized metrics engine and the unified_metrics tools built on it."""
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from vibe_inc.tools.ads import metrics_store, metrics_sync
+from vibe_inc.tools.ads.aggregation import PlatformFrame, ResponseCurves, allocate, fit_curves
+from vibe_inc.tools.ads.metrics_store import normalize_row
+
+START = date(2026, 3, 1)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_store(monkeypatch):
+    monkeypatch.delenv("AD_METRICS_STORE_PATH", raising=False)
+    metrics_store.reset_store()
+    yield
+    metrics_store.reset_store()
+
+
+def _curve_rows(platform: str, a: float, b: float, spends, start: date = START, ctr: float = 0.02) -> list[dict]:
+    """One row per day with conversions exactly a * spend ** b and revenue 300 per conversion."""
+    rows = []
+    for i, spend in enumerate(spends):
+        conversions = a * spend ** b
+        rows.append(normalize_row(platform, start + timedelta(days=i), "c1", spend=spend, impressions=10000,
+                                  clicks=10000 * ctr, conversions=conversions, revenue=300 * conversions))
+    return rows
+
+
+class _StoreFetcher:
+    """Serves a fixed set of rows, filtered to the requested days."""
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+
+    def __call__(self, start: date, end: date) -> list[dict]:
+        return [r for r in self.rows if start.isoformat() <= r["date"] <= end.isoformat()]
+
+
+def _fetchers(rows: list[dict]) -> dict:
+    by_platform = {p: [r for r in rows if r["platform"] == p] for p in metrics_sync.PLATFORMS}
+    return {p: _StoreFetcher(r) for p, r in by_platform.items()}
+
+
+def test_frame_reduces_per_platform():
+    rows = _curve_rows("meta", 1.0, 0.5, [100, 400]) + _curve_rows("google", 2.0, 0.5, [25])
+    frame = PlatformFrame.from_rows(rows, ["meta", "google", "tiktok"])
+    totals = frame.totals()
+
+    assert totals["spend"].tolist() == [500.0, 25.0, 0.0]
+    assert totals["conversions"].tolist() == [30.0, 10.0, 0.0]
+    assert totals["rows"].tolist() == [2, 1, 0]
+    assert frame.last_day().tolist() == [(START + timedelta(days=1)).toordinal(), START.toordinal(), 0]
+    assert len(frame.between(START.toordinal(), START.toordinal())) == 2
+
+
+def test_fit_curves_recovers_elasticity_and_marginal_cpa():
+    rng = np.random.default_rng(7)
+    spends = rng.uniform(100, 1000, 60)
+    frame = PlatformFrame.from_rows(
+        _curve_rows("meta", 0.5, 0.7, spends) + _curve_rows("tiktok", 0.2, 0.7, [300, 300]),
+    )
+    curves = fit_curves(frame)
+    meta, tiktok = frame.platforms.index("meta"), frame.platforms.index("tiktok")
+
+    # 60 days pull the slope most of the way from the prior to the true 0.7.
+    assert abs(curves.b[meta] - 0.7) < 0.03
+    assert curves.b[tiktok] == pytest.approx(0.6)  # too few days: prior
+    assert curves.predict(np.ones(2)) == pytest.approx(curves.a)
+    spend = np.array([400.0, 400.0])
+    assert curves.marginal_cost(spend) == pytest.approx(1 / curves.marginal(spend))
+
+
+def test_allocate_equalizes_marginal_returns_within_bounds():
+    curves = ResponseCurves(["a", "b", "c"], np.array([1.0, 2.0, 1.0]), np.array([0.5, 0.5, 0.5]), np.zeros(3))
+    wide = allocate(curves, 1000.0, np.zeros(3), np.full(3, 1000.0))
+    # sqrt curves: optimum spend is proportional to a ** 2.
+    assert wide == pytest.approx([1000 / 6, 4000 / 6, 1000 / 6], rel=1e-6)
+    assert np.ptp(curves.marginal(wide)) == pytest.approx(0, abs=1e-9)
+
+    capped = allocate(curves, 1000.0, np.full(3, 200.0), np.full(3, 500.0))
+    assert capped.sum() == pytest.approx(1000.0)
+    assert capped[1] == pytest.approx(500.0)
+    assert capped[0] == pytest.approx(250.0) and capped[2] == pytest.approx(250.0)
+
+
+def test_allocate_keeps_platforms_without_returns_at_floor():
+    curves = ResponseCurves(["a", "b"], np.array([1.0, 0.0]), np.array([0.5, 0.5]), np.zeros(2))
+    out = allocate(curves, 100.0, np.array([10.0, 30.0]), np.array([100.0, 100.0]))
+    assert out.tolist() == pytest.approx([70.0, 30.0])
+
+
+def test_allocate_spends_full_budget_when_active_platforms_are_capped():
+    curves = ResponseCurves(["a", "b"], np.array([1.0, 0.0]), np.array([0.5, 0.5]), np.zeros(2))
+    out = allocate(curves, 100.0, np.array([10.0, 10.0]), np.array([50.0, 50.0]))
+    assert out.tolist() == pytest.approx([50.0, 50.0])
+
+    rng = np.random.default_rng(11)
+    for _ in range(200):
+        n = 6
+        curves = ResponseCurves(list("abcdef"), rng.uniform(0, 2, n) * (rng.random(n) > 0.3),
+                                rng.uniform(0.2, 0.9, n), np.zeros(n))
+        lower = rng.uniform(0, 100, n)
+        upper = lower + rng.uniform(0, 200, n)
+        total = rng.uniform(lower.sum(), upper.sum())
+        out = allocate(curves, total, lower, upper)
+        assert out.sum() == pytest.approx(total, rel=1e-9)
+        assert np.all(out >= lower - 1e-9) and np.all(out <= upper + 1e-9)
+
+
+def test_budget_allocator_shifts_toward_cheaper_marginal_conversions():
+    from vibe_inc.tools.ads.unified_metrics import budget_allocator
+
+    rng = np.random.default_rng(3)
+    today = date.today()
+    start = today - timedelta(days=28)
+    rows = (
+        _curve_rows("google", 0.05, 0.8, rng.uniform(900, 1100, 28), start)
+        + _curve_rows("meta", 0.02, 0.8, rng.uniform(900, 1100, 28), start)
+        + _curve_rows("tiktok", 0.5, 0.8, [200, 200, 200], today - timedelta(days=3))
+    )
+    benchmarks = {"cross_platform": {"max_platform_budget_pct": 0.6}}
+    with patch.dict(metrics_sync.FETCHERS, _fetchers(rows)), \
+         patch("vibe_inc.tools.ads.unified_metrics.read_memory", return_value=benchmarks):
+        result = budget_allocator(total_budget=2000.0)
+
+    allocation = result["allocation"]
+    assert result["method"] == "response_curves"
+    assert sum(a["amount"] for a in allocation.values()) == pytest.approx(2000.0, abs=0.05)
+    assert sum(a["percentage"] for a in allocation.values()) == pytest.approx(1.0, abs=1e-3)
+    assert allocation["google"]["shift"] > 0 > allocation["meta"]["shift"]
+    assert allocation["google"]["shift_pct"] == pytest.approx(0.2, abs=1e-3)  # at the 20% limit
+    assert allocation["meta"]["shift_pct"] >= -0.2
+    assert allocation["google"]["amount"] <= 0.6 * 2000.0 + 0.01
+    assert "held" in allocation["tiktok"] and allocation["tiktok"]["shift"] == 0
+    assert allocation["tiktok"]["current_amount"] == pytest.approx(600 / 28, abs=0.01)  # actual, not rescaled
+    assert allocation["linkedin"]["amount"] == 0
+    assert result["expected"]["blended_cac_proposed"] < result["expected"]["blended_cac_baseline"]
+    assert result["requires_approval"] is False
+
+
+def test_budget_allocator_rejects_unknown_goal():
+    from vibe_inc.tools.ads.unified_metrics import budget_allocator
+
+    assert "error" in budget_allocator(1000.0, optimization_goal="maximize_vibes")
+
+
+def test_platform_health_score_flags_fatigue_pacing_and_cpa():
+    from vibe_inc.tools.ads.unified_metrics import platform_health_score
+
+    today = date.today()
+    start = today - timedelta(days=14)
+    steady = _curve_rows("google", 1.0, 0.5, [400] * 14, start)  # CPA 20
+    # Meta: CTR halves in the second week and the last day overspends 2x.
+    meta = _curve_rows("meta", 1.0, 0.5, [400] * 7, start) + _curve_rows(
+        "meta", 1.0, 0.5, [400] * 6 + [800], start + timedelta(days=7), ctr=0.01)
+    benchmarks = {"google": {"bot_target_cpa": 30}, "meta": {"bot_target_cpa": 30}}
+    with patch.dict(metrics_sync.FETCHERS, _fetchers(steady + meta)), \
+         patch("vibe_inc.tools.ads.unified_metrics.read_memory", return_value=benchmarks):
+        result = platform_health_score()
+
+    scores = result["health_scores"]
+    assert scores["google"]["score"] == 100 and scores["google"]["alerts"] == []
+    alerts = " ".join(scores["meta"]["alerts"])
+    assert "Creative fatigue" in alerts and "Spend pacing" in alerts and "CPA spike" in alerts
+    assert scores["meta"]["components"]["creative"] == 0
+    assert scores["meta"]["score"] < scores["google"]["score"]
+    assert scores["amazon"]["status"] == "no_data"
+    assert scores["meta"]["score"] < result["overall_score"] < 100
@@ -1,5 +1,67 @@
 from unittest.mock import patch, MagicMock
 
+import httpx
+import pytest
+
+
+_CREDS = {"client_id": "x", "client_secret": "s", "refresh_token": "t", "profile_id": "p"}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_report_cache():
+    from vibe_inc.tools.ads import amazon_ads
+    amazon_ads._reports.invalidate()
+    yield
+    amazon_ads._reports.invalidate()
+
+
+class _Chunks(httpx.AsyncByteStream):
+    """Response body delivered in small chunks, as a real download would be."""
+
+    def __init__(self, data: bytes, size: int = 7):
+        self.data = data
+        self.size = size
+
+    async def __aiter__(self):
+        for i in range(0, len(self.data), self.size):
+            yield self.data[i:i + self.size]
+
+
+def _report_api(rows, pending_polls=1, status="COMPLETED"):
+    """ProviderHTTP over a mock Amazon reporting API; returns (http, calls)."""
+    import gzip
+    import json
+    from vibe_inc.tools.http_clients import HttpClientRegistry, ProviderHTTP
+
+    calls = []
+    polls = {}
+
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        if request.method == "POST":
+            report_id = f"report-{len(polls) + 1}"
+            polls[report_id] = 0
+            return httpx.Response(200, json={"reportId": report_id})
+        if request.url.host == "download.example.com":
+            body = gzip.compress(json.dumps(rows).encode())
+            return httpx.Response(200, stream=_Chunks(body))
+        report_id = request.url.path.rsplit("/", 1)[-1]
+        polls[report_id] += 1
+        if polls[report_id] <= pending_polls:
+            return httpx.Response(200, json={"status": "PENDING"})
+        body = {"status": status, "url": f"https://download.example.com/{report_id}.json.gz"}
+        if status == "FAILED":
+            body["failureReason"] = "bad columns"
+        return httpx.Response(200, json=body)
+
+    registry = HttpClientRegistry(transport=httpx.MockTransport(handler), http2=False)
+    return ProviderHTTP("amazon_ads", registry=registry), calls
+
+
+def _fast_backoff():
+    from vibe_inc.tools.ads.report_jobs import Backoff
+    return Backoff(initial=0.001, factor=2.0, max_interval=0.01, timeout=5.0, jitter=0.0)
+
 
 def test_amazon_ads_report_three_step_flow():
     """amazon_ads_report executes 3-step async flow: request -> poll -> download."""
@@ -9,11 +71,11 @@ def test_amazon_ads_report_three_step_flow():
         {"impressions": "5000", "clicks": "120", "spend": "45.00"},
         {"impressions": "3200", "clicks": "80", "spend": "30.50"},
     ]
+    http, calls = _report_api(mock_rows, pending_polls=2)
 
-    with patch("vibe_inc.tools.ads.amazon_ads._get_client", return_value={"client_id": "x", "client_secret": "s", "refresh_token": "t", "profile_id": "p"}), \
-         patch("vibe_inc.tools.ads.amazon_ads._request_report", return_value="report-123"), \
-         patch("vibe_inc.tools.ads.amazon_ads._poll_report", return_value="https://download.example.com/report.gz"), \
-         patch("vibe_inc.tools.ads.amazon_ads._download_report", return_value=mock_rows):
+    with patch("vibe_inc.tools.ads.amazon_ads._get_client", return_value=_CREDS), \
+         patch("vibe_inc.tools.ads.amazon_ads._http", http), \
+         patch("vibe_inc.tools.ads.amazon_ads.REPORT_BACKOFF", _fast_backoff()):
         result = amazon_ads_report(
             ad_product="SPONSORED_PRODUCTS",
             report_type="spCampaigns",
@@ -22,9 +84,75 @@ def test_amazon_ads_report_three_step_flow():
         )
 
     assert "rows" in result
-    assert len(result["rows"]) == 2
+    assert result["rows"] == mock_rows
     assert result["ad_product"] == "SPONSORED_PRODUCTS"
     assert result["report_type"] == "spCampaigns"
+    assert [m for m, _ in calls] == ["POST", "GET", "GET", "GET", "GET"]
+
+
+def test_amazon_ads_report_served_from_cache():
+    """A repeated report with the same profile/type/columns/range is not regenerated."""
+    from vibe_inc.tools.ads.amazon_ads import amazon_ads_report_submit, amazon_ads_report
+
+    http, calls = _report_api([{"clicks": 1}], pending_polls=0)
+    args = dict(ad_product="SPONSORED_PRODUCTS", report_type="spCampaigns",
+                columns=["clicks"], date_range="2026-01-01,2026-01-07")
+
+    with patch("vibe_inc.tools.ads.amazon_ads._get_client", return_value=_CREDS), \
+         patch("vibe_inc.tools.ads.amazon_ads._http", http), \
+         patch("vibe_inc.tools.ads.amazon_ads.REPORT_BACKOFF", _fast_backoff()):
+        first = amazon_ads_report(**args)
+        submitted = amazon_ads_report_submit(**args)
+        other = amazon_ads_report(**{**args, "columns": ["clicks", "spend"]})
+
+    assert first["rows"] == other["rows"] == [{"clicks": 1}]
+    assert submitted["status"] == "COMPLETED" and submitted["cached"] is True
+    assert sum(1 for m, _ in calls if m == "POST") == 2
+
+
+def test_amazon_ads_reports_runs_batch_and_reports_failures():
+    """amazon_ads_reports submits all specs together and returns rows or error per spec."""
+    from vibe_inc.tools.ads.amazon_ads import amazon_ads_reports
+
+    ok_http, _ = _report_api([{"spend": 2.0}], pending_polls=1)
+    specs = [
+        {"ad_product": p, "report_type": t, "columns": ["spend"], "date_range": "last_7d"}
+        for p, t in [("SPONSORED_PRODUCTS", "spCampaigns"), ("SPONSORED_BRANDS", "sbCampaigns")]
+    ]
+    with patch("vibe_inc.tools.ads.amazon_ads._get_client", return_value=_CREDS), \
+         patch("vibe_inc.tools.ads.amazon_ads._http", ok_http), \
+         patch("vibe_inc.tools.ads.amazon_ads.REPORT_BACKOFF", _fast_backoff()):
+        result = amazon_ads_reports(specs)
+
+    assert [r["report_type"] for r in result["reports"]] == ["spCampaigns", "sbCampaigns"]
+    assert all(r["rows"] == [{"spend": 2.0}] for r in result["reports"])
+    assert all(r["status"] == "COMPLETED" for r in result["reports"])
+
+    failing_http, _ = _report_api([], pending_polls=0, status="FAILED")
+    with patch("vibe_inc.tools.ads.amazon_ads._get_client", return_value=_CREDS), \
+         patch("vibe_inc.tools.ads.amazon_ads._http", failing_http), \
+         patch("vibe_inc.tools.ads.amazon_ads.REPORT_BACKOFF", _fast_backoff()):
+        result = amazon_ads_reports([{**specs[0], "date_range": "last_30d"}])
+
+    assert result["reports"][0]["status"] == "FAILED"
+    assert "bad columns" in result["reports"][0]["error"]
+
+
+def test_amazon_ads_report_submit_then_status():
+    """amazon_ads_report_submit returns a job id that amazon_ads_report_status resolves."""
+    from vibe_inc.tools.ads.amazon_ads import amazon_ads_report_submit, amazon_ads_report_status
+
+    http, _ = _report_api([{"searchTerm": "speaker"}], pending_polls=1)
+    with patch("vibe_inc.tools.ads.amazon_ads._get_client", return_value=_CREDS), \
+         patch("vibe_inc.tools.ads.amazon_ads._http", http), \
+         patch("vibe_inc.tools.ads.amazon_ads.REPORT_BACKOFF", _fast_backoff()):
+        job = amazon_ads_report_submit("SPONSORED_PRODUCTS", "spSearchTerm", ["searchTerm"], "last_30d")
+        status = amazon_ads_report_status(job["job_id"], wait_seconds=5)
+
+    assert status["status"] == "COMPLETED"
+    assert status["rows"] == [{"searchTerm": "speaker"}]
+    assert status["report_type"] == "spSearchTerm"
+    assert amazon_ads_report_status("job-missing")["error"] == "Unknown job_id"
 
 
 def test_amazon_ads_report_has_docstring():
@@ -46,7 +174,7 @@ def test_amazon_ads_campaigns_returns_list():
     mock_resp.raise_for_status = MagicMock()
 
     with patch("vibe_inc.tools.ads.amazon_ads._get_client", return_value={"client_id": "x", "client_secret": "s", "refresh_token": "t", "profile_id": "p"}), \
-         patch("vibe_inc.tools.ads.amazon_ads.httpx") as mock_httpx:
+         patch("vibe_inc.tools.ads.amazon_ads._http") as mock_httpx:
         mock_httpx.get.return_value = mock_resp
         result = amazon_ads_campaigns(ad_product="SPONSORED_PRODUCTS")
 
@@ -74,7 +202,7 @@ def test_amazon_ads_keywords_returns_list():
     mock_resp.raise_for_status = MagicMock()
 
     with patch("vibe_inc.tools.ads.amazon_ads._get_client", return_value={"client_id": "x", "client_secret": "s", "refresh_token": "t", "profile_id": "p"}), \
-         patch("vibe_inc.tools.ads.amazon_ads.httpx") as mock_httpx:
+         patch("vibe_inc.tools.ads.amazon_ads._http") as mock_httpx:
         mock_httpx.get.return_value = mock_resp
         result = amazon_ads_keywords(campaign_id="camp_1")
 
@@ -92,7 +220,7 @@ def test_amazon_ads_bid_update_returns_result():
     mock_resp.raise_for_status = MagicMock()
 
     with patch("vibe_inc.tools.ads.amazon_ads._get_client", return_value={"client_id": "x", "client_secret": "s", "refresh_token": "t", "profile_id": "p"}), \
-         patch("vibe_inc.tools.ads.amazon_ads.httpx") as mock_httpx:
+         patch("vibe_inc.tools.ads.amazon_ads._http") as mock_httpx:
         mock_httpx.put.return_value = mock_resp
         result = amazon_ads_bid_update(
             campaign_id="12345",
@@ -115,7 +243,7 @@ def test_amazon_ads_budget_reads_current():
     mock_resp.raise_for_status = MagicMock()
 
     with patch("vibe_inc.tools.ads.amazon_ads._get_client", return_value={"client_id": "x", "client_secret": "s", "refresh_token": "t", "profile_id": "p"}), \
-         patch("vibe_inc.tools.ads.amazon_ads.httpx") as mock_httpx:
+         patch("vibe_inc.tools.ads.amazon_ads._http") as mock_httpx:
         mock_httpx.get.return_value = mock_resp
         result = amazon_ads_budget(campaign_id="camp_1")
 
@@ -134,10 +262,11 @@ def test_amazon_ads_search_terms_returns_list():
         {"searchTerm": "other term", "impressions": "100", "clicks": "5", "campaignId": "camp_2"},
     ]
 
-    with patch("vibe_inc.tools.ads.amazon_ads._get_client", return_value={"client_id": "x", "client_secret": "s", "refresh_token": "t", "profile_id": "p"}), \
-         patch("vibe_inc.tools.ads.amazon_ads._request_report", return_value="report-456"), \
-         patch("vibe_inc.tools.ads.amazon_ads._poll_report", return_value="https://download.example.com/st.gz"), \
-         patch("vibe_inc.tools.ads.amazon_ads._download_report", return_value=mock_rows):
+    http, _ = _report_api(mock_rows, pending_polls=0)
+
+    with patch("vibe_inc.tools.ads.amazon_ads._get_client", return_value=_CREDS), \
+         patch("vibe_inc.tools.ads.amazon_ads._http", http), \
+         patch("vibe_inc.tools.ads.amazon_ads.REPORT_BACKOFF", _fast_backoff()):
         result = amazon_ads_search_terms(campaign_id="camp_1", date_range="last_7d")
 
     assert "search_terms" in result
@@ -0,0 +1,67 @@
+"""Tests for the catalog-validated SQL builder."""
+import pytest
+
+CATALOG = {
+    "tables": [
+        {"name": "fct_ads_ad_metrics", "schema": "common", "columns": [
+            {"name": "dim_ads_campaign_sk"}, {"name": "platform"},
+            {"name": "date"}, {"name": "spend_in_usd"},
+        ]},
+        {"name": "dim_ads_campaign", "schema": "common", "columns": [
+            {"name": "dim_ads_campaign_sk"}, {"name": "campaign_name"},
+        ]},
+        {"name": "fct_website_page_view", "schema": "common", "columns": [{"name": "event_pk"}]},
+        {"name": "fct_website_page_view", "schema": "dbt_analytics", "columns": [{"name": "page_path"}]},
+    ],
+}
+
+
+def test_build_select_join_where_group():
+    from vibe_inc.tools.analytics.sql import Select
+
+    sql, params = (
+        Select(CATALOG, "fct_ads_ad_metrics")
+        .join("dim_ads_campaign", on="dim_ads_campaign_sk")
+        .select("campaign_name")
+        .select("spend_in_usd", agg="sum")
+        .where_between("date", "2026-01-01", "2026-01-07")
+        .where("platform", "=", ["facebook", "google"])
+        .group_by("campaign_name")
+        .order_by("spend_in_usd", desc=True)
+        .limit(10)
+        .build()
+    )
+
+    assert sql == (
+        "SELECT d_ads_campaign.campaign_name, SUM(f.spend_in_usd) AS spend_in_usd"
+        " FROM common.fct_ads_ad_metrics f"
+        " JOIN common.dim_ads_campaign d_ads_campaign"
+        " ON f.dim_ads_campaign_sk = d_ads_campaign.dim_ads_campaign_sk"
+        " WHERE f.date >= %s AND f.date <= %s AND f.platform IN (%s, %s)"
+        " GROUP BY d_ads_campaign.campaign_name"
+        " ORDER BY f.spend_in_usd DESC LIMIT 10"
+    )
+    assert params == ("2026-01-01", "2026-01-07", "facebook", "google")
+
+
+def test_rejects_identifiers_outside_catalog():
+    from vibe_inc.tools.analytics.sql import Select, SQLValidationError
+
+    q = Select(CATALOG, "common.fct_ads_ad_metrics")
+    for bad in ("net_sales", "spend_in_usd) --", "1=1"):
+        with pytest.raises(SQLValidationError):
+            q.select(bad)
+    with pytest.raises(SQLValidationError):
+        q.select("spend_in_usd", agg="SUM(1); --")
+    with pytest.raises(SQLValidationError):
+        q.where("platform", "OR", "x")
+    with pytest.raises(SQLValidationError):
+        Select(CATALOG, "fct_website_page_view")  # ambiguous without schema
+
+
+def test_where_all_orders_filters_by_column():
+    from vibe_inc.tools.analytics.sql import Select
+
+    a = Select(CATALOG, "fct_ads_ad_metrics").select("platform").where_all({"platform": "x", "date": "d"})
+    b = Select(CATALOG, "fct_ads_ad_metrics").select("platform").where_all({"date": "e", "platform": "y"})
+    assert a.build()[0] == b.build()[0]
@@ -73,3 +73,21 @@ def test_analytics_query_cohort_returns_dict():
         result = analytics_query_cohort(cohort_property="created_at", metric="net_sales")
 
     assert isinstance(result, dict)
+
+
+def test_analytics_query_table_renders_compact_markdown():
+    from vibe_inc.tools.analytics.columnar import ColumnarResult
+    from vibe_inc.tools.analytics_tools import analytics_query_table
+
+    mock_provider = MagicMock()
+    mock_provider.query_columnar.return_value = ColumnarResult(
+        ["campaign", "cpa"], {"campaign": ["a", "b", "c"], "cpa": [10.0, 55.556, 30.0]},
+    )
+    with patch("vibe_inc.tools.analytics_tools._get_provider", return_value=mock_provider):
+        result = analytics_query_table("SELECT ...", max_rows=1, top_k="cpa", describe=True)
+
+    assert result["row_count"] == 3
+    assert result["truncated"] is True
+    assert "| b | 55.56 |" in result["table"]
+    assert result["summary"]["cpa"]["count"] == 3
+    mock_provider.query_columnar.assert_called_once_with("SELECT ...", None, server_side=False)
@@ -0,0 +1,51 @@
+"""Tests for the columnar result type and its compact serializers."""
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+
+def _result():
+    from vibe_inc.tools.analytics.columnar import ColumnarResult
+    return ColumnarResult.from_rows([
+        {"platform": "facebook", "spend": 1500.456, "clicks": 1200},
+        {"platform": "google", "spend": Decimal("2300.10"), "clicks": 2100},
+        {"platform": "tiktok", "spend": None, "clicks": 90},
+    ])
+
+
+def test_from_cursor_uses_fetchmany_batches():
+    from vibe_inc.tools.analytics.columnar import ColumnarResult
+
+    cursor = MagicMock()
+    cursor.description = [("a",), ("b",)]
+    cursor.fetchmany.side_effect = [[(1, "x"), (2, "y")], [(3, "z")], []]
+    result = ColumnarResult.from_cursor(cursor, batch_size=2)
+
+    cursor.fetchmany.assert_called_with(2)
+    cursor.fetchall.assert_not_called()
+    assert result.column("a") == [1, 2, 3]
+    assert result.to_rows(limit=1) == [{"a": 1, "b": "x"}]
+
+
+def test_markdown_and_csv_round_and_truncate():
+    result = _result()
+    assert result.to_markdown(max_rows=2) == (
+        "| platform | spend | clicks |\n"
+        "|---|---|---|\n"
+        "| facebook | 1500.46 | 1200 |\n"
+        "| google | 2300.1 | 2100 |\n"
+        "(1 more rows)"
+    )
+    assert result.to_csv(digits=0).splitlines() == [
+        "platform,spend,clicks", "facebook,1500,1200", "google,2300,2100", "tiktok,,90",
+    ]
+
+
+def test_top_k_and_describe():
+    result = _result()
+    assert result.top_k("spend", 1).column("platform") == ["google"]
+    assert result.top_k("clicks", 2, smallest=True).column("platform") == ["tiktok", "facebook"]
+
+    summary = result.describe()
+    assert summary["spend"]["nulls"] == 1
+    assert summary["clicks"]["max"] == 2100
+    assert summary["platform"]["distinct"] == 3
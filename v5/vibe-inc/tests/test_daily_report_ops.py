@@ -87,16 +87,13 @@ def test_interpret_includes_date_in_prompt():
 def test_fetch_data_calls_all_three_layers():
     from vibe_inc.roles.d2c_growth.daily_report_ops import DailyReportOps
 
-    with patch("vibe_inc.roles.d2c_growth.daily_report_ops.fetch_l1", return_value=MOCK_L1) as m1, \
-         patch("vibe_inc.roles.d2c_growth.daily_report_ops.fetch_l2", return_value=MOCK_L2) as m2, \
-         patch("vibe_inc.roles.d2c_growth.daily_report_ops.fetch_l3", return_value=MOCK_L3) as m3:
+    layers = {"l1": MOCK_L1, "l2": MOCK_L2, "l3": MOCK_L3}
+    with patch("vibe_inc.roles.d2c_growth.daily_report_ops.fetch_all", return_value=layers) as m:
         llm = FakeAgentLLM([])
         op = DailyReportOps(llm=llm)
         result = op.fetch_data({"date": "2026-02-23"})
 
-    m1.assert_called_once_with("2026-02-23")
-    m2.assert_called_once_with("2026-02-23")
-    m3.assert_called_once_with("2026-02-23")
+    m.assert_called_once_with("2026-02-23")
     assert result["l1_data"] == MOCK_L1
     assert result["l2_data"] == MOCK_L2
     assert result["l3_data"] == MOCK_L3
@@ -105,16 +102,13 @@ def test_fetch_data_calls_all_three_layers():
 def test_fetch_data_passes_none_when_no_date():
     from vibe_inc.roles.d2c_growth.daily_report_ops import DailyReportOps
 
-    with patch("vibe_inc.roles.d2c_growth.daily_report_ops.fetch_l1", return_value=MOCK_L1) as m1, \
-         patch("vibe_inc.roles.d2c_growth.daily_report_ops.fetch_l2", return_value=MOCK_L2) as m2, \
-         patch("vibe_inc.roles.d2c_growth.daily_report_ops.fetch_l3", return_value=MOCK_L3) as m3:
+    layers = {"l1": MOCK_L1, "l2": MOCK_L2, "l3": MOCK_L3}
+    with patch("vibe_inc.roles.d2c_growth.daily_report_ops.fetch_all", return_value=layers) as m:
         llm = FakeAgentLLM([])
         op = DailyReportOps(llm=llm)
         result = op.fetch_data({})
 
-    m1.assert_called_once_with(None)
-    m2.assert_called_once_with(None)
-    m3.assert_called_once_with(None)
+    m.assert_called_once_with(None)
     assert "l1_data" in result
     assert "l2_data" in result
     assert "l3_data" in result
@@ -7,11 +7,20 @@ MOCK_ROWS = {"rows": [{"value": 1}], "columns": ["value"]}
 
 def _patch_sql():
     return patch(
-        "vibe_inc.roles.d2c_growth.daily_report_queries.analytics_query_sql",
-        return_value=MOCK_ROWS,
+        "vibe_inc.roles.d2c_growth.daily_report_queries.analytics_query_sql_group",
+        side_effect=lambda queries, **kwargs: {name: MOCK_ROWS for name in queries},
     )
 
 
+def _sqls(mock_sql):
+    """SQL strings in submission order across every group call."""
+    return [sql for c in mock_sql.call_args_list for sql, _ in c.args[0].values()]
+
+
+def _params(mock_sql):
+    return [p for c in mock_sql.call_args_list for _, params in c.args[0].values() for p in params]
+
+
 # --- fetch_l1 ---
 
 
@@ -33,9 +42,9 @@ def test_fetch_l1_queries_contain_fct_order():
     with _patch_sql() as mock_sql:
         fetch_l1("2026-02-23")
 
-    sqls = [c.args[0] for c in mock_sql.call_args_list]
-    assert len(sqls) == 4
-    assert any("fct_order" in s for s in sqls[:3])
+    sqls = _sqls(mock_sql)
+    assert len(sqls) == 2  # one merged scan of fct_order, one of fct_ads_ad_metrics
+    assert "fct_order" in sqls[0]
     assert any("fct_ads_ad_metrics" in s for s in sqls)
 
 
@@ -45,8 +54,8 @@ def test_fetch_l1_uses_provided_date():
     with _patch_sql() as mock_sql:
         fetch_l1("2026-01-15")
 
-    sql_text = mock_sql.call_args_list[0].args[0]
-    assert "2026-01-15" in sql_text
+    assert "2026-01-15" not in _sqls(mock_sql)[0]  # dates are bind params
+    assert "2026-01-15" in _params(mock_sql)
 
 
 def test_fetch_l1_defaults_to_yesterday():
@@ -55,9 +64,8 @@ def test_fetch_l1_defaults_to_yesterday():
     with _patch_sql() as mock_sql:
         fetch_l1()
 
-    sql_text = mock_sql.call_args_list[0].args[0]
-    # Should contain a date string, not None
-    assert "None" not in sql_text
+    # Should bind a date string, not None
+    assert None not in _params(mock_sql)
 
 
 # --- fetch_l2 ---
@@ -81,7 +89,7 @@ def test_fetch_l2_queries_platform_and_amazon_tables():
     with _patch_sql() as mock_sql:
         fetch_l2("2026-02-23")
 
-    sqls = [c.args[0] for c in mock_sql.call_args_list]
+    sqls = _sqls(mock_sql)
     assert any("fct_ads_ad_metrics" in s for s in sqls)
     assert any("fct_ads_amazon_ad_group_metrics" in s for s in sqls)
     assert any("dim_ads_campaign" in s for s in sqls)
@@ -108,6 +116,93 @@ def test_fetch_l3_queries_session_and_conversion_tables():
     with _patch_sql() as mock_sql:
         fetch_l3("2026-02-23")
 
-    sqls = [c.args[0] for c in mock_sql.call_args_list]
+    sqls = _sqls(mock_sql)
     assert any("fct_website_session" in s for s in sqls)
     assert any("fct_website_visitor_conversion" in s for s in sqls)
+
+
+def test_fetch_l1_runs_one_query_group():
+    from vibe_inc.roles.d2c_growth.daily_report_queries import fetch_l1
+
+    with _patch_sql() as mock_sql:
+        fetch_l1("2026-02-23")
+
+    mock_sql.assert_called_once()
+    assert list(mock_sql.call_args.args[0]) == ["orders", "platforms"]
+
+
+def test_build_plan_merges_same_table_windows():
+    from vibe_inc.roles.d2c_growth.daily_report_queries import build_plan
+
+    merged = build_plan("2026-02-23")
+    split = build_plan("2026-02-23", merge=False)
+    assert [q.name for q in merged] == [
+        "orders", "platforms", "sessions", "funnel", "amazon", "worst_cpa_campaigns",
+    ]
+    assert len(split) == 11
+    orders = merged[0]
+    assert orders.sql.count("FROM common.fct_order") == 1
+    assert (
+        "SUM(CASE WHEN created_at >= %s AND created_at < %s THEN net_sales END) / 28.0"
+        " AS w28__total_revenue_avg"
+    ) in orders.sql
+    assert orders.sql.count("%s") == len(orders.params)
+
+
+def _load_sqlite(conn):
+    conn.execute("ATTACH DATABASE ':memory:' AS common")
+    conn.executescript("""
+        CREATE TABLE common.fct_order (created_at TEXT, board_net_sales REAL, bot_net_sales REAL, net_sales REAL);
+        CREATE TABLE common.fct_ads_ad_metrics (date TEXT, platform TEXT, dim_ads_campaign_sk TEXT,
+            spend_in_usd REAL, impressions INT, clicks INT, purchase_count INT);
+        CREATE TABLE common.dim_ads_campaign (dim_ads_campaign_sk TEXT, campaign_name TEXT);
+        CREATE TABLE common.fct_ads_amazon_ad_group_metrics (date TEXT, channel TEXT, spend_in_usd REAL,
+            impressions INT, clicks INT, conversions14d INT, sales14d REAL);
+        CREATE TABLE common.fct_website_session (session_first_page_tstamp TEXT, session_traffic_channel TEXT,
+            session_page_viewed INT, session_time_engaged_in_s REAL);
+        CREATE TABLE common.fct_website_visitor_conversion (original_tstamp TEXT, conversion TEXT,
+            conversion_value REAL);
+    """)
+    from vibe_inc.roles.d2c_growth.daily_report_queries import _rolling_window
+    day = "2026-02-23"
+    in_7d = _rolling_window(7)[1]
+    conn.executemany("INSERT INTO common.fct_order VALUES (?, ?, ?, ?)", [
+        (f"{day} 10:00:00", 100, 0, 100), (f"{in_7d} 09:00:00", 0, 50, 50),
+    ])
+    conn.executemany("INSERT INTO common.fct_ads_ad_metrics VALUES (?, ?, ?, ?, ?, ?, ?)", [
+        (day, "facebook", "c1", 40, 1000, 10, 2), (in_7d, "google", "c2", 70, 2000, 20, 0),
+    ])
+    conn.execute("INSERT INTO common.dim_ads_campaign VALUES ('c1', 'Brand')")
+    conn.executemany("INSERT INTO common.fct_website_visitor_conversion VALUES (?, ?, ?)", [
+        (f"{day} 11:00:00", "visitor_close_won", 300), (f"{in_7d} 11:00:00", "visitor_add_to_cart", 0),
+    ])
+
+
+def _sqlite_execute(conn):
+    def execute(queries):
+        out = {}
+        for name, (sql, params) in queries.items():
+            cur = conn.execute(sql.replace("%s", "?"), params)
+            cols = [d[0] for d in cur.description]
+            out[name] = {"rows": [dict(zip(cols, row)) for row in cur.fetchall()], "columns": cols}
+        return out
+    return execute
+
+
+def test_merged_plan_matches_per_window_queries_on_sqlite():
+    import sqlite3
+    from vibe_inc.roles.d2c_growth.daily_report_queries import build_plan, run_plan
+
+    conn = sqlite3.connect(":memory:")
+    _load_sqlite(conn)
+    merged = run_plan(build_plan("2026-02-23"), _sqlite_execute(conn))
+    split = run_plan(build_plan("2026-02-23", merge=False), _sqlite_execute(conn))
+
+    assert merged == split
+    assert merged["l1"]["yesterday"][0]["total_revenue"] == 100
+    assert merged["l1"]["ad_spend"] == [{"total_spend": 40}]
+    assert [r["platform"] for r in merged["l2"]["yesterday"]] == ["facebook"]
+    assert [r["platform"] for r in merged["l2"]["avg_7d"]] == ["google"]
+    assert merged["l2"]["worst_cpa_campaigns"][0]["campaign_name"] == "Brand"
+    assert merged["l3"]["sessions_yesterday"] == []
+    assert merged["l3"]["funnel_7d"][0]["conversion"] == "visitor_add_to_cart"
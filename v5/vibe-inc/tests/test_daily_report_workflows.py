@@ -25,8 +25,8 @@ def test_daily_growth_report_graph_invokes_end_to_end():
     op = DailyReportOps(llm=FakeLLM())
     graph = create_daily_growth_report_graph(op)
 
-    with patch("vibe_inc.roles.d2c_growth.daily_report_queries.analytics_query_sql",
-               return_value={"rows": [], "columns": []}):
+    with patch("vibe_inc.roles.d2c_growth.daily_report_queries.analytics_query_sql_group",
+               side_effect=lambda queries, **kwargs: {name: {"rows": [], "columns": []} for name in queries}):
         result = graph.invoke({"date": "2026-02-23"})
 
     assert "report" in result
@@ -40,8 +40,8 @@ def test_daily_growth_report_state_contains_layer_data():
     op = DailyReportOps(llm=FakeLLM())
     graph = create_daily_growth_report_graph(op)
 
-    with patch("vibe_inc.roles.d2c_growth.daily_report_queries.analytics_query_sql",
-               return_value={"rows": [{"x": 1}], "columns": ["x"]}):
+    with patch("vibe_inc.roles.d2c_growth.daily_report_queries.analytics_query_sql_group",
+               side_effect=lambda queries, **kwargs: {name: {"rows": [{"x": 1}], "columns": ["x"]} for name in queries}):
         result = graph.invoke({"date": "2026-02-23"})
 
     assert "l1_data" in result
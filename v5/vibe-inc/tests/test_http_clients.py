@@ -0,0 +1,88 @@
+"""Tests for the shared per-provider HTTP client registry."""
+import asyncio
+
+import httpx
+
+
+def _registry(handler):
+    from vibe_inc.tools.http_clients import HttpClientRegistry
+    return HttpClientRegistry(transport=httpx.MockTransport(handler), http2=False)
+
+
+def test_provider_reuses_one_pooled_client():
+    from vibe_inc.tools.http_clients import ProviderHTTP
+
+    registry = _registry(lambda request: httpx.Response(200, json={"ok": True}))
+    http = ProviderHTTP("hubspot", registry=registry)
+    first = registry.client("hubspot")
+
+    assert http.get("https://api.example.com/a").json() == {"ok": True}
+    http.post("https://api.example.com/b", json={})
+    assert registry.client("hubspot") is first
+    assert registry.client("klaviyo") is not first
+
+
+def test_retries_429_honouring_retry_after(monkeypatch):
+    from vibe_inc.tools import http_clients
+
+    sleeps = []
+    monkeypatch.setattr(http_clients.time, "sleep", sleeps.append)
+    statuses = iter([429, 200])
+    registry = _registry(
+        lambda request: httpx.Response(next(statuses), headers={"Retry-After": "2"})
+    )
+    resp = http_clients.ProviderHTTP("tiktok_ads", registry=registry).post(
+        "https://api.example.com/report", json={}
+    )
+    assert resp.status_code == 200
+    assert sleeps == [2.0]
+
+
+def test_5xx_retried_only_for_idempotent_methods(monkeypatch):
+    from vibe_inc.tools import http_clients
+
+    monkeypatch.setattr(http_clients.time, "sleep", lambda s: None)
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(503)
+
+    http = http_clients.ProviderHTTP("shopify", registry=_registry(handler), max_retries=2)
+    assert http.get("https://shop.example.com/orders").status_code == 503
+    assert calls == ["GET"] * 3
+
+    calls.clear()
+    assert http.post("https://shop.example.com/orders").status_code == 503
+    assert calls == ["POST"]
+
+
+def test_async_request_uses_async_client():
+    from vibe_inc.tools.http_clients import ProviderHTTP
+
+    registry = _registry(lambda request: httpx.Response(200, text="pong"))
+    http = ProviderHTTP("web", registry=registry)
+
+    async def run():
+        resp = await http.aget("https://example.com/ping")
+        await registry.aclose()
+        return resp.text
+
+    assert asyncio.run(run()) == "pong"
+    assert len(registry) == 0
+
+
+def test_runtime_close_closes_shared_clients():
+    from openvibe_sdk.llm import LLMResponse
+    from vibe_inc.main import create_runtime
+    from vibe_inc.tools.http_clients import get_registry
+
+    class FakeLLM:
+        def call(self, *, system, messages, **kwargs):
+            return LLMResponse(content="ok")
+
+    client = get_registry().client("hubspot")
+    with create_runtime(llm=FakeLLM()):
+        pass
+    assert client.is_closed
+    assert get_registry().client("hubspot") is not client
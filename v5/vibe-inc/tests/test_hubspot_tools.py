@@ -28,7 +28,7 @@ def test_hubspot_contact_get_by_email():
         ],
     })
 
-    with patch("vibe_inc.tools.crm.hubspot.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.crm.hubspot._http") as mock_httpx, \
          patch("vibe_inc.tools.crm.hubspot._get_headers", return_value={"Authorization": "Bearer test"}):
         mock_httpx.post.return_value = mock_resp
         result = hubspot_contact_get(email="buyer@acme.com")
@@ -54,7 +54,7 @@ def test_hubspot_contact_update_sends_patch():
         "properties": {"lifecyclestage": "opportunity"},
     })
 
-    with patch("vibe_inc.tools.crm.hubspot.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.crm.hubspot._http") as mock_httpx, \
          patch("vibe_inc.tools.crm.hubspot._get_headers", return_value={"Authorization": "Bearer test"}):
         mock_httpx.patch.return_value = mock_resp
         result = hubspot_contact_update(
@@ -78,7 +78,7 @@ def test_hubspot_deals_list_returns_deals():
         ],
     })
 
-    with patch("vibe_inc.tools.crm.hubspot.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.crm.hubspot._http") as mock_httpx, \
          patch("vibe_inc.tools.crm.hubspot._get_headers", return_value={"Authorization": "Bearer test"}):
         mock_httpx.get.return_value = mock_assoc_resp
         result = hubspot_deals_list(contact_id="501")
@@ -101,7 +101,7 @@ def test_hubspot_deal_create_posts_with_association():
         },
     })
 
-    with patch("vibe_inc.tools.crm.hubspot.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.crm.hubspot._http") as mock_httpx, \
          patch("vibe_inc.tools.crm.hubspot._get_headers", return_value={"Authorization": "Bearer test"}):
         mock_httpx.post.return_value = mock_resp
         result = hubspot_deal_create(
@@ -126,7 +126,7 @@ def test_hubspot_deal_update_patches_stage():
         "properties": {"dealstage": "mql"},
     })
 
-    with patch("vibe_inc.tools.crm.hubspot.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.crm.hubspot._http") as mock_httpx, \
          patch("vibe_inc.tools.crm.hubspot._get_headers", return_value={"Authorization": "Bearer test"}):
         mock_httpx.patch.return_value = mock_resp
         result = hubspot_deal_update(
@@ -145,7 +145,7 @@ def test_hubspot_workflow_enroll_posts_enrollment():
     mock_resp = _mock_response({})
     mock_resp.status_code = 204
 
-    with patch("vibe_inc.tools.crm.hubspot.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.crm.hubspot._http") as mock_httpx, \
          patch("vibe_inc.tools.crm.hubspot._get_headers", return_value={"Authorization": "Bearer test"}):
         mock_httpx.post.return_value = mock_resp
         result = hubspot_workflow_enroll(
@@ -19,7 +19,7 @@ def test_klaviyo_campaigns_returns_list():
         ],
     })
 
-    with patch("vibe_inc.tools.commerce.klaviyo.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.commerce.klaviyo._http") as mock_httpx, \
          patch("vibe_inc.tools.commerce.klaviyo._get_headers", return_value={"Authorization": "Klaviyo-API-Key test"}):
         mock_httpx.get.return_value = mock_resp
         result = klaviyo_campaigns()
@@ -45,7 +45,7 @@ def test_klaviyo_flows_returns_list():
         ],
     })
 
-    with patch("vibe_inc.tools.commerce.klaviyo.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.commerce.klaviyo._http") as mock_httpx, \
          patch("vibe_inc.tools.commerce.klaviyo._get_headers", return_value={"Authorization": "Klaviyo-API-Key test"}):
         mock_httpx.get.return_value = mock_resp
         result = klaviyo_flows()
@@ -65,7 +65,7 @@ def test_klaviyo_segments_returns_list():
         ],
     })
 
-    with patch("vibe_inc.tools.commerce.klaviyo.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.commerce.klaviyo._http") as mock_httpx, \
          patch("vibe_inc.tools.commerce.klaviyo._get_headers", return_value={"Authorization": "Klaviyo-API-Key test"}):
         mock_httpx.get.return_value = mock_resp
         result = klaviyo_segments()
@@ -85,7 +85,7 @@ def test_klaviyo_metrics_returns_data():
         ],
     })
 
-    with patch("vibe_inc.tools.commerce.klaviyo.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.commerce.klaviyo._http") as mock_httpx, \
          patch("vibe_inc.tools.commerce.klaviyo._get_headers", return_value={"Authorization": "Klaviyo-API-Key test"}):
         mock_httpx.get.return_value = mock_resp
         result = klaviyo_metrics()
@@ -105,7 +105,7 @@ def test_klaviyo_profiles_returns_list():
         ],
     })
 
-    with patch("vibe_inc.tools.commerce.klaviyo.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.commerce.klaviyo._http") as mock_httpx, \
          patch("vibe_inc.tools.commerce.klaviyo._get_headers", return_value={"Authorization": "Klaviyo-API-Key test"}):
         mock_httpx.get.return_value = mock_resp
         result = klaviyo_profiles()
@@ -125,7 +125,7 @@ def test_klaviyo_catalogs_returns_items():
         ],
     })
 
-    with patch("vibe_inc.tools.commerce.klaviyo.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.commerce.klaviyo._http") as mock_httpx, \
          patch("vibe_inc.tools.commerce.klaviyo._get_headers", return_value={"Authorization": "Klaviyo-API-Key test"}):
         mock_httpx.get.return_value = mock_resp
         result = klaviyo_catalogs()
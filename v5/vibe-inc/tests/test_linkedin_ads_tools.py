@@ -20,7 +20,7 @@ def test_linkedin_ads_analytics_returns_rows():
         ],
     })
 
-    with patch("vibe_inc.tools.ads.linkedin_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.linkedin_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.linkedin_ads._get_headers", return_value={"Authorization": "Bearer test"}), \
          patch("vibe_inc.tools.ads.linkedin_ads._get_account_id", return_value="12345"):
         mock_httpx.get.return_value = mock_resp
@@ -50,7 +50,7 @@ def test_linkedin_ads_campaigns_returns_list():
         ],
     })
 
-    with patch("vibe_inc.tools.ads.linkedin_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.linkedin_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.linkedin_ads._get_headers", return_value={"Authorization": "Bearer test"}), \
          patch("vibe_inc.tools.ads.linkedin_ads._get_account_id", return_value="12345"):
         mock_httpx.get.return_value = mock_resp
@@ -69,7 +69,7 @@ def test_linkedin_ads_create_returns_id():
         headers={"x-restli-id": "new_camp_789"},
     )
 
-    with patch("vibe_inc.tools.ads.linkedin_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.linkedin_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.linkedin_ads._get_headers", return_value={"Authorization": "Bearer test"}), \
          patch("vibe_inc.tools.ads.linkedin_ads._get_account_id", return_value="12345"):
         mock_httpx.post.return_value = mock_resp
@@ -90,7 +90,7 @@ def test_linkedin_ads_update_returns_result():
 
     mock_resp = _mock_response()
 
-    with patch("vibe_inc.tools.ads.linkedin_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.linkedin_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.linkedin_ads._get_headers", return_value={"Authorization": "Bearer test"}):
         mock_httpx.post.return_value = mock_resp
         result = linkedin_ads_update(
@@ -113,7 +113,7 @@ def test_linkedin_ads_audiences_returns_list():
         ],
     })
 
-    with patch("vibe_inc.tools.ads.linkedin_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.linkedin_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.linkedin_ads._get_headers", return_value={"Authorization": "Bearer test"}), \
          patch("vibe_inc.tools.ads.linkedin_ads._get_account_id", return_value="12345"):
         mock_httpx.get.return_value = mock_resp
@@ -133,7 +133,7 @@ def test_linkedin_ads_conversions_returns_data():
         ],
     })
 
-    with patch("vibe_inc.tools.ads.linkedin_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.linkedin_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.linkedin_ads._get_headers", return_value={"Authorization": "Bearer test"}), \
          patch("vibe_inc.tools.ads.linkedin_ads._get_account_id", return_value="12345"):
         mock_httpx.get.return_value = mock_resp
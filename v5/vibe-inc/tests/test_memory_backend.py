@@ -0,0 +1,110 @@
+"""Tests for the transactional shared_memory backend."""
+import multiprocessing
+import threading
+from pathlib import Path
+
+import pytest
+
+from vibe_inc.tools import memory_backend
+from vibe_inc.tools.memory_backend import FileMemoryBackend, VersionConflict
+from vibe_inc.tools.shared_memory import memory_version, read_memory, write_memory
+
+
+@pytest.fixture(autouse=True)
+def _close_backends():
+    yield
+    memory_backend.close_backends()
+
+
+def _increment(memory_dir: str, n: int) -> None:
+    backend = FileMemoryBackend(Path(memory_dir))
+    for _ in range(n):
+        backend.update("performance/counter.yaml", lambda d: {"count": d.get("count", 0) + 1})
+    backend.close()
+
+
+def test_compare_and_swap_versions(tmp_path):
+    assert write_memory("performance/meta_weekly.yaml", {"spend": 1}, memory_dir=tmp_path)["version"] == 1
+    version = memory_version("performance/meta_weekly.yaml", memory_dir=tmp_path)
+    assert write_memory("performance/meta_weekly.yaml", {"spend": 2}, memory_dir=tmp_path,
+                        expected_version=version) == {"written": True, "path": "performance/meta_weekly.yaml", "version": 2}
+
+    stale = write_memory("performance/meta_weekly.yaml", {"spend": 3}, memory_dir=tmp_path, expected_version=version)
+    assert stale["written"] is False and stale["version"] == 2
+    assert read_memory("performance/meta_weekly.yaml", memory_dir=tmp_path) == {"spend": 2}
+
+    with pytest.raises(VersionConflict):
+        memory_backend.get_backend(tmp_path).write("performance/new.yaml", {}, expected_version=3)
+    assert "error" in write_memory("../outside.yaml", {}, memory_dir=tmp_path)
+
+
+def test_change_log_and_history(tmp_path):
+    backend = memory_backend.get_backend(tmp_path)
+    backend.write("performance/meta_weekly.yaml", {"spend": 1}, writer="meta_ad_ops")
+    backend.write("catalog.yaml", {"bot": 999})
+    backend.write("performance/meta_weekly.yaml", {"spend": 2}, writer="cross_platform_ops")
+
+    changes = backend.changes()
+    assert [(c.key, c.version) for c in changes] == [
+        ("performance/meta_weekly.yaml", 1), ("catalog.yaml", 1), ("performance/meta_weekly.yaml", 2),
+    ]
+    assert [c.seq for c in backend.changes(since=changes[0].seq, pattern="performance/*")] == [changes[2].seq]
+    history = backend.history("performance/meta_weekly.yaml")
+    assert [(h["version"], h["writer"], h["data"]) for h in history] == [
+        (2, "cross_platform_ops", {"spend": 2}), (1, "meta_ad_ops", {"spend": 1}),
+    ]
+    assert backend.read("./performance/meta_weekly.yaml") == ({"spend": 2}, 2)
+
+
+def test_concurrent_updates_do_not_lose_writes(tmp_path):
+    backend = memory_backend.get_backend(tmp_path)
+    threads = [
+        threading.Thread(target=lambda: [
+            backend.update("performance/counter.yaml", lambda d: {"count": d.get("count", 0) + 1})
+            for _ in range(25)
+        ])
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert backend.read("performance/counter.yaml") == ({"count": 100}, 100)
+
+
+def test_worker_processes_share_locks_and_versions(tmp_path):
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_increment, args=(str(tmp_path), 10)) for _ in range(3)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join(timeout=60)
+    assert [w.exitcode for w in workers] == [0, 0, 0]
+
+    assert FileMemoryBackend(tmp_path).read("performance/counter.yaml") == ({"count": 30}, 30)
+
+
+def test_subscribe_sees_local_and_other_process_writes(tmp_path):
+    backend = FileMemoryBackend(tmp_path, poll_interval=0.01)
+    other = FileMemoryBackend(tmp_path)  # a separate connection, as another worker process would have
+    seen, done = [], threading.Event()
+
+    def on_change(change):
+        seen.append((change.key, change.version))
+        if len(seen) == 2:
+            done.set()
+
+    subscription = backend.subscribe("performance/*.yaml", on_change)
+    backend.write("performance/google_weekly.yaml", {"spend": 1})
+    other.write("catalog.yaml", {"bot": 999})  # not matched
+    other.write("performance/meta_weekly.yaml", {"spend": 2})
+    assert done.wait(5)
+    assert seen == [("performance/google_weekly.yaml", 1), ("performance/meta_weekly.yaml", 1)]
+
+    subscription.close()
+    other.write("performance/meta_weekly.yaml", {"spend": 3})
+    assert backend.changes(pattern="performance/meta_weekly.yaml")[-1].version == 2
+    backend.close()
+    other.close()
+    assert len(seen) == 2
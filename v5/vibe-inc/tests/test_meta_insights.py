@@ -0,0 +1,168 @@
+"""Tests for bulk Meta Insights extraction (async report runs + incremental store)."""
+import threading
+import time
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from vibe_inc.tools.ads import meta_insights
+from vibe_inc.tools.ads.meta_insights import (
+    InsightsStore,
+    date_slices,
+    extract_daily,
+    resolve_range,
+)
+from vibe_inc.tools.ads.report_jobs import Backoff
+
+_FAST = Backoff(initial=0.001, factor=2.0, max_interval=0.01, timeout=5.0, jitter=0.0)
+
+
+class _FakeRun(dict):
+    """AdReportRun stand-in: completes after `polls` status checks."""
+
+    def __init__(self, run_id, rows, polls=1, final="Job Completed"):
+        super().__init__()
+        self.run_id = run_id
+        self.rows = rows
+        self.remaining = polls
+        self.final = final
+
+    def get_id(self):
+        return self.run_id
+
+    def api_get(self, fields=None):
+        self.remaining -= 1
+        self["async_status"] = self.final if self.remaining <= 0 else "Job Running"
+        self["async_percent_completion"] = 100 if self.remaining <= 0 else 50
+        return self
+
+    def get_result(self, params=None):
+        assert params == {"limit": meta_insights.PAGE_LIMIT}
+        return iter(self.rows)
+
+
+class _FakeAccount:
+    """AdAccount stand-in: two ads, one row per ad per day."""
+
+    def __init__(self, fail_since=None):
+        self.calls = []
+        self.fail_since = fail_since
+        self._lock = threading.Lock()
+
+    def get_id(self):
+        return "act_1"
+
+    def get_insights(self, fields, params, is_async=False):
+        assert is_async and params["time_increment"] == 1
+        since = date.fromisoformat(params["time_range"]["since"])
+        until = date.fromisoformat(params["time_range"]["until"])
+        with self._lock:
+            self.calls.append((since, until))
+        rows = []
+        day = since
+        while day <= until:
+            for ad in ("a1", "a2"):
+                rows.append({"date_start": day.isoformat(), "ad_id": ad, "spend": "1.5", "ctr": "0.8"})
+            day += timedelta(days=1)
+        final = "Job Failed" if since == self.fail_since else "Job Completed"
+        return _FakeRun(f"run-{since}", rows, final=final)
+
+
+@pytest.fixture(autouse=True)
+def _fast_polling():
+    with patch.object(meta_insights, "INSIGHTS_BACKOFF", _FAST):
+        yield
+    meta_insights._runs.invalidate()
+
+
+def test_resolve_range_presets_end_yesterday():
+    today = date(2026, 3, 15)
+    assert resolve_range("last_7d", today) == (date(2026, 3, 8), date(2026, 3, 14))
+    assert resolve_range("yesterday", today) == (date(2026, 3, 14), date(2026, 3, 14))
+    assert resolve_range("2026-02-01, 2026-02-03", today) == (date(2026, 2, 1), date(2026, 2, 3))
+    assert resolve_range("this_month", today) is None
+
+
+def test_date_slices_split_gaps_and_long_runs():
+    d = date(2026, 3, 1)
+    days = [d + timedelta(days=i) for i in (0, 1, 2, 3, 4, 7, 8)]
+    assert date_slices(days, 3) == [
+        (d, d + timedelta(days=2)),
+        (d + timedelta(days=3), d + timedelta(days=4)),
+        (d + timedelta(days=7), d + timedelta(days=8)),
+    ]
+
+
+def test_extract_daily_slices_runs_and_buffers_columns():
+    account = _FakeAccount()
+    store = InsightsStore()
+    start, end = date(2026, 1, 1), date(2026, 1, 14)
+
+    extraction = extract_daily(account, "ad", ["spend", "ctr"], start, end, store=store)
+
+    assert sorted(account.calls) == [(date(2026, 1, 1), date(2026, 1, 7)), (date(2026, 1, 8), date(2026, 1, 14))]
+    assert extraction.runs == 2 and len(extraction.fetched_days) == 14
+    result = extraction.result
+    assert result.columns == ["date_start", "ad_id", "spend", "ctr"]
+    assert len(result) == 28
+    assert result.column("date_start")[0] == "2026-01-01"
+    assert result.column("date_start")[-1] == "2026-01-14"
+
+
+def test_settled_days_come_from_the_store():
+    account = _FakeAccount()
+    store = InsightsStore()
+    start, end = date(2026, 1, 1), date(2026, 1, 14)
+    extract_daily(account, "ad", ["spend"], start, end, store=store)
+    account.calls.clear()
+
+    again = extract_daily(account, "ad", ["spend"], start, end - timedelta(days=2), store=store)
+    assert account.calls == []
+    assert again.fetched_days == [] and len(again.result) == 24
+
+    wider = extract_daily(account, "ad", ["spend"], start, end + timedelta(days=3), store=store)
+    assert account.calls == [(date(2026, 1, 15), date(2026, 1, 17))]
+    assert len(wider.result) == 34
+
+
+def test_recent_days_refetched_once_refresh_interval_passes():
+    store = InsightsStore()
+    today = date.today()
+    recent, old = today - timedelta(days=2), today - timedelta(days=30)
+    result = meta_insights.ColumnarResult(["date_start", "ad_id", "spend"])
+    now = time.time()
+    store.save("act_1", "ad", ["spend"], result, [recent, old], fetched_at=now)
+
+    assert store.stale_days("act_1", "ad", ["spend"], recent, recent, now=now + 60) == []
+    later = now + meta_insights.REFRESH_SECONDS + 1
+    assert store.stale_days("act_1", "ad", ["spend"], recent, recent, now=later) == [recent]
+    assert store.stale_days("act_1", "ad", ["spend"], old, old, now=later) == []
+
+
+def test_failed_run_raises_but_keeps_good_slices():
+    account = _FakeAccount(fail_since=date(2026, 1, 8))
+    store = InsightsStore()
+    with pytest.raises(RuntimeError, match="Job Failed"):
+        extract_daily(account, "ad", ["spend"], date(2026, 1, 1), date(2026, 1, 14), store=store)
+    stale = store.stale_days("act_1", "ad", ["spend"], date(2026, 1, 1), date(2026, 1, 14))
+    assert stale == [date(2026, 1, 8) + timedelta(days=i) for i in range(7)]
+
+
+def test_meta_ads_read_daily_uses_bulk_extraction(tmp_path, monkeypatch):
+    from vibe_inc.tools.ads.meta_ads import meta_ads_read
+
+    monkeypatch.setenv("META_INSIGHTS_STORE_PATH", str(tmp_path / "insights.sqlite"))
+    meta_insights.reset_store()
+    account = _FakeAccount()
+    try:
+        with patch("vibe_inc.tools.ads.meta_ads._get_account", return_value=account):
+            first = meta_ads_read(level="ad", date_range="2026-01-01,2026-01-03", fields=["spend"], daily=True)
+            second = meta_ads_read(level="ad", date_range="2026-01-01,2026-01-03", fields=["spend"], daily=True)
+    finally:
+        meta_insights.reset_store()
+
+    assert first["fetched_days"] == 3 and second["fetched_days"] == 0
+    assert first["rows"] == second["rows"]
+    assert first["rows"][0] == {"date_start": "2026-01-01", "ad_id": "a1", "spend": "1.5"}
+    assert len(account.calls) == 1
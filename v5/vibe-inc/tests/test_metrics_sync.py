@@ -0,0 +1,203 @@
+"""Tests for the incremental ad-metrics sync engine and its local store."""
+import time
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from vibe_inc.tools.ads import metrics_store, metrics_sync
+from vibe_inc.tools.ads.metrics_store import MetricsStore, normalize_row
+from vibe_inc.tools.ads.metrics_sync import days_to_sync, sync_platform, sync_platforms
+
+TODAY = date(2026, 3, 20)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_store(monkeypatch):
+    monkeypatch.delenv("AD_METRICS_STORE_PATH", raising=False)
+    monkeypatch.delenv("AD_SYNC_LOOKBACK_DAYS", raising=False)
+    metrics_store.reset_store()
+    yield
+    metrics_store.reset_store()
+
+
+def _days(start: date, end: date) -> list[date]:
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+class _FakeFetcher:
+    """Two campaigns per day; records each (start, end) requested."""
+
+    def __init__(self, platform: str, spend: float = 10.0):
+        self.platform = platform
+        self.spend = spend
+        self.calls = []
+
+    def __call__(self, start: date, end: date) -> list[dict]:
+        self.calls.append((start, end))
+        return [
+            normalize_row(self.platform, day, cid, f"Campaign {cid}", spend=self.spend,
+                          impressions=1000, clicks=20, conversions=2, revenue=50)
+            for day in _days(start, end)
+            for cid in ("c1", "c2")
+        ]
+
+
+def test_store_sums_measures_and_derives_ratios():
+    store = MetricsStore()
+    rows = [
+        normalize_row("meta", "2026-03-01", "c1", spend="30", impressions=1000, clicks=10, conversions=3, revenue=90),
+        normalize_row("meta", "2026-03-02", "c1", spend=10, impressions=1000, clicks=30, conversions=1, revenue=10),
+        normalize_row("google", "2026-03-01", 7, spend=5, impressions=0, clicks=0, conversions=0, revenue=0),
+    ]
+    store.replace_days("meta", [date(2026, 3, 1), date(2026, 3, 2)], rows)
+    store.replace_days("google", [date(2026, 3, 1)], rows)
+
+    by_platform = {r["platform"]: r for r in store.query(date(2026, 3, 1), date(2026, 3, 2))}
+    meta = by_platform["meta"]
+    assert meta["spend"] == 40 and meta["conversions"] == 4
+    assert meta["cpa"] == 10.0 and meta["roas"] == 2.5 and meta["ctr"] == 2.0 and meta["cpc"] == 1.0
+    assert by_platform["google"]["cpa"] is None and by_platform["google"]["spend"] == 5
+
+    daily = store.query(date(2026, 3, 1), date(2026, 3, 2), ["meta"], group_by=("date",))
+    assert [r["date"] for r in daily] == ["2026-03-01", "2026-03-02"]
+    with pytest.raises(ValueError):
+        store.query(date(2026, 3, 1), date(2026, 3, 2), group_by=("spend",))
+
+
+def test_replace_days_overwrites_restated_rows():
+    store = MetricsStore()
+    day = date(2026, 3, 1)
+    store.replace_days("meta", [day], [normalize_row("meta", day, "c1", spend=10, conversions=1)])
+    store.replace_days("meta", [day], [normalize_row("meta", day, "c1", spend=10, conversions=3)])
+    (row,) = store.query(day, day)
+    assert row["conversions"] == 3
+    store.replace_days("meta", [day], [])
+    assert store.query(day, day) == []
+    assert day in store.watermarks("meta", day, day)
+
+
+def test_days_to_sync_uses_watermark_and_lookback():
+    store = MetricsStore()
+    start, end = TODAY - timedelta(days=20), TODAY - timedelta(days=1)
+    now = time.time()
+    assert days_to_sync(store, "meta", start, end, today=TODAY, now=now) == _days(start, end)
+
+    store.replace_days("meta", _days(start, end), [], synced_at=now)
+    assert days_to_sync(store, "meta", start, end, today=TODAY, now=now + 60) == []
+
+    later = now + metrics_sync.REFRESH_SECONDS + 1
+    assert days_to_sync(store, "meta", start, end, today=TODAY, now=later) == _days(TODAY - timedelta(days=7), end)
+    store.replace_days("amazon", _days(start, end), [], synced_at=now)
+    assert days_to_sync(store, "amazon", start, end, today=TODAY, now=later) == _days(TODAY - timedelta(days=14), end)
+
+
+def test_lookback_override_from_env(monkeypatch):
+    monkeypatch.setenv("AD_SYNC_LOOKBACK_DAYS", "3")
+    assert metrics_sync.lookback_days("amazon") == 3
+
+
+def test_sync_platform_fetches_only_missing_days():
+    store = MetricsStore()
+    fetch = _FakeFetcher("tiktok")
+    start = TODAY - timedelta(days=40)
+    with patch.dict(metrics_sync.FETCHERS, {"tiktok": fetch}):
+        first = sync_platform("tiktok", start, TODAY - timedelta(days=30), store=store, today=TODAY)
+        second = sync_platform("tiktok", start, TODAY - timedelta(days=20), store=store, today=TODAY)
+
+    assert first == {"days_synced": 11, "rows": 22}
+    assert second == {"days_synced": 10, "rows": 20}
+    assert fetch.calls == [
+        (start, TODAY - timedelta(days=30)),
+        (TODAY - timedelta(days=29), TODAY - timedelta(days=20)),
+    ]
+
+
+def test_sync_platforms_isolates_failures():
+    store = MetricsStore()
+    good = _FakeFetcher("meta")
+
+    def broken(start, end):
+        raise RuntimeError("token expired")
+
+    day = TODAY - timedelta(days=30)
+    with patch.dict(metrics_sync.FETCHERS, {"meta": good, "google": broken}):
+        result = sync_platforms(["meta", "google", "myspace"], day, day, store=store, today=TODAY)
+
+    assert result["meta"] == {"days_synced": 1, "rows": 2}
+    assert "token expired" in result["google"]["error"]
+    assert result["myspace"] == {"error": "Unknown platform"}
+    assert store.watermarks("google", day, day) == {}
+
+
+def test_tiktok_fetcher_pages_and_normalizes():
+    pages = [
+        {"code": 0, "data": {"page_info": {"total_page": 2}, "list": [
+            {"dimensions": {"campaign_id": "1", "stat_time_day": "2026-03-01 00:00:00"},
+             "metrics": {"campaign_name": "Bot", "spend": "12.5", "impressions": "100", "clicks": "4",
+                         "conversion": "1", "total_complete_payment_rate": "80"}},
+        ]}},
+        {"code": 0, "data": {"page_info": {"total_page": 2}, "list": [
+            {"dimensions": {"campaign_id": "2", "stat_time_day": "2026-03-01 00:00:00"},
+             "metrics": {"spend": "1", "impressions": "10", "clicks": "0", "conversion": "0"}},
+        ]}},
+    ]
+    http = MagicMock()
+    http.post.side_effect = [MagicMock(json=MagicMock(return_value=p)) for p in pages]
+    with patch("vibe_inc.tools.ads.tiktok_ads._http", http), \
+         patch("vibe_inc.tools.ads.tiktok_ads._get_headers", return_value={}), \
+         patch("vibe_inc.tools.ads.tiktok_ads._get_advertiser_id", return_value="adv"):
+        rows = metrics_sync._fetch_tiktok(date(2026, 3, 1), date(2026, 3, 1))
+
+    assert [call.kwargs["json"]["page"] for call in http.post.call_args_list] == [1, 2]
+    assert rows[0] == {
+        "platform": "tiktok", "date": "2026-03-01", "campaign_id": "1", "campaign_name": "Bot",
+        "spend": 12.5, "impressions": 100.0, "clicks": 4.0, "conversions": 1.0, "revenue": 80.0,
+    }
+    assert rows[1]["revenue"] == 0.0
+
+
+def test_meta_fetcher_counts_purchases_once():
+    account = MagicMock()
+    account.get_insights.return_value = [{
+        "date_start": "2026-03-01", "campaign_id": "9", "campaign_name": "Dot",
+        "spend": "40", "impressions": "2000", "clicks": "50",
+        "actions": [{"action_type": "link_click", "value": "50"},
+                    {"action_type": "offsite_conversion.fb_pixel_purchase", "value": "2"},
+                    {"action_type": "purchase", "value": "2"}],
+        "action_values": [{"action_type": "purchase", "value": "598"}],
+    }]
+    with patch("vibe_inc.tools.ads.meta_ads._get_account", return_value=account):
+        (row,) = metrics_sync._fetch_meta(date(2026, 3, 1), date(2026, 3, 1))
+
+    assert row["conversions"] == 2 and row["revenue"] == 598
+    assert account.get_insights.call_args.kwargs["params"]["time_increment"] == 1
+
+
+def test_unified_metrics_read_ranks_from_store():
+    from vibe_inc.tools.ads.unified_metrics import unified_metrics_read
+
+    fetchers = {"meta": _FakeFetcher("meta", spend=10), "google": _FakeFetcher("google", spend=30)}
+    with patch.dict(metrics_sync.FETCHERS, fetchers):
+        result = unified_metrics_read(platforms=["meta", "google"], date_range="2026-03-01,2026-03-07")
+        again = unified_metrics_read(platforms=["meta", "google"], date_range="2026-03-01,2026-03-07", metric="roas")
+
+    assert result["platforms"]["meta"]["spend"] == 140.0
+    assert result["platforms"]["meta"]["cpa"] == 5.0
+    assert result["ranking"] == ["meta", "google"]
+    assert result["totals"]["spend"] == 560.0
+    assert again["ranking"] == ["meta", "google"]
+    assert len(fetchers["meta"].calls) == 1  # second read answered from the store
+
+
+def test_ad_metrics_read_groups_and_reports_bad_input():
+    from vibe_inc.tools.ads.metrics_sync import ad_metrics_read
+
+    with patch.dict(metrics_sync.FETCHERS, {"pinterest": _FakeFetcher("pinterest")}):
+        result = ad_metrics_read(platforms=["pinterest"], date_range="2026-03-01,2026-03-02",
+                                 group_by="date,campaign_id")
+
+    assert len(result["rows"]) == 4
+    assert result["rows"][0]["campaign_name"] == "Campaign c1"
+    assert result["sync"]["pinterest"]["days_synced"] == 2
+    assert "error" in ad_metrics_read(date_range="this_month")
@@ -21,7 +21,7 @@ def test_query_metrics_calls_insights_api():
     mock_response.json.return_value = {"results": {"values": {"event": {"2026-02-19": 100}}}}
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response) as mock_get:
+    with patch("vibe_inc.tools.analytics.mixpanel._http.get", return_value=mock_response) as mock_get:
         result = provider.query_metrics(metrics=["event_count"], date_range="last_7d")
 
     assert "results" in result
@@ -44,7 +44,7 @@ def test_query_funnel_calls_funnels_api():
     }
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response) as mock_get:
+    with patch("vibe_inc.tools.analytics.mixpanel._http.get", return_value=mock_response) as mock_get:
         result = provider.query_funnel(
             steps=["page_view", "add_to_cart", "checkout", "purchase"],
             date_range="last_7d",
@@ -64,7 +64,7 @@ def test_query_events_calls_export_api():
     mock_response.text = '{"event":"purchase","properties":{"revenue":99.0}}\n'
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response) as mock_get:
+    with patch("vibe_inc.tools.analytics.mixpanel._http.get", return_value=mock_response) as mock_get:
         result = provider.query_events(event_name="purchase", date_range="last_7d")
 
     assert "events" in result
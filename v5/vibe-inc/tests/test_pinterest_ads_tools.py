@@ -14,7 +14,7 @@ def test_pinterest_ads_report_returns_rows():
 
     mock_resp = _mock_response({"rows": [{"OUTBOUND_CLICK": 150, "IMPRESSION": 5000}]})
 
-    with patch("vibe_inc.tools.ads.pinterest_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.pinterest_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.pinterest_ads._get_headers", return_value={"Authorization": "Bearer test"}), \
          patch("vibe_inc.tools.ads.pinterest_ads._get_ad_account_id", return_value="acc_123"):
         mock_httpx.get.return_value = mock_resp
@@ -46,7 +46,7 @@ def test_pinterest_ads_campaigns_returns_list():
         ],
     })
 
-    with patch("vibe_inc.tools.ads.pinterest_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.pinterest_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.pinterest_ads._get_headers", return_value={"Authorization": "Bearer test"}), \
          patch("vibe_inc.tools.ads.pinterest_ads._get_ad_account_id", return_value="acc_123"):
         mock_httpx.get.return_value = mock_resp
@@ -62,7 +62,7 @@ def test_pinterest_ads_create_returns_id():
 
     mock_resp = _mock_response({"id": "c_new_456"})
 
-    with patch("vibe_inc.tools.ads.pinterest_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.pinterest_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.pinterest_ads._get_headers", return_value={"Authorization": "Bearer test"}), \
          patch("vibe_inc.tools.ads.pinterest_ads._get_ad_account_id", return_value="acc_123"):
         mock_httpx.post.return_value = mock_resp
@@ -82,7 +82,7 @@ def test_pinterest_ads_update_returns_result():
 
     mock_resp = _mock_response({"id": "c_123", "status": "ACTIVE"})
 
-    with patch("vibe_inc.tools.ads.pinterest_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.pinterest_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.pinterest_ads._get_headers", return_value={"Authorization": "Bearer test"}), \
          patch("vibe_inc.tools.ads.pinterest_ads._get_ad_account_id", return_value="acc_123"):
         mock_httpx.patch.return_value = mock_resp
@@ -105,7 +105,7 @@ def test_pinterest_ads_pins_returns_list():
         ],
     })
 
-    with patch("vibe_inc.tools.ads.pinterest_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.pinterest_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.pinterest_ads._get_headers", return_value={"Authorization": "Bearer test"}), \
          patch("vibe_inc.tools.ads.pinterest_ads._get_ad_account_id", return_value="acc_123"):
         mock_httpx.get.return_value = mock_resp
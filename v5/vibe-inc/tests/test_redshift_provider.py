@@ -1,5 +1,19 @@
+import threading
+import time
 from unittest.mock import patch, MagicMock
 
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    """Each test patches _get_connection; don't reuse another test's mock."""
+    from vibe_inc.tools.analytics import redshift
+    redshift.close_pool()
+    yield
+    redshift.close_pool()
+    redshift.reset_result_cache()
+
 
 def test_redshift_provider_implements_protocol():
     from vibe_inc.tools.analytics import AnalyticsProvider
@@ -130,9 +144,10 @@ def test_query_events_generates_sql():
         )
 
     assert "events" in result
-    sql = mock_cursor.execute.call_args[0][0]
+    sql, params = mock_cursor.execute.call_args[0]
     assert "fct_website_visitor_conversion" in sql
-    assert "visitor_close_won" in sql
+    assert "visitor_close_won" not in sql
+    assert params[0] == "visitor_close_won"
 
 
 def test_query_cohort_generates_sql():
@@ -153,3 +168,197 @@ def test_query_cohort_generates_sql():
         )
 
     assert "data" in result
+
+
+def _pool_conn(rows=((1,),)):
+    conn = MagicMock()
+    conn.cursor.return_value.fetchall.return_value = list(rows)
+    conn.cursor.return_value.description = [("n",)]
+    return conn
+
+
+def test_pool_reuses_connection_across_queries():
+    from vibe_inc.tools.analytics.redshift import RedshiftProvider
+
+    connect = MagicMock(side_effect=lambda: _pool_conn())
+    with patch("vibe_inc.tools.analytics.redshift._get_connection", connect):
+        provider = RedshiftProvider()
+        provider.query_sql("SELECT 1")
+        provider.query_sql("SELECT 2")
+    assert connect.call_count == 1
+
+
+def test_pool_discards_connection_after_error():
+    from vibe_inc.tools.analytics.redshift import ConnectionPool
+
+    bad = _pool_conn()
+    pool = ConnectionPool(connect=MagicMock(side_effect=[bad, _pool_conn()]))
+    with pytest.raises(RuntimeError):
+        with pool.connection():
+            raise RuntimeError("query failed")
+    bad.close.assert_called_once()
+    assert pool.size == 0
+    with pool.connection() as conn:
+        assert conn is not bad
+
+
+def test_pool_health_checks_and_evicts_idle():
+    from vibe_inc.tools.analytics.redshift import ConnectionPool
+
+    dead = _pool_conn()
+    dead.cursor.return_value.execute.side_effect = OSError("gone")
+    conns = iter([dead, _pool_conn(), _pool_conn()])
+    pool = ConnectionPool(connect=lambda: next(conns), health_check_after=0)
+    with pool.connection():
+        pass
+    with pool.connection() as conn:
+        assert conn is not dead
+    dead.close.assert_called_once()
+
+    pool.idle_timeout = 0
+    time.sleep(0.01)
+    with pool.connection():
+        pass  # the idle connection expired and was replaced
+    assert pool.size == 1
+
+
+def test_pool_ends_transaction_before_reuse():
+    from vibe_inc.tools.analytics.redshift import ConnectionPool
+
+    conn = _pool_conn()
+    pool = ConnectionPool(connect=MagicMock(side_effect=[conn, _pool_conn()]))
+    with pool.connection() as borrowed:
+        borrowed.cursor().execute("SELECT 1")
+        conn.rollback.assert_not_called()
+    conn.rollback.assert_called_once()
+    assert pool.idle == 1
+
+    conn.rollback.side_effect = OSError("connection reset")
+    with pool.connection() as borrowed:
+        assert borrowed is conn
+    conn.close.assert_called_once()  # could not end its transaction: not pooled
+    assert pool.size == 0 and pool.idle == 0
+
+
+def test_query_sql_group_runs_concurrently():
+    from vibe_inc.tools.analytics.redshift import ConnectionPool, RedshiftProvider
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def connect():
+        conn = _pool_conn()
+        conn.cursor.return_value.execute.side_effect = lambda sql: barrier.wait()
+        return conn
+
+    provider = RedshiftProvider(pool=ConnectionPool(connect=connect, max_size=3))
+    result = provider.query_sql_group({"a": "SELECT 1", "b": "SELECT 2", "c": "SELECT 3"})
+    assert list(result) == ["a", "b", "c"]
+    assert result["a"]["rows"] == [{"n": 1}]
+
+
+def test_get_provider_is_shared():
+    from vibe_inc.tools.analytics.redshift import get_provider
+    assert get_provider() is get_provider()
+
+
+def test_query_metrics_binds_filters_and_keeps_sql_stable():
+    from vibe_inc.tools.analytics.redshift import RedshiftProvider
+
+    mock_conn = _pool_conn()
+    with patch("vibe_inc.tools.analytics.redshift._get_connection", return_value=mock_conn):
+        provider = RedshiftProvider()
+        first = provider.query_metrics(
+            metrics=["spend_in_usd"], dimensions=["platform"],
+            date_range="2026-01-01,2026-01-07",
+            filters={"platform": "facebook' OR '1'='1", "country_code": ["US", "CA"]},
+        )
+        second = provider.query_metrics(
+            metrics=["spend_in_usd"], dimensions=["platform"],
+            date_range="2026-02-01,2026-02-07",
+            filters={"country_code": ["DE", "FR"], "platform": "google"},
+        )
+
+    assert first["sql"] == second["sql"]
+    assert "facebook" not in first["sql"]
+    assert first["params"] == ["2026-01-01", "2026-01-07", "US", "CA", "facebook' OR '1'='1"]
+
+
+def test_query_metrics_rejects_unknown_columns():
+    import pytest
+    from vibe_inc.tools.analytics.redshift import RedshiftProvider
+    from vibe_inc.tools.analytics.sql import SQLValidationError
+
+    with pytest.raises(SQLValidationError):
+        RedshiftProvider().query_metrics(metrics=["spend_in_usd; DROP TABLE x"])
+    with pytest.raises(SQLValidationError):
+        RedshiftProvider().query_metrics(metrics=["spend_in_usd"], filters={"nope": 1})
+
+
+def test_query_sql_server_side_fetches_in_batches():
+    from vibe_inc.tools.analytics.redshift import RedshiftProvider
+
+    mock_conn = _pool_conn()
+    cursor = mock_conn.cursor.return_value
+    cursor.fetchall.side_effect = [[(1,), (2,)], [(3,)], []]
+    with patch("vibe_inc.tools.analytics.redshift._get_connection", return_value=mock_conn):
+        result = RedshiftProvider().query_sql(
+            "SELECT n FROM t WHERE d = %s", ["2026-01-01"], server_side=True, batch_size=2,
+        )
+
+    assert [r["n"] for r in result["rows"]] == [1, 2, 3]
+    statements = [c.args[0] for c in cursor.execute.call_args_list]
+    assert statements[0] == "DECLARE vibe_stream CURSOR FOR SELECT n FROM t WHERE d = %s"
+    assert statements[1] == "FETCH FORWARD 2 FROM vibe_stream"
+    assert statements[-1] == "CLOSE vibe_stream"
+    assert mock_conn.rollback.call_count == 2  # closing the stream, then returning to the pool
+
+
+def test_server_side_reads_keep_columns_of_empty_results():
+    from vibe_inc.tools.analytics.redshift import RedshiftProvider
+
+    mock_conn = _pool_conn()
+    cursor = mock_conn.cursor.return_value
+    cursor.description = [("campaign",), ("spend",)]
+    cursor.fetchall.return_value = []
+    with patch("vibe_inc.tools.analytics.redshift._get_connection", return_value=mock_conn):
+        provider = RedshiftProvider()
+        columnar = provider.query_columnar("SELECT campaign, spend FROM t", server_side=True)
+        result = provider.query_sql("SELECT campaign, spend FROM t", server_side=True)
+
+    assert columnar.columns == ["campaign", "spend"] and len(columnar) == 0
+    assert result == {"rows": [], "columns": ["campaign", "spend"]}
+
+
+def test_provider_serves_repeat_reads_from_cache_until_table_advances():
+    from vibe_inc.tools.analytics.redshift import RedshiftProvider
+    from vibe_inc.tools.analytics.result_cache import FreshnessTracker, ResultCache
+
+    watermark = {"common.fct_order": "2026-02-01"}
+    cache = ResultCache(freshness=FreshnessTracker(watermark.get, check_interval=0))
+    mock_conn = _pool_conn()
+    with patch("vibe_inc.tools.analytics.redshift._get_connection", return_value=mock_conn):
+        provider = RedshiftProvider(cache=cache)
+        sql = "SELECT COUNT(*) AS n FROM common.fct_order"
+        provider.query_sql(sql)
+        provider.query_sql("  SELECT COUNT(*) AS n\n FROM common.fct_order;")
+        assert mock_conn.cursor.return_value.execute.call_count == 1
+
+        watermark["common.fct_order"] = "2026-02-02"
+        provider.query_sql(sql)
+        assert mock_conn.cursor.return_value.execute.call_count == 2
+
+    assert cache.snapshot()["memory_hits"] == 1
+    assert cache.stats.stale == 1
+
+
+def test_query_columnar_streams_with_fetchmany():
+    from vibe_inc.tools.analytics.redshift import RedshiftProvider
+
+    mock_conn = _pool_conn()
+    cursor = mock_conn.cursor.return_value
+    cursor.fetchmany.side_effect = [[(1,), (2,)], []]
+    with patch("vibe_inc.tools.analytics.redshift._get_connection", return_value=mock_conn):
+        result = RedshiftProvider().query_columnar("SELECT n FROM t", batch_size=2)
+
+    assert result.column("n") == [1, 2]
+    cursor.fetchall.assert_not_called()
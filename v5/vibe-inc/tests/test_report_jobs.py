@@ -0,0 +1,179 @@
+"""Tests for the shared async report-job scheduler."""
+import asyncio
+import gzip
+import json
+import threading
+import time
+
+import pytest
+
+from vibe_inc.tools.ads.report_jobs import (
+    Backoff,
+    GzipJsonDecoder,
+    JsonArrayStream,
+    ReportJobManager,
+    ReportScheduler,
+    poll_until,
+)
+
+
+@pytest.fixture
+def scheduler():
+    sched = ReportScheduler(name="test-report-jobs")
+    yield sched
+    sched.close()
+
+
+def test_json_array_stream_handles_every_chunk_boundary():
+    rows = [{"a": 1, "b": "x,]"}, {"a": 22.5, "b": None}, [1, 2], "s", 12345, True]
+    text = json.dumps(rows)
+    for split in range(len(text) + 1):
+        stream = JsonArrayStream()
+        out = stream.feed(text[:split]) + stream.feed(text[split:])
+        assert out + stream.close() == rows, split
+
+
+def test_json_array_stream_rejects_truncated_or_non_array():
+    stream = JsonArrayStream()
+    stream.feed('[{"a": 1}, {"a"')
+    with pytest.raises(ValueError):
+        stream.close()
+    with pytest.raises(ValueError):
+        JsonArrayStream().feed('{"a": 1}')
+
+
+def test_gzip_json_decoder_yields_rows_before_the_end():
+    rows = [{"campaignId": str(i), "spend": i * 1.5} for i in range(500)]
+    body = gzip.compress(json.dumps(rows).encode())
+    decoder = GzipJsonDecoder()
+    half = decoder.feed(body[: len(body) // 2])
+    rest = decoder.feed(body[len(body) // 2:]) + decoder.close()
+    assert 0 < len(half) < len(rows)
+    assert half + rest == rows
+
+
+def test_backoff_grows_to_cap():
+    delays = Backoff(initial=1, factor=2, max_interval=5, jitter=0).delays()
+    assert [next(delays) for _ in range(5)] == [1, 2, 4, 5, 5]
+
+
+def test_poll_until_times_out():
+    async def never():
+        return None
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(poll_until(never, Backoff(initial=0.01, timeout=0.05, jitter=0)))
+
+
+def test_jobs_poll_concurrently_on_one_loop(scheduler):
+    threads = set()
+
+    async def run(job, seconds):
+        threads.add(threading.current_thread().name)
+        await asyncio.sleep(seconds)
+        return [seconds]
+
+    manager = ReportJobManager(run, scheduler=scheduler)
+    start = time.perf_counter()
+    jobs = [manager.submit(("r", i), 0.2) for i in range(5)]
+    manager.wait(jobs, timeout=5)
+    elapsed = time.perf_counter() - start
+
+    assert [job.result() for job in jobs] == [[0.2]] * 5
+    assert elapsed < 0.6
+    assert threads == {"test-report-jobs"}
+
+
+def test_inflight_jobs_are_shared_and_results_cached(scheduler):
+    runs = []
+    release = threading.Event()
+
+    async def run(job, value):
+        runs.append(value)
+        while not release.is_set():
+            await asyncio.sleep(0.005)
+        return [value]
+
+    manager = ReportJobManager(run, scheduler=scheduler)
+    first = manager.submit(("k",), 1)
+    assert manager.submit(("k",), 1) is first
+    release.set()
+    assert first.result(timeout=5) == [1]
+
+    cached = manager.submit(("k",), 1)
+    assert cached.cached and cached.status == "COMPLETED"
+    assert cached.result() == [1]
+    assert runs == [1]
+
+    assert manager.invalidate(("k",)) == 1
+    manager.submit(("k",), 1).result(timeout=5)
+    assert runs == [1, 1]
+
+
+def test_failed_jobs_are_not_cached(scheduler):
+    attempts = []
+
+    async def run(job):
+        attempts.append(1)
+        raise RuntimeError("report failed")
+
+    manager = ReportJobManager(run, scheduler=scheduler)
+    job = manager.submit(("bad",))
+    with pytest.raises(RuntimeError):
+        job.result(timeout=5)
+    assert job.status == "FAILED"
+    with pytest.raises(RuntimeError):
+        manager.submit(("bad",)).result(timeout=5)
+    assert len(attempts) == 2
+
+
+def test_cache_expires_after_ttl(scheduler):
+    async def run(job):
+        return [time.perf_counter()]
+
+    manager = ReportJobManager(run, scheduler=scheduler, cache_ttl=0.0)
+    first = manager.submit(("t",)).result(timeout=5)
+    time.sleep(0.01)
+    assert manager.submit(("t",)).result(timeout=5) != first
+
+
+def test_max_cached_zero_disables_the_result_cache(scheduler):
+    async def run(job):
+        await asyncio.sleep(0.05)
+        return [time.perf_counter()]
+
+    manager = ReportJobManager(run, scheduler=scheduler, max_cached=0)
+    first, joined = manager.submit(("t",)), manager.submit(("t",))
+    assert joined is first  # in-flight runs are still shared
+    rows = first.result(timeout=5)
+    assert manager._cache == {}
+    assert manager.submit(("t",)).result(timeout=5) != rows
+
+
+def test_job_handle_is_awaitable_from_another_loop(scheduler):
+    async def run(job, n):
+        await asyncio.sleep(0.01)
+        return list(range(n))
+
+    manager = ReportJobManager(run, scheduler=scheduler)
+
+    async def agent():
+        return await asyncio.gather(manager.submit(("a",), 2), manager.submit(("b",), 3))
+
+    assert asyncio.run(agent()) == [[0, 1], [0, 1, 2]]
+
+
+def test_scheduler_close_cancels_pending_and_restarts(scheduler):
+    async def run(job, seconds):
+        await asyncio.sleep(seconds)
+        return [seconds]
+
+    manager = ReportJobManager(run, scheduler=scheduler)
+    slow = manager.submit(("slow",), 30)
+    scheduler.close()
+    assert not scheduler.running
+    assert slow.done() and slow.future.cancelled()
+    assert slow.status == "FAILED"
+
+    assert manager.submit(("fast",), 0.01).result(timeout=5) == [0.01]
+    assert scheduler.running
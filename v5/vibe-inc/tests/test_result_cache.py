@@ -0,0 +1,93 @@
+"""Tests for the warehouse result cache."""
+
+
+def test_disk_layer_survives_new_cache_and_tracks_hit_rate(tmp_path):
+    from vibe_inc.tools.analytics.result_cache import ResultCache
+
+    path = str(tmp_path / "cache.sqlite")
+    first = ResultCache(path=path)
+    first.set("SELECT 1", None, {"rows": [{"n": 1}], "columns": ["n"]})
+    first.close()
+
+    second = ResultCache(path=path)
+    assert second.get("SELECT 1") == {"rows": [{"n": 1}], "columns": ["n"]}
+    assert second.get("SELECT 1") is not None  # promoted to memory
+    assert second.get("SELECT 2") is None
+    stats = second.snapshot()
+    assert (stats["disk_hits"], stats["memory_hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["hit_rate"] == round(2 / 3, 4)
+
+
+def test_disk_hit_preserves_warehouse_types(tmp_path):
+    from datetime import date, datetime
+    from decimal import Decimal
+
+    from vibe_inc.tools.analytics.result_cache import ResultCache
+
+    path = str(tmp_path / "cache.sqlite")
+    row = {"day": date(2026, 3, 1), "loaded_at": datetime(2026, 3, 2, 6, 30), "spend": Decimal("12.50"),
+           "tag": {"$note": "plain dict"}, "n": 3}
+    first = ResultCache(path=path)
+    first.set("SELECT 1", None, {"rows": [row], "columns": list(row)})
+    first.close()
+
+    result = ResultCache(path=path).get("SELECT 1")  # answered by the disk layer
+    assert result["rows"] == [row]
+    assert [type(v) for v in result["rows"][0].values()] == [date, datetime, Decimal, dict, int]
+    assert sum(r["spend"] for r in result["rows"]) == Decimal("12.50")
+
+
+def test_mutating_results_does_not_change_later_hits(tmp_path):
+    from vibe_inc.tools.analytics.result_cache import ResultCache
+
+    cache = ResultCache(path=str(tmp_path / "cache.sqlite"))
+    original = {"rows": [{"n": 1}], "columns": ["n"]}
+    cache.set("SELECT 1", None, original)
+    original["rows"][0]["n"] = 99  # the caller that ran the query keeps using its result
+    hit = cache.get("SELECT 1")
+    hit["rows"].append({"n": 2})
+    hit["columns"].clear()
+    assert cache.get("SELECT 1") == {"rows": [{"n": 1}], "columns": ["n"]}
+
+    reopened = ResultCache(path=str(tmp_path / "cache.sqlite"))
+    reopened.get("SELECT 1")["rows"][0]["n"] = 7  # disk hit, promoted to memory
+    assert reopened.get("SELECT 1")["rows"] == [{"n": 1}]
+
+
+def test_key_includes_params_and_lru_evicts():
+    from vibe_inc.tools.analytics.result_cache import ResultCache
+
+    cache = ResultCache(max_entries=2)
+    sql = "SELECT * FROM common.fct_order WHERE created_at >= %s"
+    cache.set(sql, ["2026-01-01"], {"rows": [1]})
+    cache.set(sql, ["2026-02-01"], {"rows": [2]})
+    assert cache.get(sql, ["2026-01-01"]) == {"rows": [1]}
+    cache.set("SELECT 3", None, {"rows": [3]})
+    assert cache.get(sql, ["2026-02-01"]) is None  # least recently used
+
+
+def test_invalidate_by_table_and_ttl_fallback():
+    from vibe_inc.tools.analytics.result_cache import FreshnessTracker, ResultCache
+
+    cache = ResultCache(ttl_seconds=0, freshness=FreshnessTracker(lambda table: None))
+    cache.set("SELECT 1 FROM common.fct_order", None, {"rows": []})
+    assert cache.get("SELECT 1 FROM common.fct_order") is None  # unknown freshness, TTL 0
+
+    cache = ResultCache()
+    cache.set("SELECT a FROM common.fct_order o JOIN common.dim_x d ON o.k = d.k", None, {})
+    cache.set("SELECT b FROM common.fct_ads_ad_metrics", None, {})
+    assert cache.invalidate("common.dim_x") == 1
+    assert cache.get("SELECT b FROM common.fct_ads_ad_metrics") == {}
+
+
+def test_freshness_tracker_probes_at_most_once_per_interval():
+    from vibe_inc.tools.analytics.result_cache import FreshnessTracker
+
+    now = [0.0]
+    calls = []
+    tracker = FreshnessTracker(lambda t: calls.append(t) or "2026-02-01", 60, clock=lambda: now[0])
+    tracker.version(("common.fct_order",))
+    tracker.version(("common.fct_order",))
+    now[0] = 61
+    tracker.version(("common.fct_order",))
+    assert len(calls) == 2
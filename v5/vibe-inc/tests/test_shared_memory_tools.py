@@ -29,3 +29,50 @@ def test_read_memory_has_docstring():
 def test_write_memory_has_docstring():
     from vibe_inc.tools.shared_memory import write_memory
     assert write_memory.__doc__ is not None
+
+
+def test_read_memory_caches_until_file_changes():
+    from unittest.mock import patch
+
+    from vibe_inc.tools import shared_memory
+    from vibe_inc.tools.shared_memory import read_memory
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "catalog.yaml"
+        path.write_text("bot: {price: 999}\n")
+        with patch.object(shared_memory.yaml, "load", wraps=shared_memory.yaml.load) as load:
+            first = read_memory("catalog.yaml", memory_dir=Path(tmpdir))
+            first["bot"]["price"] = 1  # callers get a copy, not the cached parse
+            second = read_memory("catalog.yaml", memory_dir=Path(tmpdir))
+            assert load.call_count == 1
+            assert second["bot"]["price"] == 999
+
+            path.write_text("bot: {price: 1099}\n")  # external edit, e.g. another process
+            assert read_memory("catalog.yaml", memory_dir=Path(tmpdir))["bot"]["price"] == 1099
+            assert load.call_count == 2
+
+        path.unlink()
+        assert read_memory("catalog.yaml", memory_dir=Path(tmpdir)) == {}
+
+
+def test_write_memory_replaces_atomically_and_invalidates():
+    from vibe_inc.tools.shared_memory import read_memory, write_memory
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        write_memory("performance/meta_weekly.yaml", {"spend": 100}, memory_dir=base)
+        inode = (base / "performance/meta_weekly.yaml").stat().st_ino
+        assert read_memory("performance/meta_weekly.yaml", memory_dir=base) == {"spend": 100}
+
+        write_memory("performance/meta_weekly.yaml", {"spend": 200}, memory_dir=base)
+        assert (base / "performance/meta_weekly.yaml").stat().st_ino != inode  # renamed over, not rewritten
+        assert read_memory("performance/meta_weekly.yaml", memory_dir=base) == {"spend": 200}
+        assert [p.name for p in (base / "performance").iterdir()] == ["meta_weekly.yaml"]
+
+
+def test_preload_memory_indexes_tree():
+    from vibe_inc.tools.shared_memory import preload_memory
+
+    index = preload_memory(Path(__file__).parent.parent / "shared_memory")
+    assert "product" in index["messaging/bot-framework.yaml"]
+    assert "cross_platform" in index["performance/platform_benchmarks.yaml"]
@@ -17,7 +17,7 @@ def test_shopify_products_returns_list():
         ],
     })
 
-    with patch("vibe_inc.tools.commerce.shopify.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.commerce.shopify._http") as mock_httpx, \
          patch("vibe_inc.tools.commerce.shopify._get_headers", return_value={"X-Shopify-Access-Token": "test"}), \
          patch("vibe_inc.tools.commerce.shopify._get_base_url", return_value="https://test.myshopify.com/admin/api/2024-01"):
         mock_httpx.get.return_value = mock_resp
@@ -43,7 +43,7 @@ def test_shopify_orders_returns_list():
         ],
     })
 
-    with patch("vibe_inc.tools.commerce.shopify.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.commerce.shopify._http") as mock_httpx, \
          patch("vibe_inc.tools.commerce.shopify._get_headers", return_value={"X-Shopify-Access-Token": "test"}), \
          patch("vibe_inc.tools.commerce.shopify._get_base_url", return_value="https://test.myshopify.com/admin/api/2024-01"):
         mock_httpx.get.return_value = mock_resp
@@ -68,7 +68,7 @@ def test_shopify_collections_returns_list():
         ],
     })
 
-    with patch("vibe_inc.tools.commerce.shopify.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.commerce.shopify._http") as mock_httpx, \
          patch("vibe_inc.tools.commerce.shopify._get_headers", return_value={"X-Shopify-Access-Token": "test"}), \
          patch("vibe_inc.tools.commerce.shopify._get_base_url", return_value="https://test.myshopify.com/admin/api/2024-01"):
         mock_httpx.get.return_value = mock_resp
@@ -87,7 +87,7 @@ def test_shopify_discounts_returns_list():
         ],
     })
 
-    with patch("vibe_inc.tools.commerce.shopify.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.commerce.shopify._http") as mock_httpx, \
          patch("vibe_inc.tools.commerce.shopify._get_headers", return_value={"X-Shopify-Access-Token": "test"}), \
          patch("vibe_inc.tools.commerce.shopify._get_base_url", return_value="https://test.myshopify.com/admin/api/2024-01"):
         mock_httpx.get.return_value = mock_resp
@@ -106,7 +106,7 @@ def test_shopify_collections_custom_type():
         ],
     })
 
-    with patch("vibe_inc.tools.commerce.shopify.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.commerce.shopify._http") as mock_httpx, \
          patch("vibe_inc.tools.commerce.shopify._get_headers", return_value={"X-Shopify-Access-Token": "test"}), \
          patch("vibe_inc.tools.commerce.shopify._get_base_url", return_value="https://test.myshopify.com/admin/api/2024-01"):
         mock_httpx.get.return_value = mock_resp
@@ -126,7 +126,7 @@ def test_shopify_orders_calculates_revenue():
         ],
     })
 
-    with patch("vibe_inc.tools.commerce.shopify.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.commerce.shopify._http") as mock_httpx, \
          patch("vibe_inc.tools.commerce.shopify._get_headers", return_value={"X-Shopify-Access-Token": "test"}), \
          patch("vibe_inc.tools.commerce.shopify._get_base_url", return_value="https://test.myshopify.com/admin/api/2024-01"):
         mock_httpx.get.return_value = mock_resp
@@ -16,7 +16,7 @@ def test_tiktok_ads_report_returns_rows():
         "data": {"list": [{"spend": "120.50", "impressions": "5000"}]},
     })
 
-    with patch("vibe_inc.tools.ads.tiktok_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.tiktok_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.tiktok_ads._get_headers", return_value={"Access-Token": "test"}), \
          patch("vibe_inc.tools.ads.tiktok_ads._get_advertiser_id", return_value="adv_123"):
         mock_httpx.post.return_value = mock_resp
@@ -49,7 +49,7 @@ def test_tiktok_ads_campaigns_returns_list():
         ]},
     })
 
-    with patch("vibe_inc.tools.ads.tiktok_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.tiktok_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.tiktok_ads._get_headers", return_value={"Access-Token": "test"}), \
          patch("vibe_inc.tools.ads.tiktok_ads._get_advertiser_id", return_value="adv_123"):
         mock_httpx.get.return_value = mock_resp
@@ -67,7 +67,7 @@ def test_tiktok_ads_create_returns_id():
         "data": {"campaign_id": "c_new_123"},
     })
 
-    with patch("vibe_inc.tools.ads.tiktok_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.tiktok_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.tiktok_ads._get_headers", return_value={"Access-Token": "test"}), \
          patch("vibe_inc.tools.ads.tiktok_ads._get_advertiser_id", return_value="adv_123"):
         mock_httpx.post.return_value = mock_resp
@@ -87,7 +87,7 @@ def test_tiktok_ads_update_returns_result():
 
     mock_resp = _mock_response({"code": 0, "message": "OK"})
 
-    with patch("vibe_inc.tools.ads.tiktok_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.tiktok_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.tiktok_ads._get_headers", return_value={"Access-Token": "test"}), \
          patch("vibe_inc.tools.ads.tiktok_ads._get_advertiser_id", return_value="adv_123"):
         mock_httpx.post.return_value = mock_resp
@@ -110,7 +110,7 @@ def test_tiktok_ads_creatives_returns_list():
         ]},
     })
 
-    with patch("vibe_inc.tools.ads.tiktok_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.tiktok_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.tiktok_ads._get_headers", return_value={"Access-Token": "test"}), \
          patch("vibe_inc.tools.ads.tiktok_ads._get_advertiser_id", return_value="adv_123"):
         mock_httpx.get.return_value = mock_resp
@@ -131,7 +131,7 @@ def test_tiktok_ads_audiences_returns_list():
         ]},
     })
 
-    with patch("vibe_inc.tools.ads.tiktok_ads.httpx") as mock_httpx, \
+    with patch("vibe_inc.tools.ads.tiktok_ads._http") as mock_httpx, \
          patch("vibe_inc.tools.ads.tiktok_ads._get_headers", return_value={"Access-Token": "test"}), \
          patch("vibe_inc.tools.ads.tiktok_ads._get_advertiser_id", return_value="adv_123"):
         mock_httpx.get.return_value = mock_resp
@@ -1,5 +1,19 @@
 from unittest.mock import patch
 
+import pytest
+
+from vibe_inc.tools.ads import metrics_store, metrics_sync
+
+
+@pytest.fixture(autouse=True)
+def _empty_store(monkeypatch):
+    """Store-backed tools see an empty store and never call the platform APIs."""
+    monkeypatch.delenv("AD_METRICS_STORE_PATH", raising=False)
+    metrics_store.reset_store()
+    with patch.dict(metrics_sync.FETCHERS, {p: lambda start, end: [] for p in metrics_sync.PLATFORMS}):
+        yield
+    metrics_store.reset_store()
+
 
 def test_unified_metrics_read_returns_platforms():
     from vibe_inc.tools.ads.unified_metrics import unified_metrics_read
@@ -35,6 +49,7 @@ def test_budget_allocator_returns_allocation():
     assert result["total_budget"] == 10000.0
     assert "allocation" in result
     assert result["allocation"]["google"]["amount"] == 3700.0
+    assert result["method"] == "static_split"
 
 
 def test_platform_health_score_returns_scores():
@@ -44,4 +59,4 @@ def test_platform_health_score_returns_scores():
         result = platform_health_score()
 
     assert "health_scores" in result
-    assert "meta" in result["health_scores"]
+    assert result["health_scores"]["meta"]["status"] == "no_data"
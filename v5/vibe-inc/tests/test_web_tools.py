@@ -21,7 +21,7 @@ def test_web_search_calls_brave_api():
     mock_response.raise_for_status = MagicMock()
 
     with patch.dict("os.environ", {"BRAVE_SEARCH_API_KEY": "test-key"}), \
-         patch("httpx.get", return_value=mock_response) as mock_get:
+         patch("vibe_inc.tools.web.search._http.get", return_value=mock_response) as mock_get:
         result = web_search("meeting hardware competitors")
 
     mock_get.assert_called_once()
@@ -48,7 +48,7 @@ def test_web_search_count_param():
     mock_response.raise_for_status = MagicMock()
 
     with patch.dict("os.environ", {"BRAVE_SEARCH_API_KEY": "k"}), \
-         patch("httpx.get", return_value=mock_response) as mock_get:
+         patch("vibe_inc.tools.web.search._http.get", return_value=mock_response) as mock_get:
         web_search("test", count=50)
 
     _, kwargs = mock_get.call_args
@@ -67,7 +67,7 @@ def test_web_fetch_returns_content():
     mock_response.status_code = 200
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response):
+    with patch("vibe_inc.tools.web.search._http.get", return_value=mock_response):
         result = web_fetch("https://example.com/pricing")
 
     assert result["url"] == "https://example.com/pricing"
@@ -85,7 +85,7 @@ def test_web_fetch_truncates_content():
     mock_response.status_code = 200
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response):
+    with patch("vibe_inc.tools.web.search._http.get", return_value=mock_response):
         result = web_fetch("https://example.com", max_chars=100)
 
     assert len(result["content"]) == 100